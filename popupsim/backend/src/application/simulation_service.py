@@ -9,6 +9,8 @@ from application.context_registry import ContextRegistry
 from contexts.configuration.domain.models.scenario import Scenario
 from contexts.external_trains.application.external_trains_context import ExternalTrainsContext
 from contexts.railway_infrastructure.infrastructure.di_container import create_railway_context
+from contexts.retrofit_workflow.application.config.output_selection import EventStream
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
 from contexts.retrofit_workflow.application.retrofit_workflow_context import RetrofitWorkshopContext
 from infrastructure.tracking.process_export import export_process_tracking_data
 from shared.domain.events.simulation_lifecycle_events import SimulationEndedEvent
@@ -16,6 +18,7 @@ from shared.domain.events.simulation_lifecycle_events import SimulationFailedEve
 from shared.domain.events.simulation_lifecycle_events import SimulationStartedEvent
 from shared.infrastructure.simulation.coordination.simulation_infrastructure import SimulationInfrastructure
 from shared.infrastructure.simulation.engines.simpy_adapter import SimPyEngineAdapter
+from shared.infrastructure.tabular_format import TabularFormat
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +35,17 @@ class SimulationResult:
 class SimulationApplicationService:
     """Application service managing simulation lifecycle."""
 
-    def __init__(self, scenario: Scenario, output_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        scenario: Scenario,
+        output_dir: Path | None = None,
+        output_selection: OutputSelection | None = None,
+        output_format: TabularFormat = TabularFormat.CSV,
+    ) -> None:
         self.scenario = scenario
         self.output_dir = output_dir
+        self.output_selection = output_selection or OutputSelection.full()
+        self.output_format = output_format
         self.engine = SimPyEngineAdapter.create()
 
         # Extract workshop IDs for infrastructure
@@ -91,8 +102,8 @@ class SimulationApplicationService:
             result = self._collect_results(self.engine.current_time() - start_time)
 
             # Export process tracking data if output directory is available
-            if self.output_dir:
-                export_process_tracking_data(self.output_dir)
+            if self.output_dir and self.output_selection.records(EventStream.PROCESS_TRACKING):
+                export_process_tracking_data(self.output_dir, self.output_format)
 
             # Publish simulation ended event
             ended_event = SimulationEndedEvent.create(
@@ -144,6 +155,7 @@ class SimulationApplicationService:
         retrofit_context = RetrofitWorkshopContext(
             self.engine.get_env(),
             self.scenario,
+            output_selection=self.output_selection,
         )
         retrofit_context.initialize()
         self.contexts['retrofit_workflow'] = retrofit_context
@@ -0,0 +1,29 @@
+"""Performance benchmark of the simulation pipeline (``popupsim bench``)."""
+
+from .results import BenchmarkRun
+from .results import CaseResult
+from .results import Regression
+from .results import compare
+from .scaling import MAX_RATIO
+from .scaling import SCALING_BENCHMARKS
+from .scaling import ScalingResult
+from .scaling import run_scaling_benchmarks
+from .suite import BENCHMARK_SUITES
+from .suite import BenchmarkCase
+from .suite import benchmark_cases
+from .suite import run_benchmark
+
+__all__ = [
+    'BENCHMARK_SUITES',
+    'MAX_RATIO',
+    'SCALING_BENCHMARKS',
+    'BenchmarkCase',
+    'BenchmarkRun',
+    'CaseResult',
+    'Regression',
+    'ScalingResult',
+    'benchmark_cases',
+    'compare',
+    'run_benchmark',
+    'run_scaling_benchmarks',
+]
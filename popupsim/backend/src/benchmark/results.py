@@ -0,0 +1,218 @@
+"""Benchmark results, their JSON file format and the comparison against a baseline."""
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import subprocess  # nosec B404 - runs git only
+import sys
+
+RESULTS_FORMAT_VERSION = 1
+PHASES = ('load', 'initialize', 'run', 'export')
+
+# Metrics compared against a baseline: (higher is better, time the metric is measured over)
+_COMPARED_METRICS: dict[str, tuple[bool, str | None]] = {
+    **{f'{phase}_s': (False, f'{phase}_s') for phase in PHASES},
+    'total_s': (False, 'total_s'),
+    'peak_rss_mb': (False, None),
+    'events_per_s': (True, 'run_s'),
+    'wagons_per_s': (True, 'run_s'),
+}
+# Time differences below this are noise on any machine and never count as regression
+_NOISE_FLOOR_S = 0.05
+
+
+@dataclass(frozen=True)
+class CaseResult:  # pylint: disable=too-many-instance-attributes
+    """Measurements of one benchmark case (fastest of its repeats)."""
+
+    case: str
+    load_s: float
+    initialize_s: float
+    run_s: float
+    export_s: float
+    events: int
+    wagons: int
+    peak_rss_mb: float | None = None
+    repeats: int = 1
+
+    @property
+    def total_s(self) -> float:
+        """Get wall time of all phases."""
+        return self.load_s + self.initialize_s + self.run_s + self.export_s
+
+    @property
+    def events_per_s(self) -> float:
+        """Get SimPy events processed per second of the run phase."""
+        return self.events / self.run_s if self.run_s > 0 else 0.0
+
+    @property
+    def wagons_per_s(self) -> float:
+        """Get arrived wagons simulated per second of the run phase."""
+        return self.wagons / self.run_s if self.run_s > 0 else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to JSON-compatible dict, including derived metrics."""
+        return {
+            **asdict(self),
+            'total_s': self.total_s,
+            'events_per_s': self.events_per_s,
+            'wagons_per_s': self.wagons_per_s,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> 'CaseResult':
+        """Create from dict written by to_dict (derived metrics are recomputed)."""
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class BenchmarkRun:
+    """Results of one benchmark invocation with the code version and machine they were measured on."""
+
+    cases: list[CaseResult]
+    git_sha: str | None = None
+    git_dirty: bool | None = None
+    machine: dict[str, object] = field(default_factory=dict)
+    created: str = field(default_factory=lambda: datetime.now(UTC).isoformat(timespec='seconds'))
+
+    @classmethod
+    def create(cls, cases: list[CaseResult]) -> 'BenchmarkRun':
+        """Create run for cases measured with the current checkout on this machine."""
+        sha, dirty = _git_revision()
+        return cls(cases=cases, git_sha=sha, git_dirty=dirty, machine=machine_info())
+
+    def case(self, name: str) -> CaseResult | None:
+        """Get result of case by name."""
+        return next((c for c in self.cases if c.case == name), None)
+
+    def save(self, path: Path) -> None:
+        """Write results as JSON."""
+        data = {
+            'format_version': RESULTS_FORMAT_VERSION,
+            'created': self.created,
+            'git_sha': self.git_sha,
+            'git_dirty': self.git_dirty,
+            'machine': self.machine,
+            'cases': [c.to_dict() for c in self.cases],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path) -> 'BenchmarkRun':
+        """Read results written by save.
+
+        Raises
+        ------
+        ValueError
+            If the file has an unsupported format version
+        """
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('format_version') != RESULTS_FORMAT_VERSION:
+            msg = f'{path}: unsupported benchmark results format {data.get("format_version")!r}'
+            raise ValueError(msg)
+        return cls(
+            cases=[CaseResult.from_dict(c) for c in data['cases']],
+            git_sha=data.get('git_sha'),
+            git_dirty=data.get('git_dirty'),
+            machine=data.get('machine', {}),
+            created=data.get('created', ''),
+        )
+
+
+@dataclass(frozen=True)
+class Regression:
+    """Metric of a case that got worse than the baseline by more than the tolerance."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Get relative change against the baseline (positive = higher)."""
+        return (self.current - self.baseline) / self.baseline
+
+    def __str__(self) -> str:
+        """Describe regression for reports."""
+        return f'{self.case}: {self.metric} {self.baseline:.3g} -> {self.current:.3g} ({self.change:+.0%})'
+
+
+def compare(current: BenchmarkRun, baseline: BenchmarkRun, tolerance: float = 0.1) -> list[Regression]:
+    """Find metrics that regressed against the baseline.
+
+    Cases missing in either run are skipped, as are metrics whose underlying time
+    differs by less than the noise floor of 50 ms.
+
+    Parameters
+    ----------
+    current : BenchmarkRun
+        Results to check
+    baseline : BenchmarkRun
+        Stored reference results
+    tolerance : float
+        Allowed relative change before a metric counts as regression (0.1 = 10 %)
+
+    Returns
+    -------
+    list[Regression]
+        Regressed metrics (empty if none)
+    """
+    regressions = []
+    for result in current.cases:
+        reference = baseline.case(result.case)
+        if reference is None:
+            continue
+        for metric, (higher_is_better, timed) in _COMPARED_METRICS.items():
+            before = getattr(reference, metric)
+            after = getattr(result, metric)
+            if not before or after is None:
+                continue
+            if timed and abs(getattr(result, timed) - getattr(reference, timed)) < _NOISE_FLOOR_S:
+                continue
+            worse = after < before * (1 - tolerance) if higher_is_better else after > before * (1 + tolerance)
+            if worse:
+                regressions.append(Regression(result.case, metric, before, after))
+    return regressions
+
+
+def machine_info() -> dict[str, object]:
+    """Describe the machine and interpreter results were measured on."""
+    return {
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+    }
+
+
+def _git_revision() -> tuple[str | None, bool | None]:
+    """Get commit SHA of the checkout and whether it has uncommitted changes (None outside git)."""
+    source_root = Path(__file__).resolve().parent
+    try:
+        sha = subprocess.run(  # nosec B603 B607
+            ['git', 'rev-parse', 'HEAD'],  # noqa: S607
+            cwd=source_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(  # nosec B603 B607
+            ['git', 'status', '--porcelain', '--untracked-files=no'],  # noqa: S607
+            cwd=source_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return sha, bool(status.strip())
@@ -0,0 +1,186 @@
+"""Scaling micro-benchmarks of indexed simulation data structures.
+
+Each benchmark times a fixed number of operations on a structure holding a
+small and a large number of items. Indexed structures cost about the same at
+both sizes; a list-backed one slows down in proportion to its size (10x from
+500 to 5000 items). The ratio is checked by ``popupsim bench --scaling``
+instead of the unit tests, where wall-clock comparisons are unreliable on
+loaded machines.
+"""
+
+from collections.abc import Callable
+from collections.abc import Generator
+from dataclasses import dataclass
+import time
+from typing import Any
+
+OPERATIONS = 200
+# Largest accepted slowdown of the large structure (list-backed: about 10x)
+MAX_RATIO = 3.0
+
+
+@dataclass(frozen=True)
+class ScalingResult:
+    """Time of the same operations on a small and a large structure."""
+
+    name: str
+    small: int
+    large: int
+    small_s: float
+    large_s: float
+
+    @property
+    def ratio(self) -> float:
+        """Get slowdown of the large structure against the small one."""
+        return self.large_s / self.small_s if self.small_s > 0 else 0.0
+
+
+def _best_of(repeats: int, func: Callable[[], None]) -> float:
+    """Get minimum wall time of func over repeats."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _wagons(count: int) -> list[Any]:
+    """Create retrofit workflow wagons W0..W<count-1>."""
+    # pylint: disable=import-outside-toplevel
+    from contexts.retrofit_workflow.domain.entities.wagon import Wagon
+    from contexts.retrofit_workflow.domain.value_objects.coupler import Coupler
+    from contexts.retrofit_workflow.domain.value_objects.coupler import CouplerType
+
+    return [
+        Wagon(
+            id=f'W{i}',
+            length=15.0,
+            coupler_a=Coupler(CouplerType.SCREW, 'A'),
+            coupler_b=Coupler(CouplerType.SCREW, 'B'),
+        )
+        for i in range(count)
+    ]
+
+
+def _filled_track(wagons: list[Any]) -> tuple[Any, Any]:
+    """Create SimPy environment and parking track holding wagons."""
+    # pylint: disable=import-outside-toplevel
+    from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
+    import simpy
+
+    env = simpy.Environment()
+    track = TrackCapacityManager(env, 'parking', sum(w.length for w in wagons) + 100.0)
+    env.process(track.add_wagons(wagons))
+    env.run()
+    return env, track
+
+
+def track_membership_time(size: int) -> float:
+    """Time OPERATIONS membership checks on a track holding size wagons."""
+    wagons = _wagons(size)
+    _, track = _filled_track(wagons)
+    probes = wagons[-OPERATIONS:]
+
+    def run() -> None:
+        for wagon in probes:
+            track.has_wagon(wagon)
+            track.has_any_wagon([wagon])
+
+    return _best_of(5, run)
+
+
+def track_removal_time(size: int) -> float:
+    """Time OPERATIONS single-wagon removals from a track holding size wagons."""
+    best = float('inf')
+    for _ in range(3):
+        wagons = _wagons(size)
+        env, track = _filled_track(wagons)
+
+        def remove_all(track: Any = track, to_remove: list[Any] = wagons[-OPERATIONS:]) -> Generator[Any]:
+            for wagon in to_remove:
+                yield from track.remove_wagons([wagon])
+
+        env.process(remove_all())
+        start = time.perf_counter()
+        env.run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _rake_registry(size: int) -> Any:
+    """Create rake registry with size empty rakes spread over two tracks."""
+    # pylint: disable=import-outside-toplevel
+    from shared.domain.entities.rake import Rake
+    from shared.domain.services.rake_registry import RakeRegistry
+    from shared.domain.value_objects.rake_type import RakeType
+
+    registry = RakeRegistry()
+    for i in range(size):
+        registry.register_rake(
+            Rake(
+                rake_id=f'R{i}',
+                wagons=[],
+                rake_type=RakeType.COLLECTION_RAKE,
+                formation_time=0.0,
+                formation_track=f'track_{i % 2}',
+            )
+        )
+    return registry
+
+
+def rake_move_time(size: int) -> float:
+    """Time OPERATIONS single and batch moves with size live rakes."""
+    registry = _rake_registry(size)
+    rake_ids = [f'R{i}' for i in range(0, 2 * OPERATIONS, 2)]
+
+    def run() -> None:
+        for rake_id in rake_ids:
+            registry.update_rake_track(rake_id, 'track_1')
+        registry.move_many(rake_ids, 'track_0')
+
+    return _best_of(5, run)
+
+
+def rake_removal_time(size: int) -> float:
+    """Time OPERATIONS removals and re-registrations with size live rakes."""
+    registry = _rake_registry(size)
+    rakes = [registry.get_rake(f'R{i}') for i in range(OPERATIONS)]
+
+    def run() -> None:
+        for rake in rakes:
+            registry.remove_rake(rake.rake_id)
+        for rake in rakes:
+            registry.register_rake(rake)
+
+    return _best_of(5, run)
+
+
+SCALING_BENCHMARKS: dict[str, Callable[[int], float]] = {
+    'track_membership': track_membership_time,
+    'track_removal': track_removal_time,
+    'rake_move': rake_move_time,
+    'rake_removal': rake_removal_time,
+}
+"""Micro-benchmarks of ``popupsim bench --scaling`` by name."""
+
+
+def run_scaling_benchmarks(small: int = 500, large: int = 5000) -> list[ScalingResult]:
+    """Time every scaling benchmark at both sizes.
+
+    Parameters
+    ----------
+    small : int
+        Items in the small structure (at least OPERATIONS)
+    large : int
+        Items in the large structure
+
+    Returns
+    -------
+    list[ScalingResult]
+        One result per benchmark, in SCALING_BENCHMARKS order
+    """
+    return [
+        ScalingResult(name, small, large, measure(small), measure(large))
+        for name, measure in SCALING_BENCHMARKS.items()
+    ]
@@ -0,0 +1,200 @@
+"""Benchmark cases and their timed execution.
+
+A case loads a scenario directory, builds the simulation, runs it and exports
+all outputs, timing each phase separately. By default every repeat runs in a
+fresh interpreter, so peak RSS belongs to that case alone and no warm caches or
+imports carry over between cases.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import replace
+import logging
+import multiprocessing
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from benchmark.results import CaseResult
+
+_EXAMPLES_DIR = Path(__file__).resolve().parents[4] / 'Data' / 'examples'
+EXAMPLE_SCENARIOS = ('ten_trains_two_days_baseline', 'ten_trains_two_days_priority_dispatch')
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Scenario measured by the benchmark.
+
+    Either ``scenario_path`` points to an existing scenario directory or
+    ``ladder_preset`` names a SCALING_LADDER preset generated before the run.
+    """
+
+    name: str
+    scenario_path: Path | None = None
+    ladder_preset: str | None = None
+
+
+def benchmark_cases() -> dict[str, BenchmarkCase]:
+    """Get all benchmark cases by name (bundled examples, then the scaling ladder)."""
+    # pylint: disable-next=import-outside-toplevel
+    from contexts.configuration.infrastructure.scenario_generator import SCALING_LADDER
+
+    cases = [BenchmarkCase(name, scenario_path=_EXAMPLES_DIR / name) for name in EXAMPLE_SCENARIOS]
+    cases += [BenchmarkCase(f'ladder_{preset}', ladder_preset=preset) for preset in SCALING_LADDER]
+    return {case.name: case for case in cases}
+
+
+BENCHMARK_SUITES: dict[str, tuple[str, ...]] = {
+    'quick': (*EXAMPLE_SCENARIOS, 'ladder_10k'),
+    'examples': EXAMPLE_SCENARIOS,
+    'ladder': ('ladder_10k', 'ladder_100k', 'ladder_1m'),
+}
+"""Named case selections of ``popupsim bench --suite``."""
+
+
+def run_benchmark(
+    cases: list[BenchmarkCase],
+    repeats: int = 1,
+    isolate: bool = True,
+    progress: Callable[[str], None] | None = None,
+) -> list[CaseResult]:
+    """Measure cases, keeping the fastest repeat of each.
+
+    Parameters
+    ----------
+    cases : list[BenchmarkCase]
+        Cases to measure
+    repeats : int
+        Runs per case
+    isolate : bool
+        Run every repeat in a fresh interpreter (peak RSS is only meaningful then)
+    progress : Callable[[str], None] | None
+        Called with a status line before each case
+
+    Returns
+    -------
+    list[CaseResult]
+        One result per case, in order
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix='popupsim_bench_') as tmp:
+        work_dir = Path(tmp)
+        for case in cases:
+            if progress:
+                progress(f'{case.name} ({repeats}x)')
+            scenario_path = _prepare(case, work_dir)
+            measure = _run_isolated if isolate else run_case
+            runs = [measure(case.name, scenario_path, work_dir) for _ in range(max(repeats, 1))]
+            best = min(runs, key=lambda r: r.total_s)
+            results.append(replace(best, repeats=len(runs)))
+    return results
+
+
+def run_case(name: str, scenario_path: Path, work_dir: Path) -> CaseResult:
+    """Load, initialize, run and export one scenario, timing each phase.
+
+    Parameters
+    ----------
+    name : str
+        Case name stored in the result
+    scenario_path : Path
+        Scenario directory
+    work_dir : Path
+        Directory receiving the exported outputs (in a subdirectory)
+
+    Returns
+    -------
+    CaseResult
+        Phase times, SimPy event and wagon counts, and peak RSS of the process
+
+    Raises
+    ------
+    RuntimeError
+        If the simulation fails
+    """
+    # pylint: disable=import-outside-toplevel
+    from application.simulation_service import SimulationApplicationService
+    from contexts.configuration.domain.configuration_builder import ConfigurationBuilder
+    from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
+
+    output_dir = Path(tempfile.mkdtemp(prefix=f'{name}_', dir=work_dir))
+
+    started = time.perf_counter()
+    scenario = ConfigurationBuilder(scenario_path).build()
+    loaded = time.perf_counter()
+
+    service = SimulationApplicationService(scenario, output_dir)
+    marks: dict[str, float] = {}
+    service.engine.add_pre_run_hook(lambda: marks.setdefault('run_start', time.perf_counter()))
+    service.engine.add_post_run_hook(lambda: marks.setdefault('run_end', time.perf_counter()))
+    events = _count_events(service.engine.get_env())
+    result = service.execute(timedelta_to_sim_ticks(scenario.end_date - scenario.start_date))
+    if not result.success:
+        msg = f'Benchmark case {name} failed, see log output'
+        raise RuntimeError(msg)
+    service.contexts['retrofit_workflow'].export_events(str(output_dir))
+    exported = time.perf_counter()
+
+    return CaseResult(
+        case=name,
+        load_s=loaded - started,
+        initialize_s=marks['run_start'] - loaded,
+        run_s=marks['run_end'] - marks['run_start'],
+        export_s=exported - marks['run_end'],
+        events=events(),
+        wagons=service.contexts['external_trains'].get_metrics()['total_wagons'],
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def peak_rss_mb() -> float | None:
+    """Get peak resident set size of this process in MB (None where unsupported, e.g. Windows)."""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _prepare(case: BenchmarkCase, work_dir: Path) -> Path:
+    """Get scenario directory of case, generating ladder scenarios into work_dir."""
+    if case.scenario_path is not None:
+        return case.scenario_path
+    # pylint: disable=import-outside-toplevel
+    from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+    from contexts.configuration.infrastructure.scenario_generator import scaled_config
+
+    return generate_scenario(scaled_config(str(case.ladder_preset)), work_dir / case.name)
+
+
+def _run_isolated(name: str, scenario_path: Path, work_dir: Path) -> CaseResult:
+    """Run case in a fresh interpreter, silencing its log warnings."""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=context, initializer=logging.disable, initargs=(logging.WARNING,)
+    ) as pool:
+        return pool.submit(run_case, name, scenario_path, work_dir).result()
+
+
+def _count_events(env: object) -> Callable[[], int]:
+    """Count events processed by a SimPy environment.
+
+    Returns
+    -------
+    Callable[[], int]
+        Returns the number of events processed so far
+    """
+    count = 0
+    step = env.step  # type: ignore[attr-defined]
+
+    def counting_step() -> None:
+        nonlocal count
+        count += 1
+        step()
+
+    env.step = counting_step  # type: ignore[attr-defined]
+    return lambda: count
@@ -4,15 +4,21 @@ from pathlib import Path
 
 from contexts.configuration.domain.models.scenario import Scenario
 from contexts.configuration.infrastructure.file_loader import FileLoader
+from contexts.configuration.infrastructure.scenario_cache import ScenarioCache
 
 
 class ConfigurationBuilder:  # pylint: disable=too-few-public-methods
     """Loads scenario configuration from files."""
 
-    def __init__(self, path: Path | str) -> None:
-        """Initialize with scenario path."""
+    def __init__(self, path: Path | str, cache: ScenarioCache | None = None, stream_schedule: bool = False) -> None:
+        """Initialize with scenario path, optional compiled-scenario cache and lazy train schedule reading."""
         self._path = Path(path) if isinstance(path, str) else path
+        self._cache = cache
+        self._stream_schedule = stream_schedule
 
     def build(self) -> Scenario:
-        """Load and build scenario from file path."""
-        return FileLoader(self._path).load()
+        """Load and build scenario from file path (or from the cache if its inputs are unchanged)."""
+        loader = FileLoader(self._path, stream_schedule=self._stream_schedule)
+        if self._cache is None:
+            return loader.load()
+        return self._cache.load(self._path, loader.load, stream_schedule=self._stream_schedule)
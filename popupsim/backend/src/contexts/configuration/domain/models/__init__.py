@@ -3,11 +3,13 @@
 from shared.domain.value_objects.selection_strategy import SelectionStrategy
 
 from .process_times import ProcessTimes
+from .scenario import LocoAllocationStrategy
 from .scenario import LocoDeliveryStrategy
 from .scenario import LocoPriorityStrategy
 from .scenario import Scenario
 
 __all__ = [
+    'LocoAllocationStrategy',
     'LocoDeliveryStrategy',
     'LocoPriorityStrategy',
     'ProcessTimes',
@@ -32,6 +32,13 @@ class LocoDeliveryStrategy(StrEnum):
     DIRECT_DELIVERY = 'direct_delivery'
 
 
+class LocoAllocationStrategy(StrEnum):
+    """Strategy for picking an idle locomotive from the pool."""
+
+    FIFO = 'fifo'  # Locomotive released first
+    NEAREST = 'nearest'  # Locomotive with the shortest route to the task's source track
+
+
 class LocoPriorityStrategy(StrEnum):
     """Strategy for locomotive task prioritization."""
 
@@ -82,6 +89,7 @@ class Scenario(BaseModel):
     parking_idle_check_interval: float = 1.0
     loco_delivery_strategy: LocoDeliveryStrategy = LocoDeliveryStrategy.RETURN_TO_PARKING
     loco_priority_strategy: LocoPriorityStrategy = LocoPriorityStrategy.WORKSHOP_PRIORITY
+    loco_allocation_strategy: LocoAllocationStrategy = LocoAllocationStrategy.FIFO
     task_priorities: dict[str, TaskPriorityInputDTO] = Field(
         default_factory=dict,
         description='Priority configuration per task type with fill-level-dependent rules. '
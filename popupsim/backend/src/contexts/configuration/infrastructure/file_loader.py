@@ -14,20 +14,46 @@ from contexts.configuration.application.dtos.train_input_dto import TrainInputDT
 from contexts.configuration.application.dtos.wagon_input_dto import WagonInputDTO
 from contexts.configuration.application.dtos.workshop_input_dto import WorkshopInputDTO
 from contexts.configuration.domain.models.process_times import ProcessTimes
+from contexts.configuration.domain.models.scenario import LocoAllocationStrategy
 from contexts.configuration.domain.models.scenario import LocoDeliveryStrategy
 from contexts.configuration.domain.models.scenario import Scenario
 from contexts.configuration.domain.models.scenario import WorkflowMode
 from contexts.configuration.domain.models.topology import Topology
+from contexts.configuration.infrastructure.schedule_rows import DEFAULT_WAGON_LENGTH
+from contexts.configuration.infrastructure.schedule_rows import read_schedule
+from contexts.configuration.infrastructure.schedule_rows import text
+from contexts.configuration.infrastructure.schedule_rows import train_ids
+from contexts.configuration.infrastructure.schedule_rows import train_input
+from contexts.configuration.infrastructure.train_schedule_stream import TrainScheduleStream
 import pandas as pd
+from pydantic import TypeAdapter
 from shared.domain.value_objects.selection_strategy import SelectionStrategy
 
+_WAGON_LIST_ADAPTER = TypeAdapter(list[WagonInputDTO])
+
 
 class FileLoader:  # pylint: disable=too-few-public-methods
     """Load scenario from file system."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, strict_schedule: bool = False, stream_schedule: bool = False) -> None:
+        """Initialize loader.
+
+        Parameters
+        ----------
+        path : Path
+            Scenario directory or scenario.json file
+        strict_schedule : bool
+            Validate every train schedule row with WagonInputDTO (slow, reference behaviour)
+            instead of the vectorized loader
+        stream_schedule : bool
+            Leave a train schedule CSV on disk and set scenario.trains to a TrainScheduleStream
+            (the file must be sorted by arrival_time, which is checked while loading); trains given
+            in scenario.json are still loaded
+        """
         self.path = path if path.is_dir() else path.parent
         self.scenario_file = path if path.is_file() else path / 'scenario.json'
+        self.strict_schedule = strict_schedule
+        self.stream_schedule = stream_schedule
 
     def load(self) -> Scenario:  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
         """Load scenario from files."""
@@ -53,6 +79,7 @@ class FileLoader:  # pylint: disable=too-few-public-methods
             parking_critical_threshold=data.get('parking_critical_threshold', 0.8),
             parking_idle_check_interval=data.get('parking_idle_check_interval', 1.0),
             loco_delivery_strategy=data.get('loco_delivery_strategy') or LocoDeliveryStrategy.RETURN_TO_PARKING,
+            loco_allocation_strategy=data.get('loco_allocation_strategy') or LocoAllocationStrategy.FIFO,
             task_priorities=self._parse_task_priorities(data.get('task_priorities', {})),
         )
 
@@ -181,38 +208,15 @@ class FileLoader:  # pylint: disable=too-few-public-methods
         else:
             # Load from CSV file
             csv_file = self.path / data.get('train_schedule_file', refs.get('trains'))
-            # Detect delimiter by checking first line
-            with open(csv_file, encoding='utf-8') as f:
-                first_line = f.readline()
-                delimiter = ';' if ';' in first_line else ','
-
-            df = pd.read_csv(csv_file, sep=delimiter, parse_dates=['arrival_time'])
-            df['train_id'] = df['train_id'].fillna('NO_ID').astype(str)
-            train_dtos = []
-            for train_id, group in df.groupby('train_id'):
-                latest_arrival = group['arrival_time'].max()
-                first_row = group.iloc[0]
-                wagon_dtos = [
-                    WagonInputDTO(
-                        id=str(row.get('wagon_id', f'{train_id}_wagon_{i + 1}')),
-                        length=float(row.get('length', 10.0)),
-                        is_loaded=str(row.get('is_loaded', 'False')).lower() == 'true',
-                        needs_retrofit=str(row.get('needs_retrofit', 'True')).lower() == 'true',
-                        track=str(row.get('Track')) if pd.notna(row.get('Track')) else None,
-                    )
-                    for i, (_, row) in enumerate(group.iterrows())
-                ]
-                train_dtos.append(
-                    TrainInputDTO(
-                        train_id=str(train_id),
-                        arrival_time=latest_arrival.isoformat(),
-                        departure_time=latest_arrival.isoformat(),
-                        locomotive_id=str(first_row.get('locomotive_id', 'default_loco')),
-                        route_id=str(first_row.get('route_id', 'default_route')),
-                        wagons=wagon_dtos,
-                    )
-                )
-            scenario.trains = train_dtos
+            if self.stream_schedule:
+                # Reject unsorted schedules now rather than partway through the simulation
+                stream = TrainScheduleStream(csv_file)
+                stream.check_order()
+                scenario.trains = stream
+            elif self.strict_schedule:
+                scenario.trains = self._load_train_schedule_strict(csv_file)
+            else:
+                scenario.trains = self._load_train_schedule(csv_file)
 
         # Load topology and process times (if using references)
         if 'topology' in refs:
@@ -224,6 +228,93 @@ class FileLoader:  # pylint: disable=too-few-public-methods
 
         return scenario
 
+    @staticmethod
+    def _load_train_schedule_strict(csv_file: Path) -> list[TrainInputDTO]:
+        """Load trains from CSV, validating every wagon row with WagonInputDTO."""
+        df = read_schedule(csv_file)
+        df['train_id'] = train_ids(df)
+        return [train_input(str(train_id), group.to_dict('records')) for train_id, group in df.groupby('train_id')]
+
+    @classmethod
+    def _load_train_schedule(cls, csv_file: Path) -> list[TrainInputDTO]:  # pylint: disable=too-many-locals
+        """Load trains from CSV with column-wise parsing and validation.
+
+        Columns are parsed and checked as arrays. Rows passing the array-level checks
+        (non-empty ID, positive length) are validated in one bulk pydantic-core call.
+        Other rows are validated one by one like in the strict loader, so they raise
+        the same errors. Cells are converted to text like in the strict loader
+        (see schedule_rows).
+        """
+        df = read_schedule(csv_file)
+        df['train_id'] = train_ids(df)
+        if 'wagon_id' in df:
+            ids = cls._text_column(df, 'wagon_id')
+        else:
+            ids = (df['train_id'] + '_wagon_' + (df.groupby('train_id').cumcount() + 1).astype(str)).tolist()
+        raw_lengths = df['length'] if 'length' in df else pd.Series(DEFAULT_WAGON_LENGTH, index=df.index)
+        lengths = pd.to_numeric(raw_lengths, errors='coerce')
+        valid = [bool(wagon_id) and length > 0 for wagon_id, length in zip(ids, lengths.tolist(), strict=True)]
+
+        n_rows = len(df)
+        length_values = lengths.tolist()
+        is_loaded = cls._bool_column(df, 'is_loaded', default=False)
+        needs_retrofit = cls._bool_column(df, 'needs_retrofit', default=True)
+        tracks = cls._text_column(df, 'Track', missing=None) if 'Track' in df else None
+        rows = [
+            {
+                'id': ids[i],
+                'length': length_values[i],
+                'is_loaded': is_loaded[i],
+                'needs_retrofit': needs_retrofit[i],
+                'track': tracks[i] if tracks is not None else None,
+            }
+            for i in range(n_rows)
+        ]
+        wagon_dtos = _WAGON_LIST_ADAPTER.validate_python([row for row, ok in zip(rows, valid, strict=True) if ok])
+        wagon_by_row: list[WagonInputDTO | None] = [None] * n_rows
+        for i, wagon in zip((i for i in range(n_rows) if valid[i]), wagon_dtos, strict=True):
+            wagon_by_row[i] = wagon
+
+        raw_length_values = raw_lengths.tolist()
+        locomotive_ids = cls._text_column(df, 'locomotive_id') if 'locomotive_id' in df else None
+        route_ids = cls._text_column(df, 'route_id') if 'route_id' in df else None
+        latest_arrivals = df.groupby('train_id')['arrival_time'].max().to_dict()
+
+        train_dtos = []
+        for train_id, positions in df.groupby('train_id').indices.items():
+            wagons = []
+            for i in positions:
+                wagon = wagon_by_row[i]
+                if wagon is None:
+                    # Invalid row: validate like the strict loader to raise its error
+                    wagon = WagonInputDTO(**{**rows[i], 'length': float(raw_length_values[i])})
+                wagons.append(wagon)
+            first = positions[0]
+            latest_arrival = latest_arrivals[train_id]
+            train_dtos.append(
+                TrainInputDTO(
+                    train_id=str(train_id),
+                    arrival_time=latest_arrival.isoformat(),
+                    departure_time=latest_arrival.isoformat(),
+                    locomotive_id=locomotive_ids[first] if locomotive_ids is not None else 'default_loco',
+                    route_id=route_ids[first] if route_ids is not None else 'default_route',
+                    wagons=wagons,
+                )
+            )
+        return train_dtos
+
+    @staticmethod
+    def _text_column(df: pd.DataFrame, column: str, missing: str | None = 'nan') -> list[str | None]:
+        """Convert column cells to text like the strict loader, missing cells to missing."""
+        return [text(value, missing) for value in df[column].tolist()]
+
+    @staticmethod
+    def _bool_column(df: pd.DataFrame, column: str, default: bool) -> list[bool]:
+        """Parse column as booleans like schedule_rows.flag, default if missing."""
+        if column not in df:
+            return [default] * len(df)
+        return df[column].astype(str).str.lower().eq('true').tolist()
+
     @staticmethod
     def _parse_task_priorities(raw: dict) -> dict[str, TaskPriorityInputDTO]:
         """Parse task_priorities from JSON into DTOs.
@@ -0,0 +1,186 @@
+"""Content-hashed cache of compiled (loaded and validated) scenarios."""
+
+from collections.abc import Callable
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import pickle  # nosec B403 - cache files are written and read by the local user only
+import sys
+import tempfile
+
+from contexts.configuration.domain.models.scenario import Scenario
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR_ENV = 'POPUPSIM_CACHE_DIR'
+DEFAULT_MAX_ENTRIES = 32
+
+# Code whose changes invalidate cached scenarios: the configuration package
+# (models, DTOs, loaders) and the shared package of value objects in the pickles
+_SRC_DIR = Path(__file__).resolve().parents[3]
+_LOADER_PACKAGES = (_SRC_DIR / 'contexts' / 'configuration', _SRC_DIR / 'shared')
+
+
+class ScenarioCache:
+    """Pickled scenarios under a cache directory, keyed by a hash of their inputs.
+
+    The key covers the bytes of scenario.json and every file it references,
+    the loader options, the configuration package source and the Python and
+    pydantic versions, so editing any input or upgrading the loader invalidates
+    entries automatically. Unreadable entries are rebuilt, scenarios whose
+    inputs cannot be hashed (e.g. malformed scenario.json) are built uncached.
+    Entries are evicted least recently used first once more than max_entries
+    are stored (a hit counts as use).
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        cache_dir : Path | None
+            Cache directory, default from POPUPSIM_CACHE_DIR or ~/.cache/popupsim/scenarios
+        max_entries : int
+            Entries kept in the cache directory, least recently used are deleted beyond it
+        """
+        self.cache_dir = cache_dir or self.default_dir()
+        self.max_entries = max_entries
+
+    @staticmethod
+    def default_dir() -> Path:
+        """Get default cache directory."""
+        configured = os.environ.get(CACHE_DIR_ENV)
+        if configured:
+            return Path(configured)
+        return Path.home() / '.cache' / 'popupsim' / 'scenarios'
+
+    def load(self, scenario_path: Path, build: Callable[[], Scenario], **options: object) -> Scenario:
+        """Get cached scenario, building and storing it on a miss.
+
+        Parameters
+        ----------
+        scenario_path : Path
+            Scenario directory or scenario.json file
+        build : Callable[[], Scenario]
+            Builds the scenario from its files
+        **options : object
+            Loader options that change the result (part of the key)
+
+        Returns
+        -------
+        Scenario
+            Cached or freshly built scenario
+        """
+        try:
+            key = self.key(scenario_path, **options)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Malformed scenario.json: the build reports the error as it would without the cache
+            logger.debug('Not caching scenario %s, its inputs cannot be hashed', scenario_path, exc_info=True)
+            return build()
+        entry = self.cache_dir / f'{key}.pkl'
+        if entry.is_file():
+            try:
+                with entry.open('rb') as f:
+                    scenario: Scenario = pickle.load(f)  # nosec B301  # noqa: S301
+                with contextlib.suppress(OSError):
+                    entry.touch()  # Mark as recently used
+                return scenario
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning('Ignoring unreadable scenario cache entry %s', entry, exc_info=True)
+
+        scenario = build()
+        self._store(entry, scenario)
+        self._evict()
+        return scenario
+
+    def key(self, scenario_path: Path, **options: object) -> str:
+        """Get cache key of scenario.
+
+        Parameters
+        ----------
+        scenario_path : Path
+            Scenario directory or scenario.json file
+        **options : object
+            Loader options that change the result
+
+        Returns
+        -------
+        str
+            Hex digest over all inputs of the scenario
+        """
+        base = scenario_path if scenario_path.is_dir() else scenario_path.parent
+        scenario_file = scenario_path if scenario_path.is_file() else scenario_path / 'scenario.json'
+
+        digest = hashlib.sha256()
+        digest.update(f'{CACHE_FORMAT_VERSION}|{sys.version}|{pydantic.VERSION}|{sorted(options.items())}'.encode())
+        digest.update(_loader_fingerprint())
+        for path in [scenario_file, *self._referenced_files(base, scenario_file)]:
+            digest.update(str(path.relative_to(base) if path.is_relative_to(base) else path).encode())
+            digest.update(path.read_bytes() if path.is_file() else b'<missing>')
+        return digest.hexdigest()
+
+    def clear(self) -> int:
+        """Delete all cache entries.
+
+        Returns
+        -------
+        int
+            Number of deleted entries
+        """
+        entries = list(self.cache_dir.glob('*.pkl')) if self.cache_dir.is_dir() else []
+        for entry in entries:
+            entry.unlink(missing_ok=True)
+        return len(entries)
+
+    @staticmethod
+    def _referenced_files(base: Path, scenario_file: Path) -> list[Path]:
+        """Get files referenced by scenario.json (references and train schedule)."""
+        with scenario_file.open(encoding='utf-8') as f:
+            data = json.load(f)
+        names = list((data.get('references') or {}).values())
+        if data.get('train_schedule_file'):
+            names.append(data['train_schedule_file'])
+        return [base / name for name in sorted(set(names))]
+
+    def _store(self, entry: Path, scenario: Scenario) -> None:
+        """Write entry atomically, logging instead of failing when the cache is not writable."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(scenario, f, protocol=pickle.HIGHEST_PROTOCOL)
+                Path(tmp_name).replace(entry)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(tmp_name).unlink()
+                raise
+        except (OSError, pickle.PicklingError):
+            logger.warning('Could not write scenario cache entry %s', entry, exc_info=True)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries beyond max_entries."""
+        try:
+            entries = sorted(self.cache_dir.glob('*.pkl'), key=lambda entry: entry.stat().st_mtime, reverse=True)
+        except OSError:
+            return  # Directory missing or an entry deleted concurrently, evict on the next store
+        for entry in entries[self.max_entries :]:
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+
+@functools.cache
+def _loader_fingerprint() -> bytes:
+    """Hash the source of the configuration and shared packages."""
+    digest = hashlib.sha256()
+    for package in _LOADER_PACKAGES:
+        for source in sorted(package.rglob('*.py')):
+            digest.update(str(source.relative_to(_SRC_DIR)).encode())
+            digest.update(source.read_bytes())
+    return digest.digest()
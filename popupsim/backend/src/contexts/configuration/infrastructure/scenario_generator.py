@@ -0,0 +1,344 @@
+"""Seeded generator for large synthetic scenario directories.
+
+Generated directories use the same file layout as ``Data/examples`` and load
+with :class:`FileLoader`. Every location (loco parking, collection, retrofit,
+workshop, retrofitted and parking tracks) is connected to every other by a
+route, so the workflow never misses one regardless of the track counts.
+Track lengths are sized from the wagon volume: collection tracks buffer four
+trains, retrofit and retrofitted tracks two and parking holds every wagon.
+"""
+
+from collections.abc import Iterator
+import csv
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import replace
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from enum import StrEnum
+import itertools
+import json
+import math
+from pathlib import Path
+import random
+
+MAX_WAGON_LENGTH = 25.0
+"""Upper bound of generated wagon lengths in meters (lower bound is 12 m)."""
+
+_FILL_FACTOR = 0.75
+_MAINLINE = 'Mainline'
+_LOCO_PARKING = 'loco_parking'
+
+
+class ArrivalPattern(StrEnum):
+    """Distribution of train arrivals over the arrival window."""
+
+    UNIFORM = 'uniform'  # Evenly spaced
+    POISSON = 'poisson'  # Exponential gaps (random but steady load)
+    PEAKS = 'peaks'  # Morning and evening waves every day
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:  # pylint: disable=too-many-instance-attributes
+    """Parameters of a synthetic scenario.
+
+    Arrivals are spread over the first ``arrival_share`` of the simulated days
+    so that the remaining time drains the yard.
+    """
+
+    trains: int = 10
+    wagons_per_train: int = 20
+    collection_tracks: int = 2
+    retrofit_tracks: int = 1
+    retrofitted_tracks: int = 1
+    parking_tracks: int = 8
+    workshops: int = 2
+    bays_per_workshop: int = 4
+    locomotives: int = 2
+    arrival_pattern: ArrivalPattern = ArrivalPattern.UNIFORM
+    days: int = 2
+    arrival_share: float = 0.8
+    seed: int = 42
+    loaded_share: float = 0.0
+    needs_retrofit_share: float = 1.0
+    retrofit_minutes: float = 60.0
+    shunting_minutes: float = 5.0
+    mainline_minutes: float = 60.0
+    start_date: datetime = datetime(2025, 12, 1, tzinfo=UTC)
+
+    def __post_init__(self) -> None:
+        """Validate parameters.
+
+        Raises
+        ------
+        ValueError
+            If a count is not positive or a share is outside [0, 1]
+        """
+        counts = (
+            'trains',
+            'wagons_per_train',
+            'collection_tracks',
+            'retrofit_tracks',
+            'retrofitted_tracks',
+            'parking_tracks',
+            'workshops',
+            'bays_per_workshop',
+            'locomotives',
+            'days',
+        )
+        for name in counts:
+            if getattr(self, name) < 1:
+                raise ValueError(f'{name} must be at least 1, got {getattr(self, name)}')
+        for name in ('arrival_share', 'loaded_share', 'needs_retrofit_share'):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f'{name} must be between 0 and 1, got {getattr(self, name)}')
+        if self.arrival_share == 0.0:
+            raise ValueError('arrival_share must be greater than 0')
+
+    @property
+    def total_wagons(self) -> int:
+        """Get number of generated wagons."""
+        return self.trains * self.wagons_per_train
+
+
+_LADDER_YARD = {
+    'collection_tracks': 8,
+    'retrofit_tracks': 4,
+    'retrofitted_tracks': 4,
+    'parking_tracks': 40,
+    'workshops': 12,
+    'bays_per_workshop': 4,
+    'locomotives': 24,
+}
+
+SCALING_LADDER: dict[str, GeneratorConfig] = {
+    '10k': GeneratorConfig(
+        trains=200, wagons_per_train=50, days=15, arrival_pattern=ArrivalPattern.POISSON, **_LADDER_YARD
+    ),
+    '100k': GeneratorConfig(
+        trains=2_000, wagons_per_train=50, days=150, arrival_pattern=ArrivalPattern.POISSON, **_LADDER_YARD
+    ),
+    '1m': GeneratorConfig(
+        trains=20_000, wagons_per_train=50, days=1_500, arrival_pattern=ArrivalPattern.POISSON, **_LADDER_YARD
+    ),
+}
+"""Reproducible 10k/100k/1M-wagon presets for scaling benchmarks.
+
+All rungs share one yard and arrival rate and differ in the simulated horizon,
+so cost per wagon can be compared across rungs.
+"""
+
+
+def generate_scenario(config: GeneratorConfig, output_dir: Path, scenario_id: str | None = None) -> Path:
+    """Write scenario directory for config.
+
+    Parameters
+    ----------
+    config : GeneratorConfig
+        Scenario parameters (same config and seed give identical files)
+    output_dir : Path
+        Target directory, created if missing; existing scenario files are overwritten
+    scenario_id : str | None
+        Scenario ID, default derived from the wagon count and seed
+
+    Returns
+    -------
+    Path
+        Path of the written scenario.json
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(config.seed)  # noqa: S311  # nosec B311 - reproducible test data, not security
+    layout = _Layout(config)
+
+    _write_json(output_dir / 'tracks.json', {'tracks': layout.tracks()})
+    _write_json(output_dir / 'topology.json', {'nodes': [1, 2], 'edges': layout.edges()})
+    _write_json(output_dir / 'routes.json', {'routes': layout.routes()})
+    _write_json(output_dir / 'workshops.json', {'workshops': layout.workshops()})
+    _write_json(output_dir / 'locomotive.json', {'locomotives': layout.locomotives()})
+    _write_json(
+        output_dir / 'process_times.json',
+        {
+            'wagon_retrofit_time': config.retrofit_minutes,
+            'train_to_hump_delay': 0.0,
+            'wagon_hump_interval': 0.0,
+            'screw_coupling_time': 2.0,
+            'screw_decoupling_time': 3.0,
+            'dac_coupling_time': 0.5,
+            'dac_decoupling_time': 0.5,
+        },
+    )
+    _write_schedule(output_dir / 'train_schedule.csv', config, rng)
+
+    scenario_file = output_dir / 'scenario.json'
+    _write_json(
+        scenario_file,
+        {
+            'id': scenario_id or f'synthetic_{config.total_wagons}_wagons_seed_{config.seed}',
+            'description': (
+                f'Synthetic scenario: {config.trains} trains x {config.wagons_per_train} wagons, '
+                f'{config.workshops} workshops x {config.bays_per_workshop} bays, {config.locomotives} locomotives, '
+                f'{config.arrival_pattern} arrivals'
+            ),
+            'version': '1.0.0',
+            'start_date': config.start_date.isoformat(),
+            'end_date': (config.start_date + timedelta(days=config.days)).isoformat(),
+            'collection_track_strategy': 'least_occupied',
+            'retrofit_selection_strategy': 'least_occupied',
+            'retrofitted_selection_strategy': 'least_occupied',
+            'workshop_selection_strategy': 'least_occupied',
+            'parking_selection_strategy': 'least_occupied',
+            'generator': {**asdict(config), 'start_date': config.start_date.isoformat()},
+            'references': {
+                'locomotives': 'locomotive.json',
+                'process_times': 'process_times.json',
+                'routes': 'routes.json',
+                'trains': 'train_schedule.csv',
+                'topology': 'topology.json',
+                'tracks': 'tracks.json',
+                'workshops': 'workshops.json',
+            },
+        },
+    )
+    return scenario_file
+
+
+def scaled_config(preset: str, **overrides: object) -> GeneratorConfig:
+    """Get ladder preset with some parameters replaced.
+
+    Raises
+    ------
+    ValueError
+        If the preset is unknown
+    """
+    if preset not in SCALING_LADDER:
+        raise ValueError(f'Unknown preset {preset!r}, expected one of {", ".join(SCALING_LADDER)}')
+    return replace(SCALING_LADDER[preset], **overrides)  # type: ignore[arg-type]
+
+
+class _Layout:
+    """Track IDs, lengths and connections of a generated yard."""
+
+    def __init__(self, config: GeneratorConfig) -> None:
+        self.config = config
+        train_length = config.wagons_per_train * MAX_WAGON_LENGTH / _FILL_FACTOR
+        parking_total = config.total_wagons * MAX_WAGON_LENGTH / _FILL_FACTOR
+        bays_length = config.bays_per_workshop * MAX_WAGON_LENGTH / _FILL_FACTOR
+
+        self.collection = _numbered('collection', config.collection_tracks)
+        self.retrofit = _numbered('retrofit', config.retrofit_tracks)
+        self.workshop = _numbered('WS', config.workshops)
+        self.retrofitted = _numbered('retrofitted', config.retrofitted_tracks)
+        self.parking = _numbered('parking', config.parking_tracks)
+        self.lengths = {
+            _LOCO_PARKING: _round_up(config.locomotives * 25.0 / _FILL_FACTOR),
+            **dict.fromkeys(self.collection, _round_up(4 * train_length)),
+            **dict.fromkeys(self.retrofit, _round_up(2 * train_length)),
+            **dict.fromkeys(self.workshop, _round_up(bays_length)),
+            **dict.fromkeys(self.retrofitted, _round_up(2 * train_length)),
+            **dict.fromkeys(self.parking, _round_up(parking_total / config.parking_tracks)),
+            _MAINLINE: 8000.0,
+        }
+        self.types = {
+            _LOCO_PARKING: 'locoparking',
+            **dict.fromkeys(self.collection, 'collection'),
+            **dict.fromkeys(self.retrofit, 'retrofit'),
+            **dict.fromkeys(self.workshop, 'workshop'),
+            **dict.fromkeys(self.retrofitted, 'retrofitted'),
+            **dict.fromkeys(self.parking, 'parking'),
+            _MAINLINE: 'mainline',
+        }
+
+    def tracks(self) -> list[dict]:
+        """Get tracks.json entries."""
+        return [{'id': track, 'edges': [track], 'type': track_type} for track, track_type in self.types.items()]
+
+    def edges(self) -> dict[str, dict]:
+        """Get topology edges (one edge per track)."""
+        return {track: {'nodes': [1, 2], 'length': length} for track, length in self.lengths.items()}
+
+    def routes(self) -> list[dict]:
+        """Get routes between all pairs of locations (collection tracks are reached via the mainline)."""
+        locations = [track for track in self.types if track != _MAINLINE]
+        routes = []
+        for origin, destination in itertools.permutations(locations, 2):
+            if origin in self.collection or destination in self.collection:
+                path, duration = [origin, _MAINLINE, destination], self.config.mainline_minutes
+            else:
+                path, duration = [origin, destination], self.config.shunting_minutes
+            routes.append({'id': f'{origin}_{destination}', 'duration': duration, 'path': path})
+        return routes
+
+    def workshops(self) -> list[dict]:
+        """Get workshops (each on the track of the same ID)."""
+        return [
+            {'id': workshop, 'track': workshop, 'retrofit_stations': self.config.bays_per_workshop}
+            for workshop in self.workshop
+        ]
+
+    def locomotives(self) -> list[dict]:
+        """Get locomotives parked on the loco parking track."""
+        return [{'id': loco_id, 'home track': _LOCO_PARKING} for loco_id in _numbered('LOCO_', self.config.locomotives)]
+
+
+def _write_schedule(filepath: Path, config: GeneratorConfig, rng: random.Random) -> None:
+    """Write train schedule CSV in the example format, row by row."""
+    train_width = len(str(config.trains))
+    wagon_width = len(str(config.total_wagons))
+    wagon_number = itertools.count(1)
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(['train_id', 'wagon_id', 'arrival_time', 'length', 'is_loaded', 'needs_retrofit', 'Track'])
+        for index, arrival in enumerate(_arrival_times(config, rng), start=1):
+            train_id = f'T{index:0{train_width}d}'
+            arrival_time = arrival.isoformat()
+            for _ in range(config.wagons_per_train):
+                writer.writerow(
+                    [
+                        train_id,
+                        f'W{next(wagon_number):0{wagon_width}d}',
+                        arrival_time,
+                        round(rng.uniform(12.0, MAX_WAGON_LENGTH), 1),
+                        rng.random() < config.loaded_share,
+                        rng.random() < config.needs_retrofit_share,
+                        'collection',
+                    ]
+                )
+
+
+def _arrival_times(config: GeneratorConfig, rng: random.Random) -> Iterator[datetime]:
+    """Get sorted train arrival times (whole seconds) within the arrival window."""
+    window = config.days * 86400.0 * config.arrival_share
+    if config.arrival_pattern is ArrivalPattern.UNIFORM:
+        offsets = [window * i / config.trains for i in range(config.trains)]
+    elif config.arrival_pattern is ArrivalPattern.POISSON:
+        gaps = [rng.expovariate(1.0) for _ in range(config.trains + 1)]
+        scale = window / sum(gaps)
+        offsets = list(itertools.accumulate(gap * scale for gap in gaps[:-1]))
+    else:
+        day_count = math.ceil(window / 86400.0)
+        offsets = []
+        for _ in range(config.trains):
+            peak_hour = rng.choice((7.0, 17.0))
+            hour = min(max(rng.gauss(peak_hour, 1.5), 0.0), 23.99)
+            offsets.append(min(rng.randrange(day_count) * 86400.0 + hour * 3600.0, window))
+        offsets.sort()
+    for offset in offsets:
+        yield config.start_date + timedelta(seconds=round(offset))
+
+
+def _numbered(prefix: str, count: int) -> list[str]:
+    """Get IDs prefix1..prefixN (zero-padded for N >= 10 so they sort naturally)."""
+    width = len(str(count)) if count >= 10 else 1
+    return [f'{prefix}{i:0{width}d}' for i in range(1, count + 1)]
+
+
+def _round_up(length: float) -> float:
+    """Round track length up to whole 10 m."""
+    return float(math.ceil(length / 10.0) * 10)
+
+
+def _write_json(filepath: Path, payload: object) -> None:
+    """Write indented JSON."""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
@@ -0,0 +1,84 @@
+"""Coercion of train schedule CSV rows to train and wagon input DTOs.
+
+Shared by the FileLoader and TrainScheduleStream, so a schedule loads the same
+whether it is read at once or in chunks. Cells are converted to text with
+str() as pandas parsed them, so blank IDs become 'nan' and numeric IDs in a
+column with gaps '12.0'.
+"""
+
+from collections.abc import Mapping
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from contexts.configuration.application.dtos.train_input_dto import TrainInputDTO
+from contexts.configuration.application.dtos.wagon_input_dto import WagonInputDTO
+import pandas as pd
+
+MISSING_TRAIN_ID = 'NO_ID'
+DEFAULT_WAGON_LENGTH = 10.0
+
+
+def read_schedule(csv_file: Path, **options: Any) -> Any:
+    """Read schedule CSV (';' or ',' separated) with parsed arrival_time.
+
+    Parameters
+    ----------
+    csv_file : Path
+        Train schedule CSV
+    **options : Any
+        Further pandas.read_csv options, e.g. chunksize or usecols
+
+    Returns
+    -------
+    Any
+        DataFrame, or reader of DataFrame chunks if chunksize is given
+    """
+    with open(csv_file, encoding='utf-8') as f:
+        separator = ';' if ';' in f.readline() else ','
+    return pd.read_csv(csv_file, sep=separator, parse_dates=['arrival_time'], **options)
+
+
+def train_ids(df: pd.DataFrame) -> pd.Series:
+    """Get train_id column as text, rows without ID as MISSING_TRAIN_ID."""
+    return df['train_id'].fillna(MISSING_TRAIN_ID).astype(str)
+
+
+def text(value: object, missing: str | None = 'nan') -> str | None:
+    """Convert cell to text, missing cells to missing."""
+    return str(value) if pd.notna(value) else missing
+
+
+def flag(row: Mapping[str, Any], column: str, default: bool) -> bool:
+    """Parse boolean cell ('true' in any case is True, anything else False), default if the column is missing."""
+    return str(row.get(column, default)).lower() == 'true'
+
+
+def wagon_input(row: Mapping[str, Any], train_id: str, position: int) -> WagonInputDTO:
+    """Build wagon DTO from schedule row at position (0-based) within its train."""
+    return WagonInputDTO(
+        id=text(row['wagon_id']) if 'wagon_id' in row else f'{train_id}_wagon_{position + 1}',
+        length=float(row.get('length', DEFAULT_WAGON_LENGTH)),
+        is_loaded=flag(row, 'is_loaded', default=False),
+        needs_retrofit=flag(row, 'needs_retrofit', default=True),
+        track=text(row.get('Track'), missing=None),
+    )
+
+
+def latest_arrival(rows: Sequence[Mapping[str, Any]]) -> pd.Timestamp:
+    """Get latest arrival_time of rows, skipping blank cells like DataFrame.max (NaT if all are blank)."""
+    return max((row['arrival_time'] for row in rows if pd.notna(row['arrival_time'])), default=pd.NaT)
+
+
+def train_input(train_id: str, rows: Sequence[Mapping[str, Any]]) -> TrainInputDTO:
+    """Build train DTO from its schedule rows in file order, arriving at their latest arrival_time."""
+    first = rows[0]
+    arrival = latest_arrival(rows).isoformat()
+    return TrainInputDTO(
+        train_id=train_id,
+        arrival_time=arrival,
+        departure_time=arrival,
+        locomotive_id=str(first.get('locomotive_id', 'default_loco')),
+        route_id=str(first.get('route_id', 'default_route')),
+        wagons=[wagon_input(row, train_id, i) for i, row in enumerate(rows)],
+    )
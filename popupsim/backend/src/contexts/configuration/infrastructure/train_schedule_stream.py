@@ -0,0 +1,110 @@
+"""Streaming reader for time-sorted train schedule CSV files."""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from contexts.configuration.application.dtos.train_input_dto import TrainInputDTO
+from contexts.configuration.infrastructure.schedule_rows import latest_arrival
+from contexts.configuration.infrastructure.schedule_rows import read_schedule
+from contexts.configuration.infrastructure.schedule_rows import train_ids
+from contexts.configuration.infrastructure.schedule_rows import train_input
+
+
+class TrainScheduleStream:  # pylint: disable=too-few-public-methods
+    """Trains of a schedule CSV, read chunk by chunk in file order.
+
+    Only the current chunk and the train being assembled are held in memory, so
+    the schedule can be longer than what fits as a list of DTOs. The file must
+    list the rows of each train consecutively and the trains sorted by
+    arrival_time; ``check_order`` verifies this before the simulation starts
+    (``FileLoader`` calls it). Rows are converted to DTOs like in ``FileLoader``
+    (see schedule_rows).
+    """
+
+    def __init__(self, csv_file: Path, chunk_size: int = 10_000) -> None:
+        """Initialize stream.
+
+        Parameters
+        ----------
+        csv_file : Path
+            Train schedule CSV (';' or ',' separated)
+        chunk_size : int
+            Rows read from the file at a time
+        """
+        self.csv_file = csv_file
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[TrainInputDTO]:
+        """Iterate trains in arrival order.
+
+        Raises
+        ------
+        ValueError
+            If the rows of a train are not consecutive or trains are not sorted by arrival_time
+        """
+        seen: set[str] = set()
+        previous: tuple[str, datetime] | None = None
+        rows: list[dict[str, Any]] = []
+        for row in self._rows():
+            if rows and row['train_id'] != rows[0]['train_id']:
+                train = train_input(rows[0]['train_id'], rows)
+                previous = self._checked(train.train_id, _arrival(train), previous, seen)
+                yield train
+                rows = []
+            rows.append(row)
+        if rows:
+            train = train_input(rows[0]['train_id'], rows)
+            self._checked(train.train_id, _arrival(train), previous, seen)
+            yield train
+
+    def check_order(self) -> None:
+        """Check the whole file lists trains consecutively and sorted by arrival_time.
+
+        Only the train_id and arrival_time columns are read, chunk by chunk.
+
+        Raises
+        ------
+        ValueError
+            If the rows of a train are not consecutive or trains are not sorted by arrival_time
+        """
+        seen: set[str] = set()
+        previous: tuple[str, datetime] | None = None
+        train_id: str | None = None
+        arrivals: list[dict[str, Any]] = []
+        for row in self._rows(usecols=['train_id', 'arrival_time']):
+            if row['train_id'] != train_id:
+                if train_id is not None:
+                    previous = self._checked(train_id, latest_arrival(arrivals), previous, seen)
+                train_id, arrivals = row['train_id'], []
+            arrivals.append(row)
+        if train_id is not None:
+            self._checked(train_id, latest_arrival(arrivals), previous, seen)
+
+    def _rows(self, **options: Any) -> Iterator[dict[str, Any]]:
+        """Iterate schedule rows as dicts, reading the file in chunks."""
+        for chunk in read_schedule(self.csv_file, chunksize=self.chunk_size, **options):
+            chunk['train_id'] = train_ids(chunk)
+            yield from chunk.to_dict('records')
+
+    def _checked(
+        self, train_id: str, arrival: datetime, previous: tuple[str, datetime] | None, seen: set[str]
+    ) -> tuple[str, datetime]:
+        """Check train continues the schedule in order and return it as the previous train of the next."""
+        if train_id in seen:
+            msg = f'{self.csv_file.name}: rows of train {train_id} are not consecutive'
+            raise ValueError(msg)
+        if previous is not None and arrival < previous[1]:
+            msg = (
+                f'{self.csv_file.name} is not sorted by arrival_time: train {train_id} '
+                f'({arrival.isoformat()}) is listed after train {previous[0]} ({previous[1].isoformat()})'
+            )
+            raise ValueError(msg)
+        seen.add(train_id)
+        return train_id, arrival
+
+
+def _arrival(train: TrainInputDTO) -> datetime:
+    """Get arrival time of train as datetime."""
+    return datetime.fromisoformat(str(train.arrival_time))
@@ -7,6 +7,8 @@ Notes
     which time are provided.
 """
 
+from collections.abc import Iterable
+from collections.abc import Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
@@ -49,15 +51,28 @@ class ExternalTrainsContext(ExternalTrainsContextPort):
         # Don't reset scenario - it's set before initialization
 
     def start_processes(self) -> None:
-        """Start train arrival processes."""
+        """Start train arrival processes.
+
+        A list of trains is scheduled up front, one process per train. Any other
+        iterable (e.g. a TrainScheduleStream) is consumed lazily by a single
+        process, so only the next arrival is pending in the event queue.
+        """
         if self.infra and self.scenario:
-            # Schedule each train as a separate process to avoid generator stopping mid-execution
-            for train in self.scenario.trains:
-                self.infra.engine.schedule_process(self._process_single_train_arrival(train))
+            if isinstance(self.scenario.trains, Sequence):
+                # Schedule each train as a separate process to avoid generator stopping mid-execution
+                for train in self.scenario.trains:
+                    self.infra.engine.schedule_process(self._process_single_train_arrival(train))
+            else:
+                self.infra.engine.schedule_process(self._process_train_stream(self.scenario.trains))
 
         # Subscribe to completion events to update wagon state
         self.event_bus.subscribe(WagonRetrofitCompletedEvent, self._handle_wagon_completed)  # type: ignore[arg-type]
 
+    def _process_train_stream(self, trains: Iterable[Any]) -> Any:
+        """Process trains in arrival order, reading the next one after the previous arrived."""
+        for train in trains:
+            yield from self._process_single_train_arrival(train)
+
     def _process_single_train_arrival(self, train: Any) -> Any:
         """Process a single train arrival."""
         # Wait for train arrival time
@@ -66,7 +81,10 @@ class ExternalTrainsContext(ExternalTrainsContextPort):
             if isinstance(train.arrival_time, datetime)
             else datetime.fromisoformat(train.arrival_time)
         )
-        arrival_delay = datetime_to_ticks(arrival_time, self.scenario.start_date)  # type: ignore[attr-defined]
+        arrival_delay = (
+            datetime_to_ticks(arrival_time, self.scenario.start_date)  # type: ignore[attr-defined]
+            - self.infra.engine.current_time()  # type: ignore[union-attr]
+        )
 
         if arrival_delay > 0:
             yield from self.infra.engine.delay(arrival_delay)  # type: ignore[union-attr]
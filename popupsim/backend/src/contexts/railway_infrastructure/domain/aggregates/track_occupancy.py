@@ -1,5 +1,6 @@
 """Track occupancy aggregate root with wagon queue management."""
 
+import bisect
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
@@ -7,6 +8,7 @@ from uuid import UUID
 
 from contexts.railway_infrastructure.domain.entities.track import Track
 from contexts.railway_infrastructure.domain.entities.track import TrackAccess
+from contexts.railway_infrastructure.domain.value_objects.occupancy_history import OccupancyHistory
 from contexts.railway_infrastructure.domain.value_objects.occupancy_snapshot import OccupancySnapshot
 from contexts.railway_infrastructure.domain.value_objects.track_occupant import OccupantType
 from contexts.railway_infrastructure.domain.value_objects.track_occupant import TrackOccupant
@@ -18,17 +20,30 @@ class TrackOccupancy:
     """Aggregate root managing occupancy state and wagon queue for a single track.
 
     Combines position-aware occupancy management with wagon sequence tracking.
+
+    Occupants are non-overlapping intervals kept sorted by position, so they are
+    sorted by end as well: placement and collision checks only look at the
+    neighbours found by bisect. Occupied meters and wagon count are running totals.
+    Occupant IDs are unique per track.
     """
 
     track_id: UUID | str
     track_specification: Track
     _occupants: list[TrackOccupant] = field(default_factory=list)
-    _occupancy_history: list[OccupancySnapshot] = field(default_factory=list)
+    _occupancy_history: OccupancyHistory = field(init=False)
     _wagon_queue: TrackWagonQueue = field(init=False)
+    _occupants_by_id: dict[str, TrackOccupant] = field(init=False)
+    _occupied_meters: float = field(init=False)
+    _wagon_count: int = field(init=False)
 
     def __post_init__(self) -> None:
-        """Initialize wagon queue after dataclass initialization."""
+        """Initialize wagon queue, history and running totals after dataclass initialization."""
         self._wagon_queue = TrackWagonQueue(str(self.track_id))
+        self._occupancy_history = OccupancyHistory(self.track_specification.capacity)
+        self._occupants.sort(key=_position_start)
+        self._occupants_by_id = {occ.id: occ for occ in self._occupants}
+        self._occupied_meters = sum(occ.effective_length for occ in self._occupants)
+        self._wagon_count = sum(1 for occ in self._occupants if occ.type is OccupantType.WAGON)
 
     def add_wagon(self, wagon: Any, timestamp: float) -> None:
         """Add wagon to both occupancy and queue."""
@@ -61,18 +76,31 @@ class TrackOccupancy:
         if not self._can_accommodate(occupant):
             raise ValueError('Occupant overlaps with existing occupant')
 
-        self._occupants.append(occupant)
-        self._occupants.sort(key=lambda x: x.position_start)  # Keep sorted by position
-        self._record_snapshot(timestamp)
+        # Keep sorted by position (after occupants with the same start)
+        index = bisect.bisect_right(self._occupants, occupant.position_start, key=_position_start)
+        self._occupants.insert(index, occupant)
+        self._occupants_by_id[occupant.id] = occupant
+        self._occupied_meters += occupant.effective_length
+        if occupant.type is OccupantType.WAGON:
+            self._wagon_count += 1
+        self._occupancy_history.record_add(timestamp, index, occupant, self._occupants)
 
     def remove_occupant(self, occupant_id: str, timestamp: float) -> TrackOccupant | None:
         """Remove occupant by ID."""
-        for i, occupant in enumerate(self._occupants):
-            if occupant.id == occupant_id:
-                removed = self._occupants.pop(i)
-                self._record_snapshot(timestamp)
-                return removed
-        return None
+        occupant = self._occupants_by_id.pop(occupant_id, None)
+        if occupant is None:
+            return None
+
+        # Locate by position, then by identity among occupants with the same start
+        index = bisect.bisect_left(self._occupants, occupant.position_start, key=_position_start)
+        while self._occupants[index] is not occupant:
+            index += 1
+        removed = self._occupants.pop(index)
+        self._occupied_meters = self._occupied_meters - removed.effective_length if self._occupants else 0.0
+        if removed.type is OccupantType.WAGON:
+            self._wagon_count -= 1
+        self._occupancy_history.record_remove(timestamp, index, removed, self._occupants)
+        return removed
 
     def can_accommodate_length(self, required_length: float) -> bool:
         """Check if track can accommodate required length."""
@@ -99,14 +127,12 @@ class TrackOccupancy:
         if not self._occupants:
             return 0.0
 
-        # Sort occupants by position for sequential processing
-        sorted_occupants = sorted(self._occupants, key=lambda x: x.position_start)
-
         # Determine filling direction based on track access
         # Most collection tracks fill from front (position 0) sequentially
         if self.track_specification.access in (TrackAccess.FRONT_ONLY, TrackAccess.BOTH_ENDS):
-            # Fill from front: find the end of the last occupant and add there
-            last_occupant_end = max(occ.position_start + occ.effective_length for occ in sorted_occupants)
+            # Fill from front: the last occupant by position ends furthest (no overlaps)
+            last = self._occupants[-1]
+            last_occupant_end = last.position_start + last.effective_length
 
             # Check if there's space at the end
             if last_occupant_end + required_length <= self.track_specification.capacity:
@@ -115,7 +141,7 @@ class TrackOccupancy:
         # If front filling failed or track is REAR_ONLY, try rear filling
         if self.track_specification.access in (TrackAccess.REAR_ONLY, TrackAccess.BOTH_ENDS):
             # Fill from rear: find space before the first occupant
-            first_occupant_start = min(occ.position_start for occ in sorted_occupants)
+            first_occupant_start = self._occupants[0].position_start
 
             # Check if there's space at the beginning
             if first_occupant_start >= required_length:
@@ -125,7 +151,7 @@ class TrackOccupancy:
 
     def get_current_occupancy_meters(self) -> float:
         """Get total occupied length in meters."""
-        return sum(occ.effective_length for occ in self._occupants)
+        return self._occupied_meters
 
     def get_current_occupancy_percentage(self) -> float:
         """Get occupancy as percentage of track capacity."""
@@ -139,7 +165,7 @@ class TrackOccupancy:
 
     def get_wagon_count(self) -> int:
         """Get current wagon count on track."""
-        return len([occ for occ in self._occupants if occ.type.value == 'wagon'])
+        return self._wagon_count
 
     def get_utilization_percentage(self) -> float:
         """Get utilization percentage (alias for occupancy percentage)."""
@@ -157,6 +183,16 @@ class TrackOccupancy:
         """Get list of current occupants."""
         return self._occupants.copy()
 
+    def snapshot_at(self, timestamp: float) -> OccupancySnapshot | None:
+        """Get occupancy state as of timestamp (latest change at or before it)."""
+        return self._occupancy_history.snapshot_at(timestamp)
+
+    def get_occupancy_history(
+        self, from_time: float = float('-inf'), to_time: float = float('inf')
+    ) -> list[OccupancySnapshot]:
+        """Get snapshots of changes recorded in [from_time, to_time]."""
+        return self._occupancy_history.snapshots_between(from_time, to_time)
+
     def _can_accommodate(self, occupant: TrackOccupant) -> bool:
         """Check if occupant can be accommodated (length + position + count)."""
         # Check length capacity
@@ -178,8 +214,10 @@ class TrackOccupancy:
         if occupant.position_start < 0 or occupant_end > self.track_specification.capacity:
             return False
 
-        # Check collisions with existing occupants
-        for existing in self._occupants:
+        # Check collisions with the neighbours: existing occupants before the
+        # predecessor end before it, those after the successor start after it
+        index = bisect.bisect_right(self._occupants, occupant.position_start, key=_position_start)
+        for existing in self._occupants[max(index - 1, 0) : index + 1]:
             existing_end = existing.position_start + existing.effective_length
 
             # Check overlap
@@ -188,13 +226,7 @@ class TrackOccupancy:
 
         return True
 
-    def _record_snapshot(self, timestamp: float) -> None:
-        """Record current state snapshot for audit trail."""
-        snapshot = OccupancySnapshot(
-            timestamp=timestamp,
-            occupancy_meters=self.get_current_occupancy_meters(),
-            occupancy_percentage=self.get_current_occupancy_percentage(),
-            occupant_count=len(self._occupants),
-            occupants=tuple(self._occupants),  # Immutable snapshot
-        )
-        self._occupancy_history.append(snapshot)
+
+def _position_start(occupant: TrackOccupant) -> float:
+    """Sort key of occupants."""
+    return occupant.position_start
@@ -36,7 +36,7 @@ class TrackOccupancyRepository:
         if not occupancy:
             return []
 
-        return [snapshot for snapshot in occupancy._occupancy_history if from_time <= snapshot.timestamp <= to_time]
+        return occupancy.get_occupancy_history(from_time, to_time)
 
     def reset(self, track_id: UUID | str | None = None) -> None:
         """Reset occupancy for specific track or all tracks."""
@@ -1,7 +1,11 @@
 """Railway topology service - upstream conformist pattern."""
 
+from datetime import timedelta
+from functools import cached_property
 from typing import Any
 
+from shared.domain.services.route_table import RouteTable
+
 
 class TopologyService:
     """Upstream topology service - other contexts copy data from this."""
@@ -13,14 +17,20 @@ class TopologyService:
         """Get complete topology data."""
         return self._topology.copy()
 
+    @cached_property
+    def route_table(self) -> RouteTable:
+        """Get all-pairs shortest routes between route endpoints (compiled on first use)."""
+        return RouteTable(
+            ((route['from'], route['to']), _minutes(route.get('duration', 0.0)))
+            for route in self._topology.get('routes', [])
+            if route.get('from') and route.get('to')
+        )
+
     def find_path(self, from_node: str, to_node: str) -> list[str]:
-        """Find path between two nodes."""
-        # Simple implementation - contexts can copy and enhance
-        routes = self._topology.get('routes', [])
-        for route in routes:
-            if route.get('from') == from_node and route.get('to') == to_node:
-                return [from_node, to_node]
-        return []
+        """Find fastest chain of routes between two nodes (empty if none connects them)."""
+        if not self.route_table.has_route(from_node, to_node):
+            return []
+        return self.route_table.path(from_node, to_node)
 
     def get_track_info(self, track_id: str) -> dict[str, Any] | None:
         """Get track information."""
@@ -29,3 +39,8 @@ class TopologyService:
             if track.get('id') == track_id:
                 return dict(track).copy()
         return None
+
+
+def _minutes(duration: timedelta | float) -> float:
+    """Get route duration in minutes (numbers are taken as minutes)."""
+    return duration.total_seconds() / 60 if isinstance(duration, timedelta) else float(duration)
@@ -1,6 +1,8 @@
 """Railway infrastructure value objects."""
 
+from .occupancy_history import OccupancyDelta
+from .occupancy_history import OccupancyHistory
 from .occupancy_snapshot import OccupancySnapshot
 from .track_occupant import TrackOccupant
 
-__all__ = ['OccupancySnapshot', 'TrackOccupant']
+__all__ = ['OccupancyDelta', 'OccupancyHistory', 'OccupancySnapshot', 'TrackOccupant']
@@ -0,0 +1,121 @@
+"""Delta-encoded occupancy history for track audit trails."""
+
+import bisect
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+
+from contexts.railway_infrastructure.domain.value_objects.occupancy_snapshot import OccupancySnapshot
+from contexts.railway_infrastructure.domain.value_objects.track_occupant import TrackOccupant
+
+
+@dataclass(frozen=True)
+class OccupancyDelta:
+    """Single change of track occupants: occupant added at or removed from list index."""
+
+    timestamp: float
+    occupant: TrackOccupant
+    index: int
+    added: bool
+
+
+@dataclass
+class OccupancyHistory:
+    """Occupancy history stored as deltas plus periodic keyframes.
+
+    Each change records only the added/removed occupant and its index in the
+    position-sorted occupant list. Every ``keyframe_interval`` changes the full
+    occupant tuple is kept, so any snapshot is rebuilt by replaying at most
+    ``keyframe_interval - 1`` deltas. Memory is O(changes + changes / interval * occupants)
+    instead of O(changes * occupants).
+
+    Changes must be recorded in non-decreasing timestamp order (simulation time).
+    Supports ``len()`` and indexing, returning reconstructed OccupancySnapshots.
+    """
+
+    capacity: float
+    keyframe_interval: int = 64
+    _deltas: list[OccupancyDelta] = field(default_factory=list)
+    _timestamps: list[float] = field(default_factory=list)
+    _keyframes: list[tuple[TrackOccupant, ...]] = field(default_factory=list)
+
+    def record_add(self, timestamp: float, index: int, occupant: TrackOccupant, occupants: list[TrackOccupant]) -> None:
+        """Record occupant inserted at index; occupants is the list after the change."""
+        self._record(OccupancyDelta(timestamp, occupant, index, added=True), occupants)
+
+    def record_remove(
+        self, timestamp: float, index: int, occupant: TrackOccupant, occupants: list[TrackOccupant]
+    ) -> None:
+        """Record occupant removed from index; occupants is the list after the change."""
+        self._record(OccupancyDelta(timestamp, occupant, index, added=False), occupants)
+
+    def snapshot_at(self, timestamp: float) -> OccupancySnapshot | None:
+        """Get latest snapshot recorded at or before timestamp.
+
+        Returns
+        -------
+        OccupancySnapshot | None
+            Snapshot, or None if nothing was recorded up to timestamp
+        """
+        position = bisect.bisect_right(self._timestamps, timestamp) - 1
+        return self[position] if position >= 0 else None
+
+    def snapshots_between(self, from_time: float, to_time: float) -> list[OccupancySnapshot]:
+        """Get snapshots recorded in [from_time, to_time], replaying from one keyframe."""
+        start = bisect.bisect_left(self._timestamps, from_time)
+        stop = bisect.bisect_right(self._timestamps, to_time)
+        return list(self._replay(start, stop))
+
+    def __len__(self) -> int:
+        """Get number of recorded changes."""
+        return len(self._deltas)
+
+    def __getitem__(self, position: int) -> OccupancySnapshot:
+        """Get snapshot after the change at position (negative positions count from the end)."""
+        if position < 0:
+            position += len(self._deltas)
+        if not 0 <= position < len(self._deltas):
+            raise IndexError('occupancy history index out of range')
+        return next(self._replay(position, position + 1))
+
+    def __iter__(self) -> Iterator[OccupancySnapshot]:
+        """Iterate over all snapshots in recording order."""
+        return self._replay(0, len(self._deltas))
+
+    def _record(self, delta: OccupancyDelta, occupants: list[TrackOccupant]) -> None:
+        """Append delta, storing a keyframe at the start of each block."""
+        if len(self._deltas) % self.keyframe_interval == 0:
+            self._keyframes.append(tuple(occupants))
+        self._deltas.append(delta)
+        self._timestamps.append(delta.timestamp)
+
+    def _replay(self, start: int, stop: int) -> Iterator[OccupancySnapshot]:
+        """Yield snapshots after changes start..stop-1, starting at the keyframe of start's block."""
+        if start >= stop:
+            return
+        # Keyframe of a block holds the occupants after the block's first change
+        first = start - start % self.keyframe_interval
+        occupants = list(self._keyframes[first // self.keyframe_interval])
+        if first == start:
+            yield self._snapshot(self._timestamps[first], occupants)
+        for position in range(first + 1, stop):
+            delta = self._deltas[position]
+            if position % self.keyframe_interval == 0:
+                occupants = list(self._keyframes[position // self.keyframe_interval])
+            elif delta.added:
+                occupants.insert(delta.index, delta.occupant)
+            else:
+                del occupants[delta.index]
+            if position >= start:
+                yield self._snapshot(delta.timestamp, occupants)
+
+    def _snapshot(self, timestamp: float, occupants: list[TrackOccupant]) -> OccupancySnapshot:
+        """Build snapshot from occupant list."""
+        meters = sum(occ.effective_length for occ in occupants)
+        return OccupancySnapshot(
+            timestamp=timestamp,
+            occupancy_meters=meters,
+            occupancy_percentage=(meters / self.capacity) * 100 if self.capacity != 0 else 0.0,
+            occupant_count=len(occupants),
+            occupants=tuple(occupants),
+        )
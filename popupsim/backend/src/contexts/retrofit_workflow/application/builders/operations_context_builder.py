@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
 from contexts.retrofit_workflow.application.event_collector import EventCollector
 from contexts.retrofit_workflow.domain.entities.locomotive import Locomotive
 from contexts.retrofit_workflow.domain.entities.workshop import Workshop
@@ -27,10 +28,14 @@ class RetrofitWorkshopContexttBuilder:  # pylint: disable=too-many-instance-attr
         self._locomotive_manager: LocomotiveResourceManager | None = None
         self._track_manager: Any = None
 
-    def build_event_collector(self, process_logger: Any = None) -> 'RetrofitWorkshopContexttBuilder':
-        """Build event collector with optional process logger."""
+    def build_event_collector(
+        self, process_logger: Any = None, output_selection: OutputSelection | None = None
+    ) -> 'RetrofitWorkshopContexttBuilder':
+        """Build event collector with optional process logger and output selection."""
         start_datetime = getattr(self._scenario, 'start_date', None)
-        self._event_collector = EventCollector(process_logger=process_logger, start_datetime=start_datetime)
+        self._event_collector = EventCollector(
+            process_logger=process_logger, start_datetime=start_datetime, output_selection=output_selection
+        )
         return self
 
     def build_entities(self) -> 'RetrofitWorkshopContexttBuilder':
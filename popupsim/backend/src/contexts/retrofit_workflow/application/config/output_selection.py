@@ -0,0 +1,141 @@
+"""Output artifact selection for simulation runs.
+
+Each artifact declares the event streams it is built from. Streams that no
+selected artifact needs are not recorded during the simulation at all.
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cached_property
+from pathlib import Path
+
+from shared.infrastructure.tabular_format import TabularFormat
+
+
+class EventStream(StrEnum):
+    """Event streams recorded by the event collector."""
+
+    WAGON = 'wagon'
+    LOCOMOTIVE = 'locomotive'
+    RESOURCE = 'resource'
+    BATCH = 'batch'
+    COUPLING = 'coupling'
+    STATE = 'state'
+    """Dual-stream state changes."""
+    LOCATION = 'location'
+    """Dual-stream location changes."""
+    PROCESS = 'process'
+    """Dual-stream process events."""
+    PROCESS_TRACKING = 'process_tracking'
+    """Process and state tracker records."""
+    METRICS = 'metrics'
+    """Online summary metrics accumulator."""
+
+
+ARTIFACT_STREAMS: dict[str, frozenset[EventStream]] = {
+    'wagon_journey': frozenset({EventStream.WAGON}),
+    'rejected_wagons': frozenset({EventStream.WAGON}),
+    'locomotive_movements': frozenset({EventStream.LOCOMOTIVE}),
+    'locomotive_journey': frozenset({EventStream.LOCOMOTIVE, EventStream.COUPLING}),
+    'track_capacity': frozenset({EventStream.RESOURCE}),
+    'locomotive_utilization': frozenset({EventStream.RESOURCE}),
+    'locomotive_util': frozenset({EventStream.RESOURCE}),
+    'locomotive_time_breakdown': frozenset({EventStream.LOCOMOTIVE, EventStream.COUPLING}),
+    'workshop_utilization': frozenset({EventStream.RESOURCE}),
+    'summary_metrics': frozenset({EventStream.METRICS}),
+    'events': frozenset({EventStream.WAGON, EventStream.LOCOMOTIVE, EventStream.BATCH}),
+    'timeline': frozenset({EventStream.WAGON, EventStream.RESOURCE}),
+    'workshop_metrics': frozenset({EventStream.WAGON}),
+    'resource_states': frozenset({EventStream.STATE}),
+    'resource_locations': frozenset({EventStream.LOCATION}),
+    'resource_processes': frozenset({EventStream.PROCESS}),
+    'process_tracking': frozenset({EventStream.PROCESS_TRACKING}),
+}
+"""Event streams each artifact is built from, keyed by artifact name (file stem)."""
+
+OUTPUT_PRESETS: dict[str, tuple[str, ...]] = {
+    'summary': ('summary_metrics',),
+    'dashboard': (
+        'summary_metrics',
+        'wagon_journey',
+        'rejected_wagons',
+        'locomotive_movements',
+        'locomotive_journey',
+        'track_capacity',
+        'workshop_utilization',
+        'locomotive_utilization',
+        'timeline',
+        'workshop_metrics',
+        'resource_states',
+        'resource_locations',
+        'resource_processes',
+    ),
+    'full': tuple(ARTIFACT_STREAMS),
+}
+"""Named artifact sets: batch evaluation, dashboard input, everything."""
+
+ARTIFACT_SUFFIXES = frozenset({'.json', *(output_format.suffix for output_format in TabularFormat)})
+"""File suffixes artifacts are written with (JSON or any table format)."""
+
+
+@dataclass(frozen=True)
+class OutputSelection:
+    """Set of artifacts to produce and the event streams they require."""
+
+    artifacts: frozenset[str]
+
+    def __post_init__(self) -> None:
+        """Validate artifact names."""
+        unknown = sorted(self.artifacts - ARTIFACT_STREAMS.keys())
+        if unknown:
+            raise ValueError(
+                f'Unknown output artifact(s): {", ".join(unknown)}. '
+                f'Valid presets: {", ".join(OUTPUT_PRESETS)}; artifacts: {", ".join(ARTIFACT_STREAMS)}'
+            )
+
+    @classmethod
+    def full(cls) -> 'OutputSelection':
+        """Create selection with every artifact."""
+        return cls(frozenset(ARTIFACT_STREAMS))
+
+    @classmethod
+    def parse(cls, spec: str) -> 'OutputSelection':
+        """Parse comma-separated presets and artifact names.
+
+        Artifact names may be given with or without file extension, e.g.
+        ``summary,resource_states.csv``.
+        """
+        artifacts: set[str] = set()
+        for token in (t.strip() for t in spec.split(',')):
+            if not token:
+                continue
+            if token in OUTPUT_PRESETS:
+                artifacts.update(OUTPUT_PRESETS[token])
+            else:
+                artifacts.add(Path(token).stem)
+        if not artifacts:
+            raise ValueError('No output artifacts selected')
+        return cls(frozenset(artifacts))
+
+    @cached_property
+    def required_streams(self) -> frozenset[EventStream]:
+        """Get event streams needed by the selected artifacts."""
+        return frozenset().union(*(ARTIFACT_STREAMS[name] for name in self.artifacts))
+
+    def includes(self, filename: str) -> bool:
+        """Check whether artifact with given file name (or stem) is selected."""
+        return Path(filename).stem in self.artifacts
+
+    def records(self, stream: EventStream) -> bool:
+        """Check whether event stream must be recorded."""
+        return stream in self.required_streams
+
+    def unselected_files(self, output_dir: Path) -> list[Path]:
+        """Get artifact files in output_dir that this selection does not write (left by earlier runs)."""
+        if not output_dir.is_dir():
+            return []
+        return sorted(
+            path
+            for path in output_dir.iterdir()
+            if path.suffix in ARTIFACT_SUFFIXES and path.stem in ARTIFACT_STREAMS and not self.includes(path.name)
+        )
@@ -6,9 +6,11 @@ from typing import Any
 
 from contexts.retrofit_workflow.application.config.coordinator_config import CollectionCoordinatorConfig
 from contexts.retrofit_workflow.application.coordinators.event_publisher_helper import EventPublisherHelper
+from contexts.retrofit_workflow.application.coordinators.locomotive_move_helper import LocomotiveMoveHelper
 from contexts.retrofit_workflow.application.services.locomotive_dispatcher import TaskRequest
 from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from shared.infrastructure.perf_metrics import timed
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,7 @@ class CollectionCoordinator:  # pylint: disable=too-few-public-methods
                 return sum(w.length for w in track.queue.items)
         return 0.0
 
+    @timed('CollectionCoordinator._collection_process')
     def _collection_process(self, track_id: str) -> Generator[Any, Any]:
         """Run collection process for a specific collection track.
 
@@ -167,7 +170,7 @@ class CollectionCoordinator:  # pylint: disable=too-few-public-methods
             collection_track_id = wagons[0].current_track_id
             if collection_track_id:
                 collection_track = self.track_manager.get_track(collection_track_id)
-                if collection_track and any(w in collection_track.wagons for w in wagons):
+                if collection_track and collection_track.has_any_wagon(wagons):
                     yield from collection_track.remove_wagons(wagons)
 
         # Batch events published AFTER locomotive arrives in _transport_to_retrofit_with_batch
@@ -201,21 +204,19 @@ class CollectionCoordinator:  # pylint: disable=too-few-public-methods
         yield self.config.env.timeout(0)
 
     def _return_locomotive(self, loco: Any, from_track_id: str) -> Generator[Any, Any]:
-        """Return locomotive to home track.
+        """Return locomotive to home track (or leave it on from_track_id with nearest allocation).
 
         Args:
             loco: Locomotive to return
             from_track_id: Track ID where locomotive currently is
         """
-        EventPublisherHelper.publish_loco_moving(
-            self.config.loco_event_publisher, self.config.env.now, loco.id, from_track_id, loco.home_track
-        )
-
-        return_time = self.config.route_service.get_duration(from_track_id, loco.home_track)
-        yield self.config.env.timeout(return_time)
-
-        EventPublisherHelper.publish_loco_parking(
-            self.config.loco_event_publisher, self.config.env.now, loco.id, loco.home_track
+        yield from LocomotiveMoveHelper.finish(
+            self.config.env,
+            self.config.route_service,
+            self.config.locomotive_manager,
+            self.config.loco_event_publisher,
+            loco,
+            from_track_id,
         )
 
     def _allocate_locomotive(self, wagons: list[Wagon]) -> Generator[Any, Any, Any]:
@@ -244,7 +245,9 @@ class CollectionCoordinator:  # pylint: disable=too-few-public-methods
             loco = yield event
             return loco
 
-        loco = yield from self.config.locomotive_manager.allocate(purpose='collection_pickup')
+        loco = yield from self.config.locomotive_manager.allocate(
+            purpose='collection_pickup', near_track=wagons[0].current_track_id if wagons else None
+        )
         return loco
 
     def _transport_to_retrofit_with_batch(  # noqa: PLR0915  # pylint: disable=too-many-locals,too-many-statements
@@ -267,13 +270,10 @@ class CollectionCoordinator:  # pylint: disable=too-few-public-methods
         collection_track_id = wagons[0].current_track_id
 
         # Publish movement immediately
-        EventPublisherHelper.publish_loco_moving(
-            self.config.loco_event_publisher, self.config.env.now, loco.id, loco.home_track, collection_track_id
+        yield from LocomotiveMoveHelper.approach(
+            self.config.env, self.config.route_service, self.config.loco_event_publisher, loco, collection_track_id
         )
 
-        move_time = self.config.route_service.get_duration(loco.home_track, collection_track_id)
-        yield self.config.env.timeout(move_time)
-
         # NOW publish batch formation (after locomotive arrives)
         self._publish_batch_events(batch_aggregate)
 
@@ -126,12 +126,9 @@ class EventPublisherHelper:
                 event_type=event_type,
                 location=location,
                 status=status,
+                route_path=route_path or None,
+                coupler_type=coupler_type or None,
             )
-            # Store route_path and coupler_type as custom attributes for dual-stream adapter
-            if route_path:
-                event.route_path = route_path  # type: ignore
-            if coupler_type:
-                event.coupler_type = coupler_type  # type: ignore
             publisher(event)
 
     @staticmethod
@@ -0,0 +1,61 @@
+"""Helper for locomotive approach and return legs shared by coordinators."""
+
+from collections.abc import Callable
+from collections.abc import Generator
+from typing import Any
+
+from contexts.retrofit_workflow.application.coordinators.event_publisher_helper import EventPublisherHelper
+from contexts.retrofit_workflow.domain.entities.locomotive import Locomotive
+from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.services.route_service import RouteService
+from contexts.retrofit_workflow.infrastructure.resources.locomotive_resource_manager import LocomotiveResourceManager
+import simpy
+
+
+class LocomotiveMoveHelper:
+    """Moves of locomotives to a transport and back, keeping their track up to date.
+
+    A locomotive approaches a transport from the track it is on. With
+    location-aware (nearest) allocation it stays on the track where the
+    transport ended and goes back to the pool from there; otherwise it returns
+    to its home track first.
+    """
+
+    @staticmethod
+    def approach(
+        env: simpy.Environment,
+        route_service: RouteService,
+        publisher: Callable[[LocomotiveMovementEvent], None] | None,
+        loco: Locomotive,
+        track_id: str,
+    ) -> Generator[Any, Any]:
+        """Move locomotive from its current track to track_id (through its home track if no route connects them)."""
+        from_track_id = loco.current_track
+        EventPublisherHelper.publish_loco_moving(publisher, env.now, loco.id, from_track_id, track_id)
+        yield env.timeout(route_service.get_duration_via(from_track_id, track_id, loco.home_track))
+        loco.arrive_at(track_id)
+
+    @staticmethod
+    def finish(  # noqa: PLR0913, PLR0917  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        env: simpy.Environment,
+        route_service: RouteService,
+        locomotive_manager: LocomotiveResourceManager,
+        publisher: Callable[[LocomotiveMovementEvent], None] | None,
+        loco: Locomotive,
+        track_id: str,
+        publish_parking: bool = True,
+    ) -> Generator[Any, Any]:
+        """End transport of locomotive on track_id: stay there if location-aware, else return home.
+
+        publish_parking only applies to the return home; a locomotive staying
+        on track_id always publishes its parking event.
+        """
+        if locomotive_manager.is_location_aware():
+            loco.arrive_at(track_id)
+            EventPublisherHelper.publish_loco_parking(publisher, env.now, loco.id, track_id)
+            return
+        EventPublisherHelper.publish_loco_moving(publisher, env.now, loco.id, track_id, loco.home_track)
+        yield env.timeout(route_service.get_duration(track_id, loco.home_track))
+        loco.arrive_at(loco.home_track)
+        if publish_parking:
+            EventPublisherHelper.publish_loco_parking(publisher, env.now, loco.id, loco.home_track)
@@ -1,14 +1,17 @@
 """Parking Coordinator - moves wagons from retrofitted to parking track."""
 
 from collections.abc import Generator
+import contextlib
 import logging
 from typing import Any
 
 from contexts.retrofit_workflow.application.config.coordinator_config import ParkingCoordinatorConfig
 from contexts.retrofit_workflow.application.coordinators.event_publisher_helper import EventPublisherHelper
+from contexts.retrofit_workflow.application.coordinators.locomotive_move_helper import LocomotiveMoveHelper
 from contexts.retrofit_workflow.application.services.locomotive_dispatcher import TaskRequest
 from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from shared.infrastructure.perf_metrics import timed
 import simpy
 
 logger = logging.getLogger(__name__)
@@ -59,6 +62,7 @@ class ParkingCoordinator:  # pylint: disable=too-many-instance-attributes,too-fe
         # Start single process that monitors all retrofitted tracks
         self.config.env.process(self._parking_process_all_tracks(retrofitted_tracks))
 
+    @timed('ParkingCoordinator._parking_process_all_tracks')
     def _parking_process_all_tracks(self, retrofitted_tracks: list[Any]) -> Generator[Any, Any]:
         """Monitor all retrofitted tracks with single process.
 
@@ -176,17 +180,18 @@ class ParkingCoordinator:  # pylint: disable=too-many-instance-attributes,too-fe
             pass
 
     def _return_locomotive(self, loco: Any, parking_track_id: str) -> Generator[Any, Any]:
-        """Return locomotive to home track."""
-        try:
-            EventPublisherHelper.publish_loco_moving(
-                self.config.loco_event_publisher, self.config.env.now, loco.id, parking_track_id, loco.home_track
+        """Return locomotive to home track (or leave it on the parking track with nearest allocation)."""
+        with contextlib.suppress(GeneratorExit):
+            yield from LocomotiveMoveHelper.finish(
+                self.config.env,
+                self.config.route_service,
+                self.config.locomotive_manager,
+                self.config.loco_event_publisher,
+                loco,
+                parking_track_id,
+                publish_parking=False,
             )
 
-            return_time = self.config.route_service.get_duration(parking_track_id, loco.home_track)
-            yield self.config.env.timeout(return_time)
-        except GeneratorExit:
-            pass
-
     def _transport_to_parking_with_batch(  # pylint: disable=too-many-locals
         self, loco: Any, batch_aggregate: Any, parking_track_id: str, retrofitted_track_id: str
     ) -> Generator[Any, Any]:
@@ -305,7 +310,7 @@ class ParkingCoordinator:  # pylint: disable=too-many-instance-attributes,too-fe
             loco = yield event
             return loco
 
-        loco = yield from self.config.locomotive_manager.allocate(purpose='batch_transport')
+        loco = yield from self.config.locomotive_manager.allocate(purpose='batch_transport', near_track=source_track_id)
         return loco
 
     def _transport_batch_aggregate(
@@ -332,20 +337,18 @@ class ParkingCoordinator:  # pylint: disable=too-many-instance-attributes,too-fe
 
             transport_completed = False
             try:
-                EventPublisherHelper.publish_loco_moving(
+                yield from LocomotiveMoveHelper.approach(
+                    self.config.env,
+                    self.config.route_service,
                     self.config.loco_event_publisher,
-                    self.config.env.now,
-                    loco.id,
-                    loco.home_track,
+                    loco,
                     retrofitted_track_id,
                 )
-                move_time = self.config.route_service.get_duration(loco.home_track, retrofitted_track_id)
-                yield self.config.env.timeout(move_time)
 
                 if self.track_manager:
                     retrofitted_track = self.track_manager.get_track(retrofitted_track_id)
                     if retrofitted_track:
-                        wagons_on_track = [w for w in wagons if w in retrofitted_track.wagons]
+                        wagons_on_track = [w for w in wagons if retrofitted_track.has_wagon(w)]
                         if wagons_on_track:
                             yield from retrofitted_track.remove_wagons(wagons_on_track)
 
@@ -6,12 +6,16 @@ import logging
 from typing import Any
 
 from contexts.retrofit_workflow.application.coordinators.event_publisher_helper import EventPublisherHelper
+from contexts.retrofit_workflow.application.coordinators.locomotive_move_helper import LocomotiveMoveHelper
 from contexts.retrofit_workflow.application.services.locomotive_dispatcher import TaskRequest
 from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.events import CouplingEvent
 from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
 from contexts.retrofit_workflow.domain.services.train_formation_service import TrainFormationService
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from contexts.retrofit_workflow.infrastructure.resources.workshop_availability import WorkshopAvailability
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
+from shared.infrastructure.perf_metrics import timed
 from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,7 @@ class WorkshopCoordinatorConfig:  # pylint: disable=too-many-instance-attributes
     loco_event_publisher: Any = None
     event_publisher: Any = None
     coupling_event_publisher: Any = None
+    workshop_strategy: SelectionStrategy = SelectionStrategy.FIRST_AVAILABLE
 
 
 class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
@@ -66,9 +71,8 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
         self.loco_event_publisher = config.loco_event_publisher
         self.event_publisher = config.event_publisher
         self.coupling_event_publisher = config.coupling_event_publisher
-        self.workshop_busy = dict.fromkeys(self.workshops.keys(), False)
+        self.workshop_availability = WorkshopAvailability(self.env, self.workshops.keys(), config.workshop_strategy)
         self.track_manager = None
-        self._waiting_processes: list[Any] = []
         self.track_selector: Any = None  # Will be set by context
         self.locomotive_dispatcher = None  # Set by context if task_priorities configured
 
@@ -110,7 +114,7 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
             loco = yield event
             return loco
 
-        loco = yield from self.locomotive_manager.allocate(purpose='batch_transport')
+        loco = yield from self.locomotive_manager.allocate(purpose='batch_transport', near_track=source_track_id)
         return loco
 
     def start(self) -> None:
@@ -125,6 +129,7 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
             self.env.process(self._assignment_process(retrofit_track))
             logger.info('Started workshop assignment process for %s', retrofit_track.track_id)
 
+    @timed('WorkshopCoordinator._assignment_process')
     def _assignment_process(self, retrofit_track: Any) -> Generator[Any, Any]:
         """Single process that assigns wagons from a specific retrofit track queue to workshops.
 
@@ -138,22 +143,13 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
             wagon = yield retrofit_queue.get()
             logger.info('t=%.1f: WAGON[%s] → Retrieved from %s queue', self.env.now, wagon.id, retrofit_track_id)
 
-            available_workshop = self._find_available_workshop()
-            if not available_workshop:
+            # Released workshops are handed to waiting processes directly (already marked busy)
+            workshop_request = self.workshop_availability.acquire()
+            if not workshop_request.triggered:
                 logger.info('t=%.1f: WORKSHOP → No workshop available, waiting...', self.env.now)
-                wait_event = self.env.event()
-                self._waiting_processes.append(wait_event)
-                yield wait_event
-                logger.info('t=%.1f: WORKSHOP → Workshop became available', self.env.now)
-                available_workshop = self._find_available_workshop()
-                if not available_workshop:
-                    raise RuntimeError(f'Workshop should be available after event at t={self.env.now}')
-
+            available_workshop = yield workshop_request
             logger.info('t=%.1f: WORKSHOP[%s] → Selected for batch', self.env.now, available_workshop)
 
-            # Mark workshop as busy IMMEDIATELY to prevent race condition
-            self.workshop_busy[available_workshop] = True
-
             workshop = self.workshops[available_workshop]
             available_bays = workshop.available_capacity
             wagons = [wagon]
@@ -196,7 +192,7 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
                     f'[t={self.env.now}] WS: Track capacity: '
                     f'{retrofit_track.get_occupied_capacity():.1f}m / {retrofit_track.capacity_meters:.1f}m'
                 )
-                print(f'[t={self.env.now}] WS: Wagons on track: {[w.id for w in retrofit_track.wagons]}')
+                print(f'[t={self.env.now}] WS: Wagons on track: {retrofit_track.get_wagon_ids()}')
                 raise
 
             # Allocate locomotive (workshop already marked as busy above)
@@ -207,14 +203,7 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
             # Start workshop process
             self.env.process(self._process_and_release(available_workshop, batch_wagons, loco, retrofit_track.track_id))
 
-    def _find_available_workshop(self) -> str | None:
-        """Find first available workshop (not busy)."""
-        for workshop_id in sorted(self.workshops.keys()):
-            if not self.workshop_busy[workshop_id]:
-                return workshop_id  # type: ignore[no-any-return]
-        return None
-
-    def _process_and_release(  # noqa: C901, PLR0912, PLR0915  # pylint: disable=too-many-statements,too-many-branches
+    def _process_and_release(  # pylint: disable=too-many-statements,too-many-branches
         self, workshop_id: str, wagons: list[Wagon], loco: Any, retrofit_track_id: str
     ) -> Generator[Any, Any]:
         """Process batch and release workshop.
@@ -270,33 +259,19 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
 
             # NOW release workshop (wagons are gone)
             logger.info(
-                't=%.1f: WORKSHOP[%s] → Released, notifying %d waiting processes',
+                't=%.1f: WORKSHOP[%s] → Released, %d processes waiting',
                 self.env.now,
                 workshop_id,
-                len(self._waiting_processes),
+                self.workshop_availability.get_waiting_count(),
             )
-            self.workshop_busy[workshop_id] = False
-            # Only trigger ONE waiting process to prevent race condition
-            if self._waiting_processes:
-                event = self._waiting_processes.pop(0)
-                if not event.triggered:
-                    event.succeed()
+            self.workshop_availability.release(workshop_id)
         except GeneratorExit:
             # Simulation ended - clean up and re-raise
-            self.workshop_busy[workshop_id] = False
-            if self._waiting_processes:
-                event = self._waiting_processes.pop(0)
-                if not event.triggered:
-                    event.succeed()
+            self.workshop_availability.release(workshop_id)
             raise
         except Exception as e:
             print(f'[t={self.env.now}] WS: ERROR in process_and_release: {e}')
-            self.workshop_busy[workshop_id] = False
-            # Only trigger ONE waiting process to prevent race condition
-            if self._waiting_processes:
-                event = self._waiting_processes.pop(0)
-                if not event.triggered:
-                    event.succeed()
+            self.workshop_availability.release(workshop_id)
             raise
 
     def _process_workshop_batch(  # pylint: disable=too-many-locals
@@ -371,14 +346,11 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
             wagons: List of wagons to transport
             retrofit_track_id: ID of the retrofit track where wagons are located
         """
-        # Transport: loco home track -> retrofit (no prep, loco is already there)
-        EventPublisherHelper.publish_loco_moving(
-            self.loco_event_publisher, self.env.now, loco.id, loco.home_track, retrofit_track_id
+        # Transport: loco track -> retrofit (no prep, loco is already there)
+        yield from LocomotiveMoveHelper.approach(
+            self.env, self.route_service, self.loco_event_publisher, loco, retrofit_track_id
         )
 
-        transport_time = self.route_service.get_duration(loco.home_track, retrofit_track_id)
-        yield self.env.timeout(transport_time)
-
         # Prepare train at retrofit (loco coupling + prep time)
         # Note: Loco coupling time is now dynamic based on wagon coupler types
         # For workshop transport, wagons have SCREW couplers (before retrofit)
@@ -539,13 +511,16 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
         yield self.env.timeout(0)
 
     def _return_locomotive(self, loco: Any, workshop_id: str) -> Generator[Any, Any]:
-        """Return locomotive to parking."""
-        EventPublisherHelper.publish_loco_moving(
-            self.loco_event_publisher, self.env.now, loco.id, workshop_id, loco.home_track
+        """Return locomotive to parking (or leave it at the workshop with nearest allocation)."""
+        yield from LocomotiveMoveHelper.finish(
+            self.env,
+            self.route_service,
+            self.locomotive_manager,
+            self.loco_event_publisher,
+            loco,
+            workshop_id,
+            publish_parking=False,
         )
-
-        return_time = self.route_service.get_duration(workshop_id, loco.home_track)
-        yield self.env.timeout(return_time)
         yield from self.locomotive_manager.release(loco)
 
     def _transport_from_workshop(  # pylint: disable=too-many-locals
@@ -559,14 +534,11 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
         retrofitted_track = max(retrofitted_tracks, key=lambda t: t.get_available_capacity())
         retrofitted_track_id = retrofitted_track.track_id
 
-        # Move locomotive from home track to workshop
-        EventPublisherHelper.publish_loco_moving(
-            self.loco_event_publisher, self.env.now, loco.id, loco.home_track, workshop_id
+        # Move locomotive from its track to workshop
+        yield from LocomotiveMoveHelper.approach(
+            self.env, self.route_service, self.loco_event_publisher, loco, workshop_id
         )
 
-        transport_time = self.route_service.get_duration(loco.home_track, workshop_id)
-        yield self.env.timeout(transport_time)
-
         # Get route type
         route_type = self.route_service.get_route_type(workshop_id, retrofitted_track_id)
 
@@ -680,13 +652,16 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
                 retrofitted_track.track_id,
             )
 
-        EventPublisherHelper.publish_loco_moving(
-            self.loco_event_publisher, self.env.now, loco.id, retrofitted_track_id, loco.home_track
-        )
-
         # Return locomotive
-        return_time = self.route_service.get_duration(retrofitted_track_id, loco.home_track)
-        yield self.env.timeout(return_time)
+        yield from LocomotiveMoveHelper.finish(
+            self.env,
+            self.route_service,
+            self.locomotive_manager,
+            self.loco_event_publisher,
+            loco,
+            retrofitted_track_id,
+            publish_parking=False,
+        )
 
         train.dissolve()
 
@@ -766,7 +741,7 @@ class WorkshopCoordinator:  # pylint: disable=too-many-instance-attributes,too-f
 
         # Allocate locomotive
         print(f'[t={self.env.now}] WS: Allocating locomotive for pickup from {workshop_id}')
-        pickup_loco = yield from self.locomotive_manager.allocate(purpose='batch_transport')
+        pickup_loco = yield from self.locomotive_manager.allocate(purpose='batch_transport', near_track=workshop_id)
         print(f'[t={self.env.now}] WS: Got locomotive {pickup_loco.id} for pickup')
 
         transport_completed = False
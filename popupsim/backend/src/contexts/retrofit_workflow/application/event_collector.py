@@ -1,17 +1,18 @@
 """Backward-compatible facade for EventCollector (delegates to refactored components)."""
 
 from collections.abc import Callable
-import json
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 
-from collections.abc import Callable
-
+from contexts.retrofit_workflow.application.config.output_selection import EventStream
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
 from contexts.retrofit_workflow.application.services.dual_stream_adapter import _record_loco_dual_stream
 from contexts.retrofit_workflow.application.services.dual_stream_adapter import _record_wagon_dual_stream
 from contexts.retrofit_workflow.application.services.dual_stream_collector import DualStreamEventCollector
 from contexts.retrofit_workflow.application.services.event_collection_service import EventCollectionService
-from contexts.retrofit_workflow.application.services.metrics_aggregator import MetricsAggregator
+from contexts.retrofit_workflow.application.services.metrics_accumulator import MetricsAccumulator
 from contexts.retrofit_workflow.domain.events import CouplingEvent
 from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
 from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
@@ -19,16 +20,22 @@ from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
 from contexts.retrofit_workflow.domain.events.batch_events import BatchArrivedAtDestination
 from contexts.retrofit_workflow.domain.events.batch_events import BatchFormed
 from contexts.retrofit_workflow.domain.events.batch_events import BatchTransportStarted
-from contexts.retrofit_workflow.infrastructure.exporters.csv_event_exporter import CsvEventExporter
-from contexts.retrofit_workflow.infrastructure.exporters.dual_stream_csv_exporter import DualStreamCsvExporter
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ArtifactTiming
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ExportArtifact
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ParallelArtifactWriter
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import write_json
 from shared.domain.events.dual_stream_events import LocationChangeEvent
 from shared.domain.events.dual_stream_events import ProcessEvent
 from shared.domain.events.dual_stream_events import ProcessState
 from shared.domain.events.dual_stream_events import ResourceState
 from shared.domain.events.dual_stream_events import StateChangeEvent
+from shared.infrastructure.perf_metrics import get_perf_registry
 from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime
+from shared.infrastructure.tabular_format import TabularFormat
 
 if TYPE_CHECKING:
+    from contexts.retrofit_workflow.infrastructure.exporters.csv_event_exporter import CsvEventExporter
+    from contexts.retrofit_workflow.infrastructure.exporters.dual_stream_csv_exporter import DualStreamCsvExporter
     from infrastructure.logging import ProcessLogger
 
 
@@ -38,16 +45,55 @@ class EventCollector:  # pylint: disable=too-many-public-methods
     Note: Multiple public methods needed for backward compatibility with existing code.
     """
 
-    def __init__(self, process_logger: 'ProcessLogger | None' = None, start_datetime: str | None = None) -> None:
-        """Initialize event collector facade."""
+    def __init__(
+        self,
+        process_logger: 'ProcessLogger | None' = None,
+        start_datetime: str | None = None,
+        output_selection: OutputSelection | None = None,
+    ) -> None:
+        """Initialize event collector facade.
+
+        Args:
+            process_logger: Optional process logger
+            start_datetime: Simulation start used for datetime columns
+            output_selection: Artifacts to produce; streams no artifact needs are not recorded (default: all)
+        """
         self._collection_service = EventCollectionService(process_logger)
-        self._csv_exporter = CsvEventExporter(start_datetime)
         self._dual_stream_collector = DualStreamEventCollector(process_logger)
-        self._dual_stream_exporter = DualStreamCsvExporter(start_datetime)
-        self._metrics = MetricsAggregator()
+        self._metrics = MetricsAccumulator()
         self.start_datetime = start_datetime
         self.on_retrofit_completed: Callable[[str], None] | None = None
 
+        self.output_selection = output_selection or OutputSelection.full()
+        streams = self.output_selection.required_streams
+        self._record_wagon = EventStream.WAGON in streams
+        self._record_locomotive = EventStream.LOCOMOTIVE in streams
+        self._record_resource = EventStream.RESOURCE in streams
+        self._record_batch = EventStream.BATCH in streams
+        self._record_coupling = EventStream.COUPLING in streams
+        self._record_state = EventStream.STATE in streams
+        self._record_location = EventStream.LOCATION in streams
+        self._record_process = EventStream.PROCESS in streams
+        self._record_metrics = EventStream.METRICS in streams
+        self._record_dual_stream = self._record_state or self._record_location or self._record_process
+
+    # Exporters (and pandas) are loaded on first export, not when the simulation is built
+    @cached_property
+    def _csv_exporter(self) -> 'CsvEventExporter':
+        """Get CSV exporter for collected events."""
+        # pylint: disable-next=import-outside-toplevel
+        from contexts.retrofit_workflow.infrastructure.exporters.csv_event_exporter import CsvEventExporter
+
+        return CsvEventExporter(self.start_datetime)
+
+    @cached_property
+    def _dual_stream_exporter(self) -> 'DualStreamCsvExporter':
+        """Get exporter for dual-stream events."""
+        # pylint: disable-next=import-outside-toplevel
+        from contexts.retrofit_workflow.infrastructure.exporters.dual_stream_csv_exporter import DualStreamCsvExporter
+
+        return DualStreamCsvExporter(self.start_datetime)
+
     @property
     def wagon_events(self) -> list[WagonJourneyEvent]:
         """Get wagon events."""
@@ -75,10 +121,14 @@ class EventCollector:  # pylint: disable=too-many-public-methods
 
     def add_wagon_event(self, event: WagonJourneyEvent) -> None:
         """Add wagon event."""
-        self._collection_service.add_wagon_event(event)
-        # Also record in dual-stream
+        if self._record_metrics:
+            self._metrics.add_wagon_event(event)
+        if self._record_wagon:
+            self._collection_service.add_wagon_event(event)
 
-        _record_wagon_dual_stream(event, self)
+        # Also record in dual-stream
+        if self._record_dual_stream:
+            _record_wagon_dual_stream(event, self)
 
         # Notify arrival coordinator when a wagon completes retrofit
         if event.event_type == 'RETROFIT_COMPLETED' and self.on_retrofit_completed is not None:
@@ -86,22 +136,35 @@ class EventCollector:  # pylint: disable=too-many-public-methods
 
     def add_locomotive_event(self, event: LocomotiveMovementEvent) -> None:
         """Add locomotive event."""
-        self._collection_service.add_locomotive_event(event)
-        # Also record in dual-stream
+        if self._record_metrics:
+            self._metrics.add_locomotive_event(event)
+        if self._record_locomotive:
+            self._collection_service.add_locomotive_event(event)
 
-        _record_loco_dual_stream(event, self)
+        # Also record in dual-stream
+        if self._record_dual_stream:
+            _record_loco_dual_stream(event, self)
 
     def add_resource_event(self, event: ResourceStateChangeEvent) -> None:
         """Add resource event."""
-        self._collection_service.add_resource_event(event)
+        if self._record_metrics:
+            self._metrics.add_resource_event(event)
+        if self._record_resource:
+            self._collection_service.add_resource_event(event)
 
     def add_batch_event(self, event: BatchFormed | BatchTransportStarted | BatchArrivedAtDestination) -> None:
         """Add batch event."""
-        self._collection_service.add_batch_event(event)
+        if self._record_metrics:
+            self._metrics.add_batch_event(event)
+        if self._record_batch:
+            self._collection_service.add_batch_event(event)
 
     def add_coupling_event(self, event: CouplingEvent) -> None:
         """Add coupling event."""
-        self._collection_service.add_coupling_event(event)
+        if self._record_metrics:
+            self._metrics.add_coupling_event(event)
+        if self._record_coupling:
+            self._collection_service.add_coupling_event(event)
 
     # Dual-stream event recording
     def record_state_change(  # pylint: disable=too-many-positional-arguments,too-many-arguments  # noqa: PLR0913
@@ -115,6 +178,8 @@ class EventCollector:  # pylint: disable=too-many-public-methods
         rejection_reason: str | None = None,
     ) -> None:
         """Record state change in dual-stream system."""
+        if not self._record_state:
+            return
         event = StateChangeEvent(
             timestamp=timestamp,
             resource_id=resource_id,
@@ -136,6 +201,8 @@ class EventCollector:  # pylint: disable=too-many-public-methods
         route_path: list[str] | None = None,
     ) -> None:
         """Record location change in dual-stream system."""
+        if not self._record_location:
+            return
         event = LocationChangeEvent(
             timestamp=timestamp,
             resource_id=resource_id,
@@ -159,6 +226,8 @@ class EventCollector:  # pylint: disable=too-many-public-methods
         locomotive_id: str | None = None,
     ) -> None:
         """Record process event in dual-stream system."""
+        if not self._record_process:
+            return
         event = ProcessEvent(
             timestamp=timestamp,
             resource_id=resource_id,
@@ -206,6 +275,16 @@ class EventCollector:  # pylint: disable=too-many-public-methods
         """Export workshop utilization."""
         self._csv_exporter.export_workshop_utilization(self.resource_events, filepath)
 
+    def build_summary_metrics(self, simulation_end_time: float | None = None) -> dict[str, Any]:
+        """Build summary metrics from the online accumulator (no event list scan).
+
+        Can be called during the run for a live snapshot.
+
+        Args:
+            simulation_end_time: Actual simulation end (or current) time (if None, uses max event timestamp)
+        """
+        return self._metrics.get_summary(simulation_end_time)
+
     def export_summary_metrics(self, filepath: str, simulation_end_time: float | None = None) -> None:
         """Export summary metrics.
 
@@ -213,25 +292,7 @@ class EventCollector:  # pylint: disable=too-many-public-methods
             filepath: Path to export file
             simulation_end_time: Actual simulation end time (if None, uses max event timestamp)
         """
-        duration = (
-            simulation_end_time
-            if simulation_end_time is not None
-            else self._metrics.get_sim_duration(self.wagon_events, self.locomotive_events, self.resource_events)
-        )
-
-        summary = {
-            **self._metrics.get_event_counts(self.wagon_events, self.locomotive_events, self.batch_events),
-            **self._metrics.get_wagon_metrics(self.wagon_events),
-            **self._metrics.get_workshop_metrics(self.wagon_events, self.resource_events),
-            **self._metrics.get_locomotive_metrics(self.locomotive_events, self.resource_events),
-            'locomotive_time_breakdown': self._metrics.get_locomotive_time_breakdown(
-                self.locomotive_events, self.coupling_events, duration
-            ),
-            'simulation_duration_minutes': duration,
-        }
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        write_json(self.build_summary_metrics(simulation_end_time), Path(filepath))
 
     def export_events_csv(self, filepath: str) -> None:
         """Export all events CSV."""
@@ -253,34 +314,80 @@ class EventCollector:  # pylint: disable=too-many-public-methods
         """Export detailed locomotive journey."""
         self._csv_exporter.export_locomotive_journey(self.locomotive_events, self.coupling_events, filepath)
 
-    def export_all(self, output_dir: str, simulation_end_time: float | None = None) -> None:
-        """Export all data.
+    def get_export_artifacts(self, simulation_end_time: float | None = None) -> list[ExportArtifact]:
+        """Get independent output artifacts enabled by the output selection.
 
         Args:
-            output_dir: Directory to export files
             simulation_end_time: Actual simulation end time for duration calculation
         """
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        self.export_wagon_journey(str(output_path / 'wagon_journey.csv'))
-        self.export_rejected_wagons(str(output_path / 'rejected_wagons.csv'))
-        self.export_locomotive_movements(str(output_path / 'locomotive_movements.csv'))
-        self.export_locomotive_journey(str(output_path / 'locomotive_journey.csv'))
-        self.export_track_capacity(str(output_path / 'track_capacity.csv'))
-        self.export_locomotive_utilization(str(output_path / 'locomotive_utilization.csv'))
-        self.export_locomotive_util(str(output_path / 'locomotive_util.csv'))
-        self.export_locomotive_time_breakdown(str(output_path / 'locomotive_time_breakdown.csv'))
-        self.export_workshop_utilization(str(output_path / 'workshop_utilization.csv'))
-        self.export_summary_metrics(str(output_path / 'summary_metrics.json'), simulation_end_time)
-        self.export_events_csv(str(output_path / 'events.csv'))
-        self.export_timeline(str(output_path / 'timeline.csv'))
-        self.export_workshop_metrics(str(output_path / 'workshop_metrics.csv'))
-
-        # Export dual-stream events
-        self._dual_stream_exporter.export_all(
-            self._dual_stream_collector.state_events,
-            self._dual_stream_collector.location_events,
-            self._dual_stream_collector.process_events,
-            output_dir,
-        )
+        csv = self._csv_exporter
+        artifacts = [
+            ExportArtifact('wagon_journey.csv', lambda: csv.build_wagon_journey(self.wagon_events)),
+            ExportArtifact('rejected_wagons.csv', lambda: csv.build_rejected_wagons(self.wagon_events)),
+            ExportArtifact('locomotive_movements.csv', lambda: csv.build_locomotive_movements(self.locomotive_events)),
+            ExportArtifact(
+                'locomotive_journey.csv',
+                lambda: csv.build_locomotive_journey(self.locomotive_events, self.coupling_events),
+            ),
+            ExportArtifact('track_capacity.csv', lambda: csv.build_track_capacity(self.resource_events)),
+            ExportArtifact(
+                'locomotive_utilization.csv', lambda: csv.build_locomotive_utilization(self.resource_events)
+            ),
+            ExportArtifact('locomotive_util.csv', lambda: csv.build_locomotive_utilization(self.resource_events)),
+            ExportArtifact(
+                'locomotive_time_breakdown.csv',
+                lambda: csv.build_locomotive_time_breakdown(self.locomotive_events, self.coupling_events),
+            ),
+            ExportArtifact('workshop_utilization.csv', lambda: csv.build_workshop_utilization(self.resource_events)),
+            ExportArtifact(
+                'summary_metrics.json', lambda: self.build_summary_metrics(simulation_end_time), write=write_json
+            ),
+            ExportArtifact(
+                'events.csv',
+                lambda: csv.build_events(self.wagon_events, self.locomotive_events, self.batch_events),
+            ),
+            ExportArtifact('timeline.csv', lambda: csv.build_timeline(self.wagon_events, self.resource_events)),
+            ExportArtifact('workshop_metrics.csv', lambda: csv.build_workshop_metrics(self.wagon_events)),
+            *self._dual_stream_exporter.get_artifacts(
+                self._dual_stream_collector.state_events,
+                self._dual_stream_collector.location_events,
+                self._dual_stream_collector.process_events,
+            ),
+        ]
+        return [a for a in artifacts if self.output_selection.includes(a.filename)]
+
+    def export_all(
+        self,
+        output_dir: str,
+        simulation_end_time: float | None = None,
+        max_workers: int | None = None,
+        output_format: TabularFormat = TabularFormat.CSV,
+    ) -> list[ArtifactTiming]:
+        """Export all data, building and writing independent artifacts concurrently.
+
+        When instrumentation is enabled, perf_metrics.json (timers and counters of
+        the run, including the export) is written last.
+
+        Parameters
+        ----------
+        output_dir : str
+            Directory to export files
+        simulation_end_time : float | None
+            Actual simulation end time for duration calculation
+        max_workers : int | None
+            Number of export threads (None = one per CPU, 1 = sequential)
+        output_format : TabularFormat
+            File format for tables (JSON artifacts are unaffected)
+
+        Returns
+        -------
+        list[ArtifactTiming]
+            Build and write time per artifact
+        """
+        writer = ParallelArtifactWriter(max_workers)
+        artifacts = [a.with_format(output_format) for a in self.get_export_artifacts(simulation_end_time)]
+        timings = writer.write_all(artifacts, output_dir)
+        perf = get_perf_registry()
+        if perf.enabled:
+            perf.write_json(Path(output_dir) / 'perf_metrics.json')
+        return timings
@@ -10,6 +10,7 @@ from contexts.retrofit_workflow.application.builders.operations_context_builder
 from contexts.retrofit_workflow.application.config.coordinator_config import ArrivalCoordinatorConfig
 from contexts.retrofit_workflow.application.config.coordinator_config import CollectionCoordinatorConfig
 from contexts.retrofit_workflow.application.config.coordinator_config import ParkingCoordinatorConfig
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
 from contexts.retrofit_workflow.application.config.rake_support_config import RakeSupportConfig
 from contexts.retrofit_workflow.application.coordinators.arrival_coordinator import ArrivalCoordinator
 from contexts.retrofit_workflow.application.coordinators.collection_coordinator import CollectionCoordinator
@@ -33,12 +34,14 @@ from contexts.retrofit_workflow.domain.value_objects.task_priority import Priori
 from contexts.retrofit_workflow.domain.value_objects.task_priority import PriorityRule
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskPriorityConfig
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ArtifactTiming
 from contexts.retrofit_workflow.infrastructure.resources.locomotive_resource_manager import LocomotiveResourceManager
 from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackResourceManager
 from contexts.retrofit_workflow.infrastructure.resources.workshop_resource_manager import WorkshopResourceManager
 from infrastructure.logging import get_process_logger
 from shared.domain.events.wagon_lifecycle_events import TrainArrivedEvent
 from shared.domain.value_objects.selection_strategy import SelectionStrategy
+from shared.infrastructure.tabular_format import TabularFormat
 import simpy
 
 
@@ -59,17 +62,25 @@ class RetrofitWorkshopContext:  # pylint: disable=too-many-instance-attributes
     Train → Collection → Retrofit → Workshop → Retrofitted → Parking
     """
 
-    def __init__(self, env: simpy.Environment, scenario: Any, rake_support_config: RakeSupportConfig | None = None):
+    def __init__(
+        self,
+        env: simpy.Environment,
+        scenario: Any,
+        rake_support_config: RakeSupportConfig | None = None,
+        output_selection: OutputSelection | None = None,
+    ):
         """Initialize context.
 
         Args:
             env: SimPy environment
             scenario: Scenario configuration
             rake_support_config: Optional rake support configuration
+            output_selection: Optional output artifacts to produce (default: all)
         """
         self.env = env
         self.scenario = scenario
         self.rake_support_config = rake_support_config or RakeSupportConfig.create_disabled()
+        self.output_selection = output_selection
 
         # SimPy queues for wagon flow
         self.collection_queue: simpy.FilterStore = simpy.FilterStore(env)
@@ -122,7 +133,7 @@ class RetrofitWorkshopContext:  # pylint: disable=too-many-instance-attributes
         builder = RetrofitWorkshopContexttBuilder(self.env, self.scenario)
 
         # Build components step by step
-        builder.build_event_collector(process_logger=process_logger)
+        builder.build_event_collector(process_logger=process_logger, output_selection=self.output_selection)
         builder.build_entities()
         builder.build_resource_managers()
 
@@ -197,16 +208,30 @@ class RetrofitWorkshopContext:  # pylint: disable=too-many-instance-attributes
 
         return metrics
 
-    def export_events(self, output_dir: str) -> None:
+    def export_events(
+        self, output_dir: str, max_workers: int | None = None, output_format: TabularFormat = TabularFormat.CSV
+    ) -> list[ArtifactTiming]:
         """Export collected events to files.
 
         Parameters
         ----------
         output_dir: str
             Directory to write event files
+        max_workers: int | None
+            Number of parallel export threads (None = one per CPU)
+        output_format: TabularFormat
+            File format for tabular outputs
+
+        Returns
+        -------
+        list[ArtifactTiming]
+            Build and write time per exported artifact
         """
         if self.event_collector:
-            self.event_collector.export_all(output_dir, self.env.now)
+            return self.event_collector.export_all(
+                output_dir, self.env.now, max_workers=max_workers, output_format=output_format
+            )
+        return []
 
     def cleanup(self) -> None:
         """Cleanup context resources."""
@@ -248,6 +273,8 @@ class RetrofitWorkshopContext:  # pylint: disable=too-many-instance-attributes
 
         # Create route service
         self.route_service = RouteService(self.scenario.routes)
+        if self.locomotive_manager and getattr(self.scenario, 'loco_allocation_strategy', 'fifo') == 'nearest':
+            self.locomotive_manager.set_route_duration(self.route_service.get_duration)
 
         # Build tracks_by_type dictionary
         tracks_by_type: dict[str, list[Any]] = {}
@@ -407,6 +434,7 @@ class RetrofitWorkshopContext:  # pylint: disable=too-many-instance-attributes
             loco_event_publisher=self.event_collector.add_locomotive_event if self.event_collector else None,
             event_publisher=self.event_collector.add_resource_event if self.event_collector else None,
             coupling_event_publisher=self.event_collector.add_coupling_event if self.event_collector else None,
+            workshop_strategy=self.scenario.workshop_selection_strategy,
         )
 
         self.workshop_coordinator = WorkshopCoordinator(workshop_config)
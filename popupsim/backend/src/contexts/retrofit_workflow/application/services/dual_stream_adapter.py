@@ -76,8 +76,7 @@ def _record_wagon_dual_stream(event: WagonJourneyEvent, collector: 'EventCollect
     }
 
     if event.event_type in process_map:
-        # Extract coupler type from event metadata if available
-        coupler_type = getattr(event, 'coupler_type', None)
+        coupler_type = event.coupler_type
 
         collector.record_process_event(
             timestamp=event.timestamp,
@@ -109,7 +108,7 @@ def _record_wagon_dual_stream(event: WagonJourneyEvent, collector: 'EventCollect
 
     # For MOVING events, record route_path without changing location
     if event.event_type == 'MOVING':
-        route_path = getattr(event, 'route_path', None)
+        route_path = event.route_path
         if route_path and event.location:
             # Record location with route_path for visualization
             collector.record_location_change(
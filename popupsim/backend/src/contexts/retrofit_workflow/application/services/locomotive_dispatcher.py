@@ -7,16 +7,19 @@ task requests to the dispatcher, which assigns the next free locomotive to
 the highest-priority pending task.
 """
 
+from collections import deque
 from collections.abc import Callable
 from collections.abc import Generator
 from dataclasses import dataclass
 from dataclasses import field
+import itertools
 import logging
 from typing import Any
 
 from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskPriorityConfig
 from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from shared.infrastructure.perf_metrics import timed
 import simpy
 
 logger = logging.getLogger(__name__)
@@ -74,6 +77,12 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
     effective priority of each pending task based on current track fill
     levels, then assigns the locomotive to the highest-priority task.
 
+    Pending tasks are bucketed per task type in submission order. Priority and
+    hold state depend only on the task type and fill levels, so only the head
+    of each bucket competes, and both are cached until the fill-level version
+    of the type's source or target track type changes. Dispatch cost therefore
+    scales with the number of task types, not the number of pending tasks.
+
     Parameters
     ----------
     env : simpy.Environment
@@ -109,8 +118,13 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         self.priority_configs = priority_configs
         self.event_publisher = event_publisher
 
-        # Pending task requests
-        self._pending: list[TaskRequest] = []
+        # Pending task requests per task type in submission order, with submission sequence
+        self._pending: dict[TaskType, deque[tuple[int, TaskRequest]]] = {}
+        self._pending_count: int = 0
+        self._submission_seq = itertools.count()
+
+        # Cached (fill-level versions, hold satisfied, effective priority) per task type
+        self._type_state: dict[TaskType, tuple[tuple[int, ...], bool, int]] = {}
 
         # Signal that new tasks are available
         self._task_available: simpy.Event = env.event()
@@ -136,12 +150,13 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         task : TaskRequest
             Task to enqueue for locomotive assignment.
         """
-        self._pending.append(task)
+        self._pending.setdefault(task.task_type, deque()).append((next(self._submission_seq), task))
+        self._pending_count += 1
         logger.info(
             't=%.1f: DISPATCHER → Task submitted: %s (pending=%d)',
             self.env.now,
             task.task_type.value,
-            len(self._pending),
+            self._pending_count,
         )
 
         # Signal the dispatch loop
@@ -152,6 +167,7 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         if self._eligibility_wake and not self._eligibility_wake.triggered:
             self._eligibility_wake.succeed()
 
+    @timed('LocomotiveDispatcher._dispatch_loop')
     def _dispatch_loop(self) -> Generator[Any, Any]:
         """Dispatch locomotives to highest-priority tasks in a loop.
 
@@ -171,8 +187,13 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
             # Wait until at least one task is eligible before allocating a loco
             yield from self._wait_for_eligible_task()
 
-            # Now we know there's an eligible task — allocate a locomotive
-            loco = yield self.env.process(self.locomotive_manager.allocate(purpose='dispatcher'))
+            # Now we know there's an eligible task — allocate a locomotive (in a location-aware
+            # pool the one nearest to the currently best task's source track)
+            best_type = self._find_best_type()
+            near_track = self._pending[best_type][0][1].source_track_id if best_type is not None else None
+            loco = yield self.env.process(
+                self.locomotive_manager.allocate(purpose='dispatcher', near_track=near_track or None)
+            )
 
             # Select best eligible task (re-evaluate after loco wait)
             best_task = self._select_best_task()
@@ -193,7 +214,7 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
                 loco.id,
                 best_task.task_type.value,
                 wait_time,
-                len(self._pending),
+                self._pending_count,
             )
 
             # Trigger the callback event with the locomotive
@@ -213,9 +234,10 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         poll_interval = 5.0  # Re-check every 5 sim minutes
 
         while True:
-            # Check if any pending task is eligible right now
-            for task in self._pending:
-                if self._is_task_eligible(task):
+            # Check if any pending task is eligible right now (the oldest task of a type
+            # is eligible whenever any task of that type is)
+            for bucket in self._pending.values():
+                if self._is_task_eligible(bucket[0][1]):
                     return
 
             # None eligible — wait for either a new task or the poll interval
@@ -230,9 +252,9 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
     def _select_best_task(self) -> TaskRequest | None:
         """Select the highest-priority pending task that is eligible to run.
 
-        Evaluates effective priority for each pending task based on
-        current track fill levels, then returns the most urgent one.
-        Tasks whose hold_until condition is not met are skipped.
+        Evaluates effective priority for the oldest pending task of each
+        type based on current track fill levels, then returns the most urgent
+        one. Tasks whose hold_until condition is not met are skipped.
         Ties are broken by submission time (FIFO).
 
         Returns
@@ -240,28 +262,42 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         TaskRequest | None
             Highest priority eligible task, or None if all are held/empty.
         """
-        if not self._pending:
+        best_type = self._find_best_type()
+        if best_type is None:
             return None
 
-        best_task: TaskRequest | None = None
-        best_score: tuple[int, float] | None = None  # (priority, submitted_at)
+        bucket = self._pending[best_type]
+        _, best_task = bucket.popleft()
+        if not bucket:
+            del self._pending[best_type]
+        self._pending_count -= 1
+        return best_task
+
+    def _find_best_type(self) -> TaskType | None:
+        """Find the task type whose oldest pending task is the best eligible task.
 
-        for task in self._pending:
+        Returns
+        -------
+        TaskType | None
+            Task type of the best eligible task, or None if all are held/empty.
+        """
+        best_type: TaskType | None = None
+        best_score: tuple[int, float, int] | None = None  # (priority, submitted_at, submission seq)
+
+        # Within a bucket all tasks share priority and hold state, and older tasks
+        # reach max_hold_time first, so the head is the bucket's only candidate
+        for task_type, bucket in self._pending.items():
+            seq, task = bucket[0]
             # Check hold_until gate
             if not self._is_task_eligible(task):
                 continue
 
-            priority = self._evaluate_task_priority(task)
-            score = (priority, task.submitted_at)
-
+            score = (self._evaluate_task_priority(task), task.submitted_at, seq)
             if best_score is None or score < best_score:
                 best_score = score
-                best_task = task
+                best_type = task_type
 
-        if best_task:
-            self._pending.remove(best_task)
-
-        return best_task
+        return best_type
 
     def _is_task_eligible(self, task: TaskRequest) -> bool:
         """Check if a task's hold_until condition allows it to proceed.
@@ -298,8 +334,7 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
                 )
                 return True
 
-        source_fill, target_fill, target_idle = self._get_fill_levels(task.task_type)
-        return config.hold_until.is_satisfied(source_fill, target_fill, target_idle)
+        return self._get_type_state(task.task_type)[0]
 
     def _evaluate_task_priority(self, task: TaskRequest) -> int:
         """Evaluate effective priority for a task given current state.
@@ -314,14 +349,55 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         int
             Effective priority (lower = more urgent).
         """
-        config = self.priority_configs.get(task.task_type)
-        if config is None:
+        if task.task_type not in self.priority_configs:
             return 5  # Low default priority for unknown task types
 
-        # Get track fill levels for this task type
-        source_fill, target_fill, target_idle = self._get_fill_levels(task.task_type)
+        return self._get_type_state(task.task_type)[1]
+
+    def _get_type_state(self, task_type: TaskType) -> tuple[bool, int]:
+        """Get hold state and effective priority of a task type, cached per fill-level version.
+
+        Parameters
+        ----------
+        task_type : TaskType
+            Task type with a priority config.
+
+        Returns
+        -------
+        tuple[bool, int]
+            (hold_until satisfied, effective priority)
+        """
+        version = self._get_fill_version(task_type)
+        cached = self._type_state.get(task_type)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        config = self.priority_configs[task_type]
+        source_fill, target_fill, target_idle = self._get_fill_levels(task_type)
+        hold_satisfied = config.hold_until is None or config.hold_until.is_satisfied(
+            source_fill, target_fill, target_idle
+        )
+        priority = config.evaluate(source_fill, target_fill, target_idle)
+        self._type_state[task_type] = (version, hold_satisfied, priority)
+        return hold_satisfied, priority
+
+    def _get_fill_version(self, task_type: TaskType) -> tuple[int, ...]:
+        """Get fill-level versions of the source and target track types of a task type.
+
+        Parameters
+        ----------
+        task_type : TaskType
+            Task type to look up track types for.
 
-        return config.evaluate(source_fill, target_fill, target_idle)
+        Returns
+        -------
+        tuple[int, ...]
+            Versions that change whenever the fill levels of the task type may change.
+        """
+        track_types = TASK_TRACK_TYPES.get(task_type)
+        if not track_types or not self.track_selector:
+            return ()
+        return tuple(self.track_selector.get_fill_version(track_type) for track_type in track_types)
 
     def _get_fill_levels(self, task_type: TaskType) -> tuple[float, float, bool]:
         """Get current fill levels for source and target track types.
@@ -368,25 +444,11 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         if not self.track_selector:
             return 0.0
 
-        tracks = self.track_selector.tracks_by_type.get(track_type, [])
-        if not tracks:
-            return 0.0
-
-        total_capacity = 0.0
-        total_occupied = 0.0
-
-        for track in tracks:
-            total_capacity += track.capacity_meters
-            total_occupied += track.get_occupied_capacity()
-
-        if total_capacity == 0:
-            return 0.0
-
-        return total_occupied / total_capacity
+        return self.track_selector.get_fill_ratio(track_type)
 
     def get_pending_count(self) -> int:
         """Get number of pending tasks."""
-        return len(self._pending)
+        return self._pending_count
 
     def get_metrics(self) -> dict[str, Any]:
         """Get dispatcher metrics.
@@ -399,6 +461,6 @@ class LocomotiveDispatcher:  # pylint: disable=too-many-instance-attributes
         avg_wait = self._total_wait_time / self._tasks_dispatched if self._tasks_dispatched > 0 else 0.0
         return {
             'tasks_dispatched': self._tasks_dispatched,
-            'pending_tasks': len(self._pending),
+            'pending_tasks': self._pending_count,
             'average_wait_time': avg_wait,
         }
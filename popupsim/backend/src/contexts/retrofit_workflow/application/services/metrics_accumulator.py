@@ -0,0 +1,324 @@
+"""Online summary metrics accumulator.
+
+Maintains the counters, unique-id sets and time integrals behind
+``summary_metrics.json`` while events are published, so the summary is
+available at any point of the run without rescanning event lists. Results
+match :class:`MetricsAggregator` for events published in simulation-time order.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from contexts.retrofit_workflow.domain.events import CouplingEvent
+from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+from contexts.retrofit_workflow.domain.events.batch_events import BatchArrivedAtDestination
+from contexts.retrofit_workflow.domain.events.batch_events import BatchFormed
+from contexts.retrofit_workflow.domain.events.batch_events import BatchTransportStarted
+
+
+@dataclass
+class _WorkshopIntegral:
+    """Running busy/total time integral of one workshop."""
+
+    total_time: float = 0.0
+    busy_time: float = 0.0
+    prev_time: float = 0.0
+    prev_busy: float = 0.0
+    prev_total: float = 0.0
+
+    def advance(self, event: ResourceStateChangeEvent) -> None:
+        """Close interval since previous event and store new bay state."""
+        if self.prev_time > 0 and self.prev_total > 0:
+            duration = event.timestamp - self.prev_time
+            self.total_time += duration
+            self.busy_time += duration * (self.prev_busy / self.prev_total)
+
+        self.prev_time = event.timestamp
+        self.prev_busy = float(event.busy_bays_after)  # type: ignore[arg-type]
+        self.prev_total = float(event.total_bays)  # type: ignore[arg-type]
+
+    def utilization(self, sim_duration: float) -> float:
+        """Get utilization percent, extending last state to ``sim_duration``."""
+        total_time = self.total_time
+        busy_time = self.busy_time
+        if 0 < self.prev_time < sim_duration and self.prev_total > 0:
+            duration = sim_duration - self.prev_time
+            total_time += duration
+            busy_time += duration * (self.prev_busy / self.prev_total)
+        return (busy_time / total_time) * 100 if total_time > 0 else 0.0
+
+
+@dataclass
+class _LocomotiveTimes:
+    """Running time breakdown of one locomotive."""
+
+    last_event_type: str | None = None
+    last_timestamp: float = 0.0
+    moving_time: float = 0.0
+    coupling_time: float = 0.0
+    decoupling_time: float = 0.0
+
+
+@dataclass
+class _RejectionCounts:
+    """Rejection counters by reason."""
+
+    no_retrofit: int = 0
+    loaded: int = 0
+    track_full: int = 0
+    no_retrofit_ids: set[str] = field(default_factory=set)
+    loaded_ids: set[str] = field(default_factory=set)
+
+
+class MetricsAccumulator:  # pylint: disable=too-many-instance-attributes
+    """Incrementally aggregates summary metrics from published events.
+
+    Note: Multiple attributes needed to keep every summary metric up to date.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty accumulator."""
+        # Event counts per stream keep the key order of MetricsAggregator
+        self._wagon_counts: dict[str, int] = {}
+        self._locomotive_counts: dict[str, int] = {}
+        self._batch_counts: dict[str, int] = {}
+
+        self._arrived_ids: set[str] = set()
+        self._rejected_ids: set[str] = set()
+        self._retrofitted_ids: set[str] = set()
+        self._parked_ids: set[str] = set()
+        self._arrived_train_ids: set[str] = set()
+        self._wagons_rejected = 0
+        self._wagons_distributed = 0
+        self._rejections = _RejectionCounts()
+
+        self._workshop_stats: dict[str, dict[str, int]] = {}
+        self._workshop_integrals: dict[str, _WorkshopIntegral] = {}
+
+        self._loco_allocated = 0
+        self._loco_released = 0
+        self._loco_movements = 0
+        self._loco_resource_events = 0
+        self._loco_resource_released = 0
+        self._locomotives: dict[str, _LocomotiveTimes] = {}
+
+        self._max_wagon_timestamp: float | None = None
+        self._max_timestamp: float | None = None
+
+    def _observe_timestamp(self, timestamp: float) -> None:
+        """Track latest timestamp over wagon, locomotive and resource events."""
+        if self._max_timestamp is None or timestamp > self._max_timestamp:
+            self._max_timestamp = timestamp
+
+    def add_wagon_event(self, event: WagonJourneyEvent) -> None:
+        """Accumulate wagon event."""
+        name = event.__class__.__name__
+        self._wagon_counts[name] = self._wagon_counts.get(name, 0) + 1
+        self._observe_timestamp(event.timestamp)
+        if self._max_wagon_timestamp is None or event.timestamp > self._max_wagon_timestamp:
+            self._max_wagon_timestamp = event.timestamp
+
+        match event.event_type:
+            case 'ARRIVED':
+                self._arrived_ids.add(event.wagon_id)
+                if event.train_id:
+                    self._arrived_train_ids.add(event.train_id)
+            case 'PARKED':
+                self._parked_ids.add(event.wagon_id)
+            case 'REJECTED':
+                self._add_rejection(event)
+            case 'RETROFIT_COMPLETED':
+                self._retrofitted_ids.add(event.wagon_id)
+            case 'DISTRIBUTED':
+                self._wagons_distributed += 1
+            case 'RETROFIT_STARTED' if event.location:
+                stats = self._workshop_stats.setdefault(event.location, {'wagons_processed': 0, 'retrofits_started': 0})
+                stats['retrofits_started'] += 1
+                stats['wagons_processed'] += 1
+
+    def _add_rejection(self, event: WagonJourneyEvent) -> None:
+        """Accumulate rejected wagon event."""
+        self._rejected_ids.add(event.wagon_id)
+        self._wagons_rejected += 1
+        reason = event.rejection_reason
+        if not reason:
+            return
+        if 'No Retrofit' in reason:
+            self._rejections.no_retrofit += 1
+            self._rejections.no_retrofit_ids.add(event.wagon_id)
+        if 'Loaded' in reason:
+            self._rejections.loaded += 1
+            self._rejections.loaded_ids.add(event.wagon_id)
+        if 'TRACK' in reason.upper():
+            self._rejections.track_full += 1
+
+    def add_locomotive_event(self, event: LocomotiveMovementEvent) -> None:
+        """Accumulate locomotive event."""
+        name = event.__class__.__name__
+        self._locomotive_counts[name] = self._locomotive_counts.get(name, 0) + 1
+        self._observe_timestamp(event.timestamp)
+
+        if event.event_type == 'ALLOCATED':
+            self._loco_allocated += 1
+        elif event.event_type == 'RELEASED':
+            self._loco_released += 1
+        elif event.event_type == 'MOVING':
+            self._loco_movements += 1
+
+        times = self._locomotives.setdefault(event.locomotive_id, _LocomotiveTimes())
+        if times.last_event_type == 'MOVING':
+            times.moving_time += event.timestamp - times.last_timestamp
+        times.last_event_type = event.event_type
+        times.last_timestamp = event.timestamp
+
+    def add_resource_event(self, event: ResourceStateChangeEvent) -> None:
+        """Accumulate resource event."""
+        self._observe_timestamp(event.timestamp)
+        if event.resource_type == 'workshop':
+            self._workshop_integrals.setdefault(event.resource_id, _WorkshopIntegral()).advance(event)
+        elif event.resource_type == 'locomotive':
+            self._loco_resource_events += 1
+            if event.change_type == 'released':
+                self._loco_resource_released += 1
+
+    def add_batch_event(self, event: BatchFormed | BatchTransportStarted | BatchArrivedAtDestination) -> None:
+        """Accumulate batch event."""
+        name = event.__class__.__name__
+        self._batch_counts[name] = self._batch_counts.get(name, 0) + 1
+
+    def add_coupling_event(self, event: CouplingEvent) -> None:
+        """Accumulate coupling event."""
+        if not event.duration:
+            return
+        times = self._locomotives.get(event.locomotive_id)
+        if times is None:
+            # Coupling may precede the first movement event of a locomotive
+            times = self._locomotives[event.locomotive_id] = _LocomotiveTimes()
+        if 'COUPLING' in event.event_type and 'DECOUPLING' not in event.event_type:
+            times.coupling_time += event.duration
+        elif 'DECOUPLING' in event.event_type:
+            times.decoupling_time += event.duration
+
+    def get_event_counts(self) -> dict[str, int | dict[str, int]]:
+        """Get event counts."""
+        event_type_counts = dict(self._wagon_counts)
+        for counts in (self._locomotive_counts, self._batch_counts):
+            for name, count in counts.items():
+                event_type_counts[name] = event_type_counts.get(name, 0) + count
+
+        return {
+            'total_events': sum(event_type_counts.values()),
+            'event_counts': event_type_counts,
+        }
+
+    def _wagon_sim_duration(self) -> float:
+        """Get latest wagon timestamp (1 without wagon events)."""
+        return self._max_wagon_timestamp if self._max_wagon_timestamp is not None else 1
+
+    def get_wagon_metrics(self) -> dict[str, int | float]:
+        """Get wagon-related metrics."""
+        total_wagons = len(self._arrived_ids | self._rejected_ids)
+        wagons_arrived = len(self._arrived_ids)
+        wagons_parked = len(self._parked_ids)
+        retrofits_completed = len(self._retrofitted_ids)
+        rejections = self._rejections
+        rejected_other = self._wagons_rejected - rejections.no_retrofit - rejections.loaded - rejections.track_full
+
+        wagons_eligible = total_wagons - len(rejections.no_retrofit_ids - self._retrofitted_ids)
+        wagons_processable = wagons_eligible - len(rejections.loaded_ids)
+        sim_duration = self._wagon_sim_duration()
+
+        return {
+            'trains_arrived': len(self._arrived_train_ids),
+            'total_wagons': total_wagons,
+            'wagons_eligible': wagons_eligible,
+            'wagons_processable': wagons_processable,
+            'wagons_arrived': wagons_arrived,
+            'wagons_parked': wagons_parked,
+            'retrofits_completed': retrofits_completed,
+            'wagons_rejected': self._wagons_rejected,
+            'rejected_no_retrofit': rejections.no_retrofit,
+            'rejected_loaded': rejections.loaded,
+            'rejected_track_full': rejections.track_full,
+            'rejected_other': rejected_other,
+            'wagons_distributed': self._wagons_distributed,
+            'wagons_in_process': wagons_arrived - wagons_parked,
+            'completion_rate': retrofits_completed / wagons_processable if wagons_processable > 0 else 0,
+            'throughput_rate_per_hour': (wagons_parked / sim_duration * 60) if sim_duration > 0 else 0,
+        }
+
+    def get_workshop_metrics(self) -> dict[str, Any]:
+        """Get workshop statistics and average utilization."""
+        workshop_util = 0.0
+        if self._workshop_stats:
+            sim_duration = self._wagon_sim_duration()
+            total_util = sum(
+                self._workshop_integrals[ws_id].utilization(sim_duration)
+                for ws_id in self._workshop_stats
+                if ws_id in self._workshop_integrals
+            )
+            workshop_util = total_util / len(self._workshop_stats)
+
+        return {
+            'workshop_statistics': {
+                'total_workshops': len(self._workshop_stats),
+                'workshops': {ws_id: dict(stats) for ws_id, stats in self._workshop_stats.items()},
+                'total_wagons_processed': sum(ws['wagons_processed'] for ws in self._workshop_stats.values()),
+            },
+            'workshop_utilization': workshop_util,
+        }
+
+    def get_locomotive_metrics(self) -> dict[str, dict[str, int]]:
+        """Get locomotive metrics."""
+        loco_released = self._loco_released
+        # Fallback: locomotive_manager always publishes a resource event on release
+        if loco_released == 0 and self._loco_resource_events:
+            loco_released = self._loco_resource_released
+
+        return {
+            'locomotive_statistics': {
+                'allocations': self._loco_allocated,
+                'releases': loco_released,
+                'movements': self._loco_movements,
+                'total_operations': self._loco_allocated + loco_released + self._loco_movements,
+            }
+        }
+
+    def get_sim_duration(self) -> float:
+        """Get latest wagon, locomotive or resource event timestamp (0 without events)."""
+        return self._max_timestamp if self._max_timestamp is not None else 0
+
+    def get_locomotive_time_breakdown(self, sim_duration: float) -> dict[str, dict[str, float]]:
+        """Get per-locomotive time breakdown for locomotives with movement events, sorted by id."""
+        breakdown: dict[str, dict[str, float]] = {}
+        for loco_id, times in sorted(self._locomotives.items()):
+            if times.last_event_type is None:
+                continue
+            total_active = times.moving_time + times.coupling_time + times.decoupling_time
+            breakdown[loco_id] = {
+                'moving_time': times.moving_time,
+                'idle_time': max(0, sim_duration - total_active),
+                'coupling_time': times.coupling_time,
+                'decoupling_time': times.decoupling_time,
+            }
+        return breakdown
+
+    def get_summary(self, simulation_end_time: float | None = None) -> dict[str, Any]:
+        """Get summary metrics.
+
+        Args:
+            simulation_end_time: Simulation end (or current) time (if None, uses max event timestamp)
+        """
+        duration = simulation_end_time if simulation_end_time is not None else self.get_sim_duration()
+
+        return {
+            **self.get_event_counts(),
+            **self.get_wagon_metrics(),
+            **self.get_workshop_metrics(),
+            **self.get_locomotive_metrics(),
+            'locomotive_time_breakdown': self.get_locomotive_time_breakdown(duration),
+            'simulation_duration_minutes': duration,
+        }
@@ -16,7 +16,7 @@ class LocomotiveStatus(Enum):
     DECOUPLING = 'DECOUPLING'
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Locomotive:  # pylint: disable=too-many-instance-attributes
     """Locomotive entity with enforced business rules.
 
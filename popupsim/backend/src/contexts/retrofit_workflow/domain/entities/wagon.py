@@ -19,7 +19,7 @@ class WagonStatus(Enum):
     PARKED = 'PARKED'
 
 
-@dataclass
+@dataclass(slots=True)
 class Wagon:  # pylint: disable=too-many-instance-attributes
     """Wagon entity with enforced business rules.
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class WagonJourneyEvent:  # pylint: disable=too-many-instance-attributes
     """Tracks wagon state changes throughout the simulation."""
 
@@ -15,9 +15,11 @@ class WagonJourneyEvent:  # pylint: disable=too-many-instance-attributes
     train_id: str | None = None
     rejection_reason: str | None = None
     rejection_description: str | None = None
+    route_path: list[str] | None = None  # Route of MOVING events for visualization
+    coupler_type: str | None = None  # Coupler type of rake coupling/decoupling events
 
 
-@dataclass
+@dataclass(slots=True)
 class LocomotiveMovementEvent:
     """Tracks locomotive movements and allocations."""
 
@@ -30,7 +32,7 @@ class LocomotiveMovementEvent:
     current_location: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceStateChangeEvent:  # pylint: disable=too-many-instance-attributes
     """Tracks resource utilization changes when they happen."""
 
@@ -63,7 +65,7 @@ class ResourceStateChangeEvent:  # pylint: disable=too-many-instance-attributes
     triggered_by: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LocomotiveAssemblyEvent:  # pylint: disable=too-many-instance-attributes
     """Tracks locomotive assembly operations."""
 
@@ -77,7 +79,7 @@ class LocomotiveAssemblyEvent:  # pylint: disable=too-many-instance-attributes
     location: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CouplingEvent:  # pylint: disable=too-many-instance-attributes
     """Tracks coupling/decoupling operations.
 
@@ -5,7 +5,9 @@ etc.) using various selection strategies. It implements common resource allocati
 patterns used throughout the DAC migration simulation system.
 """
 
+import bisect
 from collections.abc import Callable
+import math
 import random
 from typing import TypeVar
 
@@ -14,6 +16,50 @@ from shared.domain.value_objects.selection_strategy import SelectionStrategy
 
 TResource = TypeVar('TResource', bound=ResourcePort)  # pylint: disable=invalid-name
 
+INDEXED_STRATEGIES = frozenset(
+    {SelectionStrategy.MOST_AVAILABLE, SelectionStrategy.LEAST_OCCUPIED, SelectionStrategy.BEST_FIT}
+)
+"""Strategies answered from the capacity index by ``select_with_capacity``."""
+
+
+class _CapacityIndex[TResource: ResourcePort]:
+    """Resources sorted by available capacity for logarithmic capacity queries.
+
+    Entries are ``(available_capacity, insertion_position, resource_id)`` so ties
+    resolve to the first resource in dict order, like the linear strategies.
+    """
+
+    def __init__(self, resources: dict[str, TResource]) -> None:
+        self._resources = resources
+        self._positions = {resource_id: i for i, resource_id in enumerate(resources)}
+        self._entries: dict[str, tuple[float, int, str]] = {}
+        self._sorted: list[tuple[float, int, str]] = []
+        for resource_id in resources:
+            self.refresh(resource_id)
+
+    def refresh(self, resource_id: str) -> None:
+        """Re-read available capacity of resource and move it to its sorted position."""
+        old = self._entries.get(resource_id)
+        if old is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+        entry = (self._resources[resource_id].get_available_capacity(), self._positions[resource_id], resource_id)
+        self._entries[resource_id] = entry
+        bisect.insort(self._sorted, entry)
+
+    def most_available(self, required_capacity: float) -> str | None:
+        """Get first resource with the most available capacity, if it has at least required_capacity."""
+        if not self._sorted or self._sorted[-1][0] < required_capacity:
+            return None
+        return self._sorted[bisect.bisect_left(self._sorted, (self._sorted[-1][0],))][2]
+
+    def best_fit(self, required_capacity: float) -> str | None:
+        """Get first resource with the least positive available capacity of at least required_capacity."""
+        if required_capacity > 0:
+            index = bisect.bisect_left(self._sorted, (required_capacity,))
+        else:
+            index = bisect.bisect_right(self._sorted, (0.0, math.inf))
+        return self._sorted[index][2] if index < len(self._sorted) else None
+
 
 class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=invalid-name,too-few-public-methods
     """Generic service for selecting resources using configurable strategies.
@@ -39,6 +85,12 @@ class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=inva
     This is a stateless service except for round-robin counter state.
     All selection logic is based on pure business rules.
 
+    With ``indexed=True`` the service also keeps resources sorted by available
+    capacity. Capacity queries via ``select_with_capacity`` are then answered in
+    O(log n) for MOST_AVAILABLE/LEAST_OCCUPIED and BEST_FIT, with the same result
+    as the linear strategies, provided ``refresh`` is called whenever a resource's
+    available capacity changes.
+
     Examples
     --------
     >>> workshops = {'WS1': workshop1, 'WS2': workshop2}
@@ -50,6 +102,7 @@ class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=inva
         self,
         resources: dict[str, TResource],
         strategy: SelectionStrategy = SelectionStrategy.FIRST_AVAILABLE,
+        indexed: bool = False,
     ) -> None:
         """Initialize the resource selection service.
 
@@ -59,6 +112,8 @@ class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=inva
             Dictionary mapping resource identifiers to resource objects
         strategy : SelectionStrategy, default=SelectionStrategy.FIRST_AVAILABLE
             Selection strategy to use for resource allocation
+        indexed : bool, default=False
+            Keep a capacity index for ``select_with_capacity`` (needs ``refresh`` calls)
 
         Notes
         -----
@@ -68,6 +123,7 @@ class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=inva
         self.resources = resources
         self.strategy = strategy
         self._round_robin_counter = 0
+        self._capacity_index = _CapacityIndex(resources) if indexed and strategy in INDEXED_STRATEGIES else None
 
         # Strategy dispatch mapping
         self._strategy_map: dict[SelectionStrategy, Callable] = {
@@ -115,6 +171,39 @@ class ResourceSelectionService[TResource: ResourcePort]:  # pylint: disable=inva
         strategy_func = self._strategy_map.get(self.strategy)
         return strategy_func(can_use) if strategy_func else None
 
+    def select_with_capacity(self, required_capacity: float = 0.0) -> str | None:
+        """Select a resource with at least required_capacity available.
+
+        Equivalent to ``select(lambda _id, r: r.get_available_capacity() >= required_capacity)``
+        but answered from the capacity index when the service is indexed.
+
+        Parameters
+        ----------
+        required_capacity : float, default=0.0
+            Minimum available capacity
+
+        Returns
+        -------
+        str | None
+            Resource identifier of selected resource, or None if no suitable resource
+        """
+        if self._capacity_index is None:
+            return self.select(lambda _rid, resource: resource.get_available_capacity() >= required_capacity)
+        if self.strategy is SelectionStrategy.BEST_FIT:
+            return self._capacity_index.best_fit(required_capacity)
+        return self._capacity_index.most_available(required_capacity)
+
+    def refresh(self, resource_id: str) -> None:
+        """Update capacity index after the available capacity of a resource changed.
+
+        Parameters
+        ----------
+        resource_id : str
+            Identifier of the changed resource
+        """
+        if self._capacity_index is not None:
+            self._capacity_index.refresh(resource_id)
+
     def _can_use_resource(
         self,
         resource_id: str,
@@ -5,7 +5,10 @@ between different locations in the DAC migration simulation system. It manages
 route configurations and provides standardized access to timing information.
 """
 
+from functools import cached_property
+
 from contexts.configuration.application.dtos.route_input_dto import RouteType
+from shared.domain.services.route_table import RouteTable
 from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
 
 
@@ -20,6 +23,8 @@ class RouteService:
     ----------
     route_durations : dict[tuple[str, str], float]
         Dictionary mapping (from_location, to_location) tuples to duration values
+    route_table : RouteTable
+        Shortest chains of configured routes between all location pairs (compiled on first use)
 
     Route Types Supported
     ---------------------
@@ -32,7 +37,8 @@ class RouteService:
     Notes
     -----
     All durations are normalized to simulation time units (minutes by default).
-    Missing routes default to 1.0 minute for system resilience.
+    A configured route always wins. Pairs without one use the fastest chain of
+    configured routes, so routes.json does not need every pair.
 
     Examples
     --------
@@ -91,11 +97,20 @@ class RouteService:
                     route_type = RouteType.SHUNTING
                 self.route_types[(from_location, to_location)] = route_type
 
+    @cached_property
+    def route_table(self) -> RouteTable:
+        """Get all-pairs shortest chains of configured routes.
+
+        Compiled on the first lookup of a pair without its own route, so
+        scenarios that configure every pair they use never pay for it.
+        """
+        return RouteTable((path, self.route_durations[pair]) for pair, path in self.route_paths.items())
+
     def get_duration(self, from_location: str, to_location: str) -> float:
         """Get transport duration between two specified locations.
 
-        Looks up the configured transport time between the specified locations.
-        Raises KeyError if route not found.
+        Looks up the configured transport time between the specified locations,
+        or the fastest chain of configured routes if the pair has no route.
 
         Parameters
         ----------
@@ -112,7 +127,7 @@ class RouteService:
         Raises
         ------
         KeyError
-            If route from_location->to_location is not configured
+            If no route or chain of routes connects from_location->to_location
 
         Examples
         --------
@@ -120,9 +135,64 @@ class RouteService:
         >>> duration = service.get_duration('TRACK_A', 'WORKSHOP_01')
         >>> print(f'Transport time: {duration} minutes')
         """
-        if (from_location, to_location) not in self.route_durations:
+        duration = self.route_durations.get((from_location, to_location))
+        if duration is not None:
+            return duration
+        if not self.route_table.has_route(from_location, to_location):
             raise KeyError(f'Route {from_location}->{to_location} not found in routes configuration')
-        return self.route_durations[(from_location, to_location)]
+        return self.route_table.duration(from_location, to_location)
+
+    def has_route(self, from_location: str, to_location: str) -> bool:
+        """Check whether a route or chain of routes connects two locations.
+
+        Parameters
+        ----------
+        from_location : str
+            Starting location identifier
+        to_location : str
+            Destination location identifier
+
+        Returns
+        -------
+        bool
+            True if get_duration(from_location, to_location) does not raise
+        """
+        return (from_location, to_location) in self.route_durations or self.route_table.has_route(
+            from_location, to_location
+        )
+
+    def get_duration_via(self, from_location: str, to_location: str, via: str) -> float:
+        """Get transport duration, through a third location if no route connects the two.
+
+        Used for locomotives approaching their next track from where their last
+        transport ended: every track is connected to the locomotive home track,
+        but not necessarily to every other track.
+
+        Parameters
+        ----------
+        from_location : str
+            Starting location identifier
+        to_location : str
+            Destination location identifier
+        via : str
+            Location to pass if no route connects from_location->to_location
+
+        Returns
+        -------
+        float
+            Transport duration in simulation time units (minutes), 0 if the
+            locations are the same and no route is configured for the pair
+
+        Raises
+        ------
+        KeyError
+            If neither route nor the two routes through via exist
+        """
+        if from_location == via or self.has_route(from_location, to_location):
+            return self.get_duration(from_location, to_location)
+        if from_location == to_location:
+            return 0.0
+        return self.get_duration(from_location, via) + self.get_duration(via, to_location)
 
     def get_collection_to_retrofit_time(self) -> float:
         """Get standardized transport time from collection to retrofit track.
@@ -245,6 +315,7 @@ class RouteService:
         RouteType
             Route type (MAINLINE or SHUNTING), defaults to SHUNTING if not found
             Exception: collection→retrofit defaults to MAINLINE (requires brake test)
+            A chain of routes is MAINLINE if one of its routes is
 
         Examples
         --------
@@ -257,6 +328,11 @@ class RouteService:
         if (from_location, to_location) in self.route_types:
             return self.route_types[(from_location, to_location)]
 
+        if self.route_table.has_route(from_location, to_location) and any(
+            self.route_types[leg] == RouteType.MAINLINE for leg in self.route_table.legs(from_location, to_location)
+        ):
+            return RouteType.MAINLINE
+
         # Default: collection→retrofit is MAINLINE (requires brake test + inspection)
         if from_location == 'collection' and to_location == 'retrofit':
             return RouteType.MAINLINE
@@ -290,7 +366,7 @@ class RouteService:
         >>> location = service.get_route_location('retrofitted', 'parking1')
         >>> print(location)  # 'en_route'
         """
-        path = self.route_paths.get((from_location, to_location), [])
+        path = self.get_route_path(from_location, to_location)
         # If path has intermediate locations, use the first one (typically 'Mainline')
         if len(path) > 2:
             return path[1]
@@ -311,6 +387,7 @@ class RouteService:
         -------
         list[str]
             Full route path including start, intermediate waypoints, and destination
+            (for a chain of routes, the paths of all its routes)
 
         Examples
         --------
@@ -318,4 +395,9 @@ class RouteService:
         >>> path = service.get_route_path('collection1', 'retrofit')
         >>> print(path)  # ['collection1', 'Mainline', 'retrofit']
         """
-        return self.route_paths.get((from_location, to_location), [from_location, to_location])
+        path = self.route_paths.get((from_location, to_location))
+        if path is not None:
+            return path
+        if self.route_table.has_route(from_location, to_location):
+            return self.route_table.path(from_location, to_location)
+        return [from_location, to_location]
@@ -5,6 +5,8 @@ offering track-type grouping, per-type strategies, and convenience methods for t
 selection in the DAC migration workflow.
 """
 
+from functools import partial
+
 from contexts.retrofit_workflow.domain.services.resource_selection_service import ResourceSelectionService
 from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
 from shared.domain.value_objects.selection_strategy import SelectionStrategy
@@ -34,6 +36,9 @@ class TrackSelectionFacade:
     selector : ResourceSelectionService
         Generic resource selector for consistent allocation logic
 
+    Capacity and occupied meters are aggregated per track type and kept up to
+    date by occupancy callbacks of the tracks, so fill ratios are O(1).
+
     Notes
     -----
     Uses LEAST_BUSY strategy by default for optimal load balancing across
@@ -76,7 +81,24 @@ class TrackSelectionFacade:
         for track_type, track_list in tracks_by_type.items():
             track_dict = {t.track_id: t for t in track_list}
             strategy = self.strategies_by_type.get(track_type, default_strategy)
-            self.selectors[track_type] = ResourceSelectionService(track_dict, strategy)
+            self.selectors[track_type] = ResourceSelectionService(track_dict, strategy, indexed=True)
+
+        # Running per-type totals, updated by track occupancy callbacks
+        self._capacity_by_type: dict[str, float] = {}
+        self._occupied_by_type: dict[str, float] = {}
+        self._fill_version_by_type: dict[str, int] = {}
+        for track_type, track_list in tracks_by_type.items():
+            self._capacity_by_type[track_type] = sum(t.capacity_meters for t in track_list)
+            self._occupied_by_type[track_type] = sum(t.get_occupied_capacity() for t in track_list)
+            self._fill_version_by_type[track_type] = 0
+            for track in track_list:
+                track.add_occupancy_listener(partial(self._on_occupancy_change, track_type, track.track_id))
+
+    def _on_occupancy_change(self, track_type: str, track_id: str, delta: float) -> None:
+        """Update aggregates and selection index after a track reserved or released meters."""
+        self._occupied_by_type[track_type] += delta
+        self._fill_version_by_type[track_type] += 1
+        self.selectors[track_type].refresh(track_id)
 
     def select_track_with_capacity(
         self, track_type: str, required_capacity: float = 0.0
@@ -112,8 +134,8 @@ class TrackSelectionFacade:
                     return track
             return None
 
-        # Use selector with capacity filter
-        selected_id = selector.select(lambda _tid, t: t.get_available_capacity() >= required_capacity)
+        # Use selector with capacity filter (indexed for capacity-ordered strategies)
+        selected_id = selector.select_with_capacity(required_capacity)
 
         if selected_id:
             # Get track directly from selector's resources dict
@@ -155,6 +177,64 @@ class TrackSelectionFacade:
         total: float = sum(track.get_available_capacity() for track in tracks)
         return total
 
+    def get_total_occupied_capacity(self, track_type: str) -> float:
+        """Get occupied meters across all tracks of specified type.
+
+        Parameters
+        ----------
+        track_type : str
+            Track type identifier
+
+        Returns
+        -------
+        float
+            Occupied capacity in meters (0.0 for unknown types)
+        """
+        return self._occupied_by_type.get(track_type, 0.0)
+
+    def get_fill_ratio(self, track_type: str) -> float:
+        """Get fill ratio of track type (occupied over total capacity).
+
+        Parameters
+        ----------
+        track_type : str
+            Track type identifier
+
+        Returns
+        -------
+        float
+            Fill ratio (0.0-1.0), 0.0 for unknown types or zero capacity
+        """
+        capacity = self._capacity_by_type.get(track_type, 0.0)
+        if capacity == 0:
+            return 0.0
+        return self._occupied_by_type[track_type] / capacity
+
+    def get_fill_version(self, track_type: str) -> int:
+        """Get counter that changes whenever the fill level of track type changes.
+
+        Parameters
+        ----------
+        track_type : str
+            Track type identifier
+
+        Returns
+        -------
+        int
+            Fill-level version (constant 0 for unknown types)
+        """
+        return self._fill_version_by_type.get(track_type, 0)
+
+    def get_fill_ratios(self) -> dict[str, float]:
+        """Get fill ratio of every track type.
+
+        Returns
+        -------
+        dict[str, float]
+            Mapping of track type to fill ratio (0.0-1.0)
+        """
+        return {track_type: self.get_fill_ratio(track_type) for track_type in self._capacity_by_type}
+
     def get_tracks_of_type(self, track_type: str) -> list[TrackCapacityManager]:
         """Retrieve all track managers of the specified type.
 
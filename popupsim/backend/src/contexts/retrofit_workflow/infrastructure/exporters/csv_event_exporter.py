@@ -11,7 +11,14 @@ from contexts.retrofit_workflow.domain.events.batch_events import BatchArrivedAt
 from contexts.retrofit_workflow.domain.events.batch_events import BatchFormed
 from contexts.retrofit_workflow.domain.events.batch_events import BatchTransportStarted
 import pandas as pd
-from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime
+from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime_series
+
+
+def _frame(columns: dict[str, Any]) -> pd.DataFrame:
+    """Build frame from column arrays (no columns when there are no rows)."""
+    if not len(columns['timestamp']):
+        return pd.DataFrame()
+    return pd.DataFrame(columns)
 
 
 class CsvEventExporter:
@@ -21,34 +28,35 @@ class CsvEventExporter:
         """Initialize CSV exporter."""
         self.start_datetime = start_datetime
 
-    def _to_datetime(self, sim_time: float) -> str:
-        """Convert simulation time to datetime string."""
-        if not self.start_datetime:
-            return ''
-        return sim_ticks_to_datetime(sim_time, self.start_datetime)
+    def _to_datetimes(self, sim_times: list[float] | pd.Series) -> pd.Series | list[str]:
+        """Convert simulation times to datetime strings in one vectorized operation."""
+        if not self.start_datetime or not len(sim_times):
+            return [''] * len(sim_times)
+        return sim_ticks_to_datetime_series(sim_times, self.start_datetime)
+
+    def build_wagon_journey(self, events: list[WagonJourneyEvent]) -> pd.DataFrame:
+        """Build wagon journey frame."""
+        timestamps = [e.timestamp for e in events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'wagon_id': [e.wagon_id for e in events],
+                'train_id': [e.train_id or '' for e in events],
+                'event': [e.event_type for e in events],
+                'track_id': [e.location for e in events],
+                'status': [e.status for e in events],
+                'rejection_reason': [e.rejection_reason or '' for e in events],
+                'rejection_description': [e.rejection_description or '' for e in events],
+            }
+        )
 
     def export_wagon_journey(self, events: list[WagonJourneyEvent], filepath: str) -> None:
         """Export wagon journey events to CSV."""
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'wagon_id': e.wagon_id,
-                    'train_id': e.train_id or '',
-                    'event': e.event_type,
-                    'track_id': e.location,
-                    'status': e.status,
-                    'rejection_reason': e.rejection_reason or '',
-                    'rejection_description': e.rejection_description or '',
-                }
-                for e in events
-            ]
-        )
-        df.to_csv(filepath, index=False)
+        self.build_wagon_journey(events).to_csv(filepath, index=False)
 
-    def export_rejected_wagons(self, events: list[WagonJourneyEvent], filepath: str) -> None:
-        """Export rejected wagons to CSV."""
+    def build_rejected_wagons(self, events: list[WagonJourneyEvent]) -> pd.DataFrame:
+        """Build rejected wagons frame."""
         rejected = [e for e in events if e.event_type == 'REJECTED']
 
         def map_rejection_type(reason: str) -> str:
@@ -63,66 +71,65 @@ class CsvEventExporter:
                 return 'TRACK_FULL'
             return 'TRACK_FULL'
 
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'wagon_id': e.wagon_id,
-                    'train_id': e.train_id,
-                    'rejection_type': map_rejection_type(e.rejection_reason),
-                    'detailed_reason': e.rejection_description or e.rejection_reason or '',
-                    'track_id': e.location if e.location != 'REJECTED' else '',
-                }
-                for e in rejected
-            ]
+        timestamps = [e.timestamp for e in rejected]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'wagon_id': [e.wagon_id for e in rejected],
+                'train_id': [e.train_id for e in rejected],
+                'rejection_type': [map_rejection_type(e.rejection_reason) for e in rejected],
+                'detailed_reason': [e.rejection_description or e.rejection_reason or '' for e in rejected],
+                'track_id': [e.location if e.location != 'REJECTED' else '' for e in rejected],
+            }
+        )
+
+    def export_rejected_wagons(self, events: list[WagonJourneyEvent], filepath: str) -> None:
+        """Export rejected wagons to CSV."""
+        self.build_rejected_wagons(events).to_csv(filepath, index=False)
+
+    def build_locomotive_movements(self, events: list[LocomotiveMovementEvent]) -> pd.DataFrame:
+        """Build locomotive movements frame."""
+        timestamps = [e.timestamp for e in events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'locomotive_id': [e.locomotive_id for e in events],
+                'event': [e.event_type for e in events],
+                'from_location': [e.from_location or '' for e in events],
+                'to_location': [e.to_location or '' for e in events],
+                'purpose': [e.purpose or '' for e in events],
+            }
         )
-        df.to_csv(filepath, index=False)
 
     def export_locomotive_movements(self, events: list[LocomotiveMovementEvent], filepath: str) -> None:
         """Export locomotive movements to CSV."""
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'locomotive_id': e.locomotive_id,
-                    'event': e.event_type,
-                    'from_location': e.from_location or '',
-                    'to_location': e.to_location or '',
-                    'purpose': e.purpose or '',
-                }
-                for e in events
-            ]
+        self.build_locomotive_movements(events).to_csv(filepath, index=False)
+
+    def build_track_capacity(self, resource_events: list[ResourceStateChangeEvent]) -> pd.DataFrame:
+        """Build track capacity frame."""
+        track_events = [e for e in resource_events if e.resource_type == 'track']
+        timestamps = [e.timestamp for e in track_events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'track_id': [e.resource_id for e in track_events],
+                'change_type': [e.change_type for e in track_events],
+                'capacity': [e.capacity for e in track_events],
+                'used_before': [e.used_before for e in track_events],
+                'used_after': [e.used_after for e in track_events],
+                'utilization_before_percent': [e.utilization_before_percent for e in track_events],
+                'utilization_after_percent': [e.utilization_after_percent for e in track_events],
+                'change_amount': [e.change_amount for e in track_events],
+                'triggered_by': [e.triggered_by or '' for e in track_events],
+            }
         )
-        df.to_csv(filepath, index=False)
 
     def export_track_capacity(self, resource_events: list[ResourceStateChangeEvent], filepath: str) -> None:
         """Export track capacity changes."""
-        track_events = [e for e in resource_events if e.resource_type == 'track']
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'track_id': e.resource_id,
-                    'change_type': e.change_type,
-                    'capacity': e.capacity,
-                    'used_before': e.used_before,
-                    'used_after': e.used_after,
-                    'utilization_before_percent': e.utilization_before_percent
-                    if hasattr(e, 'utilization_before_percent')
-                    else 0.0,
-                    'utilization_after_percent': e.utilization_after_percent
-                    if hasattr(e, 'utilization_after_percent')
-                    else 0.0,
-                    'change_amount': e.change_amount,
-                    'triggered_by': e.triggered_by or '',
-                }
-                for e in track_events
-            ]
-        )
-        df.to_csv(filepath, index=False)
+        self.build_track_capacity(resource_events).to_csv(filepath, index=False)
 
     def _get_or_init_loco_times(self, loco_times: dict, loco_id: str) -> None:
         """Initialize locomotive times if not exists."""
@@ -138,12 +145,8 @@ class CsvEventExporter:
             return 'coupling'
         return 'parking'
 
-    def export_locomotive_summary(
-        self,
-        locomotive_events: list[LocomotiveMovementEvent],
-        filepath: str,
-    ) -> None:
-        """Export per-locomotive summary statistics."""
+    def build_locomotive_summary(self, locomotive_events: list[LocomotiveMovementEvent]) -> pd.DataFrame:
+        """Build per-locomotive summary statistics frame."""
         loco_times: dict[str, dict[str, float]] = {}
         loco_state: dict[str, tuple[float, str]] = {}
 
@@ -182,7 +185,15 @@ class CsvEventExporter:
                     }
                 )
 
-        pd.DataFrame(output_data).to_csv(filepath, index=False)
+        return pd.DataFrame(output_data)
+
+    def export_locomotive_summary(
+        self,
+        locomotive_events: list[LocomotiveMovementEvent],
+        filepath: str,
+    ) -> None:
+        """Export per-locomotive summary statistics."""
+        self.build_locomotive_summary(locomotive_events).to_csv(filepath, index=False)
 
     def _init_loco_breakdown(self) -> dict[str, float]:
         """Initialize locomotive breakdown dict."""
@@ -208,10 +219,10 @@ class CsvEventExporter:
         else:
             breakdown['decoupling_time_automatic'] += event.duration
 
-    def export_locomotive_time_breakdown(
-        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any], filepath: str
-    ) -> None:
-        """Export detailed per-locomotive time breakdown with coupling details."""
+    def build_locomotive_time_breakdown(
+        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any]
+    ) -> pd.DataFrame:
+        """Build detailed per-locomotive time breakdown frame with coupling details."""
         loco_breakdown: dict[str, dict[str, float]] = {}
 
         # Calculate moving time per locomotive
@@ -257,7 +268,13 @@ class CsvEventExporter:
                 }
             )
 
-        pd.DataFrame(output_data).to_csv(filepath, index=False)
+        return pd.DataFrame(output_data)
+
+    def export_locomotive_time_breakdown(
+        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any], filepath: str
+    ) -> None:
+        """Export detailed per-locomotive time breakdown with coupling details."""
+        self.build_locomotive_time_breakdown(locomotive_events, coupling_events).to_csv(filepath, index=False)
 
     def _create_movement_event_dict(self, e: LocomotiveMovementEvent) -> dict:
         """Create movement event dictionary."""
@@ -290,10 +307,10 @@ class CsvEventExporter:
             'duration_min': e.duration or 0.0,
         }
 
-    def export_locomotive_journey(
-        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any], filepath: str
-    ) -> None:
-        """Export detailed locomotive journey with all activities."""
+    def build_locomotive_journey(
+        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any]
+    ) -> pd.DataFrame:
+        """Build detailed locomotive journey frame with all activities."""
         # Combine all events
         all_events = []
 
@@ -325,7 +342,7 @@ class CsvEventExporter:
         # Convert to DataFrame and add datetime
         df = pd.DataFrame(all_events)
         if not df.empty:
-            df['datetime'] = df['timestamp'].apply(self._to_datetime)
+            df['datetime'] = self._to_datetimes(df['timestamp'])
             df = df[
                 [
                     'timestamp',
@@ -342,10 +359,16 @@ class CsvEventExporter:
                 ]
             ]
 
-        df.to_csv(filepath, index=False)
+        return df
 
-    def export_locomotive_utilization(self, resource_events: list[ResourceStateChangeEvent], filepath: str) -> None:
-        """Export locomotive utilization changes."""
+    def export_locomotive_journey(
+        self, locomotive_events: list[LocomotiveMovementEvent], coupling_events: list[Any], filepath: str
+    ) -> None:
+        """Export detailed locomotive journey with all activities."""
+        self.build_locomotive_journey(locomotive_events, coupling_events).to_csv(filepath, index=False)
+
+    def build_locomotive_utilization(self, resource_events: list[ResourceStateChangeEvent]) -> pd.DataFrame:
+        """Build locomotive utilization frame."""
         loco_events = [e for e in resource_events if e.resource_type == 'locomotive']
 
         if not loco_events:
@@ -364,35 +387,44 @@ class CsvEventExporter:
                 ]
             )
         else:
+            timestamps = [e.timestamp for e in loco_events]
+            totals = [e.total_count for e in loco_events]
+            busy_before = [e.busy_count_before for e in loco_events]
+            busy_after = [e.busy_count_after for e in loco_events]
             df = pd.DataFrame(
-                [
-                    {
-                        'timestamp': e.timestamp,
-                        'datetime': self._to_datetime(e.timestamp),
-                        'change_type': e.change_type,
-                        'total_locomotives': e.total_count,
-                        'busy_before': e.busy_count_before,
-                        'busy_after': e.busy_count_after,
-                        'available_before': e.total_count - e.busy_count_before
-                        if e.total_count and e.busy_count_before is not None and e.total_count > 0
-                        else None,
-                        'available_after': e.total_count - e.busy_count_after
-                        if e.total_count and e.busy_count_after is not None and e.total_count > 0
-                        else None,
-                        'utilization_before_percent': (e.busy_count_before / e.total_count * 100)
-                        if e.total_count and e.busy_count_before is not None and e.total_count > 0
-                        else 0.0,
-                        'utilization_after_percent': (e.busy_count_after / e.total_count * 100)
-                        if e.total_count and e.busy_count_after is not None and e.total_count > 0
-                        else 0.0,
-                    }
-                    for e in loco_events
-                ]
+                {
+                    'timestamp': timestamps,
+                    'datetime': self._to_datetimes(timestamps),
+                    'change_type': [e.change_type for e in loco_events],
+                    'total_locomotives': totals,
+                    'busy_before': busy_before,
+                    'busy_after': busy_after,
+                    'available_before': [
+                        t - b if t and b is not None and t > 0 else None
+                        for t, b in zip(totals, busy_before, strict=True)
+                    ],
+                    'available_after': [
+                        t - b if t and b is not None and t > 0 else None
+                        for t, b in zip(totals, busy_after, strict=True)
+                    ],
+                    'utilization_before_percent': [
+                        b / t * 100 if t and b is not None and t > 0 else 0.0
+                        for t, b in zip(totals, busy_before, strict=True)
+                    ],
+                    'utilization_after_percent': [
+                        b / t * 100 if t and b is not None and t > 0 else 0.0
+                        for t, b in zip(totals, busy_after, strict=True)
+                    ],
+                }
             )
-        df.to_csv(filepath, index=False)
+        return df
 
-    def export_workshop_utilization(self, resource_events: list[ResourceStateChangeEvent], filepath: str) -> None:
-        """Export workshop bay utilization changes."""
+    def export_locomotive_utilization(self, resource_events: list[ResourceStateChangeEvent], filepath: str) -> None:
+        """Export locomotive utilization changes."""
+        self.build_locomotive_utilization(resource_events).to_csv(filepath, index=False)
+
+    def build_workshop_utilization(self, resource_events: list[ResourceStateChangeEvent]) -> pd.DataFrame:
+        """Build workshop bay utilization frame."""
         workshop_events = [e for e in resource_events if e.resource_type == 'workshop']
 
         if not workshop_events:
@@ -412,84 +444,50 @@ class CsvEventExporter:
                 ]
             )
         else:
+            timestamps = [e.timestamp for e in workshop_events]
+            totals = [e.total_bays for e in workshop_events]
+            busy_before = [e.busy_bays_before for e in workshop_events]
+            busy_after = [e.busy_bays_after for e in workshop_events]
             df = pd.DataFrame(
-                [
-                    {
-                        'timestamp': e.timestamp,
-                        'datetime': self._to_datetime(e.timestamp),
-                        'workshop_id': e.resource_id,
-                        'change_type': e.change_type,
-                        'total_bays': e.total_bays,
-                        'busy_before': e.busy_bays_before,
-                        'busy_after': e.busy_bays_after,
-                        'available_before': e.total_bays - e.busy_bays_before
-                        if e.total_bays and e.busy_bays_before is not None
-                        else None,
-                        'available_after': e.total_bays - e.busy_bays_after
-                        if e.total_bays and e.busy_bays_after is not None
-                        else None,
-                        'utilization_before_percent': (e.busy_bays_before / e.total_bays * 100)
-                        if e.total_bays and e.busy_bays_before is not None and e.total_bays > 0
-                        else 0.0,
-                        'utilization_after_percent': (e.busy_bays_after / e.total_bays * 100)
-                        if e.total_bays and e.busy_bays_after is not None and e.total_bays > 0
-                        else 0.0,
-                    }
-                    for e in workshop_events
-                ]
+                {
+                    'timestamp': timestamps,
+                    'datetime': self._to_datetimes(timestamps),
+                    'workshop_id': [e.resource_id for e in workshop_events],
+                    'change_type': [e.change_type for e in workshop_events],
+                    'total_bays': totals,
+                    'busy_before': busy_before,
+                    'busy_after': busy_after,
+                    'available_before': [
+                        t - b if t and b is not None else None for t, b in zip(totals, busy_before, strict=True)
+                    ],
+                    'available_after': [
+                        t - b if t and b is not None else None for t, b in zip(totals, busy_after, strict=True)
+                    ],
+                    'utilization_before_percent': [
+                        b / t * 100 if t and b is not None and t > 0 else 0.0
+                        for t, b in zip(totals, busy_before, strict=True)
+                    ],
+                    'utilization_after_percent': [
+                        b / t * 100 if t and b is not None and t > 0 else 0.0
+                        for t, b in zip(totals, busy_after, strict=True)
+                    ],
+                }
             )
-        df.to_csv(filepath, index=False)
+        return df
 
-    def export_events_csv(
+    def export_workshop_utilization(self, resource_events: list[ResourceStateChangeEvent], filepath: str) -> None:
+        """Export workshop bay utilization changes."""
+        self.build_workshop_utilization(resource_events).to_csv(filepath, index=False)
+
+    def build_events(
         self,
         wagon_events: list[WagonJourneyEvent],
         locomotive_events: list[LocomotiveMovementEvent],
         batch_events: list[BatchFormed | BatchTransportStarted | BatchArrivedAtDestination],
-        filepath: str,
-    ) -> None:
-        """Export all events in chronological order."""
-        all_events = []
+    ) -> pd.DataFrame:
+        """Build frame of all events in chronological order."""
 
-        for e in wagon_events:
-            all_events.append(
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'event_type': f'Wagon{e.event_type}Event',
-                    'resource_type': 'wagon',
-                    'resource_id': e.wagon_id,
-                    'details': json.dumps(
-                        {
-                            'location': e.location,
-                            'status': e.status,
-                            'train_id': e.train_id or '',
-                            'rejection_reason': e.rejection_reason or '',
-                            'rejection_description': e.rejection_description or '',
-                        }
-                    ),
-                }
-            )
-
-        for e in locomotive_events:
-            all_events.append(
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'event_type': f'Locomotive{e.event_type}Event',
-                    'resource_type': 'locomotive',
-                    'resource_id': e.locomotive_id,
-                    'details': json.dumps(
-                        {
-                            'from_location': e.from_location or '',
-                            'to_location': e.to_location or '',
-                            'purpose': e.purpose or '',
-                        }
-                    ),
-                }
-            )
-
-        for e in batch_events:
-            event_type = e.__class__.__name__
+        def batch_details(e: BatchFormed | BatchTransportStarted | BatchArrivedAtDestination) -> str:
             details_dict = {
                 'destination': e.destination,
                 'wagon_count': e.wagon_count if hasattr(e, 'wagon_count') else len(e.wagon_ids),
@@ -497,32 +495,71 @@ class CsvEventExporter:
             }
             if hasattr(e, 'wagon_ids'):
                 details_dict['wagon_ids'] = ','.join(e.wagon_ids)
+            return json.dumps(details_dict)
+
+        columns: dict[str, list[Any]] = {
+            'timestamp': [e.timestamp for e in wagon_events]
+            + [e.timestamp for e in locomotive_events]
+            + [e.timestamp for e in batch_events],
+            'event_type': [f'Wagon{e.event_type}Event' for e in wagon_events]
+            + [f'Locomotive{e.event_type}Event' for e in locomotive_events]
+            + [e.__class__.__name__ for e in batch_events],
+            'resource_type': ['wagon'] * len(wagon_events)
+            + ['locomotive'] * len(locomotive_events)
+            + ['batch'] * len(batch_events),
+            'resource_id': [e.wagon_id for e in wagon_events]
+            + [e.locomotive_id for e in locomotive_events]
+            + [e.batch_id for e in batch_events],
+            'details': [
+                json.dumps(
+                    {
+                        'location': e.location,
+                        'status': e.status,
+                        'train_id': e.train_id or '',
+                        'rejection_reason': e.rejection_reason or '',
+                        'rejection_description': e.rejection_description or '',
+                    }
+                )
+                for e in wagon_events
+            ]
+            + [
+                json.dumps(
+                    {
+                        'from_location': e.from_location or '',
+                        'to_location': e.to_location or '',
+                        'purpose': e.purpose or '',
+                    }
+                )
+                for e in locomotive_events
+            ]
+            + [batch_details(e) for e in batch_events],
+        }
+        df = _frame(columns)
+        if df.empty:
+            return df
+        df = df.sort_values('timestamp', kind='stable', ignore_index=True)
+        df.insert(1, 'datetime', self._to_datetimes(df['timestamp']))
+        return df
 
-            all_events.append(
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'event_type': event_type,
-                    'resource_type': 'batch',
-                    'resource_id': e.batch_id,
-                    'details': json.dumps(details_dict),
-                }
-            )
-
-        all_events.sort(key=lambda x: x['timestamp'])
-        pd.DataFrame(all_events).to_csv(filepath, index=False)
-
-    def export_timeline(
+    def export_events_csv(
         self,
         wagon_events: list[WagonJourneyEvent],
-        resource_events: list[ResourceStateChangeEvent],
+        locomotive_events: list[LocomotiveMovementEvent],
+        batch_events: list[BatchFormed | BatchTransportStarted | BatchArrivedAtDestination],
         filepath: str,
     ) -> None:
-        """Export bottleneck analysis timeline."""
+        """Export all events in chronological order."""
+        self.build_events(wagon_events, locomotive_events, batch_events).to_csv(filepath, index=False)
+
+    def build_timeline(
+        self,
+        wagon_events: list[WagonJourneyEvent],
+        resource_events: list[ResourceStateChangeEvent],
+    ) -> pd.DataFrame:
+        """Build bottleneck analysis timeline frame."""
         all_timestamps = [e.timestamp for e in wagon_events + resource_events]
         if not all_timestamps:
-            pd.DataFrame(columns=['timestamp', 'datetime']).to_csv(filepath, index=False)
-            return
+            return pd.DataFrame(columns=['timestamp', 'datetime'])
 
         tracks, workshops = self._discover_resources(wagon_events, resource_events)
         max_time = max(all_timestamps)
@@ -534,7 +571,18 @@ class CsvEventExporter:
             timeline_data.append(snapshot)
             current_time += 60.0
 
-        pd.DataFrame(timeline_data).to_csv(filepath, index=False)
+        df = pd.DataFrame(timeline_data)
+        df['datetime'] = self._to_datetimes(df['timestamp'])
+        return df
+
+    def export_timeline(
+        self,
+        wagon_events: list[WagonJourneyEvent],
+        resource_events: list[ResourceStateChangeEvent],
+        filepath: str,
+    ) -> None:
+        """Export bottleneck analysis timeline."""
+        self.build_timeline(wagon_events, resource_events).to_csv(filepath, index=False)
 
     def _discover_resources(
         self, wagon_events: list[WagonJourneyEvent], resource_events: list[ResourceStateChangeEvent]
@@ -574,10 +622,7 @@ class CsvEventExporter:
         workshop_bays = self._get_workshop_state(resource_events, current_time, workshops)
         loco_busy = self._get_locomotive_state(resource_events, current_time)
 
-        row: dict[str, float | int | str] = {
-            'timestamp': current_time,
-            'datetime': self._to_datetime(current_time),
-        }
+        row: dict[str, float | int | str] = {'timestamp': current_time, 'datetime': ''}
         for track in sorted(tracks):
             row[f'track_{track}'] = track_counts[track]
         for workshop in sorted(workshops):
@@ -646,12 +691,15 @@ class CsvEventExporter:
                 track_counts[e.resource_id] = int(e.used_after / 15.0) if e.used_after > 0 else 0
         return track_counts
 
-    def export_workshop_metrics(self, wagon_events: list[WagonJourneyEvent], filepath: str) -> None:
-        """Export workshop performance metrics."""
+    def build_workshop_metrics(self, wagon_events: list[WagonJourneyEvent]) -> pd.DataFrame:
+        """Build workshop performance metrics frame."""
         workshop_stats = self._collect_workshop_stats(wagon_events)
         sim_duration = max((e.timestamp for e in wagon_events), default=1.0)
-        output_data = self._build_workshop_metrics(workshop_stats, sim_duration)
-        pd.DataFrame(output_data).to_csv(filepath, index=False)
+        return pd.DataFrame(self._build_workshop_metrics(workshop_stats, sim_duration))
+
+    def export_workshop_metrics(self, wagon_events: list[WagonJourneyEvent], filepath: str) -> None:
+        """Export workshop performance metrics."""
+        self.build_workshop_metrics(wagon_events).to_csv(filepath, index=False)
 
     def _collect_workshop_stats(self, wagon_events: list[WagonJourneyEvent]) -> dict[str, dict[str, float]]:
         """Collect workshop statistics from wagon events."""
@@ -1,12 +1,21 @@
 """CSV exporter for dual-stream events."""
 
 from pathlib import Path
+from typing import Any
 
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ExportArtifact
 import pandas as pd
 from shared.domain.events.dual_stream_events import LocationChangeEvent
 from shared.domain.events.dual_stream_events import ProcessEvent
 from shared.domain.events.dual_stream_events import StateChangeEvent
-from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime
+from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime_series
+
+
+def _frame(columns: dict[str, Any]) -> pd.DataFrame:
+    """Build frame from column arrays (no columns when there are no rows)."""
+    if not len(columns['timestamp']):
+        return pd.DataFrame()
+    return pd.DataFrame(columns)
 
 
 class DualStreamCsvExporter:
@@ -16,69 +25,85 @@ class DualStreamCsvExporter:
         """Initialize exporter."""
         self.start_datetime = start_datetime
 
-    def _to_datetime(self, sim_time: float) -> str:
-        """Convert simulation time to datetime."""
-        if not self.start_datetime:
-            return ''
-        return sim_ticks_to_datetime(sim_time, self.start_datetime)
+    def _to_datetimes(self, sim_times: list[float]) -> pd.Series | list[str]:
+        """Convert simulation times to datetime strings in one vectorized operation."""
+        if not self.start_datetime or not len(sim_times):
+            return [''] * len(sim_times)
+        return sim_ticks_to_datetime_series(sim_times, self.start_datetime)
+
+    def build_state_changes(self, events: list[StateChangeEvent]) -> pd.DataFrame:
+        """Build state change events frame."""
+        timestamps = [e.timestamp for e in events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'resource_id': [e.resource_id for e in events],
+                'resource_type': [e.resource_type for e in events],
+                'state': [e.state.value for e in events],
+                'train_id': [e.train_id or '' for e in events],
+                'batch_id': [e.batch_id or '' for e in events],
+                'rejection_reason': [e.rejection_reason or '' for e in events],
+            }
+        )
 
     def export_state_changes(self, events: list[StateChangeEvent], filepath: str | Path) -> None:
         """Export state change events."""
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'resource_id': e.resource_id,
-                    'resource_type': e.resource_type,
-                    'state': e.state.value,
-                    'train_id': e.train_id or '',
-                    'batch_id': e.batch_id or '',
-                    'rejection_reason': e.rejection_reason or '',
-                }
-                for e in events
-            ]
+        self.build_state_changes(events).to_csv(filepath, index=False)
+
+    def build_location_changes(self, events: list[LocationChangeEvent]) -> pd.DataFrame:
+        """Build location change events frame."""
+        timestamps = [e.timestamp for e in events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'resource_id': [e.resource_id for e in events],
+                'resource_type': [e.resource_type for e in events],
+                'location': [e.location for e in events],
+                'previous_location': [e.previous_location or '' for e in events],
+                'route_path': ['|'.join(e.route_path) if e.route_path else '' for e in events],
+            }
         )
-        df.to_csv(filepath, index=False)
 
     def export_location_changes(self, events: list[LocationChangeEvent], filepath: str | Path) -> None:
         """Export location change events."""
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'resource_id': e.resource_id,
-                    'resource_type': e.resource_type,
-                    'location': e.location,
-                    'previous_location': e.previous_location or '',
-                    'route_path': '|'.join(e.route_path) if e.route_path else '',
-                }
-                for e in events
-            ]
+        self.build_location_changes(events).to_csv(filepath, index=False)
+
+    def build_process_events(self, events: list[ProcessEvent]) -> pd.DataFrame:
+        """Build process events frame."""
+        timestamps = [e.timestamp for e in events]
+        return _frame(
+            {
+                'timestamp': timestamps,
+                'datetime': self._to_datetimes(timestamps),
+                'resource_id': [e.resource_id for e in events],
+                'resource_type': [e.resource_type for e in events],
+                'process_state': [e.process_state.value for e in events],
+                'location': [e.location for e in events],
+                'coupler_type': [e.coupler_type or '' for e in events],
+                'batch_id': [e.batch_id or '' for e in events],
+                'rake_id': [e.rake_id or '' for e in events],
+                'locomotive_id': [e.locomotive_id or '' for e in events],
+            }
         )
-        df.to_csv(filepath, index=False)
 
     def export_process_events(self, events: list[ProcessEvent], filepath: str | Path) -> None:
         """Export process events."""
-        df = pd.DataFrame(
-            [
-                {
-                    'timestamp': e.timestamp,
-                    'datetime': self._to_datetime(e.timestamp),
-                    'resource_id': e.resource_id,
-                    'resource_type': e.resource_type,
-                    'process_state': e.process_state.value,
-                    'location': e.location,
-                    'coupler_type': e.coupler_type or '',
-                    'batch_id': e.batch_id or '',
-                    'rake_id': e.rake_id or '',
-                    'locomotive_id': e.locomotive_id or '',
-                }
-                for e in events
-            ]
-        )
-        df.to_csv(filepath, index=False)
+        self.build_process_events(events).to_csv(filepath, index=False)
+
+    def get_artifacts(
+        self,
+        state_events: list[StateChangeEvent],
+        location_events: list[LocationChangeEvent],
+        process_events: list[ProcessEvent],
+    ) -> list[ExportArtifact]:
+        """Get export artifacts for all event streams."""
+        return [
+            ExportArtifact('resource_states.csv', lambda: self.build_state_changes(state_events)),
+            ExportArtifact('resource_locations.csv', lambda: self.build_location_changes(location_events)),
+            ExportArtifact('resource_processes.csv', lambda: self.build_process_events(process_events)),
+        ]
 
     def export_all(
         self,
@@ -0,0 +1,142 @@
+"""Parallel writer for independent simulation output artifacts."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import replace
+from functools import partial
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from shared.infrastructure.perf_metrics import get_perf_registry
+from shared.infrastructure.tabular_format import TabularFormat
+from shared.infrastructure.tabular_format import write_table
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def write_csv(frame: 'pd.DataFrame', filepath: Path) -> None:
+    """Write frame as CSV without index (replacing columnar files of the table)."""
+    write_table(frame, filepath)
+
+
+def write_json(payload: Any, filepath: Path) -> None:
+    """Write payload as indented JSON."""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+
+
+@dataclass(frozen=True)
+class ExportArtifact:
+    """Output artifact with separate build and write steps.
+
+    Attributes
+    ----------
+    filename : str
+        File name relative to the output directory
+    build : Callable[[], Any]
+        Builds the payload (usually a DataFrame) from collected events
+    write : Callable[[Any, Path], None]
+        Writes the payload to the given path
+    """
+
+    filename: str
+    build: Callable[[], Any]
+    write: Callable[[Any, Path], None] = write_csv
+
+    def with_format(self, output_format: TabularFormat) -> 'ExportArtifact':
+        """Get artifact writing its table in output_format (non-CSV artifacts are unchanged)."""
+        if self.write is not write_csv or output_format is TabularFormat.CSV:
+            return self
+        return replace(
+            self,
+            filename=Path(self.filename).with_suffix(output_format.suffix).name,
+            write=partial(write_table, output_format=output_format),
+        )
+
+
+@dataclass(frozen=True)
+class ArtifactTiming:
+    """Wall-clock build and write time of one artifact in seconds."""
+
+    filename: str
+    build_seconds: float
+    write_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        """Get combined build and write time."""
+        return self.build_seconds + self.write_seconds
+
+
+class ParallelArtifactWriter:
+    """Build and write independent artifacts concurrently.
+
+    A thread pool is used so the collected event lists are shared with the
+    workers instead of being pickled into each one. Artifacts must not depend
+    on each other; each one only reads the event store.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize writer.
+
+        Parameters
+        ----------
+        max_workers : int | None
+            Number of worker threads. ``None`` uses one per CPU, ``1`` writes
+            sequentially in the calling thread.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'max_workers must be at least 1, got {max_workers}')
+        self.max_workers = max_workers
+
+    def write_all(self, artifacts: list[ExportArtifact], output_dir: str | Path) -> list[ArtifactTiming]:
+        """Build and write all artifacts into output_dir.
+
+        Returns
+        -------
+        list[ArtifactTiming]
+            Timings in the same order as ``artifacts``
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        workers = self._resolve_workers(len(artifacts))
+        if workers <= 1:
+            timings = [self._run(artifact, output_path) for artifact in artifacts]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export') as pool:
+                futures = [pool.submit(self._run, artifact, output_path) for artifact in artifacts]
+                timings = [future.result() for future in futures]
+
+        perf = get_perf_registry()
+        for timing in timings:
+            logger.info(
+                'Exported %s (build %.3fs, write %.3fs)', timing.filename, timing.build_seconds, timing.write_seconds
+            )
+            perf.record(f'export.build.{timing.filename}', timing.build_seconds)
+            perf.record(f'export.write.{timing.filename}', timing.write_seconds)
+        return timings
+
+    def _resolve_workers(self, artifact_count: int) -> int:
+        """Get number of threads to use for artifact_count artifacts."""
+        workers = self.max_workers if self.max_workers is not None else (os.cpu_count() or 1)
+        return max(1, min(workers, artifact_count))
+
+    @staticmethod
+    def _run(artifact: ExportArtifact, output_path: Path) -> ArtifactTiming:
+        """Build and write single artifact, measuring both steps."""
+        start = time.perf_counter()
+        payload = artifact.build()
+        built = time.perf_counter()
+        artifact.write(payload, output_path / artifact.filename)
+        written = time.perf_counter()
+        return ArtifactTiming(artifact.filename, built - start, written - built)
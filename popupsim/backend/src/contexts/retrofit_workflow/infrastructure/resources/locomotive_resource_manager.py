@@ -6,7 +6,80 @@ from typing import Any
 
 from contexts.retrofit_workflow.domain.entities.locomotive import Locomotive
 from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
+from shared.infrastructure.perf_metrics import get_perf_registry
+from shared.infrastructure.perf_metrics import timed
 import simpy
+from simpy.core import BoundClass
+from simpy.resources.store import StoreGet
+from simpy.resources.store import StorePut
+
+
+class _LocomotiveGet(StoreGet):
+    """Store get request, optionally for the locomotive closest to a track."""
+
+    def __init__(self, store: '_LocomotiveStore', near_track: str | None = None) -> None:
+        # Set before the base class triggers the request
+        self.near_track = near_track
+        super().__init__(store)
+
+
+class _LocomotiveStore(simpy.Store):
+    """SimPy Store of idle locomotives, also indexed by the track they are on.
+
+    Without route durations (or without a requested track) requests are served
+    FIFO like a plain Store. With route durations a request for a track gets the
+    idle locomotive with the shortest route to it, earliest released on ties.
+    Durations are looked up once per occupied track, not per locomotive.
+    Locomotives on tracks without a route to the requested one are skipped; if
+    no idle locomotive has a route, the request is served FIFO.
+    """
+
+    get = BoundClass(_LocomotiveGet)
+
+    def __init__(self, env: simpy.Environment, capacity: int) -> None:
+        super().__init__(env, capacity=capacity)
+        self.route_duration: Callable[[str, str], float] | None = None
+        self._idle_by_track: dict[str, dict[str, Locomotive]] = {}
+
+    def _do_put(self, event: StorePut) -> bool | None:
+        if len(self.items) < self._capacity:
+            loco: Locomotive = event.item
+            self.items.append(loco)
+            self._idle_by_track.setdefault(loco.current_track, {})[loco.id] = loco
+            event.succeed()
+        return None
+
+    def _do_get(self, event: _LocomotiveGet) -> bool | None:  # type: ignore[override]
+        if self.items:
+            if self.route_duration is None or event.near_track is None:
+                loco = self.items[0]
+            else:
+                loco = self._nearest(event.near_track, self.route_duration)
+            self.items.remove(loco)
+            on_track = self._idle_by_track[loco.current_track]
+            del on_track[loco.id]
+            if not on_track:
+                del self._idle_by_track[loco.current_track]
+            event.succeed(loco)
+        return None
+
+    def _nearest(self, track_id: str, route_duration: Callable[[str, str], float]) -> Locomotive:
+        """Get idle locomotive with the shortest route to track."""
+        on_track = self._idle_by_track.get(track_id)
+        if on_track:
+            return next(iter(on_track.values()))
+        durations: dict[str, float] = {}
+        for loco_track in self._idle_by_track:
+            try:
+                durations[loco_track] = route_duration(loco_track, track_id)
+            except KeyError:
+                continue  # No route to track, skip its locomotives
+        if not durations:
+            return self.items[0]
+        return min(
+            (loco for loco in self.items if loco.current_track in durations),
+            key=lambda loco: durations[loco.current_track],
+        )
 
 
 class LocomotiveResourceManager:
@@ -15,6 +88,12 @@ class LocomotiveResourceManager:
     SimPy Store provides natural FIFO queuing for locomotives.
     When all locomotives are allocated, requests automatically queue.
 
+    With route durations set (location-aware mode), ``allocate(near_track=...)``
+    returns the idle locomotive with the shortest route to that track instead
+    of the one released first. Locomotives are indexed by their current track
+    when released; in this mode coordinators release them where their
+    transport ended (see LocomotiveMoveHelper).
+
     Example:
         manager = LocomotiveResourceManager(env, [loco1, loco2])
         loco = yield from manager.allocate()
@@ -27,6 +106,7 @@ class LocomotiveResourceManager:
         env: simpy.Environment,
         locomotives: list[Locomotive],
         event_publisher: Callable[[ResourceStateChangeEvent], None] | None = None,
+        route_duration: Callable[[str, str], float] | None = None,
     ):
         """Initialize locomotive resource manager.
 
@@ -34,13 +114,15 @@ class LocomotiveResourceManager:
             env: SimPy environment
             locomotives: List of locomotive entities
             event_publisher: Optional callback to publish events
+            route_duration: Optional route duration lookup (from, to) enabling location-aware allocation
         """
         self.env = env
         self.locomotives = locomotives
         self.event_publisher = event_publisher
 
-        # Use simple Store for FIFO allocation
-        self.store: simpy.Store = simpy.Store(env, capacity=len(locomotives))
+        # Store with FIFO or location-aware allocation
+        self.store = _LocomotiveStore(env, capacity=len(locomotives))
+        self.store.route_duration = route_duration
         for loco in locomotives:
             self.store.put(loco)
 
@@ -48,11 +130,13 @@ class LocomotiveResourceManager:
         self._allocated: set[str] = set()
         self._workshop_pickup_pending: int = 0
 
-    def allocate(self, purpose: str = 'general') -> Generator[Any, Any, Locomotive]:
+    @timed('LocomotiveResourceManager.allocate')
+    def allocate(self, purpose: str = 'general', near_track: str | None = None) -> Generator[Any, Any, Locomotive]:
         """Allocate a locomotive (blocks if none available).
 
         Args:
             purpose: Purpose description (for tracking)
+            near_track: Track the locomotive is needed at (used in location-aware mode)
 
         Yields
         ------
@@ -67,8 +151,11 @@ class LocomotiveResourceManager:
 
         busy_before = len(self._allocated)
 
-        # Get locomotive from store (FIFO)
-        loco: Locomotive = yield self.store.get()
+        # Get locomotive from store (FIFO, or nearest to near_track)
+        request = self.store.get(near_track)
+        if not request.triggered:
+            get_perf_registry().count('LocomotiveResourceManager.allocate_waited')
+        loco: Locomotive = yield request
         self._allocated.add(loco.id)
 
         if purpose == 'workshop_pickup':
@@ -125,6 +212,23 @@ class LocomotiveResourceManager:
                 )
             )
 
+    def set_route_duration(self, route_duration: Callable[[str, str], float] | None) -> None:
+        """Enable location-aware allocation (or disable it with None).
+
+        Args:
+            route_duration: Route duration lookup (from, to)
+        """
+        self.store.route_duration = route_duration
+
+    def is_location_aware(self) -> bool:
+        """Check if allocation picks the nearest locomotive.
+
+        Returns
+        -------
+            True if route durations are set
+        """
+        return self.store.route_duration is not None
+
     def get_total_count(self) -> int:
         """Get total number of locomotives.
 
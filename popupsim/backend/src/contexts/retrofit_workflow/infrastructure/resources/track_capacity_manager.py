@@ -7,9 +7,37 @@ from typing import Any
 from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
 from contexts.retrofit_workflow.domain.ports.resource_port import ResourcePort
+from shared.infrastructure.perf_metrics import get_perf_registry
+from shared.infrastructure.perf_metrics import timed
 import simpy
 
 
+class _ObservedContainer(simpy.Container):
+    """SimPy Container reporting every level change to a callback.
+
+    Blocked puts are granted inside other processes' gets, so the level can
+    change outside ``add_wagons``; observing the container keeps listeners exact.
+    """
+
+    def __init__(
+        self, env: simpy.Environment, capacity: float, init: float, on_change: Callable[[float], None]
+    ) -> None:
+        super().__init__(env, capacity=capacity, init=init)
+        self._on_change = on_change
+
+    def _do_put(self, event: simpy.resources.container.ContainerPut) -> bool | None:
+        triggered = super()._do_put(event)
+        if triggered:
+            self._on_change(event.amount)
+        return triggered
+
+    def _do_get(self, event: simpy.resources.container.ContainerGet) -> bool | None:
+        triggered = super()._do_get(event)
+        if triggered:
+            self._on_change(-event.amount)
+        return triggered
+
+
 class TrackCapacityManager(ResourcePort):
     """Manages track capacity using SimPy Container (supports floats!).
 
@@ -45,19 +73,79 @@ class TrackCapacityManager(ResourcePort):
         self.capacity_meters = capacity_meters
         self.event_publisher = event_publisher
 
+        # Callbacks notified with the change of occupied meters (+ reserved, - released)
+        self._occupancy_listeners: list[Callable[[float], None]] = []
+
         # Level represents occupied meters
-        self.container: simpy.Container = simpy.Container(
+        self.container: simpy.Container = _ObservedContainer(
             env,
             capacity=capacity_meters,
             init=0.0,
+            on_change=self._notify_occupancy_change,
         )
 
-        # Track wagons on this track (for domain logic)
-        self.wagons: list[Wagon] = []
+        # Track wagons on this track (for domain logic), keyed by wagon id in arrival order
+        self._wagons: dict[str, Wagon] = {}
 
         # Workflow queue for coordinator processing
         self.queue: simpy.Store = simpy.Store(env)
 
+    def add_occupancy_listener(self, listener: Callable[[float], None]) -> None:
+        """Register callback for changes of occupied capacity.
+
+        Args:
+            listener: Called with the occupied meters delta whenever the level changes
+        """
+        self._occupancy_listeners.append(listener)
+
+    def _notify_occupancy_change(self, delta: float) -> None:
+        """Notify occupancy listeners about a change of occupied meters."""
+        for listener in self._occupancy_listeners:
+            listener(delta)
+
+    @property
+    def wagons(self) -> list[Wagon]:
+        """Get wagons on track in arrival order (copy).
+
+        Returns
+        -------
+            Wagons on track
+        """
+        return list(self._wagons.values())
+
+    def has_wagon(self, wagon: Wagon) -> bool:
+        """Check if wagon is on track.
+
+        Args:
+            wagon: Wagon to check
+
+        Returns
+        -------
+            True if wagon is on track
+        """
+        return wagon.id in self._wagons
+
+    def has_any_wagon(self, wagons: list[Wagon]) -> bool:
+        """Check if any of the wagons is on track.
+
+        Args:
+            wagons: Wagons to check
+
+        Returns
+        -------
+            True if at least one wagon is on track
+        """
+        return any(w.id in self._wagons for w in wagons)
+
+    def get_wagon_ids(self) -> list[str]:
+        """Get IDs of wagons on track in arrival order.
+
+        Returns
+        -------
+            Wagon IDs
+        """
+        return list(self._wagons)
+
     def get_available_capacity(self) -> float:
         """Get available capacity in meters.
 
@@ -116,6 +204,7 @@ class TrackCapacityManager(ResourcePort):
         total_length = sum(w.length for w in wagons)
         return total_length <= self.get_available_capacity()  # type: ignore[no-any-return]
 
+    @timed('TrackCapacityManager.add_wagons')
     def add_wagons(self, wagons: list[Wagon]) -> Generator[Any, Any]:
         """Add wagons to track (blocks if not enough capacity).
 
@@ -140,6 +229,8 @@ class TrackCapacityManager(ResourcePort):
         used_before = self.container.level
         available_before = self.capacity_meters - used_before
         will_block = total_length > available_before
+        if will_block:
+            get_perf_registry().count('TrackCapacityManager.add_wagons_blocked')
 
         # Publish pre-operation event if will block
         if self.event_publisher and will_block:
@@ -192,8 +283,8 @@ class TrackCapacityManager(ResourcePort):
             )
 
         # Space acquired - add wagons
-        self.wagons.extend(wagons)
         for wagon in wagons:
+            self._wagons[wagon.id] = wagon
             wagon.move_to(self.track_id)
 
     def remove_wagons(self, wagons: list[Wagon]) -> Generator[Any, Any]:
@@ -260,8 +351,7 @@ class TrackCapacityManager(ResourcePort):
 
         # Remove wagons
         for wagon in wagons:
-            if wagon in self.wagons:
-                self.wagons.remove(wagon)
+            self._wagons.pop(wagon.id, None)
 
     def get_queue_length(self) -> int:
         """Get number of wagons in workflow queue.
@@ -288,7 +378,7 @@ class TrackCapacityManager(ResourcePort):
         -------
             Number of wagons
         """
-        return len(self.wagons)
+        return len(self._wagons)
 
     def get_metrics(self) -> dict[str, Any]:
         """Get track capacity metrics.
@@ -0,0 +1,143 @@
+"""Workshop Availability - free-list of workshops with direct hand-over to waiting requests."""
+
+import bisect
+from collections import deque
+from collections.abc import Iterable
+from typing import ClassVar
+
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
+import simpy
+
+
+class WorkshopAvailability:
+    """Free workshops kept as an ordered free-set, acquired like a SimPy store.
+
+    ``acquire`` returns an event that succeeds with a workshop ID: immediately
+    if one is free, otherwise when a workshop is released. Released workshops
+    are handed to the oldest waiting request directly, so a woken request never
+    has to search (and never finds the workshop taken by someone else).
+
+    Supported strategies:
+    - FIRST_AVAILABLE: free workshop with the lowest ID
+    - ROUND_ROBIN: next free workshop after the last one handed out (in ID order)
+
+    Workshops are acquired as a whole, so every free workshop is idle.
+    LEAST_OCCUPIED and SHORTEST_QUEUE therefore tie on all of them and select
+    like FIRST_AVAILABLE.
+
+    Example:
+        availability = WorkshopAvailability(env, ['WS1', 'WS2'])
+        workshop_id = yield availability.acquire()
+        # Use workshop
+        availability.release(workshop_id)
+    """
+
+    SUPPORTED_STRATEGIES = frozenset({SelectionStrategy.FIRST_AVAILABLE, SelectionStrategy.ROUND_ROBIN})
+    EQUIVALENT_STRATEGIES: ClassVar[dict[SelectionStrategy, SelectionStrategy]] = {
+        SelectionStrategy.LEAST_OCCUPIED: SelectionStrategy.FIRST_AVAILABLE,
+        SelectionStrategy.SHORTEST_QUEUE: SelectionStrategy.FIRST_AVAILABLE,
+    }
+    """Strategies that select among idle workshops like a supported one."""
+
+    def __init__(
+        self,
+        env: simpy.Environment,
+        workshop_ids: Iterable[str],
+        strategy: SelectionStrategy = SelectionStrategy.FIRST_AVAILABLE,
+    ) -> None:
+        """Initialize with all workshops free.
+
+        Args:
+            env: SimPy environment
+            workshop_ids: IDs of workshops
+            strategy: Selection strategy among free workshops
+
+        Raises
+        ------
+            ValueError: If strategy is not supported
+        """
+        strategy = self.EQUIVALENT_STRATEGIES.get(strategy, strategy)
+        if strategy not in self.SUPPORTED_STRATEGIES:
+            raise ValueError(f'Unsupported workshop selection strategy: {strategy}')
+        self.env = env
+        self.strategy = strategy
+        self._ids = sorted(workshop_ids)
+        self._rank = {workshop_id: i for i, workshop_id in enumerate(self._ids)}
+        # Ranks (positions in ID order) of free workshops, sorted
+        self._free: list[int] = list(range(len(self._ids)))
+        self._waiting: deque[simpy.Event] = deque()
+        self._next_rank = 0
+
+    def acquire(self) -> simpy.Event:
+        """Request a free workshop.
+
+        Returns
+        -------
+            Event succeeding with the acquired workshop ID
+        """
+        event = self.env.event()
+        if self._free:
+            event.succeed(self._take())
+        else:
+            self._waiting.append(event)
+        return event
+
+    def release(self, workshop_id: str) -> None:
+        """Return workshop, handing it to the oldest waiting request if any.
+
+        Args:
+            workshop_id: Workshop to release
+        """
+        rank = self._rank[workshop_id]
+        if self.is_free(workshop_id):
+            return
+        while self._waiting:
+            event = self._waiting.popleft()
+            if not event.triggered:
+                event.succeed(workshop_id)
+                self._next_rank = rank + 1
+                return
+        bisect.insort(self._free, rank)
+
+    def is_free(self, workshop_id: str) -> bool:
+        """Check if workshop is free.
+
+        Args:
+            workshop_id: Workshop to check
+
+        Returns
+        -------
+            True if workshop is not acquired
+        """
+        rank = self._rank[workshop_id]
+        index = bisect.bisect_left(self._free, rank)
+        return index < len(self._free) and self._free[index] == rank
+
+    def get_free_count(self) -> int:
+        """Get number of free workshops.
+
+        Returns
+        -------
+            Number of free workshops
+        """
+        return len(self._free)
+
+    def get_waiting_count(self) -> int:
+        """Get number of requests waiting for a workshop.
+
+        Returns
+        -------
+            Number of waiting requests
+        """
+        return len(self._waiting)
+
+    def _take(self) -> str:
+        """Remove free workshop chosen by strategy from the free-set."""
+        index = 0
+        if self.strategy is SelectionStrategy.ROUND_ROBIN:
+            index = bisect.bisect_left(self._free, self._next_rank)
+            if index == len(self._free):
+                index = 0
+        rank = self._free.pop(index)
+        self._next_rank = rank + 1
+        return self._ids[rank]
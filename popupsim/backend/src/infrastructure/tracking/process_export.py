@@ -4,18 +4,19 @@ from pathlib import Path
 
 from infrastructure.tracking.process_tracker import get_process_tracker
 from infrastructure.tracking.state_tracker import get_state_tracker
+from shared.infrastructure.tabular_format import TabularFormat
 
 
-def export_process_tracking_data(output_dir: Path) -> None:
-    """Export both process tracking and state data using CSV pattern."""
+def export_process_tracking_data(output_dir: Path, output_format: TabularFormat = TabularFormat.CSV) -> None:
+    """Export both process tracking and state data using CSV pattern (or the given tabular format)."""
     try:
         # Export process durations
         process_tracker = get_process_tracker()
-        process_tracker.export_to_csv(output_dir)
+        process_tracker.export_to_csv(output_dir, output_format)
 
         # Export state changes
         state_tracker = get_state_tracker()
-        state_tracker.export_to_csv(output_dir)
+        state_tracker.export_to_csv(output_dir, output_format)
 
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f'Warning: Failed to export tracking data: {e}')
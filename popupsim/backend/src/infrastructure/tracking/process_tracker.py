@@ -5,9 +5,10 @@ from pathlib import Path
 from typing import Any
 
 from infrastructure.logging.process_logger import get_process_logger
-import pandas as pd
 from shared.domain.events.process_tracking_events import ProcessType
 from shared.domain.events.process_tracking_events import ResourceType
+from shared.infrastructure.tabular_format import TabularFormat
+from shared.infrastructure.tabular_format import write_table
 
 
 @dataclass
@@ -114,8 +115,10 @@ class ProcessTracker:
         """Get locomotive processes."""
         return [p for p in self._completed_processes if p.resource_type == ResourceType.LOCOMOTIVE]
 
-    def export_to_csv(self, output_dir: Path) -> None:
-        """Export process data to CSV files."""
+    def export_to_csv(self, output_dir: Path, output_format: TabularFormat = TabularFormat.CSV) -> None:
+        """Export process data to CSV (or the given tabular format) files."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         if not self._completed_processes:
             return
 
@@ -136,19 +139,19 @@ class ProcessTracker:
             )
 
         df = pd.DataFrame(all_data)
-        df.to_csv(output_dir / 'process_tracking.csv', index=False)
+        write_table(df, output_dir / 'process_tracking.csv', output_format)
 
         # Wagon-specific
         wagon_data = [d for d in all_data if d['resource_type'] == 'wagon']
         if wagon_data:
             wagon_df = pd.DataFrame(wagon_data)
-            wagon_df.to_csv(output_dir / 'wagon_processes.csv', index=False)
+            write_table(wagon_df, output_dir / 'wagon_processes.csv', output_format)
 
         # Locomotive-specific
         loco_data = [d for d in all_data if d['resource_type'] == 'locomotive']
         if loco_data:
             loco_df = pd.DataFrame(loco_data)
-            loco_df.to_csv(output_dir / 'locomotive_processes.csv', index=False)
+            write_table(loco_df, output_dir / 'locomotive_processes.csv', output_format)
 
 
 # Global instance
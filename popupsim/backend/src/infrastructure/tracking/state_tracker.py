@@ -3,6 +3,10 @@
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from shared.infrastructure.tabular_format import TabularFormat
 
 
 class WagonState(Enum):
@@ -79,9 +83,13 @@ class StateTracker:
         )
         self._state_records.append(record)
 
-    def export_to_csv(self, output_dir: Path) -> None:
-        """Export state records to CSV files."""
+    def export_to_csv(self, output_dir: Path, output_format: 'TabularFormat | None' = None) -> None:
+        """Export state records to CSV (or the given tabular format) files."""
         import pandas as pd  # pylint: disable=import-outside-toplevel
+        from shared.infrastructure.tabular_format import TabularFormat  # pylint: disable=import-outside-toplevel
+        from shared.infrastructure.tabular_format import write_table  # pylint: disable=import-outside-toplevel
+
+        output_format = output_format or TabularFormat.CSV
 
         if not self._state_records:
             return
@@ -102,19 +110,19 @@ class StateTracker:
             )
 
         df = pd.DataFrame(all_data)
-        df.to_csv(output_dir / 'resource_states.csv', index=False)
+        write_table(df, output_dir / 'resource_states.csv', output_format)
 
         # Wagon states only
         wagon_data = [d for d in all_data if d['resource_type'] == 'wagon']
         if wagon_data:
             wagon_df = pd.DataFrame(wagon_data)
-            wagon_df.to_csv(output_dir / 'wagon_states.csv', index=False)
+            write_table(wagon_df, output_dir / 'wagon_states.csv', output_format)
 
         # Locomotive states only
         loco_data = [d for d in all_data if d['resource_type'] == 'locomotive']
         if loco_data:
             loco_df = pd.DataFrame(loco_data)
-            loco_df.to_csv(output_dir / 'locomotive_states.csv', index=False)
+            write_table(loco_df, output_dir / 'locomotive_states.csv', output_format)
 
 
 # Global instance
@@ -1,5 +1,6 @@
 """PopUpSim New Architecture CLI - Bounded contexts implementation."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 import json
 import logging
@@ -7,17 +8,21 @@ from logging import StreamHandler
 import os
 from pathlib import Path
 import shutil
+from typing import TYPE_CHECKING
 from typing import Annotated
 from typing import Any
 
-from application.simulation_service import SimulationApplicationService
-from contexts.configuration.domain.configuration_builder import ConfigurationBuilder
-from contexts.configuration.domain.models.scenario import Scenario
-from contexts.external_trains.application.external_trains_context import ExternalTrainsContext
-from infrastructure.logging import init_process_logger
-from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
 import typer
 
+# Simulation, configuration and exporter modules (and pandas behind them) are
+# imported inside the commands so that --help and other commands start quickly.
+if TYPE_CHECKING:
+    from contexts.configuration.domain.models.scenario import Scenario
+    from contexts.external_trains.application.external_trains_context import ExternalTrainsContext
+    from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
+    from shared.infrastructure.memory_profile import MemoryProfiler
+    from shared.infrastructure.tabular_format import TabularFormat
+
 app = typer.Typer(name='popupsim-new', help='PopUpSim New Architecture - Bounded contexts')
 
 
@@ -25,17 +30,21 @@ app = typer.Typer(name='popupsim-new', help='PopUpSim New Architecture - Bounded
 class Contexts:
     """Class containing all contexts."""
 
-    external_trains: ExternalTrainsContext
+    external_trains: 'ExternalTrainsContext'
 
 
-def print_wagon_metrics(external_trains: ExternalTrainsContext, output_path: Path | None = None) -> None:
-    """Print metrics of wagons."""
+def print_wagon_metrics(
+    external_trains: 'ExternalTrainsContext',
+    output_path: Path | None = None,
+    output_selection: 'OutputSelection | None' = None,
+) -> None:
+    """Print metrics of wagons (completed count from summary_metrics.json if the run wrote it)."""
     ext_metrics = external_trains.get_metrics()
     typer.echo('\nWAGON METRICS:')
     typer.echo(f'  Total wagons arrived:     {ext_metrics.get("total_wagons", 0)}')
 
-    # Read completed count from summary_metrics.json
-    if output_path:
+    # Read completed count from summary_metrics.json (a file of an earlier run if not selected)
+    if output_path and (output_selection is None or output_selection.includes('summary_metrics')):
         summary_file = output_path / 'summary_metrics.json'
         if summary_file.exists():
             with open(summary_file, encoding='utf-8') as f:
@@ -74,14 +83,30 @@ def _setup_directories(scenario_path: Path, output_path: Path) -> None:
 
 def _configure_logging(output_path: Path) -> None:
     """Configure logging handlers."""
+    from infrastructure.logging import init_process_logger  # pylint: disable=import-outside-toplevel
+
     event_handler = configure_event_logging(output_path)
     console_handler = configure_console_logging()
     logging.basicConfig(level=logging.INFO, handlers=[event_handler, console_handler])
     init_process_logger(output_path)
 
 
-def _print_retrofit_statistics(output_path: Path) -> None:
-    """Print statistics for retrofit workflow."""
+def _warn_unselected_artifacts(output_path: Path, output_selection: 'OutputSelection') -> None:
+    """Warn about artifacts of an earlier run in the output directory that this run does not rewrite."""
+    stale = output_selection.unselected_files(output_path)
+    if stale:
+        typer.echo(
+            f'WARNING: {output_path} contains outputs not selected by --outputs, left by an earlier run: '
+            f'{", ".join(path.name for path in stale)}',
+            err=True,
+        )
+
+
+def _print_retrofit_statistics(output_path: Path, output_selection: 'OutputSelection') -> None:
+    """Print statistics for retrofit workflow from summary_metrics.json written by this run."""
+    if not output_selection.includes('summary_metrics'):
+        typer.echo('\n  (summary_metrics not selected by --outputs, no workflow statistics)')
+        return
     summary_file = output_path / 'summary_metrics.json'
     if not summary_file.exists():
         return
@@ -108,7 +133,11 @@ def _print_retrofit_statistics(output_path: Path) -> None:
     typer.echo(f'    Total rejected:           {metrics.get("wagons_rejected", 0)}')
     typer.echo(f'\n  Completion rate:            {metrics.get("completion_rate", 0) * 100:.1f}%')
     typer.echo(f'  Throughput (wagons/hour):   {metrics.get("throughput_rate_per_hour", 0):.2f}')
+    _print_resource_statistics(metrics)
+
 
+def _print_resource_statistics(metrics: dict[str, Any]) -> None:
+    """Print workshop, locomotive and rejection breakdown of summary metrics."""
     ws_stats = metrics.get('workshop_statistics', {})
     if ws_stats:
         typer.echo('\nWORKSHOP METRICS:')
@@ -135,52 +164,199 @@ def _print_retrofit_statistics(output_path: Path) -> None:
             typer.echo(f'  {reason}: {count}')
 
 
-def output_visualization(output_path: Path, service: Any) -> None:
+def _print_export_timings(timings: list[Any]) -> None:
+    """Print build and write time per exported artifact."""
+    typer.echo('\nExport timings (build / write):')
+    for timing in sorted(timings, key=lambda t: t.total_seconds, reverse=True):
+        typer.echo(f'  {timing.filename:<32} {timing.build_seconds:8.3f}s / {timing.write_seconds:8.3f}s')
+    typer.echo(f'  {"total (sum over artifacts)":<32} {sum(t.total_seconds for t in timings):8.3f}s')
+
+
+def _parse_output_options(outputs: str, output_format: str) -> tuple['OutputSelection', 'TabularFormat']:
+    """Parse --outputs and --output-format, reporting invalid values as bad parameters."""
+    # pylint: disable=import-outside-toplevel
+    from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
+    from shared.infrastructure.tabular_format import TabularFormat
+
+    try:
+        output_selection = OutputSelection.parse(outputs)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint='--outputs') from e
+    try:
+        tabular_format = TabularFormat.parse(output_format)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint='--output-format') from e
+    return output_selection, tabular_format
+
+
+def _start_memory_profiler(profile_memory: bool) -> 'MemoryProfiler | None':
+    """Start tracing allocations if --profile-memory is set."""
+    if not profile_memory:
+        return None
+    from shared.infrastructure.memory_profile import MemoryProfiler  # pylint: disable=import-outside-toplevel
+
+    memory_profiler = MemoryProfiler()
+    memory_profiler.start()
+    return memory_profiler
+
+
+def _load_scenario(scenario_path: Path, scenario_cache: bool, stream_arrivals: bool) -> 'Scenario':
+    """Build scenario, from the compiled-scenario cache if enabled, and print its trains."""
+    # pylint: disable=import-outside-toplevel
+    from contexts.configuration.domain.configuration_builder import ConfigurationBuilder
+    from contexts.configuration.infrastructure.scenario_cache import ScenarioCache
+    from contexts.configuration.infrastructure.train_schedule_stream import TrainScheduleStream
+
+    scenario = ConfigurationBuilder(
+        scenario_path, cache=ScenarioCache() if scenario_cache else None, stream_schedule=stream_arrivals
+    ).build()
+    typer.echo(f'Loaded scenario: {scenario.id}')
+    if isinstance(scenario.trains, TrainScheduleStream):
+        typer.echo(f'  Trains: streamed from {scenario.trains.csv_file.name}')
+    else:
+        typer.echo(f'  Trains: {len(scenario.trains or [])}')
+        typer.echo(f'  Total wagons: {sum(len(t.wagons) for t in (scenario.trains or []))}')
+    return scenario
+
+
+def _write_profiling_outputs(output_path: Path, perf_metrics: bool, memory_profiler: 'MemoryProfiler | None') -> None:
+    """List perf_metrics.json and write memory_profile.json after the export."""
+    if perf_metrics:
+        typer.echo(f'  - perf_metrics.json (instrumented hot paths, see {output_path / "perf_metrics.json"})')
+    if memory_profiler:
+        memory_profiler.checkpoint('export')
+        memory_profiler.stop()
+        memory_profiler.write_json(output_path / 'memory_profile.json')
+        typer.echo(f'  - memory_profile.json (peak {memory_profiler.to_dict()["peak_mb"]:.0f} MB traced)')
+
+
+def output_visualization(
+    output_path: Path,
+    service: Any,
+    export_workers: int | None = None,
+    verbose: bool = False,
+    output_format: 'TabularFormat | None' = None,
+) -> None:
     """Write files for visualization onto the disk.
 
     Args:
         output_path: Path to output directory
         service: Simulation service containing retrofit workflow context
+        export_workers: Number of parallel export threads (None = one per CPU)
+        verbose: Print build and write time per artifact
+        output_format: File format for tabular outputs (None = CSV)
     """
+    from shared.infrastructure.tabular_format import TabularFormat  # pylint: disable=import-outside-toplevel
+
+    output_format = output_format or TabularFormat.CSV
     # Export retrofit workflow events
     retrofit_context = service.contexts.get('retrofit_workflow')
     if retrofit_context and hasattr(retrofit_context, 'export_events'):
-        retrofit_context.export_events(str(output_path))
+        timings = retrofit_context.export_events(
+            str(output_path), max_workers=export_workers, output_format=output_format
+        )
         typer.echo('\nRetrofit workflow data exported:')
-        typer.echo('  - wagon_journey.csv')
-        typer.echo('  - rejected_wagons.csv')
-        typer.echo('  - locomotive_movements.csv')
-        typer.echo('  - summary_metrics.json')
-        typer.echo('\nDual-stream event files (new):')
-        typer.echo('  - resource_states.csv (state changes)')
-        typer.echo('  - resource_locations.csv (location tracking)')
-        typer.echo('  - resource_processes.csv (process events)')
+        for timing in timings:
+            typer.echo(f'  - {timing.filename}')
+        if verbose:
+            _print_export_timings(timings)
     else:
         typer.echo('\nRetrofit workflow output generation not available')
 
 
 @app.command()
-def run(
+def run(  # noqa: PLR0913, PLR0917
     scenario_path: Annotated[Path, typer.Option('--scenario', help='Path to scenario file')],
     output_path: Annotated[Path, typer.Option('--output', help='Output directory')] = Path('./output'),
     verbose: Annotated[bool, typer.Option('--verbose', help='Verbose output')] = False,
+    export_workers: Annotated[
+        int | None,
+        typer.Option('--export-workers', min=1, help='Parallel export threads (default: one per CPU, 1 = sequential)'),
+    ] = None,
+    outputs: Annotated[
+        str,
+        typer.Option(
+            '--outputs',
+            help=(
+                'Comma-separated output presets (summary, dashboard, full) and/or artifact names, '
+                'e.g. "summary,resource_states". Streams no selected artifact needs are not recorded.'
+            ),
+        ),
+    ] = 'full',
+    output_format: Annotated[
+        str,
+        typer.Option(
+            '--output-format',
+            help=(
+                'File format for tabular outputs: csv, columnar (parquet if pyarrow is installed, else npz), '
+                'parquet, feather or npz'
+            ),
+        ),
+    ] = 'csv',
+    scenario_cache: Annotated[
+        bool,
+        typer.Option(
+            '--scenario-cache/--no-scenario-cache',
+            help='Reuse the compiled scenario while its input files are unchanged (cache dir: POPUPSIM_CACHE_DIR)',
+        ),
+    ] = True,
+    stream_arrivals: Annotated[
+        bool,
+        typer.Option(
+            '--stream-arrivals',
+            help=(
+                'Read the train schedule CSV lazily in arrival order instead of loading every train up front '
+                '(the file must be sorted by arrival_time)'
+            ),
+        ),
+    ] = False,
+    perf_metrics: Annotated[
+        bool,
+        typer.Option(
+            '--perf-metrics',
+            help='Time coordinators, resource managers and exporters and write perf_metrics.json',
+        ),
+    ] = False,
+    profile_memory: Annotated[
+        bool,
+        typer.Option(
+            '--profile-memory',
+            help=(
+                'Trace allocations (tracemalloc, slow) and write the top allocation sites and growth '
+                'per phase to memory_profile.json'
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Run PopUpSim with new bounded contexts architecture."""
+    # pylint: disable=import-outside-toplevel
+    from application.simulation_service import SimulationApplicationService
+    from shared.infrastructure.perf_metrics import get_perf_registry
+    from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
+
+    output_selection, tabular_format = _parse_output_options(outputs, output_format)
+
     # Setup
     _setup_directories(scenario_path, output_path)
+    _warn_unselected_artifacts(output_path, output_selection)
     _configure_logging(output_path)
 
     if verbose:
         typer.echo(f'Loading scenario: {scenario_path}')
 
     # Load and run simulation
-    scenario = ConfigurationBuilder(scenario_path).build()
-    typer.echo(f'Loaded scenario: {scenario.id}')
-    typer.echo(f'  Trains: {len(scenario.trains or [])}')
-    typer.echo(f'  Total wagons: {sum(len(t.wagons) for t in (scenario.trains or []))}')
-
-    service = SimulationApplicationService(scenario, output_path)
+    memory_profiler = _start_memory_profiler(profile_memory)
+    scenario = _load_scenario(scenario_path, scenario_cache, stream_arrivals)
+    if memory_profiler:
+        memory_profiler.checkpoint('load')
+
+    get_perf_registry().reset(enabled=perf_metrics)
+    service = SimulationApplicationService(
+        scenario, output_path, output_selection=output_selection, output_format=tabular_format
+    )
     until = timedelta_to_sim_ticks(scenario.end_date - scenario.start_date)
+    if memory_profiler:
+        memory_profiler.attach(service.engine, until)
     typer.echo('Running simulation...\n')
     result = service.execute(until)
 
@@ -194,17 +370,264 @@ def run(
     typer.echo('=' * 60)
 
     typer.echo('\nGenerating outputs...')
-    output_visualization(output_path, service)
+    output_visualization(
+        output_path, service, export_workers=export_workers, verbose=verbose, output_format=tabular_format
+    )
+    _write_profiling_outputs(output_path, perf_metrics, memory_profiler)
 
     typer.echo('\n' + '=' * 60)
     typer.echo('SIMULATION STATISTICS')
     typer.echo('=' * 60)
 
-    _print_retrofit_statistics(output_path)
+    _print_retrofit_statistics(output_path, output_selection)
 
     typer.echo(f'\nSIMULATION TIME:            {result.duration:.1f} minutes')
     typer.echo('=' * 60)
 
+@app.command()
+def generate(  # noqa: PLR0913, PLR0917  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    output_path: Annotated[Path, typer.Option('--output', help='Scenario directory to write')],
+    preset: Annotated[
+        str | None, typer.Option('--preset', help='Scaling ladder preset: 10k, 100k or 1m (options below override it)')
+    ] = None,
+    seed: Annotated[int | None, typer.Option('--seed', help='Random seed (default 42)')] = None,
+    trains: Annotated[int | None, typer.Option('--trains', min=1, help='Number of trains')] = None,
+    wagons_per_train: Annotated[int | None, typer.Option('--wagons-per-train', min=1, help='Wagons per train')] = None,
+    collection_tracks: Annotated[int | None, typer.Option('--collection-tracks', min=1)] = None,
+    retrofit_tracks: Annotated[int | None, typer.Option('--retrofit-tracks', min=1)] = None,
+    retrofitted_tracks: Annotated[int | None, typer.Option('--retrofitted-tracks', min=1)] = None,
+    parking_tracks: Annotated[int | None, typer.Option('--parking-tracks', min=1)] = None,
+    workshops: Annotated[int | None, typer.Option('--workshops', min=1)] = None,
+    bays_per_workshop: Annotated[int | None, typer.Option('--bays', min=1, help='Retrofit bays per workshop')] = None,
+    locomotives: Annotated[int | None, typer.Option('--locomotives', min=1)] = None,
+    arrival_pattern: Annotated[
+        str | None, typer.Option('--arrival-pattern', help='Train arrivals: uniform, poisson or peaks')
+    ] = None,
+    days: Annotated[int | None, typer.Option('--days', min=1, help='Simulated days')] = None,
+) -> None:
+    """Generate a synthetic scenario directory for scaling benchmarks."""
+    # pylint: disable=import-outside-toplevel
+    from contexts.configuration.infrastructure.scenario_generator import ArrivalPattern
+    from contexts.configuration.infrastructure.scenario_generator import GeneratorConfig
+    from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+    from contexts.configuration.infrastructure.scenario_generator import scaled_config
+
+    overrides = {
+        'seed': seed,
+        'trains': trains,
+        'wagons_per_train': wagons_per_train,
+        'collection_tracks': collection_tracks,
+        'retrofit_tracks': retrofit_tracks,
+        'retrofitted_tracks': retrofitted_tracks,
+        'parking_tracks': parking_tracks,
+        'workshops': workshops,
+        'bays_per_workshop': bays_per_workshop,
+        'locomotives': locomotives,
+        'days': days,
+    }
+    overrides = {name: value for name, value in overrides.items() if value is not None}
+    try:
+        if arrival_pattern is not None:
+            overrides['arrival_pattern'] = ArrivalPattern(arrival_pattern)
+        config = scaled_config(preset, **overrides) if preset else GeneratorConfig(**overrides)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+    scenario_file = generate_scenario(config, output_path)
+    typer.echo(f'Generated {scenario_file}')
+    typer.echo(f'  Trains: {config.trains}')
+    typer.echo(f'  Total wagons: {config.total_wagons}')
+    typer.echo(f'  Workshops: {config.workshops} x {config.bays_per_workshop} bays, locomotives: {config.locomotives}')
+
+
+@app.command('import-time')
+def import_time(
+    runs: Annotated[int, typer.Option('--runs', min=1, help='Fresh interpreters per module (fastest counts)')] = 3,
+    top: Annotated[int, typer.Option('--top', min=0, help='Slowest modules to list per entry point')] = 10,
+) -> None:
+    """Measure import time of the CLI and simulation entry points against their budgets."""
+    # pylint: disable=import-outside-toplevel
+    from shared.infrastructure.import_time import IMPORT_BUDGETS
+    from shared.infrastructure.import_time import check_budget
+    from shared.infrastructure.import_time import measure_import_time
+
+    violations = []
+    for budget in IMPORT_BUDGETS:
+        profile = measure_import_time(budget.module, runs=runs)
+        typer.echo(f'{budget.module}: {profile.total_ms:.1f} ms (budget {budget.max_ms:.0f} ms)')
+        for timing in profile.slowest(top):
+            typer.echo(f'  {timing.self_us / 1000:8.1f} ms  {timing.module}')
+        violations.extend(check_budget(profile, budget))
+
+    for violation in violations:
+        typer.echo(f'BUDGET EXCEEDED: {violation}', err=True)
+    if violations:
+        raise typer.Exit(1)
+
+
+def _run_scaling_benchmarks() -> None:
+    """Print slowdown of indexed data structures from 500 to 5000 items, exit code 1 beyond MAX_RATIO."""
+    # pylint: disable=import-outside-toplevel
+    from benchmark import MAX_RATIO
+    from benchmark import run_scaling_benchmarks
+
+    results = run_scaling_benchmarks()
+    typer.echo(f'{"benchmark":20} {"small ms":>9} {"large ms":>9} {"ratio":>6}')
+    for r in results:
+        typer.echo(f'{r.name:20} {r.small_s * 1000:9.2f} {r.large_s * 1000:9.2f} {r.ratio:6.2f}')
+    slow = [r.name for r in results if r.ratio > MAX_RATIO]
+    if slow:
+        typer.echo(f'SCALING REGRESSION: {", ".join(slow)} slower than {MAX_RATIO:.0f}x', err=True)
+        raise typer.Exit(1)
+
+
+@app.command()
+def bench(  # noqa: PLR0913, PLR0917  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    output_path: Annotated[Path, typer.Option('--output', help='JSON file to write results to')] = Path(
+        './output/bench.json'
+    ),
+    suite: Annotated[str, typer.Option('--suite', help='Case selection: quick, examples or ladder')] = 'quick',
+    cases: Annotated[
+        list[str] | None, typer.Option('--case', help='Case to run instead of the suite (repeatable)')
+    ] = None,
+    repeats: Annotated[int, typer.Option('--repeats', min=1, help='Runs per case (fastest counts)')] = 1,
+    baseline: Annotated[
+        Path | None, typer.Option('--baseline', help='Results JSON to compare against (exit code 1 on regression)')
+    ] = None,
+    tolerance: Annotated[
+        float, typer.Option('--tolerance', min=0.0, help='Allowed relative slowdown against the baseline')
+    ] = 0.1,
+    scaling: Annotated[
+        bool, typer.Option('--scaling', help='Run data structure scaling micro-benchmarks instead of the suite')
+    ] = False,
+) -> None:
+    """Benchmark load, initialize, run and export phases of example and synthetic scenarios."""
+    if scaling:
+        _run_scaling_benchmarks()
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from benchmark import BENCHMARK_SUITES
+    from benchmark import BenchmarkRun
+    from benchmark import benchmark_cases
+    from benchmark import compare
+    from benchmark import run_benchmark
+
+    available = benchmark_cases()
+    names = cases or list(BENCHMARK_SUITES.get(suite, ()))
+    if not names:
+        raise typer.BadParameter(f'Unknown suite {suite!r}, expected one of {", ".join(BENCHMARK_SUITES)}')
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise typer.BadParameter(f'Unknown case(s) {", ".join(unknown)}, expected any of {", ".join(available)}')
+    reference = BenchmarkRun.load(baseline) if baseline else None
+
+    results = run_benchmark(
+        [available[name] for name in names], repeats=repeats, progress=lambda line: typer.echo(f'Running {line}')
+    )
+    run = BenchmarkRun.create(results)
+    run.save(output_path)
+
+    typer.echo(
+        f'\n{"case":38} {"load":>7} {"init":>7} {"run":>8} {"export":>8} '
+        f'{"events/s":>10} {"wagons/s":>9} {"RSS MB":>7}'
+    )
+    for r in results:
+        rss = f'{r.peak_rss_mb:7.0f}' if r.peak_rss_mb is not None else f'{"-":>7}'
+        typer.echo(
+            f'{r.case:38} {r.load_s:7.2f} {r.initialize_s:7.2f} {r.run_s:8.2f} {r.export_s:8.2f} '
+            f'{r.events_per_s:10.0f} {r.wagons_per_s:9.0f} {rss}'
+        )
+    typer.echo(f'\nResults written to {output_path} (git {run.git_sha or "unknown"})')
+
+    if reference is not None:
+        regressions = compare(run, reference, tolerance=tolerance)
+        for regression in regressions:
+            typer.echo(f'REGRESSION: {regression}', err=True)
+        if regressions:
+            raise typer.Exit(1)
+        typer.echo(f'No regressions beyond {tolerance:.0%} against {baseline}')
+
+
+@app.command()
+def profile(  # noqa: PLR0913, PLR0917  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    scenario_path: Annotated[Path, typer.Option('--scenario', help='Path to scenario directory')],
+    output_path: Annotated[
+        Path, typer.Option('--output', help='Directory for the profile files and simulation outputs')
+    ] = Path('./output/profile'),
+    mode: Annotated[
+        str,
+        typer.Option(
+            '--mode',
+            help='cprofile (exact call counts, slows down every call) or sample (stack sampling, low overhead)',
+        ),
+    ] = 'cprofile',
+    interval_ms: Annotated[
+        float, typer.Option('--interval-ms', min=0.1, help='Sampling interval of --mode sample in milliseconds')
+    ] = 1.0,
+    phases: Annotated[
+        str, typer.Option('--phases', help='Comma-separated phases to profile: load, run and/or export')
+    ] = 'load,run,export',
+    top: Annotated[int, typer.Option('--top', min=0, help='Functions to list by cumulative time')] = 20,
+) -> None:
+    """Profile a simulation run and write profile.pstats and collapsed stacks for flame graphs."""
+    # pylint: disable=import-outside-toplevel
+    from functools import partial
+    import io
+    import pstats
+
+    from application.simulation_service import SimulationApplicationService
+    from contexts.configuration.domain.configuration_builder import ConfigurationBuilder
+    from shared.infrastructure.cpu_profile import CpuProfiler
+    from shared.infrastructure.simpy_time_converters import timedelta_to_sim_ticks
+
+    selected = {phase.strip() for phase in phases.split(',') if phase.strip()}
+    unknown = selected - {'load', 'run', 'export'}
+    if unknown or not selected:
+        raise typer.BadParameter(f'Unknown phase(s) {", ".join(sorted(unknown))}, expected load, run and/or export')
+    try:
+        profiler = CpuProfiler(mode, interval_ms=interval_ms)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint='--mode') from e
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    logging.disable(logging.WARNING)
+
+    def profiled(phase: str, func: Callable[[], Any]) -> Any:
+        if phase not in selected:
+            return func()
+        typer.echo(f'Profiling {phase}...')
+        profiler.enable()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+
+    scenario = profiled('load', ConfigurationBuilder(scenario_path).build)
+    service = SimulationApplicationService(scenario, output_path)
+    until = timedelta_to_sim_ticks(scenario.end_date - scenario.start_date)
+    result = profiled('run', partial(service.execute, until))
+    if not result.success:
+        typer.echo('\nSIMULATION FAILED')
+        raise typer.Exit(1)
+    # Sequential export keeps the exporters on the profiled thread
+    export = partial(service.contexts['retrofit_workflow'].export_events, str(output_path), max_workers=1)
+    profiled('export', export)
+
+    pstats_path, collapsed_path = profiler.write(output_path)
+    if top:
+        report = io.StringIO()
+        pstats.Stats(str(pstats_path), stream=report).sort_stats('cumulative').print_stats(top)
+        typer.echo(report.getvalue())
+    contexts = profiler.self_time_by_context()
+    total = sum(contexts.values()) or 1.0
+    typer.echo('Self time by bounded context / package:')
+    for context, seconds in contexts.items():
+        typer.echo(f'  {seconds:8.2f} s {seconds / total:6.1%}  {context}')
+    typer.echo(f'\nProfile written to {pstats_path}')
+    typer.echo(f'Collapsed stacks written to {collapsed_path} (flamegraph.pl, inferno or speedscope)')
+
+
 @app.command()
 def optimize(
     scenario_folder_path: Annotated[Path, typer.Option('--scenario', help='Path to scenario directory')],
@@ -222,6 +645,7 @@ def optimize(
     import copy
     import json
     from tqdm import trange
+    from contexts.configuration.domain.models.scenario import Scenario
     from optimizer.harness import run_simulation, run_parallel
     from optimizer.problem_space import parameter_config
     from optimizer.util import score, convert, get_neighbors
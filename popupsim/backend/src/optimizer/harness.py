@@ -39,7 +39,14 @@ def run_simulation(
         logging.disable(logging.CRITICAL)
         try:
             with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
-                run(scenario_path=scenario_path, output_path=output_tmp, verbose=False)
+                run(
+                    scenario_path=scenario_path,
+                    output_path=output_tmp,
+                    verbose=False,
+                    export_workers=1,
+                    outputs='summary',
+                    scenario_cache=False,
+                )
         except SystemExit as exc:
             if exc.code != 0:
                 raise RuntimeError(f'Simulation failed for scenario in {scenario_path}') from exc
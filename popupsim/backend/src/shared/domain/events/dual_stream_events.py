@@ -34,7 +34,7 @@ class ProcessState(StrEnum):
     RAKE_DECOUPLING_COMPLETED = 'rake_decoupling_completed'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateChangeEvent:
     """State change event (WHAT is happening to the resource)."""
 
@@ -47,7 +47,7 @@ class StateChangeEvent:
     rejection_reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocationChangeEvent:
     """Location change event (WHERE the resource is)."""
 
@@ -59,7 +59,7 @@ class LocationChangeEvent:
     route_path: list[str] | None = None  # Full route path for MOVING state visualization
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessEvent:  # pylint: disable=too-many-instance-attributes
     """Process event (activities/operations in progress).
 
@@ -7,31 +7,32 @@ from typing import TYPE_CHECKING
 from shared.domain.value_objects.rake_type import RakeType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from shared.domain.entities.rake import Rake
 
 
 class RakeRegistry:
-    """Central registry for tracking rakes across all contexts."""
+    """Central registry for tracking rakes across all contexts.
+
+    Type and track indexes are insertion-ordered dicts keyed by rake ID, so
+    register, move and remove are O(1) and lookups keep registration/arrival order.
+    """
 
     def __init__(self) -> None:
         self._rakes: dict[str, Rake] = {}
-        self._rakes_by_type: dict[RakeType, list[str]] = {rake_type: [] for rake_type in RakeType}
-        self._rakes_by_track: dict[str, list[str]] = {}
+        self._rakes_by_type: dict[RakeType, dict[str, Rake]] = {rake_type: {} for rake_type in RakeType}
+        self._rakes_by_track: dict[str, dict[str, Rake]] = {}
 
     def register_rake(self, rake: Rake) -> None:
-        """Register a new rake in the registry."""
+        """Register a new rake in the registry (replacing one with the same ID)."""
+        if rake.rake_id in self._rakes:
+            self.remove_rake(rake.rake_id)
         self._rakes[rake.rake_id] = rake
 
-        # Index by type
-        if rake.rake_id not in self._rakes_by_type[rake.rake_type]:
-            self._rakes_by_type[rake.rake_type].append(rake.rake_id)
-
-        # Index by track
-        track = rake.formation_track
-        if track not in self._rakes_by_track:
-            self._rakes_by_track[track] = []
-        if rake.rake_id not in self._rakes_by_track[track]:
-            self._rakes_by_track[track].append(rake.rake_id)
+        # Index by type and track
+        self._rakes_by_type[rake.rake_type][rake.rake_id] = rake
+        self._rakes_by_track.setdefault(rake.formation_track, {})[rake.rake_id] = rake
 
     def get_rake(self, rake_id: str) -> Rake | None:
         """Get rake by ID."""
@@ -39,50 +40,62 @@ class RakeRegistry:
 
     def get_rakes_by_type(self, rake_type: RakeType) -> list[Rake]:
         """Get all rakes of specified type."""
-        rake_ids = self._rakes_by_type.get(rake_type, [])
-        return [self._rakes[rake_id] for rake_id in rake_ids if rake_id in self._rakes]
+        return list(self._rakes_by_type.get(rake_type, {}).values())
 
     def get_rakes_by_track(self, track_id: str) -> list[Rake]:
         """Get all rakes on specified track."""
-        rake_ids = self._rakes_by_track.get(track_id, [])
-        return [self._rakes[rake_id] for rake_id in rake_ids if rake_id in self._rakes]
+        return list(self._rakes_by_track.get(track_id, {}).values())
 
     def update_rake_track(self, rake_id: str, new_track: str) -> None:
         """Update rake track location."""
         rake = self._rakes.get(rake_id)
         if not rake:
             return
-
-        # Remove from old track index
-        old_track = rake.formation_track
-        if old_track in self._rakes_by_track and rake_id in self._rakes_by_track[old_track]:
-            self._rakes_by_track[old_track].remove(rake_id)
-
-        # Add to new track index
-        if new_track not in self._rakes_by_track:
-            self._rakes_by_track[new_track] = []
-        if rake_id not in self._rakes_by_track[new_track]:
-            self._rakes_by_track[new_track].append(rake_id)
-
-        # Update rake
-        rake.formation_track = new_track
+        self._move(rake, new_track)
+
+    def move_many(self, rake_ids: Iterable[str], new_track: str) -> list[Rake]:
+        """Move several rakes to a track, e.g. for a batch transport.
+
+        Rakes arrive on the new track in the given order. Unknown IDs are skipped.
+
+        Returns
+        -------
+        list[Rake]
+            Moved rakes
+        """
+        moved = []
+        target = self._rakes_by_track.setdefault(new_track, {})
+        for rake_id in rake_ids:
+            rake = self._rakes.get(rake_id)
+            if rake:
+                self._move(rake, new_track, target)
+                moved.append(rake)
+        return moved
 
     def remove_rake(self, rake_id: str) -> None:
         """Remove rake from registry."""
-        rake = self._rakes.get(rake_id)
+        rake = self._rakes.pop(rake_id, None)
         if not rake:
             return
 
         # Remove from all indexes
-        self._rakes_by_type[rake.rake_type].remove(rake_id)
-
-        track = rake.formation_track
-        if track in self._rakes_by_track and rake_id in self._rakes_by_track[track]:
-            self._rakes_by_track[track].remove(rake_id)
-
-        # Remove from main registry
-        del self._rakes[rake_id]
+        self._rakes_by_type[rake.rake_type].pop(rake_id, None)
+        self._discard_from_track(rake)
 
     def get_all_rakes(self) -> list[Rake]:
         """Get all registered rakes."""
         return list(self._rakes.values())
+
+    def _move(self, rake: Rake, new_track: str, target: dict[str, Rake] | None = None) -> None:
+        """Re-index rake from its current track to the end of new_track."""
+        self._discard_from_track(rake)
+        if target is None:
+            target = self._rakes_by_track.setdefault(new_track, {})
+        target[rake.rake_id] = rake
+        rake.formation_track = new_track
+
+    def _discard_from_track(self, rake: Rake) -> None:
+        """Remove rake from the index of its current track."""
+        on_track = self._rakes_by_track.get(rake.formation_track)
+        if on_track is not None:
+            on_track.pop(rake.rake_id, None)
@@ -0,0 +1,127 @@
+"""All-pairs route table compiled from configured routes.
+
+Every configured route is a directed link from the first to the last location
+of its path. The table runs Dijkstra from every location (yard graphs are
+small and sparse) and stores the shortest duration between all pairs in a
+dense matrix indexed by integer location ids, so pairs without a hand-written
+route resolve to the fastest chain of configured ones.
+"""
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Sequence
+import heapq
+import math
+
+
+class RouteTable:
+    """Shortest durations and paths between all pairs of route locations."""
+
+    def __init__(self, routes: Iterable[tuple[Sequence[str], float]]) -> None:
+        """Compile table.
+
+        Parameters
+        ----------
+        routes : Iterable[tuple[Sequence[str], float]]
+            Path (origin, waypoints, destination) and duration of every configured
+            route; a later route replaces an earlier one between the same locations
+        """
+        links: dict[tuple[str, str], tuple[float, tuple[str, ...]]] = {}
+        for path, duration in routes:
+            if len(path) >= 2:
+                links[(path[0], path[-1])] = (float(duration), tuple(path))
+
+        self.locations: list[str] = sorted({location for pair in links for location in pair})
+        self.index: dict[str, int] = {location: i for i, location in enumerate(self.locations)}
+        self._size = len(self.locations)
+        self._links = {(self.index[a], self.index[b]): link for (a, b), link in links.items()}
+        self._durations = array('d', [math.inf]) * (self._size * self._size)
+        # Location before the destination on the shortest path from the origin
+        self._previous = array('i', [-1]) * (self._size * self._size)
+
+        adjacency: list[list[tuple[int, float]]] = [[] for _ in range(self._size)]
+        for (origin, destination), (duration, _) in sorted(self._links.items()):
+            if origin != destination:
+                adjacency[origin].append((destination, duration))
+        for origin in range(self._size):
+            self._shortest_paths_from(origin, adjacency)
+
+    def duration_at(self, origin: int, destination: int) -> float:
+        """Get shortest duration between location indices (inf if unreachable)."""
+        return self._durations[origin * self._size + destination]
+
+    def duration(self, from_location: str, to_location: str) -> float:
+        """Get shortest duration between locations.
+
+        Raises
+        ------
+        KeyError
+            If a location is unknown or no chain of routes connects them
+        """
+        duration = self.duration_at(*self._indices(from_location, to_location))
+        if duration == math.inf:
+            msg = f'No route connects {from_location}->{to_location}'
+            raise KeyError(msg)
+        return duration
+
+    def has_route(self, from_location: str, to_location: str) -> bool:
+        """Check whether a chain of routes connects the locations."""
+        origin = self.index.get(from_location)
+        destination = self.index.get(to_location)
+        return origin is not None and destination is not None and self.duration_at(origin, destination) < math.inf
+
+    def legs(self, from_location: str, to_location: str) -> list[tuple[str, str]]:
+        """Get configured routes (as location pairs) of the shortest path, in travel order.
+
+        Raises
+        ------
+        KeyError
+            If a location is unknown or no chain of routes connects them
+        """
+        self.duration(from_location, to_location)
+        origin, destination = self._indices(from_location, to_location)
+        legs = []
+        while destination != origin:
+            previous = self._previous[origin * self._size + destination]
+            legs.append((self.locations[previous], self.locations[destination]))
+            destination = previous
+        return legs[::-1]
+
+    def path(self, from_location: str, to_location: str) -> list[str]:
+        """Get locations of the shortest path including the waypoints of its routes.
+
+        Raises
+        ------
+        KeyError
+            If a location is unknown or no chain of routes connects them
+        """
+        path = [from_location]
+        for a, b in self.legs(from_location, to_location):
+            path.extend(self._links[(self.index[a], self.index[b])][1][1:])
+        return path
+
+    def _indices(self, from_location: str, to_location: str) -> tuple[int, int]:
+        """Get indices of locations."""
+        for location in (from_location, to_location):
+            if location not in self.index:
+                msg = f'Unknown route location {location!r}'
+                raise KeyError(msg)
+        return self.index[from_location], self.index[to_location]
+
+    def _shortest_paths_from(self, origin: int, adjacency: list[list[tuple[int, float]]]) -> None:
+        """Fill the matrix row of origin with Dijkstra."""
+        row = origin * self._size
+        durations = self._durations
+        durations[row + origin] = 0.0
+        self._previous[row + origin] = origin
+        queue = [(0.0, origin)]
+        while queue:
+            duration, location = heapq.heappop(queue)
+            if duration > durations[row + location]:
+                continue
+            for destination, link_duration in adjacency[location]:
+                candidate = duration + link_duration
+                if candidate < durations[row + destination]:
+                    durations[row + destination] = candidate
+                    self._previous[row + destination] = location
+                    heapq.heappush(queue, (candidate, destination))
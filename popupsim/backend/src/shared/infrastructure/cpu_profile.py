@@ -0,0 +1,265 @@
+"""CPU profiling of a simulation run with pstats and collapsed-stack output.
+
+Two modes are available:
+
+``cprofile``
+    Deterministic profiling: exact call counts and times, but every Python call
+    pays the profiler overhead, which inflates call-heavy code.
+``sample``
+    A background thread records the stack of the profiled thread every
+    interval. Overhead is low and stacks are exact, call counts are unknown.
+
+Both modes write a ``.pstats`` file (``python -m pstats``, snakeviz) and
+collapsed stacks, one ``frame;frame;...;frame value`` line per stack, for
+flamegraph.pl, inferno or speedscope. Frames are labelled with the bounded
+context or package their code belongs to, e.g.
+``retrofit_workflow:collection_coordinator.CollectionCoordinator._collection_process``.
+Stack values are microseconds. In ``cprofile`` mode stacks are estimated
+from caller/callee times. In ``sample`` mode each sample counts the time since
+the previous one (a long C call holding the GIL delays the next sample) and
+the pstats "calls" count samples.
+"""
+
+from collections import Counter
+from collections import defaultdict
+import cProfile
+import functools
+import itertools
+import marshal
+from pathlib import Path
+import pstats
+import sys
+import threading
+import time
+from types import CodeType
+from types import FrameType
+
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+PROFILE_MODES = ('cprofile', 'sample')
+
+# pstats function key (file name, first line, function name)
+type FunctionKey = tuple[str, int, str]
+# pstats entry (primitive calls, calls, self time, cumulative time, callers)
+type FunctionStats = tuple[int, int, float, float, dict[FunctionKey, tuple[int, int, float, float]]]
+
+# cprofile stacks below this share of a function's time are dropped
+_MIN_STACK_S = 1e-6
+_PROFILER_DISABLE = "<method 'disable' of '_lsprof.Profiler' objects>"
+
+
+class CpuProfiler:
+    """Profile the calling thread while enabled, then write pstats and collapsed stacks."""
+
+    def __init__(self, mode: str = 'cprofile', interval_ms: float = 1.0) -> None:
+        """Initialize profiler.
+
+        Parameters
+        ----------
+        mode : str
+            'cprofile' or 'sample'
+        interval_ms : float
+            Sampling interval in milliseconds (sample mode only)
+
+        Raises
+        ------
+        ValueError
+            If the mode is unknown
+        """
+        if mode not in PROFILE_MODES:
+            msg = f'Unknown profile mode {mode!r}, expected one of {", ".join(PROFILE_MODES)}'
+            raise ValueError(msg)
+        self.mode = mode
+        self._profile = cProfile.Profile() if mode == 'cprofile' else None
+        self._sampler = _StackSampler(interval_ms / 1000) if mode == 'sample' else None
+
+    def enable(self) -> None:
+        """Start or resume profiling the calling thread."""
+        if self._profile is not None:
+            self._profile.enable()
+        else:
+            self._sampler.start(sys._getframe(1))  # type: ignore[union-attr]  # pylint: disable=protected-access
+
+    def disable(self) -> None:
+        """Pause profiling."""
+        if self._profile is not None:
+            self._profile.disable()
+        else:
+            self._sampler.stop()  # type: ignore[union-attr]
+
+    def stats(self) -> dict[FunctionKey, FunctionStats]:
+        """Get profile in pstats format."""
+        if self._profile is not None:
+            stats = pstats.Stats(self._profile).stats  # type: ignore[attr-defined]
+            # Leave out the profiler's own disable calls
+            return {key: entry for key, entry in stats.items() if key[0] != __file__ and key[2] != _PROFILER_DISABLE}
+        return self._sampler.stats()  # type: ignore[union-attr]
+
+    def collapsed(self) -> dict[str, int]:
+        """Get collapsed stacks (frames from the outermost, ';'-separated) with their values."""
+        if self._profile is not None:
+            stacks = _stacks_from_stats(self.stats())
+            lines = ((';'.join(_label(*key) for key in stack), seconds) for stack, seconds in stacks.items())
+        else:
+            lines = (
+                (';'.join(_label(c.co_filename, c.co_firstlineno, c.co_qualname) for c in stack), seconds)
+                for stack, seconds in self._sampler.seconds.items()  # type: ignore[union-attr]
+            )
+        collapsed: Counter[str] = Counter()
+        for stack, seconds in lines:
+            collapsed[stack] += round(seconds * 1e6)
+        return {stack: value for stack, value in collapsed.items() if value > 0}
+
+    def self_time_by_context(self) -> dict[str, float]:
+        """Get self time in seconds per bounded context or package, highest first."""
+        totals: Counter[str] = Counter()
+        for (filename, _, _), entry in self.stats().items():
+            totals[_context(filename)] += entry[2]
+        return dict(totals.most_common())
+
+    def write(self, output_dir: Path, name: str = 'profile') -> tuple[Path, Path]:
+        """Write ``<name>.pstats`` and ``<name>.collapsed.txt`` to output_dir.
+
+        Returns
+        -------
+        tuple[Path, Path]
+            pstats file and collapsed-stack file
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pstats_path = output_dir / f'{name}.pstats'
+        with pstats_path.open('wb') as f:
+            marshal.dump(self.stats(), f)
+        collapsed_path = output_dir / f'{name}.collapsed.txt'
+        lines = [f'{stack} {value}\n' for stack, value in sorted(self.collapsed().items())]
+        collapsed_path.write_text(''.join(lines), encoding='utf-8')
+        return pstats_path, collapsed_path
+
+
+class _StackSampler:
+    """Background thread recording the stack of one thread at a fixed interval."""
+
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self.samples: Counter[tuple[CodeType, ...]] = Counter()
+        self.seconds: Counter[tuple[CodeType, ...]] = Counter()
+        self._outer: set[FrameType] = set()
+        self._target = 0
+        self._switch_interval = sys.getswitchinterval()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, caller: FrameType) -> None:
+        """Sample the current thread, leaving out caller and the frames above it."""
+        self._outer = set()
+        frame: FrameType | None = caller
+        while frame is not None:
+            self._outer.add(frame)
+            frame = frame.f_back
+        self._target = threading.get_ident()
+        # The sampler only runs when the profiled thread releases the GIL, which it
+        # does every switch interval (5 ms by default)
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval_s))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='popupsim-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        sys.setswitchinterval(self._switch_interval)
+        self._outer = set()
+
+    def stats(self) -> dict[FunctionKey, FunctionStats]:
+        """Convert samples to pstats format."""
+        entries: dict[FunctionKey, list] = defaultdict(lambda: [0, 0, 0.0, 0.0, defaultdict(lambda: [0, 0, 0.0, 0.0])])
+        for stack, count in self.samples.items():
+            seconds = self.seconds[stack]
+            keys = [(code.co_filename, code.co_firstlineno, code.co_name) for code in stack]
+            for key in set(keys):
+                entry = entries[key]
+                entry[0] += count
+                entry[1] += count
+                entry[3] += seconds
+            entries[keys[-1]][2] += seconds
+            for caller, callee in set(itertools.pairwise(keys)):
+                edge = entries[callee][4][caller]
+                edge[0] += count
+                edge[1] += count
+                edge[2] += seconds if callee == keys[-1] else 0.0
+                edge[3] += seconds
+        return {
+            key: (cc, nc, tt, ct, {caller: tuple(edge) for caller, edge in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in entries.items()
+        }
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        current_frames = sys._current_frames  # pylint: disable=protected-access
+        previous = time.perf_counter()
+        while not self._stop.wait(self.interval_s):
+            frame = current_frames().get(self._target)
+            now = time.perf_counter()
+            elapsed, previous = now - previous, now
+            stack = []
+            while frame is not None and frame not in self._outer:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            # Samples taken while the profiler itself stops belong to no phase
+            if stack and stack[-1].co_filename != __file__:
+                key = tuple(reversed(stack))
+                self.samples[key] += 1
+                self.seconds[key] += elapsed
+
+
+def _stacks_from_stats(stats: dict[FunctionKey, FunctionStats]) -> Counter[tuple[FunctionKey, ...]]:
+    """Estimate self time per call stack from caller/callee times.
+
+    Every function's time is split among its callees in proportion to the
+    cumulative time of each call edge, starting at functions without caller.
+    Recursive calls are cut at the first repetition.
+    """
+    callees: dict[FunctionKey, list[tuple[FunctionKey, float]]] = defaultdict(list)
+    for callee, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller].append((callee, edge[3]))
+
+    stacks: Counter[tuple[FunctionKey, ...]] = Counter()
+    pending = [((key,), entry[3]) for key, entry in stats.items() if not entry[4]]
+    while pending:
+        stack, share = pending.pop()
+        _, _, self_s, cumulative_s, _ = stats[stack[-1]]
+        scale = min(share / cumulative_s, 1.0) if cumulative_s > 0 else 0.0
+        stacks[stack] += self_s * scale
+        for callee, edge_s in callees[stack[-1]]:
+            if callee not in stack and edge_s * scale >= _MIN_STACK_S:
+                pending.append(((*stack, callee), edge_s * scale))
+    return stacks
+
+
+@functools.cache
+def _label(filename: str, _line: int, name: str) -> str:
+    """Label frame as ``context:module.function`` (';' would split the frame)."""
+    if filename == '~' or filename.startswith('<'):
+        return f'python:{name}'.replace(';', ',')
+    return f'{_context(filename)}:{Path(filename).stem}.{name}'.replace(';', ',')
+
+
+@functools.cache
+def _context(filename: str) -> str:
+    """Get bounded context (e.g. retrofit_workflow), source package or third-party package of a code file."""
+    if filename == '~' or filename.startswith('<'):
+        return 'python'
+    path = Path(filename).resolve()
+    if path.is_relative_to(_SOURCE_ROOT):
+        parts = path.relative_to(_SOURCE_ROOT).parts
+        if parts[0] == 'contexts' and len(parts) > 2:  # contexts/<context>/<module>
+            return parts[1]
+        return Path(parts[0]).stem
+    if 'site-packages' in path.parts:
+        index = path.parts.index('site-packages')
+        if index + 1 < len(path.parts):
+            return Path(path.parts[index + 1]).stem
+    return 'python'
@@ -0,0 +1,128 @@
+"""Import-time benchmark based on ``python -X importtime``.
+
+Each measurement imports a module in a fresh interpreter (what every CLI call
+and optimizer worker pays) and parses the per-module timings Python reports on
+stderr. Budgets cap the cumulative import time of entry points and list heavy
+modules they must not load eagerly.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+import os
+from pathlib import Path
+import re
+import subprocess  # nosec B404 - runs the current interpreter only
+import sys
+
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)\s*$')
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Timing of one imported module (microseconds, as reported by Python)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    """Allowed import cost of an entry-point module."""
+
+    module: str
+    max_ms: float
+    forbidden: frozenset[str] = field(default_factory=frozenset)
+
+
+IMPORT_BUDGETS: tuple[ImportBudget, ...] = (
+    # CLI entry point: typer only, everything else is imported by the command that runs
+    ImportBudget(
+        'main',
+        max_ms=350.0,
+        forbidden=frozenset({'pandas', 'numpy', 'streamlit', 'tqdm', 'application.simulation_service'}),
+    ),
+    # Simulation graph: pandas belongs to the loader and exporters only
+    ImportBudget('application.simulation_service', max_ms=1500.0, forbidden=frozenset({'pandas', 'streamlit'})),
+)
+"""Budgets checked by the test suite and ``popupsim import-time``."""
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import timings of a module measured in a fresh interpreter."""
+
+    module: str
+    timings: tuple[ImportTiming, ...]
+
+    @property
+    def total_ms(self) -> float:
+        """Get cumulative import time of the module in milliseconds."""
+        return next(t.cumulative_us for t in reversed(self.timings) if t.module == self.module and t.depth == 0) / 1000
+
+    @property
+    def loaded(self) -> frozenset[str]:
+        """Get names of all modules the import loaded."""
+        return frozenset(t.module for t in self.timings)
+
+    def slowest(self, count: int = 10) -> list[ImportTiming]:
+        """Get modules with the highest self time."""
+        return sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:count]
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output (other lines are ignored).
+
+    Returns
+    -------
+    list[ImportTiming]
+        Timings in report order (dependencies before the modules importing them)
+    """
+    timings = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def measure_import_time(module: str, runs: int = 3) -> ImportProfile:
+    """Measure import of module from the backend sources, keeping the fastest of several runs.
+
+    Raises
+    ------
+    RuntimeError
+        If the module cannot be imported
+    """
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [str(_SOURCE_ROOT), os.environ.get('PYTHONPATH')]))}
+    profiles = []
+    for _ in range(max(runs, 1)):
+        result = subprocess.run(  # nosec B603  # noqa: S603
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f'Importing {module} failed:\n{result.stderr[-2000:]}')
+        profiles.append(ImportProfile(module, tuple(parse_importtime(result.stderr))))
+    return min(profiles, key=lambda p: p.total_ms)
+
+
+def check_budget(profile: ImportProfile, budget: ImportBudget) -> list[str]:
+    """Check profile against budget.
+
+    Returns
+    -------
+    list[str]
+        Violations (empty if within budget)
+    """
+    violations = []
+    if profile.total_ms > budget.max_ms:
+        violations.append(f'{budget.module} imports in {profile.total_ms:.0f} ms (budget {budget.max_ms:.0f} ms)')
+    violations.extend(f'{budget.module} eagerly imports {name}' for name in sorted(budget.forbidden & profile.loaded))
+    return violations
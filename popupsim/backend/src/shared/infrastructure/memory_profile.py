@@ -0,0 +1,158 @@
+"""Memory profiling of a simulation run with tracemalloc.
+
+Snapshots are taken at phase boundaries (after load, after initialization, at
+simulation-time checkpoints, after the run and after export). For every
+snapshot the profile lists the largest allocation sites still alive and the
+sites that grew most since the previous snapshot. The peak of a phase also
+covers memory freed before its end, e.g. pandas frames built during export.
+"""
+
+from collections.abc import Generator
+from dataclasses import asdict
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import tracemalloc
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from shared.infrastructure.simulation.engines.simulation_engine_port import SimulationEnginePort
+
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+_MB = 1024 * 1024
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    # Earlier checkpoints and their snapshot statistics
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Memory allocated at one source line (size_mb/count are differences in growth lists)."""
+
+    site: str
+    size_mb: float
+    count: int
+
+
+@dataclass(frozen=True)
+class MemoryCheckpoint:
+    """Traced memory at the end of a phase."""
+
+    phase: str
+    sim_time: float | None
+    traced_mb: float
+    peak_mb: float
+    growth_mb: float
+    top_sites: list[AllocationSite]
+    top_growth: list[AllocationSite]
+
+
+class MemoryProfiler:
+    """Take tracemalloc snapshots at phase boundaries of a run."""
+
+    def __init__(self, top: int = 20, frames: int = 1) -> None:
+        """Initialize profiler.
+
+        Parameters
+        ----------
+        top : int
+            Allocation sites listed per checkpoint
+        frames : int
+            Stack frames stored per allocation (more is slower, sites use the innermost)
+        """
+        self.top = top
+        self.frames = frames
+        self.checkpoints: list[MemoryCheckpoint] = []
+        self._previous: tracemalloc.Snapshot | None = None
+
+    def start(self) -> None:
+        """Start tracing allocations (call before the first phase)."""
+        self.checkpoints = []
+        self._previous = None
+        tracemalloc.start(self.frames)
+
+    def stop(self) -> None:
+        """Stop tracing and free the traces."""
+        self._previous = None
+        tracemalloc.stop()
+
+    def checkpoint(self, phase: str, sim_time: float | None = None) -> MemoryCheckpoint:
+        """Snapshot traced memory at the end of phase and reset the peak for the next one."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        top_sites = [
+            AllocationSite(_site(stat.traceback), stat.size / _MB, stat.count)
+            for stat in snapshot.statistics('lineno')[: self.top]
+        ]
+        top_growth: list[AllocationSite] = []
+        growth_mb = traced / _MB
+        if self._previous is not None:
+            diffs = snapshot.compare_to(self._previous, 'lineno')
+            top_growth = [
+                AllocationSite(_site(diff.traceback), diff.size_diff / _MB, diff.count_diff)
+                for diff in diffs[: self.top]
+                if diff.size_diff > 0
+            ]
+            growth_mb = (traced - self.checkpoints[-1].traced_mb * _MB) / _MB
+        self._previous = snapshot
+
+        checkpoint = MemoryCheckpoint(phase, sim_time, traced / _MB, peak / _MB, growth_mb, top_sites, top_growth)
+        self.checkpoints.append(checkpoint)
+        return checkpoint
+
+    def attach(self, engine: 'SimulationEnginePort', until: float, sim_checkpoints: int = 4) -> None:
+        """Take checkpoints when the engine starts and stops running and at evenly spaced simulation times.
+
+        Parameters
+        ----------
+        engine : SimulationEnginePort
+            Engine of the run (before it starts)
+        until : float
+            Simulation end time
+        sim_checkpoints : int
+            Checkpoints between start and end of the run
+        """
+
+        def on_start() -> None:
+            self.checkpoint('initialize', engine.current_time())
+            if sim_checkpoints > 0:
+                engine.schedule_process(self._sim_checkpoints(engine, until / (sim_checkpoints + 1), sim_checkpoints))
+
+        engine.add_pre_run_hook(on_start)
+        engine.add_post_run_hook(lambda: self.checkpoint('run', engine.current_time()))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get profile as JSON-compatible dict."""
+        return {
+            'top': self.top,
+            'frames': self.frames,
+            'peak_mb': max((c.peak_mb for c in self.checkpoints), default=0.0),
+            'phases': [asdict(c) for c in self.checkpoints],
+        }
+
+    def write_json(self, filepath: Path) -> None:
+        """Write profile as indented JSON."""
+        filepath.write_text(json.dumps(self.to_dict(), indent=2) + '\n', encoding='utf-8')
+
+    def _sim_checkpoints(self, engine: 'SimulationEnginePort', interval: float, count: int) -> Generator[Any]:
+        """Take count checkpoints, one every interval ticks."""
+        for _ in range(count):
+            yield from engine.delay(interval)
+            self.checkpoint('simulation', engine.current_time())
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    """Format innermost frame as path:line, relative to the backend sources where possible."""
+    frame = traceback[0]
+    path = Path(frame.filename)
+    if path.is_relative_to(_SOURCE_ROOT):
+        path = path.relative_to(_SOURCE_ROOT)
+    return f'{path.as_posix()}:{frame.lineno}'
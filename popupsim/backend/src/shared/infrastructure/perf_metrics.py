@@ -0,0 +1,204 @@
+"""Lightweight hot-path instrumentation: monotonic timers and counters.
+
+Instrumentation is disabled by default. Instrumented call sites then only check
+one flag, so they can stay in the simulation code permanently. When enabled
+(``popupsim run --perf-metrics``), every timed call is measured with
+``time.perf_counter_ns``.
+
+SimPy processes and other generators are timed per resume: a sample is the
+wall time between being resumed and yielding the next event, so simulated
+waiting is excluded. Times are inclusive: a timed generator driven with
+``yield from`` by another timed one counts towards both.
+"""
+
+from array import array
+from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Iterator
+from contextlib import contextmanager
+import functools
+import inspect
+import json
+from pathlib import Path
+import random
+import time
+from typing import Any
+
+SAMPLE_LIMIT = 100_000
+"""Samples kept per timer for percentiles; beyond it a uniform random subset is kept."""
+
+
+class PerfTimer:
+    """Call count, total time and sampled durations of one instrumented code path."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.samples = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self._kept = array('q')
+        self._random = random.Random(name)  # nosec B311  # noqa: S311 - reservoir sampling, not security
+
+    def add(self, duration_ns: int) -> None:
+        """Record one sample."""
+        self.samples += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        if len(self._kept) < SAMPLE_LIMIT:
+            self._kept.append(duration_ns)
+        else:
+            slot = self._random.randrange(self.samples)
+            if slot < SAMPLE_LIMIT:
+                self._kept[slot] = duration_ns
+
+    def percentile(self, q: float) -> float:
+        """Get q-th percentile (0-100, nearest rank) of the samples in nanoseconds."""
+        if not self._kept:
+            return 0.0
+        ordered = sorted(self._kept)
+        rank = max(1, round(q / 100 * len(ordered)))
+        return float(ordered[min(rank, len(ordered)) - 1])
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Summarize timer (times in seconds and milliseconds)."""
+        return {
+            'calls': self.calls,
+            'samples': self.samples,
+            'total_s': self.total_ns / 1e9,
+            'mean_ms': self.total_ns / self.samples / 1e6 if self.samples else 0.0,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+class PerfRegistry:
+    """Named timers and counters of one simulation run."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.timers: dict[str, PerfTimer] = {}
+        self.counters: dict[str, int] = {}
+
+    def reset(self, enabled: bool) -> None:
+        """Drop all measurements and enable or disable instrumentation."""
+        self.enabled = enabled
+        self.timers = {}
+        self.counters = {}
+
+    def timer(self, name: str) -> PerfTimer:
+        """Get timer by name, creating it on first use."""
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = PerfTimer(name)
+        return timer
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment counter (no-op while disabled)."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration measured elsewhere as one call (no-op while disabled)."""
+        if self.enabled:
+            timer = self.timer(name)
+            timer.calls += 1
+            timer.add(round(seconds * 1e9))
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one call."""
+        if not self.enabled:
+            yield
+            return
+        timer = self.timer(name)
+        timer.calls += 1
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            timer.add(time.perf_counter_ns() - start)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get all measurements, timers sorted by total time (highest first)."""
+        timers = sorted(self.timers.values(), key=lambda t: t.total_ns, reverse=True)
+        return {
+            'clock': 'perf_counter_ns',
+            'sample_limit': SAMPLE_LIMIT,
+            'timers': {timer.name: timer.to_dict() for timer in timers},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    def write_json(self, filepath: Path) -> None:
+        """Write snapshot as indented JSON."""
+        filepath.write_text(json.dumps(self.snapshot(), indent=2) + '\n', encoding='utf-8')
+
+
+_PERF_REGISTRY = PerfRegistry()
+
+
+def get_perf_registry() -> PerfRegistry:
+    """Get global instrumentation registry."""
+    return _PERF_REGISTRY
+
+
+def timed_process(name: str, process: Generator[Any, Any, Any]) -> Generator[Any, Any, Any]:
+    """Time each resume of a generator (returned unchanged while instrumentation is disabled).
+
+    The wrapper forwards sent values, thrown exceptions (e.g. SimPy interrupts),
+    close() and the return value, so it can replace the generator in
+    ``env.process(...)`` and ``yield from``.
+    """
+    if not _PERF_REGISTRY.enabled:
+        return process
+    timer = _PERF_REGISTRY.timer(name)
+    timer.calls += 1
+    return _timed_resumes(timer, process)
+
+
+def _timed_resumes(timer: PerfTimer, process: Generator[Any, Any, Any]) -> Generator[Any, Any, Any]:
+    """Drive process, timing every step from resume to the next yield."""
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        start = time.perf_counter_ns()
+        try:
+            event = process.send(value) if error is None else process.throw(error)
+        except StopIteration as stop:
+            timer.add(time.perf_counter_ns() - start)
+            return stop.value
+        finally:
+            error = None
+        timer.add(time.perf_counter_ns() - start)
+        try:
+            value = yield event
+        except GeneratorExit:
+            process.close()
+            raise
+        except BaseException as e:  # pylint: disable=broad-exception-caught  # forwarded into the process
+            error = e
+
+
+def timed[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time calls of a function or generator function (generators per resume, see timed_process)."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                return timed_process(name, func(*args, **kwargs))  # type: ignore[arg-type, return-value]
+
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _PERF_REGISTRY.enabled:
+                return func(*args, **kwargs)
+            with _PERF_REGISTRY.measure(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -4,9 +4,17 @@ SimPy is unit-agnostic - it just counts 'ticks'. We define what a tick means.
 This module provides the SINGLE SOURCE OF TRUTH for time unit conversions.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pandas as pd
 
 
 class SimulationTimeUnit(Enum):
@@ -118,16 +126,59 @@ def sim_ticks_to_datetime(sim_time: float, start_datetime: str | datetime) -> st
     str
         ISO format datetime string
     """
-    if isinstance(start_datetime, datetime):
-        start_dt = start_datetime
-    else:
-        start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-
+    start_dt = _parse_start_datetime(start_datetime)
     duration = sim_ticks_to_timedelta(sim_time)
     event_dt = start_dt + duration
     return event_dt.isoformat()
 
 
+def sim_ticks_to_datetime_series(sim_times: Sequence[float] | pd.Series, start_datetime: str | datetime) -> pd.Series:
+    """Convert many simulation times (ticks) to ISO datetime strings at once.
+
+    Vectorized equivalent of :func:`sim_ticks_to_datetime` producing identical
+    strings, including microsecond rounding and UTC offset.
+
+    Parameters
+    ----------
+    sim_times : Sequence[float] | pd.Series
+        Simulation times in ticks
+    start_datetime : str | datetime
+        Simulation start datetime (ISO string or datetime object)
+
+    Returns
+    -------
+    pd.Series
+        ISO format datetime strings (default index)
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    start_dt = _parse_start_datetime(start_datetime)
+    naive_start = start_dt.replace(tzinfo=None)
+    offset = start_dt.isoformat()[len(naive_start.isoformat()) :]
+    us_per_tick = sim_ticks_to_timedelta(1.0) // timedelta(microseconds=1)
+
+    # Split like timedelta() does: exact integer ticks plus rounded fractional microseconds
+    ticks = pd.Series(sim_times, dtype='float64').reset_index(drop=True)
+    whole_ticks = ticks.astype('int64')
+    micros = whole_ticks * us_per_tick + ((ticks - whole_ticks) * us_per_tick).round().astype('int64')
+    event_dt = pd.Timestamp(naive_start).as_unit('us') + pd.to_timedelta(micros, unit='us')
+
+    seconds = event_dt.dt.floor('s')
+    text = seconds.astype(str).str.replace(' ', 'T', n=1, regex=False)
+    fraction = (event_dt - seconds) // pd.Timedelta(microseconds=1)
+    has_fraction = fraction != 0
+    if has_fraction.any():
+        text[has_fraction] = text[has_fraction] + '.' + fraction[has_fraction].astype(str).str.zfill(6)
+    return text + offset if offset else text
+
+
+def _parse_start_datetime(start_datetime: str | datetime) -> datetime:
+    """Parse simulation start (ISO string with optional 'Z' suffix or datetime)."""
+    if isinstance(start_datetime, datetime):
+        return start_datetime
+    return datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
+
+
 # Backward compatibility aliases
 def timedelta_to_simpy_minutes(td: timedelta) -> float:
     """Convert timedelta to SimPy minutes (deprecated, use timedelta_to_sim_ticks)."""
@@ -0,0 +1,182 @@
+"""File formats for tabular simulation outputs.
+
+Besides CSV, tables can be written in a compact columnar format: repetitive
+string columns are dictionary (categorical) encoded, other columns keep their
+dtype. Parquet and Feather require pyarrow; the NumPy ``.npz`` layout works
+everywhere:
+
+- ``__columns__``: column names in order
+- ``c<i>``: values of column ``i`` (numbers or fixed-width strings)
+- ``c<i>_codes`` / ``c<i>_categories``: codes (``-1`` = missing) and categories
+  of categorical column ``i``
+
+NumPy and pandas are imported on first use, so parsing a format name stays cheap.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+COLUMNAR_ALIAS = 'columnar'
+"""Format name resolving to the best available columnar format."""
+
+
+def has_pyarrow() -> bool:
+    """Check whether pyarrow is installed (needed for Parquet and Feather)."""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+class TabularFormat(StrEnum):
+    """File format for tabular outputs."""
+
+    CSV = 'csv'
+    PARQUET = 'parquet'
+    FEATHER = 'feather'
+    NPZ = 'npz'
+
+    @property
+    def suffix(self) -> str:
+        """Get file suffix including dot."""
+        return f'.{self.value}'
+
+    @classmethod
+    def parse(cls, name: str) -> TabularFormat:
+        """Parse format name.
+
+        ``columnar`` selects Parquet when pyarrow is installed and ``.npz`` otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the name is unknown or the format needs pyarrow and it is missing
+        """
+        name = name.strip().lower()
+        if name == COLUMNAR_ALIAS:
+            return cls.PARQUET if has_pyarrow() else cls.NPZ
+        try:
+            output_format = cls(name)
+        except ValueError:
+            valid = ', '.join([cls.CSV, COLUMNAR_ALIAS, cls.PARQUET, cls.FEATHER, cls.NPZ])
+            raise ValueError(f'Unknown output format: {name}. Valid formats: {valid}') from None
+        if output_format in {cls.PARQUET, cls.FEATHER} and not has_pyarrow():
+            raise ValueError(f'Output format {name} requires pyarrow (use {cls.NPZ} or {COLUMNAR_ALIAS})')
+        return output_format
+
+
+def _is_text(series: pd.Series) -> bool:
+    """Check whether column holds strings (or other non-numeric objects)."""
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    return isinstance(series.dtype, pd.CategoricalDtype) or not (
+        pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)
+    )
+
+
+def _is_repetitive_text(series: pd.Series) -> bool:
+    """Check whether string column benefits from dictionary encoding."""
+    return _is_text(series) and series.nunique(dropna=True) <= len(series) // 2
+
+
+def _categorical(series: pd.Series) -> pd.Categorical:
+    """Dictionary-encode string column."""
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.array
+    return pd.Categorical(series.astype('str'))
+
+
+def encode_categoricals(frame: pd.DataFrame) -> pd.DataFrame:
+    """Get copy of frame with repetitive string columns as categoricals."""
+    return frame.assign(**{str(c): _categorical(frame[c]) for c in frame.columns if _is_repetitive_text(frame[c])})
+
+
+def _write_npz(frame: pd.DataFrame, filepath: Path) -> None:
+    """Write frame in the ``.npz`` columnar layout."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    arrays: dict[str, np.ndarray] = {'__columns__': np.asarray([str(c) for c in frame.columns], dtype=str)}
+    for i, column in enumerate(frame.columns):
+        series = frame[column]
+        if _is_repetitive_text(series):
+            categorical = _categorical(series)
+            arrays[f'c{i}_codes'] = np.asarray(categorical.codes, dtype=np.int32)
+            arrays[f'c{i}_categories'] = np.asarray(categorical.categories, dtype=str)
+        elif _is_text(series):
+            arrays[f'c{i}'] = np.asarray(series.astype('str').fillna(''), dtype=str)
+        else:
+            arrays[f'c{i}'] = series.to_numpy()
+    with open(filepath, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+def _read_npz(filepath: Path) -> pd.DataFrame:
+    """Read frame from the ``.npz`` columnar layout."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    with np.load(filepath, allow_pickle=False) as data:
+        columns: dict[str, object] = {}
+        for i, name in enumerate(data['__columns__'].tolist()):
+            if f'c{i}_codes' in data:
+                columns[name] = pd.Categorical.from_codes(data[f'c{i}_codes'], categories=data[f'c{i}_categories'])
+            else:
+                columns[name] = data[f'c{i}']
+    return pd.DataFrame(columns)
+
+
+def _remove_other_formats(filepath: Path) -> None:
+    """Delete files of the same table in formats other than the one of filepath."""
+    for output_format in TabularFormat:
+        sibling = filepath.with_suffix(output_format.suffix)
+        if sibling != filepath:
+            sibling.unlink(missing_ok=True)
+
+
+def write_table(frame: pd.DataFrame, filepath: Path, output_format: TabularFormat = TabularFormat.CSV) -> Path:
+    """Write frame without index, replacing the suffix of filepath by the format's.
+
+    Files of the table in the other formats (from an earlier run into the same
+    directory) are deleted, so readers preferring a columnar file never pick a
+    stale one over the table just written.
+
+    Returns
+    -------
+    Path
+        Path of the written file
+    """
+    filepath = Path(filepath).with_suffix(output_format.suffix)
+    _remove_other_formats(filepath)
+    if output_format is TabularFormat.CSV:
+        frame.to_csv(filepath, index=False)
+    elif output_format is TabularFormat.PARQUET:
+        encode_categoricals(frame).to_parquet(filepath, index=False)
+    elif output_format is TabularFormat.FEATHER:
+        encode_categoricals(frame).reset_index(drop=True).to_feather(filepath)
+    else:
+        _write_npz(frame, filepath)
+    return filepath
+
+
+def read_table(filepath: Path) -> pd.DataFrame:
+    """Read table written by :func:`write_table` (format taken from the suffix).
+
+    Dictionary-encoded string columns of columnar files are returned as categoricals.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    output_format = TabularFormat(Path(filepath).suffix.removeprefix('.'))
+    if output_format is TabularFormat.CSV:
+        return pd.read_csv(filepath)
+    if output_format is TabularFormat.PARQUET:
+        return pd.read_parquet(filepath)
+    if output_format is TabularFormat.FEATHER:
+        return pd.read_feather(filepath)
+    return _read_npz(filepath)
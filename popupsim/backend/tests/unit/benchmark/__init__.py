@@ -0,0 +1 @@
+"""Benchmark unit tests."""
@@ -0,0 +1,107 @@
+"""Tests for benchmark suite, results file and baseline comparison."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from benchmark import BENCHMARK_SUITES
+from benchmark import SCALING_BENCHMARKS
+from benchmark import BenchmarkCase
+from benchmark import BenchmarkRun
+from benchmark import CaseResult
+from benchmark import benchmark_cases
+from benchmark import compare
+from benchmark import run_benchmark
+from benchmark import run_scaling_benchmarks
+from contexts.configuration.infrastructure.scenario_generator import GeneratorConfig
+from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+import pytest
+
+RESULT = CaseResult(
+    case='example',
+    load_s=0.5,
+    initialize_s=0.01,
+    run_s=2.0,
+    export_s=1.0,
+    events=10_000,
+    wagons=400,
+    peak_rss_mb=200.0,
+)
+
+
+def test_suites_reference_existing_cases() -> None:
+    """Test every suite case exists and example cases point to bundled scenarios."""
+    cases = benchmark_cases()
+
+    assert {name for names in BENCHMARK_SUITES.values() for name in names} <= cases.keys()
+    assert all(case.scenario_path.is_dir() for case in cases.values() if case.scenario_path is not None)
+
+
+def test_run_case_times_phases(tmp_path: Path) -> None:
+    """Test a case reports all phases, processed events and arrived wagons."""
+    scenario = generate_scenario(GeneratorConfig(trains=2, wagons_per_train=3), tmp_path)
+
+    [result] = run_benchmark([BenchmarkCase('tiny', scenario_path=scenario)], repeats=2, isolate=False)
+
+    assert (result.case, result.wagons, result.repeats) == ('tiny', 6, 2)
+    assert result.events > 0
+    assert min(result.load_s, result.initialize_s, result.run_s, result.export_s) > 0
+    assert result.total_s == pytest.approx(result.load_s + result.initialize_s + result.run_s + result.export_s)
+
+
+def test_results_round_trip(tmp_path: Path) -> None:
+    """Test results are written with git and machine info and read back."""
+    run = BenchmarkRun.create([RESULT])
+    run.save(tmp_path / 'bench.json')
+    loaded = BenchmarkRun.load(tmp_path / 'bench.json')
+
+    assert loaded == run
+    assert loaded.machine['cpu_count']
+    assert loaded.case('example').wagons_per_s == 200.0
+
+
+def test_unsupported_results_format(tmp_path: Path) -> None:
+    """Test results of another format version are rejected."""
+    path = tmp_path / 'bench.json'
+    path.write_text('{"format_version": 99, "cases": []}', encoding='utf-8')
+
+    with pytest.raises(ValueError, match='unsupported benchmark results format 99'):
+        BenchmarkRun.load(path)
+
+
+def test_compare_flags_regressions_beyond_tolerance() -> None:
+    """Test slower phases, lower throughput and higher memory are flagged, small changes are not."""
+    baseline = BenchmarkRun([RESULT, replace(RESULT, case='removed')])
+    current = BenchmarkRun(
+        [
+            replace(RESULT, run_s=2.5, load_s=0.52, peak_rss_mb=260.0),
+            replace(RESULT, case='added', run_s=100.0),
+        ]
+    )
+
+    regressions = compare(current, baseline, tolerance=0.1)
+
+    assert [(r.metric, r.baseline, r.current) for r in regressions] == [
+        ('run_s', 2.0, 2.5),
+        ('total_s', 3.51, 4.03),
+        ('peak_rss_mb', 200.0, 260.0),
+        ('events_per_s', 5000.0, 4000.0),
+        ('wagons_per_s', 200.0, 160.0),
+    ]
+    assert str(regressions[0]) == 'example: run_s 2 -> 2.5 (+25%)'
+    assert not compare(current, baseline, tolerance=0.5)
+
+
+def test_compare_ignores_time_noise() -> None:
+    """Test relative slowdowns of tiny phases below the noise floor are not flagged, nor their throughput."""
+    baseline = BenchmarkRun([RESULT, replace(RESULT, case='small', run_s=0.05)])
+    current = BenchmarkRun([replace(RESULT, initialize_s=0.03), replace(RESULT, case='small', run_s=0.08)])
+
+    assert not compare(current, baseline)
+
+
+def test_scaling_benchmarks_time_both_sizes() -> None:
+    """Test every scaling benchmark reports a time for the small and the large structure."""
+    results = run_scaling_benchmarks(small=200, large=300)
+
+    assert [r.name for r in results] == list(SCALING_BENCHMARKS)
+    assert all(r.small_s > 0 and r.large_s > 0 and r.ratio > 0 for r in results)
@@ -0,0 +1,111 @@
+"""Tests for FileLoader train schedule loading."""
+
+import json
+from pathlib import Path
+
+from contexts.configuration.infrastructure.file_loader import FileLoader
+from pydantic import ValidationError
+import pytest
+
+SCHEDULE = """train_id;wagon_id;arrival_time;length;is_loaded;needs_retrofit;Track
+T2;W21;2025-12-01T08:00:00+00:00;15.5;TRUE;false;collection
+T1;W11;2025-12-01T06:00:00+00:00;16;False;True;
+T1;W12;2025-12-01T06:30:00+00:00;14.2;true;yes;collection_2
+;W31;2025-12-01T09:00:00+00:00;12;;;collection
+"""
+
+
+def _scenario_dir(tmp_path: Path, schedule: str) -> Path:
+    """Write minimal scenario with train schedule CSV."""
+    scenario = {
+        'id': 'loader_test',
+        'start_date': '2025-12-01T00:00:00+00:00',
+        'end_date': '2025-12-02T00:00:00+00:00',
+        'train_schedule_file': 'train_schedule.csv',
+    }
+    (tmp_path / 'scenario.json').write_text(json.dumps(scenario), encoding='utf-8')
+    (tmp_path / 'train_schedule.csv').write_text(schedule, encoding='utf-8')
+    return tmp_path
+
+
+def _outcome(path: Path, strict: bool) -> list[dict] | str:
+    """Load trains as plain dicts, or the error message if loading fails."""
+    try:
+        return _trains(path, strict)
+    except ValueError as error:
+        return f'{type(error).__name__}: {error}'
+
+
+def _trains(path: Path, strict: bool) -> list[dict]:
+    """Load trains as plain dicts."""
+    return [train.model_dump() for train in FileLoader(path, strict_schedule=strict).load().trains]
+
+
+class TestTrainScheduleLoading:
+    """Test vectorized schedule loader against the strict row-by-row loader."""
+
+    def test_matches_strict_loader(self, tmp_path: Path) -> None:
+        """Test both loaders build the same trains, including defaults and boolean parsing."""
+        path = _scenario_dir(tmp_path, SCHEDULE)
+        trains = _trains(path, strict=False)
+
+        assert trains == _trains(path, strict=True)
+        assert [t['train_id'] for t in trains] == ['NO_ID', 'T1', 'T2']
+        t1 = trains[1]
+        assert t1['arrival_time'] == '2025-12-01T06:30:00+00:00'
+        assert t1['locomotive_id'] == 'default_loco'
+        assert [(w['id'], w['is_loaded'], w['needs_retrofit'], w['track']) for w in t1['wagons']] == [
+            ('W11', False, True, None),
+            ('W12', True, False, 'collection_2'),
+        ]
+        assert [(w['is_loaded'], w['needs_retrofit']) for w in trains[0]['wagons']] == [(False, False)]
+
+    def test_generated_wagon_ids_and_default_length(self, tmp_path: Path) -> None:
+        """Test wagon IDs and length default when their columns are missing."""
+        schedule = 'train_id,arrival_time,locomotive_id\nT1,2025-12-01T06:00:00,L7\nT1,2025-12-01T06:00:00,L8\n'
+        path = _scenario_dir(tmp_path, schedule)
+        trains = _trains(path, strict=False)
+
+        assert trains == _trains(path, strict=True)
+        assert [(w['id'], w['length']) for w in trains[0]['wagons']] == [('T1_wagon_1', 10.0), ('T1_wagon_2', 10.0)]
+        assert trains[0]['locomotive_id'] == 'L7'
+
+    @pytest.mark.parametrize('length', ['0', '-3.5', ''])
+    def test_invalid_length_raises_strict_error(self, tmp_path: Path, length: str) -> None:
+        """Test rows failing array-level checks raise the strict loader's validation error."""
+        schedule = (
+            f'train_id;wagon_id;arrival_time;length\nT1;W1;2025-12-01T06:00:00;15\nT1;W2;2025-12-01T06:00:00;{length}\n'
+        )
+        path = _scenario_dir(tmp_path, schedule)
+
+        with pytest.raises(ValidationError) as strict_error:
+            FileLoader(path, strict_schedule=True).load()
+        with pytest.raises(ValidationError) as fast_error:
+            FileLoader(path).load()
+        assert str(fast_error.value) == str(strict_error.value)
+
+    def test_unparsable_length_raises_strict_error(self, tmp_path: Path) -> None:
+        """Test non-numeric lengths fail with the same error in both loaders."""
+        schedule = 'train_id;wagon_id;arrival_time;length\nT1;W1;2025-12-01T06:00:00;long\n'
+        path = _scenario_dir(tmp_path, schedule)
+
+        with pytest.raises(ValueError, match="could not convert string to float: 'long'"):
+            FileLoader(path, strict_schedule=True).load()
+        with pytest.raises(ValueError, match="could not convert string to float: 'long'"):
+            FileLoader(path).load()
+
+    @pytest.mark.parametrize(
+        'schedule',
+        [
+            'train_id;wagon_id;arrival_time;length\nT1;W1;2025-12-01T06:00:00;15\nT1;;2025-12-01T06:00:00;15\n',
+            'train_id;wagon_id;arrival_time;length\nT1;;2025-12-01T06:00:00;15\nT2;;2025-12-01T07:00:00;0\n',
+            'train_id;wagon_id;arrival_time;length\n1;1;2025-12-01T06:00:00;15\n;;2025-12-01T07:00:00;15\n',
+            'train_id;wagon_id;arrival_time;locomotive_id;Track\n1;11;2025-12-01T06:00:00;7;3\n2;12;2025-12-01T07:00:00;;\n',
+        ],
+        ids=['blank_wagon_id', 'blank_wagon_id_invalid_length', 'numeric_ids_with_gaps', 'numeric_ids'],
+    )
+    def test_blank_and_numeric_ids_match_strict_loader(self, tmp_path: Path, schedule: str) -> None:
+        """Test blank and numeric ID cells load (or fail) exactly like in the strict loader."""
+        path = _scenario_dir(tmp_path, schedule)
+
+        assert _outcome(path, strict=False) == _outcome(path, strict=True)
@@ -0,0 +1,180 @@
+"""Tests for ScenarioCache compiled-scenario cache."""
+
+import json
+import os
+from pathlib import Path
+
+from contexts.configuration.domain.configuration_builder import ConfigurationBuilder
+from contexts.configuration.domain.models.scenario import Scenario
+from contexts.configuration.infrastructure.file_loader import FileLoader
+from contexts.configuration.infrastructure.scenario_cache import _LOADER_PACKAGES
+from contexts.configuration.infrastructure.scenario_cache import ScenarioCache
+import pytest
+from shared.domain.value_objects import selection_strategy
+
+SCHEDULE = """train_id;wagon_id;arrival_time;length;is_loaded;needs_retrofit
+T1;W11;2025-12-01T06:00:00+00:00;16;false;true
+T1;W12;2025-12-01T06:00:00+00:00;14.2;true;true
+"""
+
+
+@pytest.fixture
+def scenario_dir(tmp_path: Path) -> Path:
+    """Write minimal scenario with train schedule CSV."""
+    path = tmp_path / 'scenario'
+    path.mkdir()
+    scenario = {
+        'id': 'cache_test',
+        'start_date': '2025-12-01T00:00:00+00:00',
+        'end_date': '2025-12-02T00:00:00+00:00',
+        'train_schedule_file': 'train_schedule.csv',
+    }
+    (path / 'scenario.json').write_text(json.dumps(scenario), encoding='utf-8')
+    (path / 'train_schedule.csv').write_text(SCHEDULE, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ScenarioCache:
+    """Create cache in temporary directory."""
+    return ScenarioCache(tmp_path / 'cache')
+
+
+class _CountingBuild:  # pylint: disable=too-few-public-methods
+    """Build callable counting how often the scenario is actually loaded."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.calls = 0
+
+    def __call__(self) -> Scenario:
+        self.calls += 1
+        return FileLoader(self.path).load()
+
+
+class TestScenarioCache:
+    """Test ScenarioCache hits, invalidation and recovery."""
+
+    def test_hit_returns_equal_scenario_without_building(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test second load is served from the cache."""
+        build = _CountingBuild(scenario_dir)
+
+        first = cache.load(scenario_dir, build)
+        second = cache.load(scenario_dir, build)
+
+        assert build.calls == 1
+        assert second is not first
+        assert second.model_dump() == first.model_dump()
+        assert [w.id for w in second.trains[0].wagons] == ['W11', 'W12']
+
+    def test_file_and_directory_paths_share_entry(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test scenario directory and its scenario.json map to the same key."""
+        assert cache.key(scenario_dir) == cache.key(scenario_dir / 'scenario.json')
+
+    def test_editing_referenced_file_rebuilds(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test changing the train schedule invalidates the entry."""
+        build = _CountingBuild(scenario_dir)
+        cache.load(scenario_dir, build)
+
+        (scenario_dir / 'train_schedule.csv').write_text(SCHEDULE.replace('14.2', '18.0'), encoding='utf-8')
+        scenario = cache.load(scenario_dir, build)
+
+        assert build.calls == 2
+        assert scenario.trains[0].wagons[1].length == 18.0
+
+    def test_editing_scenario_json_changes_key(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test changing scenario.json invalidates the entry."""
+        key = cache.key(scenario_dir)
+        scenario_file = scenario_dir / 'scenario.json'
+        data = json.loads(scenario_file.read_text(encoding='utf-8'))
+        data['id'] = 'renamed'
+        scenario_file.write_text(json.dumps(data), encoding='utf-8')
+
+        assert cache.key(scenario_dir) != key
+
+    def test_options_change_key(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test loader options are part of the key."""
+        assert cache.key(scenario_dir) != cache.key(scenario_dir, strict_schedule=True)
+        assert cache.key(scenario_dir, a=1, b=2) == cache.key(scenario_dir, b=2, a=1)
+
+    def test_corrupt_entry_is_rebuilt(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test unreadable entries are replaced by a fresh build."""
+        build = _CountingBuild(scenario_dir)
+        cache.load(scenario_dir, build)
+        entry = cache.cache_dir / f'{cache.key(scenario_dir)}.pkl'
+        entry.write_bytes(b'not a pickle')
+
+        scenario = cache.load(scenario_dir, build)
+        cache.load(scenario_dir, build)
+
+        assert build.calls == 2
+        assert scenario.id == 'cache_test'
+
+    @pytest.mark.parametrize(
+        'scenario_json',
+        [
+            '{"id": "broken",',
+            json.dumps({'id': 'nested', 'references': {'yards': {'test': 'yard.json'}}}),
+            '[]',
+        ],
+        ids=['malformed_json', 'nested_references', 'not_an_object'],
+    )
+    def test_malformed_scenario_fails_as_without_cache(
+        self, scenario_dir: Path, cache: ScenarioCache, scenario_json: str
+    ) -> None:
+        """Test scenarios whose key cannot be computed raise the uncached build error and store nothing."""
+        (scenario_dir / 'scenario.json').write_text(scenario_json, encoding='utf-8')
+
+        with pytest.raises(Exception) as uncached:  # noqa: PT011
+            ConfigurationBuilder(scenario_dir).build()
+        with pytest.raises(uncached.type) as cached:
+            ConfigurationBuilder(scenario_dir, cache=cache).build()
+
+        assert str(cached.value) == str(uncached.value)
+        assert not list(cache.cache_dir.glob('*.pkl'))
+
+    def test_clear(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test clear deletes all entries."""
+        assert cache.clear() == 0
+        cache.load(scenario_dir, _CountingBuild(scenario_dir))
+
+        assert cache.clear() == 1
+        assert not list(cache.cache_dir.glob('*.pkl'))
+
+    def test_least_recently_used_entries_are_evicted(self, scenario_dir: Path, tmp_path: Path) -> None:
+        """Test entries beyond max_entries are deleted, least recently stored or hit first."""
+        cache = ScenarioCache(tmp_path / 'cache', max_entries=2)
+        build = _CountingBuild(scenario_dir)
+        cache.load(scenario_dir, build, variant=1)
+        cache.load(scenario_dir, build, variant=2)
+        for variant, mtime in [(1, 1_000), (2, 2_000)]:
+            entry = cache.cache_dir / f'{cache.key(scenario_dir, variant=variant)}.pkl'
+            os.utime(entry, (mtime, mtime))
+
+        cache.load(scenario_dir, build, variant=1)
+        cache.load(scenario_dir, build, variant=3)
+
+        assert {entry.name for entry in cache.cache_dir.glob('*.pkl')} == {
+            f'{cache.key(scenario_dir, variant=variant)}.pkl' for variant in (1, 3)
+        }
+        assert build.calls == 3
+
+    def test_fingerprint_covers_pickled_shared_value_objects(self) -> None:
+        """Test source of shared value objects in cached scenarios is part of the key."""
+        source = Path(selection_strategy.__file__).resolve()
+
+        assert any(source.is_relative_to(package) for package in _LOADER_PACKAGES)
+
+    def test_default_dir_from_environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test cache directory can be configured via environment."""
+        monkeypatch.setenv('POPUPSIM_CACHE_DIR', str(tmp_path / 'env_cache'))
+
+        assert ScenarioCache().cache_dir == tmp_path / 'env_cache'
+
+    def test_configuration_builder_uses_cache(self, scenario_dir: Path, cache: ScenarioCache) -> None:
+        """Test ConfigurationBuilder stores and reuses cache entries."""
+        scenario = ConfigurationBuilder(scenario_dir, cache=cache).build()
+
+        assert len(list(cache.cache_dir.glob('*.pkl'))) == 1
+        assert ConfigurationBuilder(scenario_dir, cache=cache).build().model_dump() == scenario.model_dump()
+        assert ConfigurationBuilder(scenario_dir).build().model_dump() == scenario.model_dump()
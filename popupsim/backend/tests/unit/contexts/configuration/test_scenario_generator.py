@@ -0,0 +1,95 @@
+"""Tests for synthetic scenario generator."""
+
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+from contexts.configuration.infrastructure.file_loader import FileLoader
+from contexts.configuration.infrastructure.scenario_generator import SCALING_LADDER
+from contexts.configuration.infrastructure.scenario_generator import ArrivalPattern
+from contexts.configuration.infrastructure.scenario_generator import GeneratorConfig
+from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+from contexts.configuration.infrastructure.scenario_generator import scaled_config
+import pytest
+
+
+class TestScenarioGenerator:
+    """Test generated scenario directories."""
+
+    def test_generated_scenario_loads(self, tmp_path: Path) -> None:
+        """Test generated files load with the configured counts."""
+        config = GeneratorConfig(trains=3, wagons_per_train=4, workshops=3, bays_per_workshop=2, locomotives=2)
+        scenario = FileLoader(generate_scenario(config, tmp_path)).load()
+
+        assert [t.train_id for t in scenario.trains] == ['T1', 'T2', 'T3']
+        assert sum(len(t.wagons) for t in scenario.trains) == config.total_wagons == 12
+        assert [w.retrofit_stations for w in scenario.workshops] == [2, 2, 2]
+        assert [loco.track for loco in scenario.locomotives] == ['loco_parking', 'loco_parking']
+        assert scenario.end_date - scenario.start_date == timedelta(days=config.days)
+
+    def test_routes_connect_all_locations(self, tmp_path: Path) -> None:
+        """Test every location reaches every other, via the mainline for collection tracks."""
+        scenario = FileLoader(generate_scenario(GeneratorConfig(parking_tracks=3), tmp_path)).load()
+        tracks = {t.id: t.type for t in scenario.tracks}
+        locations = [track for track, track_type in tracks.items() if track_type != 'mainline']
+        routes = {(r.path[0], r.path[-1]): r for r in scenario.routes}
+
+        assert len(routes) == len(locations) * (len(locations) - 1)
+        assert routes[('collection1', 'retrofit1')].path == ['collection1', 'Mainline', 'retrofit1']
+        assert routes[('retrofit1', 'WS1')].duration == timedelta(minutes=5)
+        assert {w.id for w in scenario.workshops} == {w.track for w in scenario.workshops} == {'WS1', 'WS2'}
+
+    def test_same_seed_reproduces_files(self, tmp_path: Path) -> None:
+        """Test generation is deterministic per seed."""
+        config = GeneratorConfig(arrival_pattern=ArrivalPattern.POISSON, loaded_share=0.3)
+        generate_scenario(config, tmp_path / 'a')
+        generate_scenario(config, tmp_path / 'b')
+        generate_scenario(GeneratorConfig(arrival_pattern=ArrivalPattern.POISSON, seed=7), tmp_path / 'c')
+
+        schedule = (tmp_path / 'a' / 'train_schedule.csv').read_bytes()
+        assert schedule == (tmp_path / 'b' / 'train_schedule.csv').read_bytes()
+        assert schedule != (tmp_path / 'c' / 'train_schedule.csv').read_bytes()
+
+    @pytest.mark.parametrize('pattern', list(ArrivalPattern))
+    def test_arrivals_within_window(self, tmp_path: Path, pattern: ArrivalPattern) -> None:
+        """Test arrivals are ordered and fall into the arrival window."""
+        config = GeneratorConfig(trains=50, wagons_per_train=1, days=4, arrival_pattern=pattern)
+        scenario = FileLoader(generate_scenario(config, tmp_path)).load()
+        arrivals = [datetime.fromisoformat(t.arrival_time) for t in scenario.trains]
+
+        assert arrivals == sorted(arrivals)
+        assert config.start_date <= arrivals[0]
+        assert arrivals[-1] <= config.start_date + timedelta(days=config.days * config.arrival_share)
+
+    def test_shares(self, tmp_path: Path) -> None:
+        """Test loaded and retrofit shares control the wagon flags."""
+        config = GeneratorConfig(trains=1, wagons_per_train=10, loaded_share=1.0, needs_retrofit_share=0.0)
+        wagons = FileLoader(generate_scenario(config, tmp_path)).load().trains[0].wagons
+
+        assert all(w.is_loaded and not w.needs_retrofit for w in wagons)
+        assert all(12.0 <= w.length <= 25.0 for w in wagons)
+
+    @pytest.mark.parametrize(
+        ('overrides', 'message'),
+        [
+            ({'trains': 0}, 'trains must be at least 1'),
+            ({'loaded_share': 1.5}, 'loaded_share must be between 0 and 1'),
+            ({'arrival_share': 0.0}, 'arrival_share must be greater than 0'),
+        ],
+    )
+    def test_invalid_config(self, overrides: dict, message: str) -> None:
+        """Test invalid parameters are rejected."""
+        with pytest.raises(ValueError, match=message):
+            GeneratorConfig(**overrides)
+
+    def test_scaling_ladder(self) -> None:
+        """Test ladder presets and overrides."""
+        assert {name: config.total_wagons for name, config in SCALING_LADDER.items()} == {
+            '10k': 10_000,
+            '100k': 100_000,
+            '1m': 1_000_000,
+        }
+        config = scaled_config('100k', trains=10, seed=3)
+        assert (config.trains, config.seed, config.workshops) == (10, 3, SCALING_LADDER['100k'].workshops)
+        with pytest.raises(ValueError, match='Unknown preset'):
+            scaled_config('10m')
@@ -0,0 +1,98 @@
+"""Tests for streaming train schedule reader."""
+
+from pathlib import Path
+
+from contexts.configuration.infrastructure.file_loader import FileLoader
+from contexts.configuration.infrastructure.scenario_generator import GeneratorConfig
+from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+from contexts.configuration.infrastructure.train_schedule_stream import TrainScheduleStream
+import pytest
+
+
+def _stream(tmp_path: Path, schedule: str) -> TrainScheduleStream:
+    """Write schedule CSV and open it as stream."""
+    csv_file = tmp_path / 'train_schedule.csv'
+    csv_file.write_text(schedule, encoding='utf-8')
+    return TrainScheduleStream(csv_file, chunk_size=2)
+
+
+class TestTrainScheduleStream:
+    """Test lazy schedule reading against the FileLoader."""
+
+    def test_matches_loaded_trains(self, tmp_path: Path) -> None:
+        """Test streamed trains equal the loaded ones for a time-sorted schedule, across chunks."""
+        path = generate_scenario(GeneratorConfig(trains=12, wagons_per_train=3, loaded_share=0.5), tmp_path)
+        loaded = {t.train_id: t for t in FileLoader(path).load().trains}
+        streamed = FileLoader(path, stream_schedule=True).load().trains
+
+        assert isinstance(streamed, TrainScheduleStream)
+        streamed.chunk_size = 5
+        trains = list(streamed)
+        assert [t.train_id for t in trains] == [f'T{i:02d}' for i in range(1, 13)]
+        assert trains == [loaded[t.train_id] for t in trains]
+
+    def test_defaults(self, tmp_path: Path) -> None:
+        """Test generated wagon IDs, default length and latest arrival of a train's rows."""
+        stream = _stream(
+            tmp_path,
+            'train_id,arrival_time,Track\nT1,2025-12-01T06:00:00,\nT1,2025-12-01T06:30:00,c1\nT2,2025-12-01T07:00:00,\n',
+        )
+        t1, t2 = stream
+
+        assert t1.arrival_time == '2025-12-01T06:30:00'
+        assert [(w.id, w.length, w.track) for w in t1.wagons] == [
+            ('T1_wagon_1', 10.0, None),
+            ('T1_wagon_2', 10.0, 'c1'),
+        ]
+        assert (t2.locomotive_id, t2.route_id) == ('default_loco', 'default_route')
+
+    def test_unsorted_schedule_raises(self, tmp_path: Path) -> None:
+        """Test a train arriving before the previous one is rejected by check_order and when iterating."""
+        stream = _stream(
+            tmp_path, 'train_id;wagon_id;arrival_time\nT2;W2;2025-12-01T08:00:00\nT1;W1;2025-12-01T06:00:00\n'
+        )
+        trains = iter(stream)
+
+        with pytest.raises(ValueError, match='not sorted by arrival_time: train T1'):
+            stream.check_order()
+        assert next(trains).train_id == 'T2'
+        with pytest.raises(ValueError, match='not sorted by arrival_time: train T1'):
+            next(trains)
+
+    def test_loader_rejects_unsorted_schedule(self, tmp_path: Path) -> None:
+        """Test loading with a streamed schedule fails before the simulation if it is out of order."""
+        path = generate_scenario(GeneratorConfig(trains=6, wagons_per_train=2), tmp_path)
+        csv_file = path.parent / 'train_schedule.csv'
+        header, *rows = csv_file.read_text(encoding='utf-8').splitlines(keepends=True)
+        csv_file.write_text(header + ''.join(rows[:-3] + rows[-2:] + rows[-3:-2]), encoding='utf-8')
+
+        with pytest.raises(ValueError, match='rows of train T5 are not consecutive'):
+            FileLoader(path, stream_schedule=True).load()
+        csv_file.write_text(header + ''.join(rows[-2:] + rows[:-2]), encoding='utf-8')
+        with pytest.raises(ValueError, match='not sorted by arrival_time: train T1 '):
+            FileLoader(path, stream_schedule=True).load()
+
+    def test_blank_and_numeric_ids_match_loader(self, tmp_path: Path) -> None:
+        """Test streamed trains convert blank and numeric cells like the strict and vectorized loaders."""
+        path = generate_scenario(GeneratorConfig(trains=1, wagons_per_train=1), tmp_path)
+        (path.parent / 'train_schedule.csv').write_text(
+            'train_id;wagon_id;arrival_time;locomotive_id;Track\n'
+            '1;11;2025-12-01T06:00:00;7;3\n1;;2025-12-01T06:00:00;;\n2;13;2025-12-01T07:00:00;;\n',
+            encoding='utf-8',
+        )
+        streamed = list(FileLoader(path, stream_schedule=True).load().trains)
+
+        assert streamed == FileLoader(path, strict_schedule=True).load().trains == FileLoader(path).load().trains
+        assert [w.id for w in streamed[0].wagons] == ['11.0', 'nan']
+        assert (streamed[0].locomotive_id, streamed[0].wagons[0].track) == ('7.0', '3.0')
+
+    def test_split_train_raises(self, tmp_path: Path) -> None:
+        """Test rows of one train separated by another train are rejected."""
+        stream = _stream(
+            tmp_path,
+            'train_id;wagon_id;arrival_time\nT1;W1;2025-12-01T06:00:00\nT2;W2;2025-12-01T06:00:00\n'
+            'T1;W3;2025-12-01T06:00:00\n',
+        )
+
+        with pytest.raises(ValueError, match='rows of train T1 are not consecutive'):
+            list(stream)
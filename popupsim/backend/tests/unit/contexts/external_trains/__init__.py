@@ -0,0 +1 @@
+"""External trains context unit tests."""
@@ -0,0 +1,41 @@
+"""Tests for train arrival processes of the external trains context."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from contexts.configuration.infrastructure.file_loader import FileLoader
+from contexts.configuration.infrastructure.scenario_generator import GeneratorConfig
+from contexts.configuration.infrastructure.scenario_generator import generate_scenario
+from contexts.external_trains.application.external_trains_context import ExternalTrainsContext
+from infrastructure.event_bus.event_bus import InMemoryEventBus
+from shared.domain.events.wagon_lifecycle_events import TrainArrivedEvent
+from shared.infrastructure.simulation.engines.simpy_adapter import SimPyEngineAdapter
+
+
+def _run_arrivals(scenario_path: Path, stream_schedule: bool) -> tuple[list[tuple], dict]:
+    """Run only the arrival processes and collect published arrivals and engine stats."""
+    event_bus = InMemoryEventBus()
+    engine = SimPyEngineAdapter.create()
+    arrivals: list[tuple] = []
+    event_bus.subscribe(
+        TrainArrivedEvent,
+        lambda e: arrivals.append((e.train_id, e.event_timestamp, engine.current_time(), [w.id for w in e.wagons])),
+    )
+    context = ExternalTrainsContext(event_bus)
+    context.scenario = FileLoader(scenario_path, stream_schedule=stream_schedule).load()
+    context.initialize(SimpleNamespace(engine=engine))
+    context.start_processes()
+    engine.run()
+    return arrivals, engine.get_simulation_stats()
+
+
+def test_streamed_arrivals_match_scheduled_arrivals(tmp_path: Path) -> None:
+    """Test one streaming process publishes the same arrivals at the same times as one process per train."""
+    path = generate_scenario(GeneratorConfig(trains=15, wagons_per_train=2, days=3), tmp_path)
+
+    scheduled, scheduled_stats = _run_arrivals(path, stream_schedule=False)
+    streamed, streamed_stats = _run_arrivals(path, stream_schedule=True)
+
+    assert streamed == scheduled
+    assert all(timestamp == now for _, timestamp, now, _ in streamed)
+    assert (scheduled_stats['processes_scheduled'], streamed_stats['processes_scheduled']) == (15, 1)
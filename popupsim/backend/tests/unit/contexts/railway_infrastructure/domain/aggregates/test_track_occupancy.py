@@ -1,5 +1,6 @@
 """Tests for TrackOccupancy aggregate."""
 
+import random
 from uuid import uuid4
 
 from contexts.railway_infrastructure.domain.aggregates.track_occupancy import TrackOccupancy
@@ -204,3 +205,123 @@ def test_sorted_occupants(occupancy: TrackOccupancy) -> None:
     # Should be sorted by position_start
     assert occupancy._occupants[0].id == 'W2'  # Position 0
     assert occupancy._occupants[1].id == 'W1'  # Position 50
+
+
+@pytest.mark.parametrize('keyframe_interval', [1, 3, 64])
+def test_history_reconstructs_every_state(track: Track, keyframe_interval: int) -> None:
+    """Test delta history rebuilds the same snapshots as full copies would."""
+    occupancy = TrackOccupancy(track.id, track)
+    occupancy._occupancy_history.keyframe_interval = keyframe_interval
+    expected: list[tuple[float, tuple[str, ...], float]] = []
+
+    timestamp = 0.0
+    for i, slot in enumerate([5, 1, 8, 0, 3, 9, 2, 7, 4, 6]):
+        timestamp += 1.0
+        occupancy.add_occupant(TrackOccupant(f'W{i}', OccupantType.WAGON, 8.0, slot * 10.0), timestamp)
+        expected.append(
+            (timestamp, tuple(o.id for o in occupancy.get_occupants()), occupancy.get_current_occupancy_meters())
+        )
+        if i % 3 == 2:
+            occupancy.remove_occupant(f'W{i - 1}', timestamp)
+            expected.append(
+                (timestamp, tuple(o.id for o in occupancy.get_occupants()), occupancy.get_current_occupancy_meters())
+            )
+
+    history = occupancy.get_occupancy_history()
+    assert [(s.timestamp, tuple(o.id for o in s.occupants), s.occupancy_meters) for s in history] == expected
+    assert [s.occupant_count for s in history] == [len(ids) for _, ids, _ in expected]
+    assert occupancy._occupancy_history[-1] == history[-1]
+
+
+def test_snapshot_at(occupancy: TrackOccupancy) -> None:
+    """Test snapshot_at returns latest state at or before the given time."""
+    occupancy.add_occupant(TrackOccupant('W1', OccupantType.WAGON, 20.0, 0.0), 1.0)
+    occupancy.add_occupant(TrackOccupant('W2', OccupantType.WAGON, 30.0, 20.0), 5.0)
+    occupancy.remove_occupant('W1', 8.0)
+
+    assert occupancy.snapshot_at(0.5) is None
+    assert [o.id for o in occupancy.snapshot_at(4.9).occupants] == ['W1']
+    snapshot = occupancy.snapshot_at(5.0)
+    assert snapshot.occupancy_meters == 50.0
+    assert snapshot.occupancy_percentage == 50.0
+    assert [o.id for o in occupancy.snapshot_at(100.0).occupants] == ['W2']
+    assert [s.timestamp for s in occupancy.get_occupancy_history(2.0, 8.0)] == [5.0, 8.0]
+
+
+def test_collision_checks_match_full_scan(track: Track) -> None:
+    """Test neighbour-only collision checks agree with checking every occupant."""
+    rng = random.Random(11)  # noqa: S311
+    occupancy = TrackOccupancy(track.id, track)
+
+    for i in range(300):
+        candidate = TrackOccupant(
+            f'O{i}', OccupantType.WAGON, rng.uniform(1.0, 12.0), float(rng.randint(0, 95)), rng.choice([0.0, 0.5])
+        )
+        candidate_end = candidate.position_start + candidate.effective_length
+        position_free = candidate_end <= 100.0 and all(
+            candidate_end <= o.position_start or candidate.position_start >= o.position_start + o.effective_length
+            for o in occupancy.get_occupants()
+        )
+        assert occupancy._has_position_available(candidate) == position_free
+        if position_free:
+            occupancy.add_occupant(candidate, float(i))
+        elif rng.random() < 0.3 and not occupancy.is_empty():
+            occupancy.remove_occupant(rng.choice(occupancy.get_occupants()).id, float(i))
+
+        occupants = occupancy.get_occupants()
+        assert occupancy.get_current_occupancy_meters() == pytest.approx(sum(o.effective_length for o in occupants))
+        assert occupancy.get_wagon_count() == len(occupants)
+        assert [o.position_start for o in occupants] == sorted(o.position_start for o in occupants)
+
+
+def test_collision_with_neighbours(occupancy: TrackOccupancy) -> None:
+    """Test touching occupants fit while overlaps with predecessor or successor are rejected."""
+    occupancy.add_occupant(TrackOccupant('W1', OccupantType.WAGON, 20.0, 10.0), 0.0)
+    occupancy.add_occupant(TrackOccupant('W2', OccupantType.WAGON, 20.0, 50.0), 0.0)
+
+    with pytest.raises(ValueError, match='overlaps'):
+        occupancy.add_occupant(TrackOccupant('X1', OccupantType.WAGON, 10.0, 25.0), 1.0)
+    with pytest.raises(ValueError, match='overlaps'):
+        occupancy.add_occupant(TrackOccupant('X2', OccupantType.WAGON, 25.0, 30.0), 1.0)
+    with pytest.raises(ValueError, match='overlaps'):
+        occupancy.add_occupant(TrackOccupant('X3', OccupantType.WAGON, 80.0, 0.0), 1.0)
+
+    occupancy.add_occupant(TrackOccupant('W3', OccupantType.WAGON, 20.0, 30.0), 1.0)
+    assert [o.id for o in occupancy.get_occupants()] == ['W1', 'W3', 'W2']
+
+
+def test_running_totals(occupancy: TrackOccupancy) -> None:
+    """Test occupied meters and wagon count follow adds and removes of all occupant types."""
+    occupancy.add_occupant(TrackOccupant('R1', OccupantType.RAKE, 30.0, 0.0, buffer_space=2.5), 0.0)
+    occupancy.add_occupant(TrackOccupant('W1', OccupantType.WAGON, 15.0, 40.0), 1.0)
+    occupancy.add_occupant(TrackOccupant('L1', OccupantType.LOCOMOTIVE, 20.0, 60.0), 2.0)
+
+    assert occupancy.get_current_occupancy_meters() == 67.5
+    assert occupancy.get_wagon_count() == 1
+    assert occupancy.find_optimal_position(10.0) == 80.0
+
+    occupancy.remove_occupant('W1', 3.0)
+    assert occupancy.get_current_occupancy_meters() == 52.5
+    assert occupancy.get_wagon_count() == 0
+
+    occupancy.remove_occupant('R1', 4.0)
+    occupancy.remove_occupant('L1', 5.0)
+    assert occupancy.get_current_occupancy_meters() == 0.0
+    assert occupancy.is_empty()
+
+
+def test_totals_from_initial_occupants(track: Track) -> None:
+    """Test occupants passed at construction are sorted and counted."""
+    occupancy = TrackOccupancy(
+        track.id,
+        track,
+        [
+            TrackOccupant('W2', OccupantType.WAGON, 10.0, 50.0),
+            TrackOccupant('L1', OccupantType.LOCOMOTIVE, 20.0, 0.0),
+        ],
+    )
+
+    assert [o.id for o in occupancy.get_occupants()] == ['L1', 'W2']
+    assert occupancy.get_current_occupancy_meters() == 30.0
+    assert occupancy.get_wagon_count() == 1
+    assert occupancy.remove_occupant('W2', 1.0) is not None
@@ -0,0 +1,123 @@
+"""Tests for output artifact selection."""
+
+from pathlib import Path
+
+from contexts.retrofit_workflow.application.config.output_selection import ARTIFACT_STREAMS
+from contexts.retrofit_workflow.application.config.output_selection import EventStream
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
+from contexts.retrofit_workflow.application.event_collector import EventCollector
+from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+import pytest
+
+
+def _wagon_event(event_type: str = 'ARRIVED') -> WagonJourneyEvent:
+    """Create wagon event."""
+    return WagonJourneyEvent(
+        timestamp=60.0, wagon_id='W001', train_id='T001', event_type=event_type, location='collection', status='OK'
+    )
+
+
+class TestOutputSelection:
+    """Test OutputSelection parsing and stream dependencies."""
+
+    def test_full_selects_every_artifact(self) -> None:
+        """Test full preset covers all artifacts."""
+        assert OutputSelection.parse('full') == OutputSelection.full()
+        assert OutputSelection.full().artifacts == frozenset(ARTIFACT_STREAMS)
+
+    def test_summary_preset_skips_dual_stream(self) -> None:
+        """Test summary preset does not require dual-stream recording."""
+        selection = OutputSelection.parse('summary')
+
+        assert selection.artifacts == {'summary_metrics'}
+        assert not selection.records(EventStream.STATE)
+        assert not selection.records(EventStream.LOCATION)
+        assert not selection.records(EventStream.PROCESS)
+        assert not selection.records(EventStream.PROCESS_TRACKING)
+
+    def test_presets_and_names_combine(self) -> None:
+        """Test presets and explicit names (with or without extension) are merged."""
+        selection = OutputSelection.parse('summary, resource_states.csv,wagon_journey')
+
+        assert selection.artifacts == {'summary_metrics', 'resource_states', 'wagon_journey'}
+        assert selection.records(EventStream.STATE)
+        assert not selection.records(EventStream.LOCATION)
+
+    def test_required_streams_is_union_of_dependencies(self) -> None:
+        """Test required streams follow declared artifact dependencies."""
+        selection = OutputSelection.parse('locomotive_journey,track_capacity')
+
+        assert selection.required_streams == {EventStream.LOCOMOTIVE, EventStream.COUPLING, EventStream.RESOURCE}
+
+    def test_includes_matches_file_names(self) -> None:
+        """Test includes accepts file names and stems."""
+        selection = OutputSelection.parse('timeline')
+
+        assert selection.includes('timeline.csv')
+        assert selection.includes('timeline')
+        assert not selection.includes('events.csv')
+
+    def test_unselected_files_are_artifacts_of_earlier_runs(self, tmp_path: Path) -> None:
+        """Test only artifact files the selection does not write are reported."""
+        for name in ['summary_metrics.json', 'wagon_journey.csv', 'timeline.npz', 'events.log', 'notes.csv']:
+            (tmp_path / name).write_text('', encoding='utf-8')
+        (tmp_path / 'scenario').mkdir()
+
+        stale = OutputSelection.parse('wagon_journey').unselected_files(tmp_path)
+
+        assert [path.name for path in stale] == ['summary_metrics.json', 'timeline.npz']
+        assert OutputSelection.full().unselected_files(tmp_path) == []
+        assert OutputSelection.full().unselected_files(tmp_path / 'missing') == []
+
+    @pytest.mark.parametrize('spec', ['nope', 'summary,nope', ''])
+    def test_invalid_spec_raises(self, spec: str) -> None:
+        """Test unknown or empty selections are rejected."""
+        with pytest.raises(ValueError, match='output artifact'):
+            OutputSelection.parse(spec)
+
+
+class TestEventCollectorSelection:
+    """Test EventCollector only records and exports what is selected."""
+
+    def test_unselected_streams_are_not_recorded(self) -> None:
+        """Test wagon-only selection skips dual-stream and locomotive streams."""
+        collector = EventCollector(output_selection=OutputSelection.parse('wagon_journey'))
+        collector.add_wagon_event(_wagon_event())
+        collector.add_locomotive_event(
+            LocomotiveMovementEvent(timestamp=1.0, locomotive_id='L1', event_type='MOVING', to_location='t1')
+        )
+
+        assert len(collector.wagon_events) == 1
+        assert collector.locomotive_events == []
+        assert collector._dual_stream_collector.state_events == []
+        assert collector._dual_stream_collector.location_events == []
+
+    def test_dual_stream_recorded_when_requested(self) -> None:
+        """Test dual-stream state events are kept when resource_states is selected."""
+        collector = EventCollector(output_selection=OutputSelection.parse('resource_states'))
+        collector.add_wagon_event(_wagon_event())
+
+        assert collector.wagon_events == []
+        assert len(collector._dual_stream_collector.state_events) == 1
+        assert collector._dual_stream_collector.location_events == []
+
+    def test_retrofit_callback_fires_regardless_of_selection(self) -> None:
+        """Test simulation callbacks do not depend on recording."""
+        completed: list[str] = []
+        collector = EventCollector(output_selection=OutputSelection.parse('resource_locations'))
+        collector.on_retrofit_completed = completed.append
+
+        collector.add_wagon_event(_wagon_event('RETROFIT_COMPLETED'))
+
+        assert completed == ['W001']
+
+    def test_export_writes_only_selected_artifacts(self, tmp_path: Path) -> None:
+        """Test export stage skips unselected artifacts."""
+        collector = EventCollector(output_selection=OutputSelection.parse('summary'))
+        collector.add_wagon_event(_wagon_event())
+
+        timings = collector.export_all(str(tmp_path))
+
+        assert [t.filename for t in timings] == ['summary_metrics.json']
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['summary_metrics.json']
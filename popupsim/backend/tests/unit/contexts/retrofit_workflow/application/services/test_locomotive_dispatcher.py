@@ -0,0 +1,131 @@
+"""Tests for LocomotiveDispatcher task ordering."""
+
+from collections.abc import Generator
+from typing import Any
+
+from contexts.retrofit_workflow.application.services.locomotive_dispatcher import LocomotiveDispatcher
+from contexts.retrofit_workflow.application.services.locomotive_dispatcher import TaskRequest
+from contexts.retrofit_workflow.domain.entities.locomotive import Locomotive
+from contexts.retrofit_workflow.domain.entities.wagon import Wagon
+from contexts.retrofit_workflow.domain.services.track_selection_service import TrackSelectionFacade
+from contexts.retrofit_workflow.domain.value_objects.coupler import Coupler
+from contexts.retrofit_workflow.domain.value_objects.coupler import CouplerType
+from contexts.retrofit_workflow.domain.value_objects.task_priority import HoldCondition
+from contexts.retrofit_workflow.domain.value_objects.task_priority import PriorityConditionType
+from contexts.retrofit_workflow.domain.value_objects.task_priority import PriorityRule
+from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskPriorityConfig
+from contexts.retrofit_workflow.domain.value_objects.task_priority import TaskType
+from contexts.retrofit_workflow.infrastructure.resources.locomotive_resource_manager import LocomotiveResourceManager
+from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
+import pytest
+import simpy
+
+
+class _Yard:
+    """Dispatcher with one locomotive and one track per track type."""
+
+    def __init__(self, priority_configs: dict[TaskType, TaskPriorityConfig]) -> None:
+        self.env = simpy.Environment()
+        loco = Locomotive(
+            id='L1',
+            home_track='loco_parking',
+            coupler_front=Coupler(CouplerType.HYBRID, 'FRONT'),
+            coupler_back=Coupler(CouplerType.HYBRID, 'BACK'),
+        )
+        self.locomotives = LocomotiveResourceManager(self.env, [loco])
+        self.tracks = {
+            track_type: TrackCapacityManager(self.env, track_type, 100.0)
+            for track_type in ('collection', 'retrofit', 'retrofitted', 'parking')
+        }
+        selector = TrackSelectionFacade({track_type: [track] for track_type, track in self.tracks.items()})
+        self.dispatcher = LocomotiveDispatcher(self.env, self.locomotives, selector, priority_configs)
+        self.assigned: list[tuple[float, str]] = []
+
+    def submit(self, task_type: TaskType, name: str, delay: float = 0.0) -> None:
+        """Submit task after delay and record when it gets the locomotive."""
+
+        def run() -> Generator[Any, Any]:
+            yield self.env.timeout(delay)
+            callback = self.env.event()
+            self.dispatcher.submit_task(TaskRequest(task_type, [], task_type.value, callback, self.env.now))
+            loco = yield callback
+            self.assigned.append((self.env.now, name))
+            yield self.env.timeout(1.0)
+            yield from self.locomotives.release(loco, purpose='dispatcher')
+
+        self.env.process(run())
+
+    def fill(self, track_type: str, meters: float) -> None:
+        """Put wagons of given total length on track of type."""
+        wagon = Wagon(
+            id=f'W_{track_type}',
+            length=meters,
+            coupler_a=Coupler(CouplerType.SCREW, 'A'),
+            coupler_b=Coupler(CouplerType.SCREW, 'B'),
+        )
+        self.env.process(self.tracks[track_type].add_wagons([wagon]))
+
+
+@pytest.fixture
+def configs() -> dict[TaskType, TaskPriorityConfig]:
+    """Create configs where a full collection track makes collection transport urgent."""
+    return {
+        TaskType.COLLECTION_TO_RETROFIT: TaskPriorityConfig(
+            base_priority=3,
+            rules=[PriorityRule(PriorityConditionType.SOURCE_FILL_ABOVE, 0.5, 1)],
+        ),
+        TaskType.RETROFITTED_TO_PARKING: TaskPriorityConfig(base_priority=2),
+    }
+
+
+class TestLocomotiveDispatcher:
+    """Test LocomotiveDispatcher priority buckets."""
+
+    def test_priority_then_fifo(self, configs: dict[TaskType, TaskPriorityConfig]) -> None:
+        """Test higher priority types go first and tasks of a type keep submission order."""
+        yard = _Yard(configs)
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c1')
+        yard.submit(TaskType.RETROFITTED_TO_PARKING, 'p1')
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c2')
+        yard.submit(TaskType.RETROFITTED_TO_PARKING, 'p2')
+        yard.env.run()
+
+        assert [name for _, name in yard.assigned] == ['p1', 'p2', 'c1', 'c2']
+        assert yard.dispatcher.get_pending_count() == 0
+        assert yard.dispatcher.get_metrics()['tasks_dispatched'] == 4
+
+    def test_priority_follows_fill_level(self, configs: dict[TaskType, TaskPriorityConfig]) -> None:
+        """Test cached priority is re-evaluated when the source track fill changes."""
+        yard = _Yard(configs)
+        yard.submit(TaskType.RETROFITTED_TO_PARKING, 'p0')
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c1', delay=0.1)
+        yard.submit(TaskType.RETROFITTED_TO_PARKING, 'p1', delay=0.1)
+        yard.submit(TaskType.RETROFITTED_TO_PARKING, 'p2', delay=1.2)
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c2', delay=1.2)
+
+        def fill_later() -> Generator[Any, Any]:
+            yield yard.env.timeout(1.5)
+            yard.fill('collection', 60.0)
+
+        yard.env.process(fill_later())
+        yard.env.run()
+
+        # p1 beats c1 while collection is empty; once it is 60% full c1 and c2 beat p2
+        assert [name for _, name in yard.assigned] == ['p0', 'p1', 'c1', 'c2', 'p2']
+
+    def test_hold_until_with_max_hold_time(self) -> None:
+        """Test held task is dispatched once its max hold time has elapsed."""
+        yard = _Yard(
+            {
+                TaskType.COLLECTION_TO_RETROFIT: TaskPriorityConfig(
+                    hold_until=HoldCondition(PriorityConditionType.SOURCE_FILL_ABOVE, 0.5),
+                    max_hold_time=10.0,
+                ),
+            }
+        )
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c1')
+        yard.submit(TaskType.COLLECTION_TO_RETROFIT, 'c2', delay=3.0)
+        yard.env.run(until=30.0)
+
+        # Submitting c2 restarts the 5-minute poll (t=3, 8, 13); c2 follows once the loco is back
+        assert yard.assigned == [(13.0, 'c1'), (14.0, 'c2')]
@@ -0,0 +1,131 @@
+"""Tests for MetricsAccumulator."""
+
+from contexts.retrofit_workflow.application.config.output_selection import OutputSelection
+from contexts.retrofit_workflow.application.event_collector import EventCollector
+from contexts.retrofit_workflow.application.services.metrics_accumulator import MetricsAccumulator
+from contexts.retrofit_workflow.application.services.metrics_aggregator import MetricsAggregator
+from contexts.retrofit_workflow.domain.events import CouplingEvent
+from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.events import ResourceStateChangeEvent
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+import pytest
+
+
+def _wagon(ts: float, wagon_id: str, event_type: str, location: str = 'collection', **kwargs: str) -> WagonJourneyEvent:
+    """Create wagon event."""
+    return WagonJourneyEvent(
+        timestamp=ts, wagon_id=wagon_id, train_id='T1', event_type=event_type, location=location, status='OK', **kwargs
+    )
+
+
+def _workshop(ts: float, busy: int) -> ResourceStateChangeEvent:
+    """Create workshop bay event."""
+    return ResourceStateChangeEvent(
+        timestamp=ts,
+        resource_type='workshop',
+        resource_id='WS1',
+        change_type='bay_occupied',
+        total_bays=2,
+        busy_bays_after=busy,
+    )
+
+
+@pytest.fixture
+def collector() -> EventCollector:
+    """Create collector fed with a small mixed event stream."""
+    collector = EventCollector()
+    collector.add_wagon_event(_wagon(0.0, 'W1', 'ARRIVED'))
+    collector.add_wagon_event(_wagon(0.0, 'W2', 'ARRIVED'))
+    collector.add_wagon_event(_wagon(0.0, 'W3', 'REJECTED', rejection_reason='No Retrofit needed'))
+    collector.add_wagon_event(_wagon(0.0, 'W4', 'REJECTED', rejection_reason='Collection track full'))
+    collector.add_locomotive_event(LocomotiveMovementEvent(5.0, 'L1', 'ALLOCATED'))
+    collector.add_locomotive_event(LocomotiveMovementEvent(5.0, 'L1', 'MOVING', 'collection', 'retrofit'))
+    collector.add_coupling_event(CouplingEvent(4.0, 'L1', 'COUPLING_COMPLETED', 'collection', 'screw', 2, 1.5))
+    collector.add_locomotive_event(LocomotiveMovementEvent(12.0, 'L1', 'ARRIVED', to_location='retrofit'))
+    collector.add_coupling_event(CouplingEvent(13.0, 'L1', 'DECOUPLING_COMPLETED', 'retrofit', 'screw', 2, 0.5))
+    collector.add_wagon_event(_wagon(20.0, 'W1', 'RETROFIT_STARTED', 'WS1'))
+    collector.add_resource_event(_workshop(20.0, 1))
+    collector.add_wagon_event(_wagon(25.0, 'W2', 'RETROFIT_STARTED', 'WS1'))
+    collector.add_resource_event(_workshop(25.0, 2))
+    collector.add_wagon_event(_wagon(80.0, 'W1', 'RETROFIT_COMPLETED', 'WS1'))
+    collector.add_resource_event(_workshop(80.0, 1))
+    collector.add_locomotive_event(LocomotiveMovementEvent(90.0, 'L1', 'RELEASED'))
+    collector.add_wagon_event(_wagon(120.0, 'W1', 'PARKED', 'parking'))
+    return collector
+
+
+def _aggregate(collector: EventCollector, simulation_end_time: float | None) -> dict:
+    """Compute summary by rescanning the recorded event lists."""
+    aggregator = MetricsAggregator()
+    duration = (
+        simulation_end_time
+        if simulation_end_time is not None
+        else aggregator.get_sim_duration(collector.wagon_events, collector.locomotive_events, collector.resource_events)
+    )
+    return {
+        **aggregator.get_event_counts(collector.wagon_events, collector.locomotive_events, collector.batch_events),
+        **aggregator.get_wagon_metrics(collector.wagon_events),
+        **aggregator.get_workshop_metrics(collector.wagon_events, collector.resource_events),
+        **aggregator.get_locomotive_metrics(collector.locomotive_events, collector.resource_events),
+        'locomotive_time_breakdown': aggregator.get_locomotive_time_breakdown(
+            collector.locomotive_events, collector.coupling_events, duration
+        ),
+        'simulation_duration_minutes': duration,
+    }
+
+
+class TestMetricsAccumulator:
+    """Test MetricsAccumulator against the list-scanning MetricsAggregator."""
+
+    @pytest.mark.parametrize('simulation_end_time', [None, 200.0])
+    def test_summary_matches_aggregator(self, collector: EventCollector, simulation_end_time: float | None) -> None:
+        """Test online summary equals rescanning the event lists."""
+        assert collector.build_summary_metrics(simulation_end_time) == _aggregate(collector, simulation_end_time)
+
+    def test_time_integrals(self, collector: EventCollector) -> None:
+        """Test workshop utilization and locomotive breakdown values."""
+        summary = collector.build_summary_metrics(200.0)
+
+        # WS1 over 20..120: 1/2 busy for 5, 2/2 for 55, 1/2 for 40
+        assert summary['workshop_utilization'] == pytest.approx((2.5 + 55.0 + 20.0) / 100.0 * 100)
+        assert summary['locomotive_time_breakdown'] == {
+            'L1': {'moving_time': 7.0, 'idle_time': 191.0, 'coupling_time': 1.5, 'decoupling_time': 0.5}
+        }
+
+    def test_locomotive_breakdown_sorted_by_id(self) -> None:
+        """Test locomotives are listed by id, not by first event, so summaries diff cleanly."""
+        accumulator = MetricsAccumulator()
+        for loco_id in ('LOCO_02', 'LOCO_10', 'LOCO_01'):
+            accumulator.add_locomotive_event(LocomotiveMovementEvent(1.0, loco_id, 'MOVING', 'a', 'b'))
+
+        assert list(accumulator.get_summary(10.0)['locomotive_time_breakdown']) == ['LOCO_01', 'LOCO_02', 'LOCO_10']
+
+    def test_empty_summary(self) -> None:
+        """Test summary is available before any event is published."""
+        summary = MetricsAccumulator().get_summary()
+
+        assert summary['total_events'] == 0
+        assert summary['simulation_duration_minutes'] == 0
+        assert summary['workshop_utilization'] == 0.0
+        assert summary['locomotive_time_breakdown'] == {}
+
+    def test_live_snapshot(self) -> None:
+        """Test summary reflects events published so far."""
+        accumulator = MetricsAccumulator()
+        accumulator.add_wagon_event(_wagon(0.0, 'W1', 'ARRIVED'))
+        assert accumulator.get_summary(10.0)['wagons_arrived'] == 1
+
+        accumulator.add_wagon_event(_wagon(5.0, 'W2', 'ARRIVED'))
+        assert accumulator.get_summary(10.0)['wagons_arrived'] == 2
+
+    def test_summary_selection_keeps_no_event_lists(self) -> None:
+        """Test summary-only collector computes metrics without recording events."""
+        collector = EventCollector(output_selection=OutputSelection.parse('summary'))
+        collector.add_wagon_event(_wagon(0.0, 'W1', 'ARRIVED'))
+        collector.add_locomotive_event(LocomotiveMovementEvent(5.0, 'L1', 'MOVING', 'collection', 'retrofit'))
+
+        assert collector.wagon_events == []
+        assert collector.locomotive_events == []
+        summary = collector.build_summary_metrics()
+        assert summary['total_events'] == 2
+        assert summary['simulation_duration_minutes'] == 5.0
@@ -1,5 +1,7 @@
 """Tests for ResourceSelectionService with TrackCapacityManager."""
 
+import random
+
 from contexts.retrofit_workflow.domain.services.resource_selection_service import ResourceSelectionService
 from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
 import pytest
@@ -76,3 +78,52 @@ def test_empty_dict() -> None:
         {}, SelectionStrategy.FIRST_AVAILABLE
     )
     assert service.select() is None
+
+
+@pytest.mark.parametrize(
+    'strategy', [SelectionStrategy.BEST_FIT, SelectionStrategy.MOST_AVAILABLE, SelectionStrategy.LEAST_OCCUPIED]
+)
+def test_indexed_matches_linear(env: simpy.Environment, strategy: SelectionStrategy) -> None:
+    """Test capacity index selects the same track as the linear strategy."""
+    rng = random.Random(7)  # noqa: S311
+    tracks = {f'T{i}': TrackCapacityManager(env, f'T{i}', rng.choice([50.0, 100.0, 150.0])) for i in range(40)}
+    indexed = ResourceSelectionService(tracks, strategy, indexed=True)
+    for track_id, track in tracks.items():
+        track.add_occupancy_listener(lambda _delta, track_id=track_id: indexed.refresh(track_id))
+    linear = ResourceSelectionService(tracks, strategy)
+
+    def churn() -> simpy.events.Event:  # type: ignore[type-arg]
+        for _ in range(300):
+            track = rng.choice(list(tracks.values()))
+            # Whole meters only, so equal capacities (ties) occur often
+            if rng.random() < 0.6 and track.get_available_capacity() >= 10.0:
+                yield track.container.put(rng.choice([5.0, 10.0]))
+            elif track.get_occupied_capacity() >= 5.0:
+                yield track.container.get(5.0)
+            for required in (0.0, 5.0, 20.0, 75.0, 200.0):
+                assert indexed.select_with_capacity(required) == linear.select_with_capacity(required)
+
+    env.process(churn())
+    env.run()
+
+
+def test_indexed_empty_and_full(env: simpy.Environment, tracks: dict[str, TrackCapacityManager]) -> None:
+    """Test capacity index on empty and full yards."""
+    empty: ResourceSelectionService[TrackCapacityManager] = ResourceSelectionService(
+        {}, SelectionStrategy.BEST_FIT, indexed=True
+    )
+    assert empty.select_with_capacity(0.0) is None
+
+    def fill_tracks() -> simpy.events.Event:  # type: ignore[type-arg]
+        for track in tracks.values():
+            yield track.container.put(track.capacity_meters)
+
+    env.process(fill_tracks())
+    env.run()
+    best_fit = ResourceSelectionService(tracks, SelectionStrategy.BEST_FIT, indexed=True)
+    most_available = ResourceSelectionService(tracks, SelectionStrategy.MOST_AVAILABLE, indexed=True)
+
+    assert best_fit.select_with_capacity(0.0) is None
+    # Linear MOST_AVAILABLE accepts full tracks when nothing is required
+    assert most_available.select_with_capacity(0.0) == 'T1'
+    assert most_available.select_with_capacity(1.0) is None
@@ -0,0 +1,83 @@
+"""Tests for route service lookups with derived routes."""
+
+from contexts.configuration.application.dtos.route_input_dto import RouteInputDTO
+from contexts.configuration.application.dtos.route_input_dto import RouteType
+from contexts.railway_infrastructure.domain.services.topology_service import TopologyService
+from contexts.retrofit_workflow.domain.services.route_service import RouteService
+import pytest
+
+
+def _service() -> RouteService:
+    """Create service with routes collection -> retrofit -> WS1 and a slow direct route."""
+    return RouteService(
+        [
+            RouteInputDTO(id='c_r', duration=60.0, path=['collection', 'Mainline', 'retrofit'], route_type='MAINLINE'),
+            RouteInputDTO(id='r_ws', duration=5.0, path=['retrofit', 'WS1']),
+            RouteInputDTO(id='ws_rd', duration=5.0, path=['WS1', 'retrofitted']),
+            RouteInputDTO(id='r_rd', duration=30.0, path=['retrofit', 'retrofitted']),
+        ]
+    )
+
+
+def test_configured_route_wins_over_shorter_chain() -> None:
+    """Test a configured route keeps its duration and path."""
+    service = _service()
+
+    assert service.get_duration('retrofit', 'retrofitted') == 30.0
+    assert service.get_route_path('retrofit', 'retrofitted') == ['retrofit', 'retrofitted']
+
+
+def test_unconfigured_pair_uses_chain_of_routes() -> None:
+    """Test duration, path, location and type of a pair without its own route."""
+    service = _service()
+
+    assert service.get_duration('collection', 'WS1') == 65.0
+    assert service.get_route_path('collection', 'WS1') == ['collection', 'Mainline', 'retrofit', 'WS1']
+    assert service.get_route_location('collection', 'WS1') == 'Mainline'
+    assert service.get_route_type('collection', 'WS1') == RouteType.MAINLINE
+    assert service.get_route_type('retrofit', 'retrofitted') == RouteType.SHUNTING
+
+
+def test_unconnected_pair_raises_key_error() -> None:
+    """Test pairs no chain of routes connects still raise KeyError."""
+    service = _service()
+
+    with pytest.raises(KeyError, match='Route WS1->collection not found'):
+        service.get_duration('WS1', 'collection')
+    assert service.get_route_path('WS1', 'collection') == ['WS1', 'collection']
+
+
+def test_topology_service_finds_chained_path() -> None:
+    """Test topology path finding follows chains of routes instead of direct routes only."""
+    topology = TopologyService(
+        {
+            'routes': [
+                {'from': 'a', 'to': 'b', 'duration': 1.0},
+                {'from': 'b', 'to': 'c', 'duration': 1.0},
+            ]
+        }
+    )
+
+    assert topology.find_path('a', 'b') == ['a', 'b']
+    assert topology.find_path('a', 'c') == ['a', 'b', 'c']
+    assert topology.find_path('c', 'a') == []
+
+
+def test_duration_via_location_without_direct_route() -> None:
+    """Test get_duration_via takes the direct route if there is one, else the routes through via."""
+    service = RouteService(
+        [
+            RouteInputDTO(id='h_ws', duration=4.0, path=['loco_home', 'WS1']),
+            RouteInputDTO(id='ws_h', duration=4.0, path=['WS1', 'loco_home']),
+            RouteInputDTO(id='h_p', duration=7.0, path=['loco_home', 'parking']),
+            RouteInputDTO(id='ws_r', duration=2.0, path=['WS1', 'retrofitted']),
+        ]
+    )
+
+    assert service.has_route('WS1', 'retrofitted')
+    assert not service.has_route('retrofitted', 'WS1')
+    assert service.get_duration_via('WS1', 'retrofitted', 'loco_home') == 2.0
+    assert service.get_duration_via('WS1', 'parking', 'loco_home') == 11.0
+    assert service.get_duration_via('retrofitted', 'retrofitted', 'loco_home') == 0.0
+    with pytest.raises(KeyError):
+        service.get_duration_via('retrofitted', 'parking', 'loco_home')
@@ -1,6 +1,9 @@
 """Tests for TrackSelectionFacade."""
 
+from contexts.retrofit_workflow.domain.entities.wagon import Wagon
 from contexts.retrofit_workflow.domain.services.track_selection_service import TrackSelectionFacade
+from contexts.retrofit_workflow.domain.value_objects.coupler import Coupler
+from contexts.retrofit_workflow.domain.value_objects.coupler import CouplerType
 from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
 import pytest
 import simpy
@@ -67,3 +70,48 @@ def test_get_tracks_of_type(tracks_by_type: dict[str, list[TrackCapacityManager]
     facade = TrackSelectionFacade(tracks_by_type)
     tracks = facade.get_tracks_of_type('collection')
     assert len(tracks) == 2
+
+
+def _wagon(wagon_id: str, length: float) -> Wagon:
+    """Create screw-coupled wagon."""
+    return Wagon(
+        id=wagon_id, length=length, coupler_a=Coupler(CouplerType.SCREW, 'A'), coupler_b=Coupler(CouplerType.SCREW, 'B')
+    )
+
+
+def test_fill_ratio_follows_add_and_remove(
+    env: simpy.Environment, tracks_by_type: dict[str, list[TrackCapacityManager]]
+) -> None:
+    """Test per-type fill aggregates are updated by track add/remove."""
+    facade = TrackSelectionFacade(tracks_by_type)
+    c1, c2 = tracks_by_type['collection']
+    wagons = [_wagon('W1', 30.0), _wagon('W2', 20.0)]
+
+    def move() -> simpy.events.Event:  # type: ignore[type-arg]
+        yield from c1.add_wagons(wagons[:1])
+        yield from c2.add_wagons(wagons[1:])
+
+    env.process(move())
+    env.run()
+
+    assert facade.get_total_occupied_capacity('collection') == pytest.approx(50.0)
+    assert facade.get_fill_ratio('collection') == pytest.approx(0.25)
+    assert facade.get_fill_ratios() == {'collection': pytest.approx(0.25), 'retrofit': 0.0}
+
+    env.process(c1.remove_wagons(wagons[:1]))
+    env.run()
+
+    assert facade.get_fill_ratio('collection') == pytest.approx(0.1)
+
+
+def test_fill_ratio_includes_initial_occupancy(
+    env: simpy.Environment, tracks_by_type: dict[str, list[TrackCapacityManager]]
+) -> None:
+    """Test aggregates start from tracks' occupancy at construction."""
+    env.process(tracks_by_type['retrofit'][0].add_wagons([_wagon('W1', 75.0)]))
+    env.run()
+
+    facade = TrackSelectionFacade(tracks_by_type)
+
+    assert facade.get_fill_ratio('retrofit') == pytest.approx(0.5)
+    assert facade.get_fill_ratio('parking') == 0.0
@@ -0,0 +1,91 @@
+"""Tests for slotted hot-path entities and events."""
+
+from dataclasses import FrozenInstanceError
+import tracemalloc
+
+from contexts.retrofit_workflow.domain.entities.locomotive import Locomotive
+from contexts.retrofit_workflow.domain.entities.wagon import Wagon
+from contexts.retrofit_workflow.domain.events.observability_events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.events.observability_events import WagonJourneyEvent
+from contexts.retrofit_workflow.domain.value_objects.coupler import Coupler
+from contexts.retrofit_workflow.domain.value_objects.coupler import CouplerType
+import pytest
+from shared.domain.events.dual_stream_events import LocationChangeEvent
+from shared.domain.events.dual_stream_events import ResourceState
+from shared.domain.events.dual_stream_events import StateChangeEvent
+
+
+def _wagon() -> Wagon:
+    """Create test wagon."""
+    return Wagon(
+        id='W1', length=15.0, coupler_a=Coupler(CouplerType.SCREW, 'A'), coupler_b=Coupler(CouplerType.SCREW, 'B')
+    )
+
+
+def _locomotive() -> Locomotive:
+    """Create test locomotive."""
+    return Locomotive(
+        id='L1',
+        home_track='loco_parking',
+        coupler_front=Coupler(CouplerType.HYBRID, 'FRONT'),
+        coupler_back=Coupler(CouplerType.HYBRID, 'BACK'),
+    )
+
+
+@pytest.mark.parametrize(
+    'instance',
+    [
+        _wagon(),
+        _locomotive(),
+        WagonJourneyEvent(0.0, 'W1', 'ARRIVED', 'collection', 'ARRIVED'),
+        LocomotiveMovementEvent(0.0, 'L1', 'MOVING'),
+    ],
+)
+def test_no_instance_dict(instance: object) -> None:
+    """Test hot-path objects are slotted and reject unknown attributes."""
+    assert not hasattr(instance, '__dict__')
+    with pytest.raises(AttributeError):
+        instance.unknown_attribute = 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    'event',
+    [
+        StateChangeEvent(0.0, 'W1', 'wagon', ResourceState.ARRIVED),
+        LocationChangeEvent(0.0, 'W1', 'wagon', 'collection'),
+    ],
+)
+def test_frozen_events_are_slotted(event: StateChangeEvent | LocationChangeEvent) -> None:
+    """Test dual-stream events are slotted and stay immutable."""
+    assert not hasattr(event, '__dict__')
+    with pytest.raises(FrozenInstanceError):
+        event.timestamp = 1.0  # type: ignore[misc]
+
+
+def test_wagon_journey_event_carries_route_and_coupler() -> None:
+    """Test route path and coupler type are regular optional fields."""
+    event = WagonJourneyEvent(0.0, 'W1', 'MOVING', 'collection', 'MOVING', route_path=['a', 'b'], coupler_type='DAC')
+
+    assert event.route_path == ['a', 'b']
+    assert event.coupler_type == 'DAC'
+    assert WagonJourneyEvent(0.0, 'W1', 'ARRIVED', 'collection', 'ARRIVED').route_path is None
+
+
+def test_wagon_memory_after_state_changes() -> None:
+    """Test a wagon stays compact after walking through its lifecycle.
+
+    An unslotted wagon materializes a per-instance dict of ~600 bytes here.
+    """
+    count = 10_000
+    tracemalloc.start()
+    wagons = [_wagon() for _ in range(count)]
+    before = tracemalloc.get_traced_memory()[0]
+    for wagon in wagons:
+        wagon.classify()
+        wagon.prepare_for_retrofit()
+        wagon.start_retrofit('WS1', 1.0)
+        wagon.current_track_id = 'retrofit_1'
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert (after - before) / count < 100
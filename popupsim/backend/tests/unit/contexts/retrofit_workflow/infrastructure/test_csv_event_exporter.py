@@ -0,0 +1,71 @@
+"""Tests for column-wise CSV frame construction."""
+
+from contexts.retrofit_workflow.domain.events import LocomotiveMovementEvent
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+from contexts.retrofit_workflow.domain.events.batch_events import BatchFormed
+from contexts.retrofit_workflow.infrastructure.exporters.csv_event_exporter import CsvEventExporter
+from contexts.retrofit_workflow.infrastructure.exporters.dual_stream_csv_exporter import DualStreamCsvExporter
+from shared.domain.events.dual_stream_events import ResourceState
+from shared.domain.events.dual_stream_events import StateChangeEvent
+from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime
+
+START = '2025-01-01T00:00:00Z'
+
+
+def _wagon(ts: float, wagon_id: str) -> WagonJourneyEvent:
+    """Create wagon event."""
+    return WagonJourneyEvent(timestamp=ts, wagon_id=wagon_id, event_type='ARRIVED', location='collection', status='OK')
+
+
+class TestCsvEventExporter:
+    """Test CsvEventExporter frame builders."""
+
+    def test_wagon_journey_columns(self) -> None:
+        """Test rows keep event order and get one datetime per timestamp."""
+        df = CsvEventExporter(START).build_wagon_journey([_wagon(0.0, 'W1'), _wagon(90.5, 'W2')])
+
+        assert list(df.columns[:3]) == ['timestamp', 'datetime', 'wagon_id']
+        assert df['datetime'].tolist() == [sim_ticks_to_datetime(0.0, START), sim_ticks_to_datetime(90.5, START)]
+        assert df['train_id'].tolist() == ['', '']
+
+    def test_empty_frame_has_no_columns(self) -> None:
+        """Test empty event list gives empty frame."""
+        assert CsvEventExporter(START).build_wagon_journey([]).columns.empty
+
+    def test_without_start_datetime(self) -> None:
+        """Test datetime column is empty without simulation start."""
+        df = CsvEventExporter().build_wagon_journey([_wagon(5.0, 'W1')])
+
+        assert df['datetime'].tolist() == ['']
+
+    def test_events_sorted_stably_across_streams(self) -> None:
+        """Test combined event frame is chronological, keeping stream order for ties."""
+        df = CsvEventExporter(START).build_events(
+            [_wagon(10.0, 'W1')],
+            [LocomotiveMovementEvent(5.0, 'L1', 'MOVING'), LocomotiveMovementEvent(10.0, 'L1', 'ARRIVED')],
+            [
+                BatchFormed(
+                    timestamp=1.0, event_id='E1', batch_id='B1', wagon_ids=['W1'], destination='WS1', total_length=15.0
+                )
+            ],
+        )
+
+        assert df['resource_id'].tolist() == ['B1', 'L1', 'W1', 'L1']
+        assert df['datetime'].iloc[0] == sim_ticks_to_datetime(1.0, START)
+        assert list(df.columns) == ['timestamp', 'datetime', 'event_type', 'resource_type', 'resource_id', 'details']
+
+
+class TestDualStreamCsvExporter:
+    """Test DualStreamCsvExporter frame builders."""
+
+    def test_state_changes(self) -> None:
+        """Test state change frame built from columns."""
+        events = [
+            StateChangeEvent(timestamp=float(i), resource_id=f'W{i}', resource_type='wagon', state=state)
+            for i, state in enumerate(ResourceState)
+        ]
+
+        df = DualStreamCsvExporter(START).build_state_changes(events)
+
+        assert df['state'].tolist() == [s.value for s in ResourceState]
+        assert df['datetime'].tolist() == [sim_ticks_to_datetime(e.timestamp, START) for e in events]
@@ -186,3 +186,124 @@ class TestLocomotiveResourceManager:
         """Test manager with empty locomotive pool raises error."""
         with pytest.raises(ValueError, match='"capacity" must be > 0.'):
             LocomotiveResourceManager(env=env, locomotives=[])
+
+
+def _loco(loco_id: str, home_track: str) -> Locomotive:
+    """Create locomotive parked on home track."""
+    return Locomotive(
+        id=loco_id,
+        home_track=home_track,
+        coupler_front=Coupler(CouplerType.HYBRID, 'FRONT'),
+        coupler_back=Coupler(CouplerType.HYBRID, 'BACK'),
+    )
+
+
+_DURATIONS = {('north', 'collection_1'): 2.0, ('south', 'collection_1'): 8.0, ('north', 'parking_1'): 9.0}
+
+
+def _route_duration(from_track: str, to_track: str) -> float:
+    """Look up test route duration (missing routes take 5 minutes)."""
+    return _DURATIONS.get((from_track, to_track), 5.0)
+
+
+class TestLocationAwareAllocation:
+    """Test location-aware allocation of LocomotiveResourceManager."""
+
+    def _allocate(self, manager: LocomotiveResourceManager, near_track: str | None) -> str:
+        """Allocate one locomotive and get its ID."""
+        result = []
+
+        def process() -> None:
+            result.append((yield from manager.allocate(near_track=near_track)))
+
+        manager.env.process(process())
+        manager.env.run()
+        return result[0].id
+
+    def test_fifo_without_route_durations(self) -> None:
+        """Test near_track is ignored unless route durations are set."""
+        env = simpy.Environment()
+        manager = LocomotiveResourceManager(env, [_loco('L_south', 'south'), _loco('L_north', 'north')])
+
+        assert not manager.is_location_aware()
+        assert self._allocate(manager, 'collection_1') == 'L_south'
+
+    def test_nearest_locomotive(self) -> None:
+        """Test the locomotive with the shortest route to the track is allocated."""
+        env = simpy.Environment()
+        manager = LocomotiveResourceManager(
+            env, [_loco('L_south', 'south'), _loco('L_north', 'north')], route_duration=_route_duration
+        )
+
+        assert manager.is_location_aware()
+        assert self._allocate(manager, 'collection_1') == 'L_north'
+        assert manager.get_available_count() == 1
+        assert self._allocate(manager, 'collection_1') == 'L_south'
+
+    def test_ties_and_same_track(self) -> None:
+        """Test ties go to the earliest released locomotive and one on the track itself wins."""
+        env = simpy.Environment()
+        manager = LocomotiveResourceManager(
+            env, [_loco('L1', 'south'), _loco('L2', 'east'), _loco('L3', 'parking_1')], route_duration=_route_duration
+        )
+
+        assert self._allocate(manager, 'parking_1') == 'L3'
+        assert self._allocate(manager, 'workshop_1') == 'L1'
+        assert self._allocate(manager, None) == 'L2'
+
+    def test_waiting_request_gets_released_locomotive(self) -> None:
+        """Test a request waiting on an empty pool is served by the next release."""
+        env = simpy.Environment()
+        manager = LocomotiveResourceManager(env, [_loco('L_south', 'south')], route_duration=_route_duration)
+        served = []
+
+        def hold_and_release() -> None:
+            loco = yield from manager.allocate(near_track='collection_1')
+            yield env.timeout(3)
+            yield from manager.release(loco)
+
+        def wait_for_loco() -> None:
+            yield env.timeout(1)
+            loco = yield from manager.allocate(near_track='parking_1')
+            served.append((env.now, loco.id))
+
+        env.process(hold_and_release())
+        env.process(wait_for_loco())
+        env.run()
+
+        assert served == [(3, 'L_south')]
+        assert manager.get_available_count() == 0
+
+    def test_tracks_without_route_are_skipped(self) -> None:
+        """Test locomotives without a route to the track are skipped, and FIFO is used if none has one."""
+
+        def route_duration(from_track: str, to_track: str) -> float:
+            if from_track == 'island':
+                raise KeyError(f'Route {from_track}->{to_track} not found in routes configuration')
+            return _route_duration(from_track, to_track)
+
+        env = simpy.Environment()
+        manager = LocomotiveResourceManager(
+            env, [_loco('L_island', 'island'), _loco('L_south', 'south'), _loco('L_island_2', 'island')]
+        )
+        manager.set_route_duration(route_duration)
+
+        assert self._allocate(manager, 'collection_1') == 'L_south'
+        assert self._allocate(manager, 'collection_1') == 'L_island'
+
+    def test_released_locomotive_is_found_on_its_current_track(self) -> None:
+        """Test a locomotive released away from home is allocated by where it is."""
+        env = simpy.Environment()
+        south, north = _loco('L_south', 'south'), _loco('L_north', 'north')
+        manager = LocomotiveResourceManager(env, [south, north], route_duration=_route_duration)
+
+        def move_south_to_collection() -> None:
+            loco = yield from manager.allocate(near_track='parking_1')
+            loco.arrive_at('collection_1')
+            yield from manager.release(loco)
+
+        env.process(move_south_to_collection())
+        env.run()
+
+        assert south.current_track == 'collection_1'
+        assert self._allocate(manager, 'collection_1') == 'L_south'
@@ -0,0 +1,100 @@
+"""Tests for ParallelArtifactWriter."""
+
+import json
+from pathlib import Path
+
+from contexts.retrofit_workflow.application.event_collector import EventCollector
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ExportArtifact
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ParallelArtifactWriter
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import write_json
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def artifacts() -> list[ExportArtifact]:
+    """Create independent artifacts."""
+    return [
+        ExportArtifact('a.csv', lambda: pd.DataFrame({'x': [1, 2, 3]})),
+        ExportArtifact('b.csv', lambda: pd.DataFrame({'y': ['p', 'q']})),
+        ExportArtifact('c.json', lambda: {'count': 3}, write=write_json),
+    ]
+
+
+@pytest.fixture
+def collector() -> EventCollector:
+    """Create collector with a few wagon events."""
+    collector = EventCollector(start_datetime='2024-01-01T00:00:00Z')
+    for i, event_type in enumerate(['ARRIVED', 'RETROFIT_STARTED', 'RETROFIT_COMPLETED', 'PARKED']):
+        collector.add_wagon_event(
+            WagonJourneyEvent(
+                timestamp=float(i * 60),
+                wagon_id='W001',
+                train_id='T001',
+                event_type=event_type,
+                location='WS1' if 'RETROFIT' in event_type else 'collection',
+                status='OK',
+            )
+        )
+    return collector
+
+
+class TestParallelArtifactWriter:
+    """Test ParallelArtifactWriter."""
+
+    @pytest.mark.parametrize('max_workers', [None, 1, 4])
+    def test_writes_all_artifacts(self, artifacts: list[ExportArtifact], tmp_path: Path, max_workers: int) -> None:
+        """Test all artifacts are written for any worker count."""
+        timings = ParallelArtifactWriter(max_workers).write_all(artifacts, tmp_path / 'out')
+
+        assert [t.filename for t in timings] == ['a.csv', 'b.csv', 'c.json']
+        assert pd.read_csv(tmp_path / 'out' / 'a.csv')['x'].tolist() == [1, 2, 3]
+        assert json.loads((tmp_path / 'out' / 'c.json').read_text()) == {'count': 3}
+
+    def test_timings_are_non_negative(self, artifacts: list[ExportArtifact], tmp_path: Path) -> None:
+        """Test build and write timings are reported."""
+        timings = ParallelArtifactWriter(2).write_all(artifacts, tmp_path)
+
+        for timing in timings:
+            assert timing.build_seconds >= 0.0
+            assert timing.write_seconds >= 0.0
+            assert timing.total_seconds == timing.build_seconds + timing.write_seconds
+
+    def test_build_error_propagates(self, tmp_path: Path) -> None:
+        """Test exceptions raised in worker threads reach the caller."""
+
+        def failing_build() -> pd.DataFrame:
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError, match='boom'):
+            ParallelArtifactWriter(2).write_all(
+                [ExportArtifact('ok.csv', pd.DataFrame), ExportArtifact('bad.csv', failing_build)], tmp_path
+            )
+
+    def test_rejects_invalid_worker_count(self) -> None:
+        """Test worker count must be positive."""
+        with pytest.raises(ValueError, match='max_workers'):
+            ParallelArtifactWriter(0)
+
+
+class TestEventCollectorParallelExport:
+    """Test EventCollector.export_all through the parallel writer."""
+
+    def test_parallel_output_matches_sequential(self, collector: EventCollector, tmp_path: Path) -> None:
+        """Test parallel export writes the same files as sequential export."""
+        collector.export_all(str(tmp_path / 'seq'), 240.0, max_workers=1)
+        timings = collector.export_all(str(tmp_path / 'par'), 240.0, max_workers=8)
+
+        assert len(timings) == len(collector.get_export_artifacts())
+        for timing in timings:
+            sequential = (tmp_path / 'seq' / timing.filename).read_text()
+            parallel = (tmp_path / 'par' / timing.filename).read_text()
+            assert sequential == parallel, timing.filename
+
+    def test_includes_dual_stream_artifacts(self, collector: EventCollector, tmp_path: Path) -> None:
+        """Test dual-stream files are part of the export stage."""
+        timings = collector.export_all(str(tmp_path))
+
+        filenames = {t.filename for t in timings}
+        assert {'resource_states.csv', 'resource_locations.csv', 'resource_processes.csv'} <= filenames
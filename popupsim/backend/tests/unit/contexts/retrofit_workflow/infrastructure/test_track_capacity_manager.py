@@ -0,0 +1,76 @@
+"""Tests for TrackCapacityManager wagon membership."""
+
+from contexts.retrofit_workflow.domain.entities.wagon import Wagon
+from contexts.retrofit_workflow.domain.value_objects.coupler import Coupler
+from contexts.retrofit_workflow.domain.value_objects.coupler import CouplerType
+from contexts.retrofit_workflow.infrastructure.resources.track_capacity_manager import TrackCapacityManager
+import pytest
+import simpy
+
+
+def _wagons(count: int, length: float = 15.0) -> list[Wagon]:
+    """Create wagons W0..W<count-1>."""
+    return [
+        Wagon(
+            id=f'W{i}',
+            length=length,
+            coupler_a=Coupler(CouplerType.SCREW, 'A'),
+            coupler_b=Coupler(CouplerType.SCREW, 'B'),
+        )
+        for i in range(count)
+    ]
+
+
+def _parking_track(env: simpy.Environment, wagons: list[Wagon]) -> TrackCapacityManager:
+    """Create parking track holding the given wagons."""
+    track = TrackCapacityManager(env, 'parking', sum(w.length for w in wagons) + 100.0)
+    env.process(track.add_wagons(wagons))
+    env.run()
+    return track
+
+
+class TestTrackCapacityManager:
+    """Test wagon bookkeeping of TrackCapacityManager."""
+
+    def test_wagons_keep_arrival_order(self) -> None:
+        """Test wagons are listed in the order they were added."""
+        env = simpy.Environment()
+        wagons = _wagons(5)
+        track = _parking_track(env, [wagons[3], wagons[0], wagons[4]])
+
+        assert [w.id for w in track.wagons] == ['W3', 'W0', 'W4']
+        assert track.get_wagon_ids() == ['W3', 'W0', 'W4']
+        assert track.get_wagon_count() == 3
+
+    def test_membership(self) -> None:
+        """Test membership checks by wagon."""
+        env = simpy.Environment()
+        wagons = _wagons(3)
+        track = _parking_track(env, wagons[:2])
+
+        assert track.has_wagon(wagons[0])
+        assert not track.has_wagon(wagons[2])
+        assert track.has_any_wagon([wagons[2], wagons[1]])
+        assert not track.has_any_wagon([wagons[2]])
+        assert not track.has_any_wagon([])
+
+    def test_remove_keeps_order_of_remaining(self) -> None:
+        """Test removal from the middle keeps sequence order and frees capacity."""
+        env = simpy.Environment()
+        wagons = _wagons(4)
+        track = _parking_track(env, wagons)
+
+        env.process(track.remove_wagons([wagons[2], wagons[0]]))
+        env.run()
+
+        assert track.get_wagon_ids() == ['W1', 'W3']
+        assert track.get_occupied_capacity() == pytest.approx(30.0)
+
+    def test_wagons_is_a_copy(self) -> None:
+        """Test mutating the returned list does not change the track."""
+        env = simpy.Environment()
+        track = _parking_track(env, _wagons(2))
+
+        track.wagons.clear()
+
+        assert track.get_wagon_count() == 2
@@ -0,0 +1,84 @@
+"""Tests for WorkshopAvailability infrastructure component."""
+
+from collections.abc import Generator
+from typing import Any
+
+from contexts.retrofit_workflow.infrastructure.resources.workshop_availability import WorkshopAvailability
+import pytest
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
+import simpy
+
+
+class TestWorkshopAvailability:
+    """Test WorkshopAvailability free-list."""
+
+    @pytest.fixture
+    def env(self) -> simpy.Environment:
+        """Create SimPy environment."""
+        return simpy.Environment()
+
+    def test_first_available_takes_lowest_id(self, env: simpy.Environment) -> None:
+        """Test FIRST_AVAILABLE hands out the lowest free workshop ID."""
+        availability = WorkshopAvailability(env, ['WS3', 'WS1', 'WS2'])
+
+        assert availability.acquire().value == 'WS1'
+        assert availability.acquire().value == 'WS2'
+        availability.release('WS1')
+        assert availability.acquire().value == 'WS1'
+        assert availability.get_free_count() == 1
+        assert availability.is_free('WS3')
+        assert not availability.is_free('WS1')
+
+    def test_round_robin_cycles(self, env: simpy.Environment) -> None:
+        """Test ROUND_ROBIN continues after the last workshop handed out."""
+        availability = WorkshopAvailability(env, ['WS1', 'WS2', 'WS3'], SelectionStrategy.ROUND_ROBIN)
+
+        assert availability.acquire().value == 'WS1'
+        availability.release('WS1')
+        assert availability.acquire().value == 'WS2'
+        availability.release('WS2')
+        assert availability.acquire().value == 'WS3'
+        availability.release('WS3')
+        assert availability.acquire().value == 'WS1'
+
+    def test_release_hands_workshop_to_oldest_waiter(self, env: simpy.Environment) -> None:
+        """Test waiting requests get released workshops directly in FIFO order."""
+        availability = WorkshopAvailability(env, ['WS1', 'WS2'])
+        received: list[tuple[float, str, str]] = []
+
+        def user(name: str, hold: float) -> Generator[Any, Any]:
+            workshop_id = yield availability.acquire()
+            received.append((env.now, name, workshop_id))
+            yield env.timeout(hold)
+            availability.release(workshop_id)
+
+        for name, hold in [('a', 10.0), ('b', 5.0), ('c', 1.0), ('d', 1.0)]:
+            env.process(user(name, hold))
+        env.run()
+
+        assert received == [(0, 'a', 'WS1'), (0, 'b', 'WS2'), (5.0, 'c', 'WS2'), (6.0, 'd', 'WS2')]
+        assert availability.get_free_count() == 2
+        assert availability.get_waiting_count() == 0
+
+    def test_double_release_is_ignored(self, env: simpy.Environment) -> None:
+        """Test releasing a free workshop does not duplicate it."""
+        availability = WorkshopAvailability(env, ['WS1'])
+
+        availability.release('WS1')
+
+        assert availability.get_free_count() == 1
+
+    @pytest.mark.parametrize('strategy', [SelectionStrategy.LEAST_OCCUPIED, SelectionStrategy.SHORTEST_QUEUE])
+    def test_idle_workshop_strategies_select_first_available(
+        self, env: simpy.Environment, strategy: SelectionStrategy
+    ) -> None:
+        """Test strategies tying on idle workshops select the lowest free ID."""
+        availability = WorkshopAvailability(env, ['WS2', 'WS1'], strategy)
+
+        assert availability.strategy is SelectionStrategy.FIRST_AVAILABLE
+        assert availability.acquire().value == 'WS1'
+
+    def test_unsupported_strategy(self, env: simpy.Environment) -> None:
+        """Test unsupported strategies are rejected."""
+        with pytest.raises(ValueError, match='Unsupported workshop selection strategy'):
+            WorkshopAvailability(env, ['WS1'], SelectionStrategy.BEST_FIT)
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 from contexts.retrofit_workflow.application.retrofit_workflow_context import RetrofitWorkshopContext
 import pytest
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
 import simpy
 
 
@@ -61,6 +62,7 @@ class MockScenario:
         self.task_priorities = {}
         self.collection_track_strategy = Mock(value='round_robin')
         self.retrofit_selection_strategy = Mock(value='least_busy')
+        self.workshop_selection_strategy = SelectionStrategy.FIRST_AVAILABLE
         self.retrofitted_selection_strategy = Mock(value='least_busy')
         self.parking_selection_strategy = Mock(value='least_busy')
         self.parking_strategy = Mock(value='batch_completion')
@@ -139,6 +141,16 @@ class TestRetrofitWorkshopContext:
         assert context.arrival_coordinator is not None
         # Note: Other coordinators may be None in current implementation
 
+    def test_workshop_coordinator_uses_scenario_workshop_strategy(
+        self, env: simpy.Environment, scenario: MockScenario
+    ) -> None:
+        """Test the scenario's workshop_selection_strategy selects free workshops."""
+        scenario.workshop_selection_strategy = SelectionStrategy.ROUND_ROBIN
+        context = RetrofitWorkshopContext(env, scenario)
+        context.initialize()
+
+        assert context.workshop_coordinator.workshop_availability.strategy is SelectionStrategy.ROUND_ROBIN
+
     def test_initialize_creates_event_collector(self, context: RetrofitWorkshopContext) -> None:
         """Test initialization creates event collector."""
         context.initialize()
@@ -219,6 +231,7 @@ class TestRetrofitWorkshopContext:
         minimal_scenario.process_times = Mock(wagon_retrofit_time=timedelta(minutes=10))
         minimal_scenario.collection_track_strategy = Mock(value='round_robin')
         minimal_scenario.retrofit_selection_strategy = Mock(value='least_busy')
+        minimal_scenario.workshop_selection_strategy = SelectionStrategy.FIRST_AVAILABLE
         minimal_scenario.retrofitted_selection_strategy = Mock(value='least_busy')
         minimal_scenario.parking_selection_strategy = Mock(value='least_busy')
         minimal_scenario.parking_strategy = Mock(value='batch_completion')
@@ -0,0 +1,103 @@
+"""Tests for rake registry."""
+
+from shared.domain.entities.rake import Rake
+from shared.domain.services.rake_registry import RakeRegistry
+from shared.domain.value_objects.rake_type import RakeType
+
+
+def _rake(rake_id: str, track: str = 'collection_1', rake_type: RakeType = RakeType.COLLECTION_RAKE) -> Rake:
+    """Create empty rake on track."""
+    return Rake(rake_id=rake_id, wagons=[], rake_type=rake_type, formation_time=0.0, formation_track=track)
+
+
+def _registry(count: int, tracks: int = 10) -> RakeRegistry:
+    """Create registry with count rakes spread over tracks."""
+    registry = RakeRegistry()
+    for i in range(count):
+        registry.register_rake(_rake(f'R{i}', f'track_{i % tracks}'))
+    return registry
+
+
+class TestRakeRegistry:
+    """Test rake registry indexes."""
+
+    def test_register_indexes_by_type_and_track(self) -> None:
+        """Test registered rakes are found by type and track in registration order."""
+        registry = RakeRegistry()
+        registry.register_rake(_rake('R1'))
+        registry.register_rake(_rake('R2', rake_type=RakeType.WORKSHOP_RAKE))
+        registry.register_rake(_rake('R3'))
+
+        assert [r.rake_id for r in registry.get_rakes_by_track('collection_1')] == ['R1', 'R2', 'R3']
+        assert [r.rake_id for r in registry.get_rakes_by_type(RakeType.COLLECTION_RAKE)] == ['R1', 'R3']
+        assert registry.get_rakes_by_track('unknown') == []
+
+    def test_register_again_replaces_rake(self) -> None:
+        """Test re-registering a rake ID drops stale index entries."""
+        registry = RakeRegistry()
+        registry.register_rake(_rake('R1'))
+        registry.register_rake(_rake('R1', 'parking_1', RakeType.PARKING_RAKE))
+
+        assert registry.get_rakes_by_track('collection_1') == []
+        assert registry.get_rakes_by_type(RakeType.COLLECTION_RAKE) == []
+        assert [r.rake_id for r in registry.get_rakes_by_track('parking_1')] == ['R1']
+        assert len(registry.get_all_rakes()) == 1
+
+    def test_update_rake_track(self) -> None:
+        """Test moved rake is appended to the new track and its location updated."""
+        registry = RakeRegistry()
+        registry.register_rake(_rake('R1', 'retrofit_1'))
+        registry.register_rake(_rake('R2'))
+        registry.update_rake_track('R2', 'retrofit_1')
+        registry.update_rake_track('unknown', 'retrofit_1')
+
+        assert registry.get_rakes_by_track('collection_1') == []
+        assert [r.rake_id for r in registry.get_rakes_by_track('retrofit_1')] == ['R1', 'R2']
+        assert registry.get_rake('R2').formation_track == 'retrofit_1'
+
+    def test_move_many(self) -> None:
+        """Test batch move keeps given order and skips unknown rakes."""
+        registry = _registry(6, tracks=2)
+        moved = registry.move_many(['R4', 'R1', 'unknown', 'R2'], 'parking_1')
+
+        assert [r.rake_id for r in moved] == ['R4', 'R1', 'R2']
+        assert [r.rake_id for r in registry.get_rakes_by_track('parking_1')] == ['R4', 'R1', 'R2']
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_0')] == ['R0']
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_1')] == ['R3', 'R5']
+        assert all(r.formation_track == 'parking_1' for r in moved)
+
+    def test_move_many_appends_after_rakes_on_target(self) -> None:
+        """Test moved rakes queue behind rakes already on the target track, including rakes moved there again."""
+        registry = _registry(4, tracks=2)
+        registry.move_many(['R0', 'R3'], 'track_1')
+
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_1')] == ['R1', 'R0', 'R3']
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_0')] == ['R2']
+
+    def test_move_many_unknown_ids_only(self) -> None:
+        """Test batch move of unknown rakes changes nothing."""
+        registry = _registry(2, tracks=1)
+
+        assert registry.move_many(['unknown'], 'parking_1') == []
+        assert registry.get_rakes_by_track('parking_1') == []
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_0')] == ['R0', 'R1']
+
+    def test_register_again_after_remove(self) -> None:
+        """Test a removed rake registered again is listed after the remaining rakes."""
+        registry = _registry(3, tracks=1)
+        rake = registry.get_rake('R0')
+        registry.remove_rake('R0')
+        registry.register_rake(rake)
+
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_0')] == ['R1', 'R2', 'R0']
+        assert [r.rake_id for r in registry.get_rakes_by_type(RakeType.COLLECTION_RAKE)] == ['R1', 'R2', 'R0']
+
+    def test_remove_rake(self) -> None:
+        """Test removed rake disappears from all indexes."""
+        registry = _registry(3, tracks=1)
+        registry.remove_rake('R1')
+        registry.remove_rake('unknown')
+
+        assert registry.get_rake('R1') is None
+        assert [r.rake_id for r in registry.get_rakes_by_track('track_0')] == ['R0', 'R2']
+        assert [r.rake_id for r in registry.get_rakes_by_type(RakeType.COLLECTION_RAKE)] == ['R0', 'R2']
@@ -0,0 +1,70 @@
+"""Tests for the all-pairs route table."""
+
+import math
+
+import pytest
+from shared.domain.services.route_table import RouteTable
+
+
+def _table() -> RouteTable:
+    """Create table of a small yard: collection -> retrofit -> WS1/WS2 -> retrofitted."""
+    return RouteTable(
+        [
+            (['collection', 'Mainline', 'retrofit'], 60.0),
+            (['retrofit', 'WS1'], 5.0),
+            (['retrofit', 'WS2'], 7.0),
+            (['WS1', 'retrofitted'], 4.0),
+            (['WS2', 'retrofitted'], 3.0),
+            (['retrofitted', 'parking'], 10.0),
+        ]
+    )
+
+
+def test_chains_routes_for_unconfigured_pairs() -> None:
+    """Test pairs without a route resolve to the fastest chain of routes."""
+    table = _table()
+
+    assert table.duration('collection', 'parking') == 60.0 + 5.0 + 4.0 + 10.0
+    assert table.legs('retrofit', 'retrofitted') == [('retrofit', 'WS1'), ('WS1', 'retrofitted')]
+    assert table.path('collection', 'WS1') == ['collection', 'Mainline', 'retrofit', 'WS1']
+    assert table.duration('WS2', 'WS2') == 0.0
+    assert table.path('WS2', 'WS2') == ['WS2']
+
+
+def test_unreachable_and_unknown_locations() -> None:
+    """Test routes are directed and unknown locations raise KeyError."""
+    table = _table()
+
+    assert not table.has_route('parking', 'collection')
+    assert not table.has_route('collection', 'nowhere')
+    with pytest.raises(KeyError, match='No route connects parking->collection'):
+        table.duration('parking', 'collection')
+    with pytest.raises(KeyError, match='Unknown route location'):
+        table.path('collection', 'nowhere')
+
+
+def test_dense_matrix_by_location_index() -> None:
+    """Test durations can be read by integer location ids."""
+    table = _table()
+    origin = table.index['collection']
+
+    assert table.locations[origin] == 'collection'
+    assert table.duration_at(origin, table.index['retrofitted']) == 69.0
+    assert table.duration_at(table.index['parking'], origin) == math.inf
+
+
+def test_shorter_chain_beats_slower_direct_route() -> None:
+    """Test the table holds the shortest duration even where a slower direct route exists."""
+    table = RouteTable([(['a', 'c'], 10.0), (['a', 'b'], 2.0), (['b', 'c'], 3.0), (['a', 'c'], 20.0)])
+
+    assert table.duration('a', 'c') == 5.0
+    assert table.path('a', 'c') == ['a', 'b', 'c']
+
+
+def test_compiles_large_yard() -> None:
+    """Test a ring of 300 tracks with only neighbour routes resolves every pair."""
+    tracks = [f'track_{i}' for i in range(300)]
+    table = RouteTable(([a, b], 1.0) for a, b in zip(tracks, tracks[1:] + tracks[:1], strict=True))
+
+    assert table.duration('track_1', 'track_0') == 299.0
+    assert len(table.legs('track_10', 'track_5')) == 295
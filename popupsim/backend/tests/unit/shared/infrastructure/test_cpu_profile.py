@@ -0,0 +1,96 @@
+"""Tests for CPU profiling with pstats and collapsed-stack output."""
+
+from pathlib import Path
+import pstats
+import time
+
+import pytest
+from shared.infrastructure import cpu_profile
+from shared.infrastructure.cpu_profile import CpuProfiler
+
+SRC = Path(cpu_profile.__file__).resolve().parents[2]
+
+
+def _busy(seconds: float) -> int:
+    count = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        count += 1
+    return count
+
+
+def _outer() -> int:
+    return sum(_busy(0.01) for _ in range(3))
+
+
+def test_unknown_mode_is_rejected() -> None:
+    """Test only cprofile and sample modes are accepted."""
+    with pytest.raises(ValueError, match='Unknown profile mode'):
+        CpuProfiler('perf')
+
+
+def test_frames_are_attributed_to_bounded_contexts() -> None:
+    """Test frames are labelled with their bounded context, source package or third-party package."""
+    assert (
+        cpu_profile._context(str(SRC / 'contexts' / 'retrofit_workflow' / 'application' / 'x.py'))
+        == 'retrofit_workflow'
+    )
+    assert cpu_profile._context(str(SRC / 'shared' / 'infrastructure' / 'x.py')) == 'shared'
+    assert cpu_profile._context(str(SRC / 'main.py')) == 'main'
+    assert cpu_profile._context('/venv/lib/python3.13/site-packages/simpy/core.py') == 'simpy'
+    assert cpu_profile._context('~') == 'python'
+    path = str(SRC / 'contexts' / 'external_trains' / 'application' / 'external_trains_context.py')
+    assert cpu_profile._label(path, 1, 'start') == 'external_trains:external_trains_context.start'
+
+
+def test_stacks_are_estimated_from_caller_times() -> None:
+    """Test cProfile time is split among call stacks in proportion to the call edge times."""
+    a, b, c, d = (('m.py', line, name) for line, name in enumerate('abcd'))
+    stats = {
+        a: (1, 1, 2.0, 10.0, {}),
+        b: (1, 1, 2.0, 6.0, {a: (1, 1, 2.0, 6.0)}),
+        c: (1, 1, 0.0, 2.0, {a: (1, 1, 0.0, 2.0)}),
+        d: (2, 2, 6.0, 6.0, {b: (1, 1, 4.0, 4.0), c: (1, 1, 2.0, 2.0)}),
+    }
+
+    stacks = cpu_profile._stacks_from_stats(stats)
+
+    assert stacks == {(a,): 2.0, (a, b): 2.0, (a, b, d): 4.0, (a, c): 0.0, (a, c, d): 2.0}
+
+
+def test_cprofile_writes_pstats_and_collapsed_stacks(tmp_path: Path) -> None:
+    """Test cprofile mode writes a loadable pstats file and nested collapsed stacks."""
+    profiler = CpuProfiler('cprofile')
+    profiler.enable()
+    _outer()
+    profiler.disable()
+
+    pstats_path, collapsed_path = profiler.write(tmp_path)
+
+    functions = {name for _, _, name in pstats.Stats(str(pstats_path)).stats}  # type: ignore[attr-defined]
+    assert {'_outer', '_busy'} <= functions
+    assert 'disable' not in functions
+    lines = collapsed_path.read_text(encoding='utf-8').splitlines()
+    busy = [line for line in lines if line.startswith('python:test_cpu_profile._outer;')]
+    assert any(';python:test_cpu_profile._busy' in line for line in busy)
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in busy) > 20_000
+
+
+def test_sample_mode_records_stacks_below_the_caller(tmp_path: Path) -> None:
+    """Test sample mode attributes time to the sampled stacks, leaving out the enabling frame."""
+    profiler = CpuProfiler('sample', interval_ms=1.0)
+    profiler.enable()
+    _outer()
+    profiler.disable()
+
+    collapsed = profiler.collapsed()
+    assert collapsed
+    assert all(stack.startswith('python:test_cpu_profile._outer') for stack in collapsed)
+    assert sum(value for stack, value in collapsed.items() if '_busy' in stack) > 15_000
+
+    pstats_path, _ = profiler.write(tmp_path)
+    stats = pstats.Stats(str(pstats_path)).stats  # type: ignore[attr-defined]
+    outer = next(entry for key, entry in stats.items() if key[2] == '_outer')
+    busy = next(entry for key, entry in stats.items() if key[2] == '_busy')
+    assert outer[3] >= busy[3] > 0.015
+    assert profiler.self_time_by_context()['python'] == pytest.approx(sum(e[2] for e in stats.values()))
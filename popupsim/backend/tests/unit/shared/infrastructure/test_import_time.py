@@ -0,0 +1,57 @@
+"""Tests for import-time benchmark and budgets."""
+
+import pytest
+from shared.infrastructure.import_time import IMPORT_BUDGETS
+from shared.infrastructure.import_time import ImportBudget
+from shared.infrastructure.import_time import ImportProfile
+from shared.infrastructure.import_time import check_budget
+from shared.infrastructure.import_time import measure_import_time
+from shared.infrastructure.import_time import parse_importtime
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2000 |     pandas.core
+import time:       700 |       2700 |   pandas
+some unrelated line
+import time:       300 |       3000 | main
+"""
+
+
+def test_parse_importtime() -> None:
+    """Test timings, nesting depth and entry point total are parsed."""
+    timings = parse_importtime(OUTPUT)
+    profile = ImportProfile('main', tuple(timings))
+
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ('_io', 120, 120, 1),
+        ('pandas.core', 1500, 2000, 2),
+        ('pandas', 700, 2700, 1),
+        ('main', 300, 3000, 0),
+    ]
+    assert profile.total_ms == 3.0
+    assert [t.module for t in profile.slowest(2)] == ['pandas.core', 'pandas']
+
+
+def test_check_budget_reports_time_and_forbidden_modules() -> None:
+    """Test budget violations name the exceeded time and eagerly loaded modules."""
+    profile = ImportProfile('main', tuple(parse_importtime(OUTPUT)))
+
+    assert not check_budget(profile, ImportBudget('main', max_ms=5.0, forbidden=frozenset({'numpy'})))
+    assert check_budget(profile, ImportBudget('main', max_ms=2.0, forbidden=frozenset({'pandas', 'numpy'}))) == [
+        'main imports in 3 ms (budget 2 ms)',
+        'main eagerly imports pandas',
+    ]
+
+
+def test_import_failure_raises() -> None:
+    """Test a module that cannot be imported is reported."""
+    with pytest.raises(RuntimeError, match='Importing not_a_popupsim_module failed'):
+        measure_import_time('not_a_popupsim_module', runs=1)
+
+
+@pytest.mark.parametrize('budget', IMPORT_BUDGETS, ids=lambda b: b.module)
+def test_entry_points_within_budget(budget: ImportBudget) -> None:
+    """Test CLI and simulation entry points import within budget and without heavy modules."""
+    profile = measure_import_time(budget.module, runs=2)
+
+    assert check_budget(profile, budget) == []
@@ -0,0 +1,97 @@
+"""Tests for per-phase tracemalloc memory profiling."""
+
+from collections.abc import Generator
+from collections.abc import Iterator
+import json
+from pathlib import Path
+import tracemalloc
+from typing import Any
+
+import pytest
+from shared.infrastructure.memory_profile import MemoryProfiler
+from shared.infrastructure.simulation.engines.simpy_adapter import SimPyEngineAdapter
+
+
+@pytest.fixture
+def profiler() -> Iterator[MemoryProfiler]:
+    """Profiler that is tracing, stopped again after the test."""
+    memory_profiler = MemoryProfiler(top=5)
+    memory_profiler.start()
+    yield memory_profiler
+    if tracemalloc.is_tracing():
+        memory_profiler.stop()
+
+
+def _allocate(kept: list[Any]) -> None:
+    kept.append([bytearray(1024) for _ in range(2000)])
+
+
+def test_checkpoints_report_growth_and_sites(profiler: MemoryProfiler) -> None:
+    """Test a checkpoint after a large allocation attributes the growth to its source line."""
+    kept: list[Any] = []
+    first = profiler.checkpoint('load')
+    _allocate(kept)
+    second = profiler.checkpoint('run', sim_time=10.0)
+
+    assert first.top_growth == []
+    assert second.sim_time == 10.0
+    assert second.growth_mb > 1.5
+    assert second.peak_mb >= second.traced_mb
+    assert second.top_growth[0].site.endswith('test_memory_profile.py:26')
+    assert second.top_growth[0].size_mb > 1.5
+    assert any(site.site.endswith('test_memory_profile.py:26') for site in second.top_sites)
+
+
+def test_attach_checkpoints_initialize_simulation_and_run(profiler: MemoryProfiler) -> None:
+    """Test engine hooks and scheduled checkpoints cover the run at evenly spaced times."""
+    engine = SimPyEngineAdapter.create()
+    kept: list[Any] = []
+
+    def grow() -> Generator[Any]:
+        while True:
+            yield from engine.delay(10)
+            _allocate(kept)
+
+    engine.schedule_process(grow())
+    profiler.attach(engine, until=100.0, sim_checkpoints=3)
+    engine.run(100.0)
+
+    phases = [(c.phase, c.sim_time) for c in profiler.checkpoints]
+    assert phases == [
+        ('initialize', 0.0),
+        ('simulation', 25.0),
+        ('simulation', 50.0),
+        ('simulation', 75.0),
+        ('run', 100.0),
+    ]
+    assert all(c.growth_mb > 0 for c in profiler.checkpoints[1:4])
+
+
+def test_write_json(profiler: MemoryProfiler, tmp_path: Path) -> None:
+    """Test profile JSON lists phases with their sites and the overall peak."""
+    kept: list[Any] = []
+    profiler.checkpoint('load')
+    _allocate(kept)
+    profiler.checkpoint('export')
+    profiler.stop()
+    path = tmp_path / 'memory_profile.json'
+    profiler.write_json(path)
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert not tracemalloc.is_tracing()
+    assert [phase['phase'] for phase in data['phases']] == ['load', 'export']
+    assert data['peak_mb'] == max(phase['peak_mb'] for phase in data['phases'])
+    assert len(data['phases'][1]['top_sites']) <= 5
+    assert set(data['phases'][1]['top_growth'][0]) == {'site', 'size_mb', 'count'}
+
+
+def test_profiler_allocations_are_not_reported(profiler: MemoryProfiler) -> None:
+    """Test checkpoints leave out memory held by the profiler itself, e.g. earlier checkpoints."""
+    kept: list[Any] = []
+    for phase in range(5):
+        _allocate(kept)
+        profiler.checkpoint(f'phase_{phase}')
+
+    sites = [site.site for c in profiler.checkpoints for site in (*c.top_growth, *c.top_sites)]
+    assert sites
+    assert not [site for site in sites if site.startswith('shared/infrastructure/memory_profile.py:')]
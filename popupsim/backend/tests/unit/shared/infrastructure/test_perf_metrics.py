@@ -0,0 +1,105 @@
+"""Tests for hot-path timers and counters."""
+
+from collections.abc import Generator
+from collections.abc import Iterator
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from shared.infrastructure import perf_metrics
+from shared.infrastructure.perf_metrics import PerfRegistry
+from shared.infrastructure.perf_metrics import get_perf_registry
+from shared.infrastructure.perf_metrics import timed
+from shared.infrastructure.perf_metrics import timed_process
+import simpy
+
+
+@pytest.fixture
+def perf() -> Iterator[PerfRegistry]:
+    """Enable the global registry for one test."""
+    registry = get_perf_registry()
+    registry.reset(enabled=True)
+    yield registry
+    registry.reset(enabled=False)
+
+
+@timed('square')
+def _square(value: int) -> int:
+    return value * value
+
+
+@timed('worker')
+def _worker(env: simpy.Environment, log: list[Any]) -> Generator[Any, Any, str]:
+    received = yield env.timeout(5, value='tick')
+    log.append(received)
+    try:
+        yield env.timeout(100)
+    except simpy.Interrupt as interrupt:
+        log.append((interrupt.cause, env.now))
+    return 'done'
+
+
+def test_disabled_instrumentation_records_nothing() -> None:
+    """Test disabled registry leaves generators unwrapped and ignores counters."""
+    registry = get_perf_registry()
+    registry.reset(enabled=False)
+    process = iter([])
+
+    assert timed_process('noop', process) is process  # type: ignore[arg-type]
+    assert _square(3) == 9
+    registry.count('calls')
+    assert registry.snapshot()['timers'] == {}
+    assert registry.snapshot()['counters'] == {}
+
+
+def test_timed_generator_forwards_values_interrupts_and_result(perf: PerfRegistry) -> None:
+    """Test a timed SimPy process behaves like the plain one and is sampled per resume."""
+    env = simpy.Environment()
+    log: list[Any] = []
+    process = env.process(_worker(env, log))
+
+    def interrupter() -> Generator[Any]:
+        yield env.timeout(10)
+        process.interrupt('stop')
+
+    env.process(interrupter())
+    env.run()
+
+    assert (log, process.value) == (['tick', ('stop', 10)], 'done')
+    worker = perf.snapshot()['timers']['worker']
+    assert (worker['calls'], worker['samples']) == (1, 3)
+
+
+def test_timed_function_and_counters(perf: PerfRegistry) -> None:
+    """Test function calls are timed once each and counters add up."""
+    assert [_square(i) for i in range(4)] == [0, 1, 4, 9]
+    perf.count('wagons', 3)
+    perf.count('wagons')
+
+    snapshot = perf.snapshot()
+    assert (snapshot['timers']['square']['calls'], snapshot['timers']['square']['samples']) == (4, 4)
+    assert snapshot['counters'] == {'wagons': 4}
+
+
+def test_percentiles_and_json(perf: PerfRegistry, tmp_path: Path) -> None:
+    """Test nearest-rank percentiles and the written file."""
+    for ms in range(1, 101):
+        perf.record('phase', ms / 1000)
+    perf.write_json(tmp_path / 'perf_metrics.json')
+
+    phase = json.loads((tmp_path / 'perf_metrics.json').read_text(encoding='utf-8'))['timers']['phase']
+    assert phase['calls'] == phase['samples'] == 100
+    assert (phase['p50_ms'], phase['p99_ms'], phase['max_ms']) == (50.0, 99.0, 100.0)
+    assert phase['total_s'] == pytest.approx(5.05)
+
+
+def test_samples_are_bounded(perf: PerfRegistry, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test percentiles use a bounded sample while totals cover every call."""
+    monkeypatch.setattr(perf_metrics, 'SAMPLE_LIMIT', 10)
+    for ms in range(1, 1001):
+        perf.record('hot', ms / 1000)
+
+    hot = perf.timers['hot']
+    assert (hot.samples, len(hot._kept)) == (1000, 10)  # pylint: disable=protected-access
+    assert hot.to_dict()['max_ms'] == 1000.0
@@ -0,0 +1,26 @@
+"""Tests for vectorized simulation time to datetime conversion."""
+
+from datetime import UTC
+from datetime import datetime
+
+import pytest
+from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime
+from shared.infrastructure.simpy_time_converters import sim_ticks_to_datetime_series
+
+TICKS = [0.0, 1.0, 1.5, 59.999999, 0.1 / 60, 1e-9, 1234.5678, 2880.0, 100000.25]
+
+
+@pytest.mark.parametrize(
+    'start',
+    ['2025-01-01T00:00:00Z', '2025-03-30T00:00:00.250+01:00', '2025-01-01T06:00:00', datetime(2025, 1, 1, tzinfo=UTC)],
+)
+def test_series_matches_scalar_conversion(start: str | datetime) -> None:
+    """Test vectorized conversion yields the same strings as the scalar converter."""
+    expected = [sim_ticks_to_datetime(t, start) for t in TICKS]
+
+    assert sim_ticks_to_datetime_series(TICKS, start).tolist() == expected
+
+
+def test_empty_input() -> None:
+    """Test empty input gives empty result."""
+    assert sim_ticks_to_datetime_series([], '2025-01-01T00:00:00Z').tolist() == []
@@ -0,0 +1,121 @@
+"""Tests for tabular output formats."""
+
+from pathlib import Path
+
+from contexts.retrofit_workflow.application.event_collector import EventCollector
+from contexts.retrofit_workflow.domain.events import WagonJourneyEvent
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import ExportArtifact
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import write_csv
+from contexts.retrofit_workflow.infrastructure.exporters.parallel_artifact_writer import write_json
+import pandas as pd
+import pytest
+from shared.infrastructure.tabular_format import TabularFormat
+from shared.infrastructure.tabular_format import has_pyarrow
+from shared.infrastructure.tabular_format import read_table
+from shared.infrastructure.tabular_format import write_table
+
+COLUMNAR_FORMATS = [
+    TabularFormat.NPZ,
+    pytest.param(TabularFormat.PARQUET, marks=pytest.mark.skipif(not has_pyarrow(), reason='pyarrow not installed')),
+    pytest.param(TabularFormat.FEATHER, marks=pytest.mark.skipif(not has_pyarrow(), reason='pyarrow not installed')),
+]
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    """Create frame with repetitive, unique and missing values."""
+    return pd.DataFrame(
+        {
+            'timestamp': [0.0, 1.5, 3.0, 4.5],
+            'datetime': ['2025-01-01T00:00', '2025-01-01T00:01', '2025-01-01T00:03', '2025-01-01T00:04'],
+            'event': ['ARRIVED', 'PARKED', 'ARRIVED', 'ARRIVED'],
+            'train_id': ['T1', None, 'T1', 'T1'],
+            'count': [1, 2, 3, 4],
+            'capacity': [None, 2.5, None, 1.0],
+        }
+    )
+
+
+class TestTabularFormat:
+    """Test format parsing."""
+
+    def test_columnar_alias_picks_available_format(self) -> None:
+        """Test columnar resolves to Parquet with pyarrow, else npz."""
+        expected = TabularFormat.PARQUET if has_pyarrow() else TabularFormat.NPZ
+
+        assert TabularFormat.parse('columnar') == expected
+
+    def test_parse_names(self) -> None:
+        """Test plain format names are accepted case-insensitively."""
+        assert TabularFormat.parse('CSV') == TabularFormat.CSV
+        assert TabularFormat.parse('npz') == TabularFormat.NPZ
+
+    def test_unknown_format_raises(self) -> None:
+        """Test unknown names are rejected."""
+        with pytest.raises(ValueError, match='Unknown output format'):
+            TabularFormat.parse('xlsx')
+
+
+class TestWriteReadTable:
+    """Test round trips through each format."""
+
+    @pytest.mark.parametrize('output_format', COLUMNAR_FORMATS)
+    def test_round_trip(self, frame: pd.DataFrame, tmp_path: Path, output_format: TabularFormat) -> None:
+        """Test values and numeric dtypes survive, repetitive strings come back categorical."""
+        path = write_table(frame, tmp_path / 'table.csv', output_format)
+        result = read_table(path)
+
+        assert path.suffix == output_format.suffix
+        assert isinstance(result['event'].dtype, pd.CategoricalDtype)
+        assert result['count'].dtype == frame['count'].dtype
+        pd.testing.assert_frame_equal(
+            result.astype({'event': str, 'train_id': str}),
+            frame.astype({'event': str, 'train_id': str}),
+            check_dtype=False,
+        )
+
+    @pytest.mark.parametrize('output_format', COLUMNAR_FORMATS)
+    def test_empty_frame(self, tmp_path: Path, output_format: TabularFormat) -> None:
+        """Test frames without columns can be written."""
+        assert read_table(write_table(pd.DataFrame(), tmp_path / 'empty.csv', output_format)).empty
+
+    def test_other_formats_of_table_are_replaced(self, frame: pd.DataFrame, tmp_path: Path) -> None:
+        """Test writing a table deletes its files in other formats, and only those."""
+        write_table(frame, tmp_path / 'table.csv', TabularFormat.NPZ)
+        write_table(frame, tmp_path / 'other.csv', TabularFormat.NPZ)
+
+        write_table(frame, tmp_path / 'table.csv')
+        write_csv(frame, tmp_path / 'other.csv')
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['other.csv', 'table.csv']
+
+
+class TestExportArtifactFormat:
+    """Test artifacts switch format for tables only."""
+
+    def test_csv_artifact_changes_suffix(self) -> None:
+        """Test table artifact gets columnar file name."""
+        artifact = ExportArtifact('wagon_journey.csv', pd.DataFrame).with_format(TabularFormat.NPZ)
+
+        assert artifact.filename == 'wagon_journey.npz'
+
+    def test_json_artifact_unchanged(self) -> None:
+        """Test JSON artifacts keep their format."""
+        artifact = ExportArtifact('summary_metrics.json', dict, write=write_json)
+
+        assert artifact.with_format(TabularFormat.NPZ) is artifact
+
+    def test_collector_exports_columnar(self, tmp_path: Path) -> None:
+        """Test every table of a collector export uses the selected format."""
+        collector = EventCollector(start_datetime='2025-01-01T00:00:00Z')
+        collector.add_wagon_event(
+            WagonJourneyEvent(
+                timestamp=1.0, wagon_id='W1', train_id='T1', event_type='ARRIVED', location='collection', status='OK'
+            )
+        )
+
+        collector.export_all(str(tmp_path), 10.0, max_workers=1, output_format=TabularFormat.NPZ)
+
+        suffixes = {p.suffix for p in tmp_path.iterdir()}
+        assert suffixes == {'.npz', '.json'}
+        assert read_table(tmp_path / 'wagon_journey.npz')['wagon_id'].tolist() == ['W1']
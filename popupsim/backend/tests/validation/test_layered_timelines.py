@@ -11,6 +11,7 @@ from unittest.mock import Mock
 
 from contexts.retrofit_workflow.application.retrofit_workflow_context import RetrofitWorkshopContext
 from contexts.retrofit_workflow.domain.events.observability_events import WagonJourneyEvent
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
 import simpy
 
 from .retrofit_timeline_validator import validate_retrofit_timeline_from_docstring
@@ -212,6 +213,7 @@ def create_layered_scenario(
     # Track selection strategies
     mock_scenario.collection_track_strategy = Mock(value='round_robin')
     mock_scenario.retrofit_selection_strategy = Mock(value='first_available')
+    mock_scenario.workshop_selection_strategy = SelectionStrategy.FIRST_AVAILABLE
     mock_scenario.parking_selection_strategy = Mock(value='best_fit')
     mock_scenario.id = 'layered_test_scenario'
 
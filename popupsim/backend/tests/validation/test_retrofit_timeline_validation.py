@@ -4,6 +4,7 @@ from datetime import timedelta
 from unittest.mock import Mock
 
 from contexts.retrofit_workflow.application.retrofit_workflow_context import RetrofitWorkshopContext
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
 import simpy
 
 
@@ -69,6 +70,7 @@ def create_test_scenario(num_wagons: int = 2, num_workshops: int = 1) -> Mock:
     # Process times
     mock_scenario.process_times = Mock(wagon_retrofit_time=timedelta(minutes=10))
     mock_scenario.loco_priority_strategy = Mock(value='workshop_priority')
+    mock_scenario.workshop_selection_strategy = SelectionStrategy.FIRST_AVAILABLE
     mock_scenario.task_priorities = {}
 
     return mock_scenario
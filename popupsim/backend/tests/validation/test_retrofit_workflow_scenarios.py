@@ -7,6 +7,7 @@ from unittest.mock import Mock
 from contexts.retrofit_workflow.application.retrofit_workflow_context import RetrofitWorkshopContext
 from contexts.retrofit_workflow.domain.events.observability_events import WagonJourneyEvent
 from contexts.retrofit_workflow.domain.exceptions import SimulationDeadlockError
+from shared.domain.value_objects.selection_strategy import SelectionStrategy
 import simpy
 
 from .retrofit_timeline_validator import validate_retrofit_timeline_from_docstring
@@ -211,6 +212,7 @@ def create_test_scenario(
     # Track selection strategies
     mock_scenario.collection_track_strategy = Mock(value='round_robin')
     mock_scenario.retrofit_selection_strategy = Mock(value='first_available')
+    mock_scenario.workshop_selection_strategy = SelectionStrategy.FIRST_AVAILABLE
     mock_scenario.parking_selection_strategy = Mock(value='best_fit')
     mock_scenario.id = 'test_scenario'
     mock_scenario.process_logger = None  # No process logging in tests
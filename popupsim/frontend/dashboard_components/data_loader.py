@@ -5,6 +5,26 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from shared.infrastructure.tabular_format import read_table
+
+COLUMNAR_SUFFIXES = ('.parquet', '.feather', '.npz')
+"""Columnar output formats, preferred over CSV when present (the simulation keeps one format per table)."""
+
+
+def _normalize_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Decode categoricals to strings and treat empty strings as missing, as read_csv does."""
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categorical = series.array
+            if '' in categorical.categories:
+                categorical = categorical.remove_categories([''])
+            df[column] = categorical.astype(categorical.categories.dtype)
+        elif pd.api.types.is_string_dtype(series):
+            empty = series == ''
+            if empty.any():
+                df[column] = series.mask(empty)
+    return df
 
 
 class DataLoader:  # pylint: disable=too-few-public-methods
@@ -24,20 +44,20 @@ class DataLoader:  # pylint: disable=too-few-public-methods
 
         # Load simulation results
         data['metrics'] = self._load_json('summary_metrics.json')
-        data['wagon_journey'] = self._load_csv('wagon_journey.csv')
-        data['rejected_wagons'] = self._load_csv('rejected_wagons.csv')
-        data['locomotive_movements'] = self._load_csv('locomotive_movements.csv')
-        data['locomotive_journey'] = self._load_csv('locomotive_journey.csv')
-        data['track_capacity'] = self._load_csv('track_capacity.csv')
-        data['workshop_utilization'] = self._load_csv('workshop_utilization.csv')
-        data['locomotive_utilization'] = self._load_csv('locomotive_utilization.csv')
-        data['timeline'] = self._load_csv('timeline.csv')
-        data['workshop_metrics'] = self._load_csv('workshop_metrics.csv')
+        data['wagon_journey'] = self._load_table('wagon_journey.csv')
+        data['rejected_wagons'] = self._load_table('rejected_wagons.csv')
+        data['locomotive_movements'] = self._load_table('locomotive_movements.csv')
+        data['locomotive_journey'] = self._load_table('locomotive_journey.csv')
+        data['track_capacity'] = self._load_table('track_capacity.csv')
+        data['workshop_utilization'] = self._load_table('workshop_utilization.csv')
+        data['locomotive_utilization'] = self._load_table('locomotive_utilization.csv')
+        data['timeline'] = self._load_table('timeline.csv')
+        data['workshop_metrics'] = self._load_table('workshop_metrics.csv')
 
         # Load dual-stream event files
-        data['resource_states'] = self._load_csv('resource_states.csv')
-        data['resource_locations'] = self._load_csv('resource_locations.csv')
-        data['resource_processes'] = self._load_csv('resource_processes.csv')
+        data['resource_states'] = self._load_table('resource_states.csv')
+        data['resource_locations'] = self._load_table('resource_locations.csv')
+        data['resource_processes'] = self._load_table('resource_processes.csv')
 
         # Load scenario configuration
         data['scenario_config'] = self._load_scenario_config()
@@ -52,6 +72,17 @@ class DataLoader:  # pylint: disable=too-few-public-methods
                 return json.load(f)
         return None
 
+    def _load_table(self, filename: str) -> pd.DataFrame | None:
+        """Load table from output directory, preferring a columnar file over the CSV."""
+        for suffix in COLUMNAR_SUFFIXES:
+            columnar_path = (self.output_dir / filename).with_suffix(suffix)
+            if columnar_path.exists():
+                try:
+                    return _normalize_strings(read_table(columnar_path))
+                except ImportError:
+                    continue  # Parquet/Feather need pyarrow
+        return self._load_csv(filename)
+
     def _load_csv(self, filename: str) -> pd.DataFrame | None:
         """Load CSV file from output directory."""
         filepath = self.output_dir / filename